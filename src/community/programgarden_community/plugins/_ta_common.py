@@ -21,6 +21,10 @@ import math
 from typing import Any, Dict, List, Optional, Sequence
 
 
+# LS market_code (numeric) → exchange name, shared by the position-based risk plugins.
+MARKET_CODE_EXCHANGES = {"81": "NYSE", "82": "NASDAQ", "83": "AMEX"}
+
+
 def sanitize(x: Any, ndigits: Optional[int] = 6) -> Optional[float]:
     """Coerce a numeric value to a finite, JSON-serializable float.
 
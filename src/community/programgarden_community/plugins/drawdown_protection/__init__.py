@@ -15,6 +15,8 @@ from typing import Any, Dict, List, Optional, Set
 from programgarden_core.registry import PluginSchema
 from programgarden_core.registry.plugin_registry import PluginCategory, ProductType
 
+from .._ta_common import MARKET_CODE_EXCHANGES
+
 
 # risk_features 선언
 risk_features: Set[str] = {"hwm", "events"}
@@ -111,8 +113,7 @@ async def drawdown_protection_condition(
         current_price = pos_data.get("current_price", 0)
         exchange = pos_data.get("exchange") or pos_data.get("market_code", "UNKNOWN")
 
-        exchange_map = {"81": "NYSE", "82": "NASDAQ", "83": "AMEX"}
-        exchange_name = exchange_map.get(str(exchange), exchange)
+        exchange_name = MARKET_CODE_EXCHANGES.get(str(exchange), exchange)
         sym_dict = {"symbol": symbol, "exchange": exchange_name}
 
         # risk_tracker HWM 기반 drawdown (우선)
@@ -15,6 +15,8 @@ from typing import List, Dict, Any, Optional
 from programgarden_core.registry import PluginSchema
 from programgarden_core.registry.plugin_registry import PluginCategory, ProductType
 
+from .._ta_common import MARKET_CODE_EXCHANGES
+
 
 DYNAMIC_STOP_LOSS_SCHEMA = PluginSchema(
     id="DynamicStopLoss",
@@ -161,8 +163,7 @@ async def dynamic_stop_loss_condition(
         avg_price = pos_data.get("avg_price", current_price)
         exchange = pos_data.get("exchange") or pos_data.get("market_code", "UNKNOWN")
 
-        exchange_map = {"81": "NYSE", "82": "NASDAQ", "83": "AMEX"}
-        exchange_name = exchange_map.get(str(exchange), exchange)
+        exchange_name = MARKET_CODE_EXCHANGES.get(str(exchange), exchange)
         sym_dict = {"symbol": symbol, "exchange": exchange_name}
 
         # ATR 계산
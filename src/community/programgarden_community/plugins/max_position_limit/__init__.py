@@ -15,6 +15,8 @@ from typing import Any, Dict, List, Optional, Set
 from programgarden_core.registry import PluginSchema
 from programgarden_core.registry.plugin_registry import PluginCategory, ProductType
 
+from .._ta_common import MARKET_CODE_EXCHANGES
+
 
 MAX_POSITION_LIMIT_SCHEMA = PluginSchema(
     id="MaxPositionLimit",
@@ -149,8 +151,7 @@ async def max_position_limit_condition(
         symbol = pos_data["symbol"]
         current_price = pos_data.get("current_price", 0)
         exchange = pos_data.get("exchange") or pos_data.get("market_code", "UNKNOWN")
-        exchange_map = {"81": "NYSE", "82": "NASDAQ", "83": "AMEX"}
-        exchange_name = exchange_map.get(str(exchange), exchange)
+        exchange_name = MARKET_CODE_EXCHANGES.get(str(exchange), exchange)
         sym_dict = {"symbol": symbol, "exchange": exchange_name}
 
         value = symbol_values.get(symbol, 0)
@@ -14,6 +14,8 @@ from typing import Any, Dict, List, Optional
 from programgarden_core.registry import PluginSchema
 from programgarden_core.registry.plugin_registry import PluginCategory, ProductType
 
+from .._ta_common import MARKET_CODE_EXCHANGES
+
 
 PROFIT_TARGET_SCHEMA = PluginSchema(
     id="ProfitTarget",
@@ -91,8 +93,7 @@ async def profit_target_condition(
         current_price = pos_data.get("current_price", 0)
         exchange = pos_data.get("exchange") or pos_data.get("market_code", "UNKNOWN")
 
-        exchange_map = {"81": "NYSE", "82": "NASDAQ", "83": "AMEX"}
-        exchange_name = exchange_map.get(str(exchange), exchange)
+        exchange_name = MARKET_CODE_EXCHANGES.get(str(exchange), exchange)
 
         sym_dict = {"exchange": exchange_name, "symbol": symbol}
 
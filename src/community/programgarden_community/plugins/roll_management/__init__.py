@@ -154,6 +154,7 @@ async def roll_management_condition(
         }
 
     now = datetime.now()
+    signal_date = now.strftime("%Y-%m-%d")
     passed, failed, symbol_results = [], [], []
 
     for pos_data in positions:
@@ -192,7 +193,7 @@ async def roll_management_condition(
             try:
                 await context.risk_tracker.set_state(
                     f"roll.{symbol}.signal_date",
-                    now.strftime("%Y-%m-%d"),
+                    signal_date,
                 )
             except Exception:
                 pass
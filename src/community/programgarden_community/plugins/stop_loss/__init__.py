@@ -14,6 +14,8 @@ from typing import Any, Dict, List, Optional
 from programgarden_core.registry import PluginSchema
 from programgarden_core.registry.plugin_registry import PluginCategory, ProductType
 
+from .._ta_common import MARKET_CODE_EXCHANGES
+
 
 STOP_LOSS_SCHEMA = PluginSchema(
     id="StopLoss",
@@ -92,8 +94,7 @@ async def stop_loss_condition(
         exchange = pos_data.get("exchange") or pos_data.get("market_code", "UNKNOWN")
 
         # market_code를 거래소명으로 변환 (숫자 코드일 때만)
-        exchange_map = {"81": "NYSE", "82": "NASDAQ", "83": "AMEX"}
-        exchange_name = exchange_map.get(str(exchange), exchange)
+        exchange_name = MARKET_CODE_EXCHANGES.get(str(exchange), exchange)
 
         sym_dict = {"exchange": exchange_name, "symbol": symbol}
 
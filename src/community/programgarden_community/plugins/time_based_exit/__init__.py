@@ -19,6 +19,8 @@ from typing import Any, Dict, List, Optional, Set
 from programgarden_core.registry import PluginSchema
 from programgarden_core.registry.plugin_registry import PluginCategory, ProductType
 
+from .._ta_common import MARKET_CODE_EXCHANGES
+
 
 # risk_features: strategy_state 사용
 risk_features: Set[str] = {"state"}
@@ -128,8 +130,7 @@ async def time_based_exit_condition(
             continue
         qty = pos_data.get("qty", pos_data.get("quantity", 0))
         exchange = pos_data.get("exchange") or pos_data.get("market_code", "UNKNOWN")
-        exchange_map = {"81": "NYSE", "82": "NASDAQ", "83": "AMEX"}
-        exchange_name = exchange_map.get(str(exchange), exchange)
+        exchange_name = MARKET_CODE_EXCHANGES.get(str(exchange), exchange)
         sym_dict = {"symbol": symbol, "exchange": exchange_name}
 
         # 수량 0이면 청산 완료 → 상태 삭제
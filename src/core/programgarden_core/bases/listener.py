@@ -819,6 +819,43 @@ class ConsoleExecutionListener(BaseExecutionListener):
     Example:
         job = await pg.run_async(workflow, listeners=[ConsoleExecutionListener()])
     """
+
+    NODE_STATE_EMOJI = {
+        NodeState.PENDING: "⏳",
+        NodeState.RUNNING: "🔄",
+        NodeState.COMPLETED: "✅",
+        NodeState.FAILED: "❌",
+        NodeState.SKIPPED: "⏭️",
+    }
+
+    EDGE_STATE_EMOJI = {
+        EdgeState.IDLE: "⚪",
+        EdgeState.TRANSMITTING: "🔵",
+        EdgeState.TRANSMITTED: "🟢",
+    }
+
+    LOG_LEVEL_COLORS = {
+        "debug": "\033[90m",    # Gray
+        "info": "\033[92m",     # Green
+        "warning": "\033[93m",  # Yellow
+        "error": "\033[91m",    # Red
+    }
+
+    JOB_STATE_EMOJI = {
+        "pending": "⏳",
+        "running": "🚀",
+        "completed": "🎉",
+        "failed": "💥",
+        "cancelled": "🛑",
+        "stopping": "🔻",
+    }
+
+    # risk / notification 공용 severity → (색상, 이모지)
+    SEVERITY_STYLES = {
+        "info": ("\033[94m", "ℹ️"),       # Blue
+        "warning": ("\033[93m", "⚠️"),    # Yellow
+        "critical": ("\033[91m", "🚨"),   # Red
+    }
     
     def __init__(self, verbose: bool = False, start_date: Optional[str] = None):
         """
@@ -830,14 +867,7 @@ class ConsoleExecutionListener(BaseExecutionListener):
         self.verbose = verbose
     
     async def on_node_state_change(self, event: NodeStateEvent) -> None:
-        state_emoji = {
-            NodeState.PENDING: "⏳",
-            NodeState.RUNNING: "🔄",
-            NodeState.COMPLETED: "✅",
-            NodeState.FAILED: "❌",
-            NodeState.SKIPPED: "⏭️",
-        }
-        emoji = state_emoji.get(event.state, "❓")
+        emoji = self.NODE_STATE_EMOJI.get(event.state, "❓")
         
         msg = f"{emoji} [{event.node_id}] {event.state.value}"
         if event.duration_ms:
@@ -851,38 +881,19 @@ class ConsoleExecutionListener(BaseExecutionListener):
         if not self.verbose:
             return
         
-        state_emoji = {
-            EdgeState.IDLE: "⚪",
-            EdgeState.TRANSMITTING: "🔵",
-            EdgeState.TRANSMITTED: "🟢",
-        }
-        emoji = state_emoji.get(event.state, "❓")
+        emoji = self.EDGE_STATE_EMOJI.get(event.state, "❓")
         
         print(f"{emoji} {event.from_node_id}.{event.from_port} → {event.to_node_id}.{event.to_port}")
     
     async def on_log(self, event: LogEvent) -> None:
-        level_color = {
-            "debug": "\033[90m",    # Gray
-            "info": "\033[92m",     # Green
-            "warning": "\033[93m",  # Yellow
-            "error": "\033[91m",    # Red
-        }
         reset = "\033[0m"
-        color = level_color.get(event.level, "")
+        color = self.LOG_LEVEL_COLORS.get(event.level, "")
         
         node_tag = f"[{event.node_id}] " if event.node_id else ""
         print(f"{color}{event.level.upper():>7}{reset} {node_tag}{event.message}")
     
     async def on_job_state_change(self, event: JobStateEvent) -> None:
-        state_emoji = {
-            "pending": "⏳",
-            "running": "🚀",
-            "completed": "🎉",
-            "failed": "💥",
-            "cancelled": "🛑",
-            "stopping": "🔻",
-        }
-        emoji = state_emoji.get(event.state, "❓")
+        emoji = self.JOB_STATE_EMOJI.get(event.state, "❓")
         
         print(f"\n{emoji} Job [{event.job_id}] → {event.state}")
         if event.stats:
@@ -916,13 +927,8 @@ class ConsoleExecutionListener(BaseExecutionListener):
 
     async def on_risk_event(self, event: 'RiskEvent') -> None:
         """Print risk event with severity-based coloring"""
-        severity_style = {
-            "info": ("\033[94m", "ℹ️"),       # Blue
-            "warning": ("\033[93m", "⚠️"),    # Yellow
-            "critical": ("\033[91m", "🚨"),   # Red
-        }
         reset = "\033[0m"
-        color, emoji = severity_style.get(event.severity, ("\033[0m", "❓"))
+        color, emoji = self.SEVERITY_STYLES.get(event.severity, ("\033[0m", "❓"))
 
         symbol_tag = f" [{event.symbol}]" if event.symbol else ""
         print(f"{color}{emoji} RISK {event.severity.upper()}{symbol_tag} "
@@ -930,14 +936,9 @@ class ConsoleExecutionListener(BaseExecutionListener):
 
     async def on_notification(self, event: 'NotificationEvent') -> None:
         """Print notification event with severity-based coloring"""
-        severity_style = {
-            "info": ("\033[94m", "ℹ️"),       # Blue
-            "warning": ("\033[93m", "⚠️"),    # Yellow
-            "critical": ("\033[91m", "🚨"),   # Red
-        }
         reset = "\033[0m"
         sev = event.severity.value if isinstance(event.severity, Enum) else event.severity
-        color, emoji = severity_style.get(sev, ("\033[0m", "❓"))
+        color, emoji = self.SEVERITY_STYLES.get(sev, ("\033[0m", "❓"))
 
         cat = event.category.value if isinstance(event.category, Enum) else event.category
         node_tag = f" [{event.node_id}]" if event.node_id else ""
@@ -55,6 +55,12 @@ class SingletonClientMixin:
         Raises:
             ValueError: 이미 다른 인자로 초기화된 경우
         """
+        # 이미 만들어진 인스턴스를 인자 없이 조회하는 경우가 대부분이므로 락 없이 바로 반환한다.
+        # 속성 읽기 자체는 원자적이고, 생성/재설정만 락 안에서 일어난다.
+        instance = cls._singleton_instance
+        if instance is not None and not args and not kwargs:
+            return instance  # type: ignore[return-value]
+
         with cls._singleton_lock:
             if cls._singleton_instance is None:
                 cls._singleton_args = args
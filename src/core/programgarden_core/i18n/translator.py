@@ -237,10 +237,11 @@ def _translate_widget_schema(widget: Dict[str, Any], locale: str, node_type: str
     result = widget.copy()
     
     # Try multiple field_id sources (different widgets use different keys)
+    widget_args = widget.get("args") or {}
     field_id = (
-        widget.get("field_key_of_pydantic") 
-        or (widget.get("args", {}).get("fieldKey"))
-        or (widget.get("args", {}).get("decoration", {}).get("fieldId"))
+        widget.get("field_key_of_pydantic")
+        or widget_args.get("fieldKey")
+        or (widget_args.get("decoration") or {}).get("fieldId")
     )
     
     # Translate args.decoration
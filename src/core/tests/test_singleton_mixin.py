@@ -0,0 +1,66 @@
+"""SingletonClientMixin.get_instance 동작 테스트."""
+
+import threading
+
+import pytest
+
+from programgarden_core.bases.mixins import SingletonClientMixin
+
+
+class _Client(SingletonClientMixin):
+    created = 0
+
+    def __init__(self, token: str = "default"):
+        type(self).created += 1
+        self.token = token
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    _Client.reset_instance()
+    _Client.created = 0
+    yield
+    _Client.reset_instance()
+
+
+def test_cached_instance_returned_without_lock():
+    first = _Client.get_instance("abc")
+
+    class _ExplodingLock:
+        def __enter__(self):
+            raise AssertionError("lock must not be taken on the cached path")
+
+        def __exit__(self, *exc):
+            return False
+
+    original = _Client._singleton_lock
+    _Client._singleton_lock = _ExplodingLock()
+    try:
+        assert _Client.get_instance() is first
+    finally:
+        _Client._singleton_lock = original
+
+
+def test_mismatched_args_still_checked():
+    _Client.get_instance("abc")
+    assert _Client.get_instance("abc").token == "abc"
+    with pytest.raises(ValueError):
+        _Client.get_instance("other")
+
+
+def test_concurrent_first_access_creates_once():
+    barrier = threading.Barrier(8)
+    results = []
+
+    def _worker():
+        barrier.wait()
+        results.append(_Client.get_instance())
+
+    threads = [threading.Thread(target=_worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert _Client.created == 1
+    assert all(r is results[0] for r in results)
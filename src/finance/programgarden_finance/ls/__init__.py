@@ -1,6 +1,6 @@
 import asyncio
 import threading
-from typing import Optional
+from typing import Any, Dict, Optional
 from programgarden_core.korea_alias import require_korean_alias
 from programgarden_core.bases import BaseClient, SingletonClientMixin
 
@@ -28,6 +28,9 @@ class LS(SingletonClientMixin, BaseClient):
         self._sync_lock = threading.RLock()
         self._async_lock: Optional[asyncio.Lock] = None
 
+        # 상품 래퍼(overseas_stock() 등)는 token_manager 만 들고 있으므로 재사용한다
+        self._products: Dict[type, Any] = {}
+
     def is_logged_in(self) -> bool:
         """
         현재 로그인 상태인지 확인합니다.
@@ -199,6 +202,13 @@ class LS(SingletonClientMixin, BaseClient):
     비동기로그인 = async_login
     비동기로그인.__doc__ = "비동기로 로그인을 수행합니다. appkey와 appsecretkey를 입력해야 합니다."
 
+    def _product(self, product_cls: type) -> Any:
+        """상품 래퍼를 현재 token_manager 기준으로 한 번만 만들어 돌려준다."""
+        product = self._products.get(product_cls)
+        if product is None or product.token_manager is not self.token_manager:
+            product = self._products[product_cls] = product_cls(token_manager=self.token_manager)
+        return product
+
     @require_korean_alias
     def overseas_stock(self) -> OverseasStock:
         """해외 주식 데이터를 조회합니다."""
@@ -207,9 +217,7 @@ class LS(SingletonClientMixin, BaseClient):
         if not self.ensure_token():
             raise LoginException("토큰이 유효하지 않습니다.")
 
-        return OverseasStock(
-            token_manager=self.token_manager,
-        )
+        return self._product(OverseasStock)
 
     해외주식 = overseas_stock
     해외주식.__doc__ = "해외 주식 데이터를 조회합니다."
@@ -222,9 +230,7 @@ class LS(SingletonClientMixin, BaseClient):
         if not self.ensure_token():
             raise LoginException("토큰이 유효하지 않습니다.")
 
-        return OverseasFutureoption(
-            token_manager=self.token_manager,
-        )
+        return self._product(OverseasFutureoption)
 
     해외선물 = overseas_futureoption
     해외선물.__doc__ = "해외 선물 데이터를 조회합니다."
@@ -237,9 +243,7 @@ class LS(SingletonClientMixin, BaseClient):
         if not self.ensure_token():
             raise LoginException("토큰이 유효하지 않습니다.")
 
-        return KoreaStock(
-            token_manager=self.token_manager,
-        )
+        return self._product(KoreaStock)
 
     국내주식 = korea_stock
     국내주식.__doc__ = "국내 주식 데이터를 조회합니다."
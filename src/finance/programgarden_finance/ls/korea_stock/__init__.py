@@ -2,6 +2,7 @@
 from typing import Dict
 
 from programgarden_core.korea_alias import EnforceKoreanAliasMeta, require_korean_alias
+from programgarden_finance.ls.product_base import NamespaceCacheMixin
 from programgarden_finance.ls.token_manager import TokenManager
 
 from .market import Market
@@ -18,7 +19,7 @@ from .program import Program
 from .real import Real
 
 
-class KoreaStock:
+class KoreaStock(NamespaceCacheMixin):
 
     _real_instances: Dict[int, "Real"] = {}
 
@@ -29,70 +30,70 @@ class KoreaStock:
 
     @require_korean_alias
     def market(self) -> Market:
-        return Market(token_manager=self.token_manager)
+        return self._namespace(Market)
 
     시세 = market
     시세.__doc__ = "시세 데이터를 조회합니다."
 
     @require_korean_alias
     def chart(self) -> Chart:
-        return Chart(token_manager=self.token_manager)
+        return self._namespace(Chart)
 
     차트 = chart
     차트.__doc__ = "차트 데이터를 조회합니다."
 
     @require_korean_alias
     def ranking(self) -> Ranking:
-        return Ranking(token_manager=self.token_manager)
+        return self._namespace(Ranking)
 
     순위 = ranking
     순위.__doc__ = "순위(상위종목) 데이터를 조회합니다."
 
     @require_korean_alias
     def etc(self) -> Etc:
-        return Etc(token_manager=self.token_manager)
+        return self._namespace(Etc)
 
     기타 = etc
     기타.__doc__ = "기타 종목 정보(신규상장, 관리종목 등)를 조회합니다."
 
     @require_korean_alias
     def etf(self) -> Etf:
-        return Etf(token_manager=self.token_manager)
+        return self._namespace(Etf)
 
     ETF = etf
     ETF.__doc__ = "ETF 시세/일별추이/구성종목을 조회합니다."
 
     @require_korean_alias
     def frgr_itt(self) -> FrgrItt:
-        return FrgrItt(token_manager=self.token_manager)
+        return self._namespace(FrgrItt)
 
     외인기관 = frgr_itt
     외인기관.__doc__ = "외인/기관 종목별 매매동향을 조회합니다."
 
     @require_korean_alias
     def accno(self) -> Accno:
-        return Accno(token_manager=self.token_manager)
+        return self._namespace(Accno)
 
     계좌 = accno
     계좌.__doc__ = "계좌 정보(예수금, 주문가능금액, 잔고 등)를 조회합니다."
 
     @require_korean_alias
     def order(self) -> Order:
-        return Order(token_manager=self.token_manager)
+        return self._namespace(Order)
 
     주문 = order
     주문.__doc__ = "주문(매수/매도/정정)을 처리합니다."
 
     @require_korean_alias
     def sector(self) -> Sector:
-        return Sector(token_manager=self.token_manager)
+        return self._namespace(Sector)
 
     업종테마 = sector
     업종테마.__doc__ = "테마(테마별종목/종목별테마/테마종목별시세) 및 deprecated 업종 경유 조회. 업종은 ls.업종() 로 이전됨."
 
     @require_korean_alias
     def investor(self) -> Investor:
-        return Investor(token_manager=self.token_manager)
+        return self._namespace(Investor)
 
     투자자 = investor
     투자자.__doc__ = "투자자별 매매 동향(종합, 시간대별, 차트)을 조회합니다."
@@ -100,7 +101,7 @@ class KoreaStock:
     @require_korean_alias
     def program(self) -> Program:
         """Return the Program domain client for Korean stock program-trading TRs (``/stock/program``)."""
-        return Program(token_manager=self.token_manager)
+        return self._namespace(Program)
 
     프로그램매매 = program
     프로그램매매.__doc__ = (
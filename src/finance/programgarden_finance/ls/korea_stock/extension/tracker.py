@@ -14,6 +14,7 @@ from decimal import Decimal, ROUND_HALF_UP
 from typing import Dict, List, Optional, Callable, Any, Set
 from datetime import datetime
 import asyncio
+import threading
 
 from .models import (
     KrStockPositionItem,
@@ -24,6 +25,7 @@ from .models import (
 )
 from .calculator import KrStockPnLCalculator
 from .subscription_manager import SubscriptionManager
+from ...tr_base import AccountRequestSpacer
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +74,7 @@ class KrStockAccountTracker:
 
     DEFAULT_REFRESH_INTERVAL = 60  # 1분
     DEFAULT_ORDER_DELAY = 3  # 체결 후 재조회 대기 시간 (초)
+    ACCOUNT_TR_INTERVAL = 2  # 계좌 TR 시작 간격 (초, LS 는 계좌 단위로 TR 을 합산 제한)
 
     def __init__(
         self,
@@ -124,8 +127,12 @@ class KrStockAccountTracker:
 
         # Task 관리
         self._refresh_task: Optional[asyncio.Task] = None
+        # 체결 후 지연 재조회 대기 중이면 그 재조회가 잔고까지 다시 볼지 여부, 아니면 None
+        self._pending_refresh: Optional[bool] = None
         self._is_running = False
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._account_spacer = AccountRequestSpacer(self.ACCOUNT_TR_INTERVAL)
+        self._loop_thread_id: Optional[int] = None  # self._loop 를 돌리는 스레드
 
         # 에러 상태
         self._last_errors: Dict[str, str] = {}
@@ -137,6 +144,7 @@ class KrStockAccountTracker:
 
         self._is_running = True
         self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
 
         # 1. WebSocket 연결 확인
         if not self._real_client:
@@ -174,12 +182,17 @@ class KrStockAccountTracker:
     # ===== 데이터 조회 =====
 
     async def _fetch_all_data(self):
-        """모든 데이터 조회 (보유종목, 예수금, 미체결)"""
-        await self._fetch_positions()
-        await asyncio.sleep(2)  # rate limit
-        await self._fetch_balance()
-        await asyncio.sleep(2)  # rate limit
-        await self._fetch_open_orders()
+        """모든 데이터 조회 (보유종목, 예수금, 미체결)
+
+        세 TR(t0424 · CSPAQ22200 · t0425)은 서로 독립이라 동시에 조회한다.
+        TR 별 rate limit 은 클라이언트가 지키고, 계좌 단위 합산 제한 때문에 각 조회의 시작은
+        `ACCOUNT_TR_INTERVAL` 간격으로 벌린다. 각 조회는 실패를 자체 기록한다.
+        """
+        await asyncio.gather(
+            self._fetch_positions(),
+            self._fetch_balance(),
+            self._fetch_open_orders(),
+        )
 
     async def _fetch_positions(self):
         """보유종목 조회 (t0424 주식잔고2)"""
@@ -194,6 +207,7 @@ class KrStockAccountTracker:
                     charge="1",   # 제비용포함
                 ),
             )
+            await self._account_spacer.wait()
             resp = await tr.req_async()
 
             rsp_cd = getattr(resp, 'rsp_cd', '')
@@ -233,6 +247,9 @@ class KrStockAccountTracker:
             if resp.block:
                 for item in resp.block:
                     symbol = item.expcode
+                    if not symbol:
+                        # 종목코드 없는 행은 모델 검증(생성) 전에 건너뛴다
+                        continue
                     position = KrStockPositionItem(
                         symbol=symbol,
                         symbol_name=item.hname,
@@ -274,6 +291,7 @@ class KrStockAccountTracker:
             tr = self._accno_client.cspaq22200(
                 body=CSPAQ22200InBlock1(BalCreTp="0"),
             )
+            await self._account_spacer.wait()
             resp = await tr.req_async()
 
             rsp_cd = getattr(resp, 'rsp_cd', '')
@@ -325,6 +343,7 @@ class KrStockAccountTracker:
                     sortgb="1",   # 역순
                 ),
             )
+            await self._account_spacer.wait()
             resp = await tr.req_async()
 
             rsp_cd = getattr(resp, 'rsp_cd', '')
@@ -499,15 +518,33 @@ class KrStockAccountTracker:
 
             # 11: 체결, 12: 정정확인, 13: 취소확인
             if order_type in ('11', '12', '13'):
-                self._schedule_coroutine(self._delayed_refresh())
+                self._schedule_coroutine(
+                    self._delayed_refresh(positions_changed=order_type == '11')
+                )
 
         except Exception as e:
             print(f"[KrStockAccountTracker] 주문 이벤트 처리 오류: {e}")
 
-    async def _delayed_refresh(self):
-        """체결 후 지연 재조회"""
-        await asyncio.sleep(self.DEFAULT_ORDER_DELAY)
-        await self._fetch_all_data()
+    async def _delayed_refresh(self, positions_changed: bool = True):
+        """체결 후 지연 재조회
+
+        정정/취소 확인은 보유종목을 바꾸지 않으므로 잔고(t0424)는 건너뛰고
+        예수금(주문가능금액)과 미체결만 다시 조회한다. 대기 중에 들어온 주문 이벤트는
+        대기 중인 재조회 한 번으로 합친다 (바스켓 주문 체결이 몰려도 TR 은 한 벌).
+        """
+        if self._pending_refresh is not None:
+            self._pending_refresh = self._pending_refresh or positions_changed
+            return
+        self._pending_refresh = positions_changed
+        try:
+            await asyncio.sleep(self.DEFAULT_ORDER_DELAY)
+        finally:
+            # 조회 시작 전에 비워, 조회 중 들어온 이벤트는 다음 재조회로 잡히게 한다
+            positions_changed, self._pending_refresh = self._pending_refresh, None
+        if positions_changed:
+            await self._fetch_all_data()
+        else:
+            await asyncio.gather(self._fetch_balance(), self._fetch_open_orders())
 
     async def _periodic_refresh(self):
         """주기적 갱신"""
@@ -518,17 +555,21 @@ class KrStockAccountTracker:
 
     def _schedule_coroutine(self, coro):
         """스레드 안전하게 코루틴 스케줄링 (WebSocket 콜백 스레드 대응)"""
+        # 실시간 콜백은 대부분 WebSocket 스레드(루프 없음)에서 들어오므로, 예외로
+        # 분기하기 전에 start() 때 기록한 루프 스레드와 비교해 먼저 가른다.
+        loop = self._loop  # 로컬 복사로 TOCTOU 방지
+        if loop is not None and threading.get_ident() != self._loop_thread_id:
+            # WebSocket 콜백 등 별도 스레드에서 호출 시
+            try:
+                asyncio.run_coroutine_threadsafe(coro, loop)
+            except RuntimeError:
+                coro.close()  # loop already closed
+            return
+
         try:
-            asyncio.get_running_loop()
-            asyncio.create_task(coro)
+            asyncio.get_running_loop().create_task(coro)
         except RuntimeError:
-            # WebSocket 콜백 등 별도 스레드에서 호출 시
-            loop = self._loop  # 로컬 복사로 TOCTOU 방지
-            if loop is not None:
-                try:
-                    asyncio.run_coroutine_threadsafe(coro, loop)
-                except RuntimeError:
-                    pass  # loop already closed
+            coro.close()  # No event loop running
 
     # ===== 계좌 수익률 계산 =====
 
@@ -1,6 +1,7 @@
 from typing import Dict
 
 from programgarden_finance.ls.overseas_futureoption.real import Real
+from programgarden_finance.ls.product_base import NamespaceCacheMixin
 from programgarden_finance.ls.token_manager import TokenManager
 from .market import Market
 from .accno import Accno
@@ -10,7 +11,7 @@ from programgarden_core.korea_alias import EnforceKoreanAliasMeta, require_korea
 from programgarden_core.bases import BaseOverseasFutureoption
 
 
-class OverseasFutureoption(BaseOverseasFutureoption):
+class OverseasFutureoption(NamespaceCacheMixin, BaseOverseasFutureoption):
 
     _real_instances: Dict[int, "Real"] = {}
 
@@ -21,28 +22,28 @@ class OverseasFutureoption(BaseOverseasFutureoption):
 
     @require_korean_alias
     def market(self) -> Market:
-        return Market(self.token_manager)
+        return self._namespace(Market)
 
     시세 = market
     시세.__doc__ = "해외선물옵션 시세 데이터를 조회합니다."
 
     @require_korean_alias
     def accno(self) -> Accno:
-        return Accno(self.token_manager)
+        return self._namespace(Accno)
 
     계좌 = accno
     계좌.__doc__ = "해외선물옵션 계좌 정보를 조회합니다."
 
     @require_korean_alias
     def chart(self) -> Chart:
-        return Chart(self.token_manager)
+        return self._namespace(Chart)
 
     차트 = chart
     차트.__doc__ = "해외선물옵션 차트 정보를 조회합니다."
 
     @require_korean_alias
     def order(self) -> Order:
-        return Order(self.token_manager)
+        return self._namespace(Order)
 
     주문 = order
     주문.__doc__ = "해외선물옵션 주문 정보를 조회합니다."
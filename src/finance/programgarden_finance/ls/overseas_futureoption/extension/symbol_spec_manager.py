@@ -99,6 +99,8 @@ class SymbolSpecManager:
                 if resp.rsp_cd == "00000" and resp.block:
                     self._specs.clear()
                     self._specs_by_base.clear()
+                    # 한 번의 o3121 응답이므로 갱신 시각은 모든 종목에 동일하게 둔다
+                    refreshed_at = datetime.now()
                     
                     for item in resp.block:
                         spec = SymbolSpec(
@@ -113,7 +115,7 @@ class SymbolSpecManager:
                             maintenance_margin=Decimal(str(item.MntncMgn)) if item.MntncMgn else Decimal("0"),
                             decimal_places=item.DotGb or 2,
                             base_product_code=item.BscGdsCd or "",
-                            last_updated=datetime.now()
+                            last_updated=refreshed_at
                         )
                         self._specs[spec.symbol] = spec
                         
@@ -124,7 +126,7 @@ class SymbolSpecManager:
                                 self._specs_by_base[base_code] = []
                             self._specs_by_base[base_code].append(spec.symbol)
                     
-                    self._last_refresh = datetime.now()
+                    self._last_refresh = refreshed_at
                     print(f"[SymbolSpecManager] {len(self._specs)}개 종목 로드 완료")
                 else:
                     print(f"[SymbolSpecManager] o3121 조회 실패: {resp.rsp_msg}")
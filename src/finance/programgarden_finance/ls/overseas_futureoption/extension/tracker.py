@@ -25,6 +25,7 @@ from .models import (
 from .calculator import FuturesPnLCalculator, DEFAULT_FEE_PER_CONTRACT
 from .symbol_spec_manager import SymbolSpecManager, SymbolSpec
 from .subscription_manager import SubscriptionManager
+from ...tr_base import AccountRequestSpacer
 
 # LS증권 API 응답 코드
 SUCCESS_CODES = {"00000", "00001"}  # 정상 응답
@@ -53,6 +54,7 @@ class FuturesAccountTracker:
     DEFAULT_REFRESH_INTERVAL = 60  # 1분
     DEFAULT_SPEC_REFRESH_HOURS = 6  # 6시간
     DEFAULT_ORDER_DELAY = 2  # 체결 후 재조회 대기 시간 (초)
+    ACCOUNT_TR_INTERVAL = 1  # 계좌 TR 시작 간격 (초, LS 는 계좌 단위로 TR 을 합산 제한)
     
     def __init__(
         self,
@@ -104,7 +106,10 @@ class FuturesAccountTracker:
         
         # Task 관리
         self._refresh_task: Optional[asyncio.Task] = None
+        # 체결 후 지연 재조회 대기 중이면 그 재조회가 잔고까지 다시 볼지 여부, 아니면 None
+        self._pending_refresh: Optional[bool] = None
         self._is_running = False
+        self._account_spacer = AccountRequestSpacer(self.ACCOUNT_TR_INTERVAL)
         
         # 에러 상태 저장 (서버 오류 등)
         self._last_errors: Dict[str, str] = {}
@@ -158,20 +163,17 @@ class FuturesAccountTracker:
         await self._cleanup_subscriptions()
     
     async def _fetch_all_data(self):
-        """모든 데이터 조회 (보유포지션, 예수금, 미체결)"""
-        # 보유포지션 조회 (CIDBQ01500)
-        await self._fetch_positions()
-        
-        # 잠시 대기 (rate limit)
-        await asyncio.sleep(1)
-        
-        # 예수금 조회 (CIDBQ03000)
-        await self._fetch_balance()
-        
-        await asyncio.sleep(1)
-        
-        # 미체결 주문 조회 (CIDBQ01800)
-        await self._fetch_open_orders()
+        """모든 데이터 조회 (보유포지션, 예수금, 미체결)
+
+        세 TR(CIDBQ01500 · CIDBQ03000 · CIDBQ01800)은 서로 독립이라 동시에 조회한다.
+        TR 별 rate limit 은 클라이언트가 지키고, 계좌 단위 합산 제한 때문에 각 조회의 시작은
+        `ACCOUNT_TR_INTERVAL` 간격으로 벌린다. 각 조회는 실패를 자체 기록한다.
+        """
+        await asyncio.gather(
+            self._fetch_positions(),
+            self._fetch_balance(),
+            self._fetch_open_orders(),
+        )
     
     async def _fetch_positions(self):
         """보유포지션 조회 (CIDBQ01500)"""
@@ -182,7 +184,7 @@ class FuturesAccountTracker:
             from datetime import datetime as dt
             
             query_date = dt.now().strftime("%Y%m%d")
-            logger.debug(f"[_fetch_positions] 요청 파라미터: QryDt={query_date}")
+            logger.debug("[_fetch_positions] 요청 파라미터: QryDt=%s", query_date)
             
             tr = self._accno_client.CIDBQ01500(
                 body=CIDBQ01500InBlock1(
@@ -193,13 +195,14 @@ class FuturesAccountTracker:
                     FcmAcntNo=""
                 ),
             )
+            await self._account_spacer.wait()
             resp = await tr.req_async()
             
             # 응답 코드 확인
             rsp_cd = getattr(resp, 'rsp_cd', '')
             rsp_msg = getattr(resp, 'rsp_msg', '')
-            logger.debug(f"[_fetch_positions] rsp_cd={rsp_cd}, rsp_msg={rsp_msg}")
-            logger.debug(f"[_fetch_positions] error_msg={getattr(resp, 'error_msg', None)}")
+            logger.debug("[_fetch_positions] rsp_cd=%s, rsp_msg=%s", rsp_cd, rsp_msg)
+            logger.debug("[_fetch_positions] error_msg=%s", getattr(resp, 'error_msg', None))
             
             # "데이터 없음" 응답 → 정상 케이스 (빈 데이터)
             if is_no_data_response(rsp_cd, rsp_msg):
@@ -217,10 +220,10 @@ class FuturesAccountTracker:
                 return
             
             block2_count = len(resp.block2) if hasattr(resp, 'block2') and resp.block2 else 0
-            logger.debug(f"[_fetch_positions] block2 개수: {block2_count}")
+            logger.debug("[_fetch_positions] block2 개수: %s", block2_count)
             
             # 첫 번째 아이템 상세 로깅
-            if hasattr(resp, 'block2') and resp.block2:
+            if logger.isEnabledFor(logging.DEBUG) and hasattr(resp, 'block2') and resp.block2:
                 first = resp.block2[0]
                 logger.debug(
                     f"[_fetch_positions] 첫번째 포지션: "
@@ -240,7 +243,10 @@ class FuturesAccountTracker:
             # block2에 보유포지션 데이터가 있음
             if hasattr(resp, 'block2') and resp.block2:
                 for item in resp.block2:
-                    symbol = getattr(item, 'IsuCodeVal', '')
+                    symbol = (getattr(item, 'IsuCodeVal', '') or '').strip()
+                    if not symbol:
+                        # 종목코드 없는 행은 spec 조회/포지션 생성 없이 건너뛴다 ("" 키 포지션 방지)
+                        continue
                     is_long = getattr(item, 'BnsTpCode', '2') == '2'  # 2: 매수
                     currency = getattr(item, 'CrcyCodeVal', 'USD')
                     
@@ -278,7 +284,10 @@ class FuturesAccountTracker:
                             position.pnl_rate = -position.pnl_rate
                     
                     self._positions[symbol] = position
-                    logger.debug(f"[_fetch_positions] 포지션 추가: {symbol}@{exchange_code} ({'LONG' if is_long else 'SHORT'}) x{position.quantity}")
+                    logger.debug(
+                        "[_fetch_positions] 포지션 추가: %s@%s (%s) x%s",
+                        symbol, exchange_code, 'LONG' if is_long else 'SHORT', position.quantity,
+                    )
                 
                 logger.info(f"[_fetch_positions] 총 {len(self._positions)}개 포지션 로드 완료")
             else:
@@ -313,13 +322,14 @@ class FuturesAccountTracker:
                     TrdDt=""
                 ),
             )
+            await self._account_spacer.wait()
             resp = await tr.req_async()
             
             # 응답 코드 확인
             rsp_cd = getattr(resp, 'rsp_cd', '')
             rsp_msg = getattr(resp, 'rsp_msg', '')
-            logger.debug(f"[_fetch_balance] rsp_cd={rsp_cd}, rsp_msg={rsp_msg}")
-            logger.debug(f"[_fetch_balance] error_msg={getattr(resp, 'error_msg', None)}")
+            logger.debug("[_fetch_balance] rsp_cd=%s, rsp_msg=%s", rsp_cd, rsp_msg)
+            logger.debug("[_fetch_balance] error_msg=%s", getattr(resp, 'error_msg', None))
             
             # "데이터 없음" 응답 → 정상 케이스 (빈 데이터)
             if is_no_data_response(rsp_cd, rsp_msg):
@@ -337,7 +347,7 @@ class FuturesAccountTracker:
                 return
             
             block2_count = len(resp.block2) if hasattr(resp, 'block2') and resp.block2 else 0
-            logger.debug(f"[_fetch_balance] block2 개수: {block2_count}")
+            logger.debug("[_fetch_balance] block2 개수: %s", block2_count)
             
             # block 데이터 처리 (block이 비어있으면 예수금 없음 = 정상 케이스)
             now = datetime.now()
@@ -348,7 +358,7 @@ class FuturesAccountTracker:
                 item = None
                 for b in resp.block2:
                     currency_code = getattr(b, 'CrcyObjCode', '')
-                    logger.debug(f"[_fetch_balance] 통화별 데이터: {currency_code}")
+                    logger.debug("[_fetch_balance] 통화별 데이터: %s", currency_code)
                     if currency_code == 'USD':
                         item = b
                         break
@@ -396,7 +406,7 @@ class FuturesAccountTracker:
             from datetime import datetime as dt
             
             query_date = dt.now().strftime("%Y%m%d")
-            logger.debug(f"[_fetch_open_orders] 요청 파라미터: OrdDt={query_date}")
+            logger.debug("[_fetch_open_orders] 요청 파라미터: OrdDt=%s", query_date)
             
             tr = self._accno_client.CIDBQ01800(
                 body=CIDBQ01800InBlock1(
@@ -411,13 +421,14 @@ class FuturesAccountTracker:
                     OvrsDrvtFnoTpCode="A"  # A: 전체
                 ),
             )
+            await self._account_spacer.wait()
             resp = await tr.req_async()
             
             # 응답 코드 확인
             rsp_cd = getattr(resp, 'rsp_cd', '')
             rsp_msg = getattr(resp, 'rsp_msg', '')
-            logger.debug(f"[_fetch_open_orders] rsp_cd={rsp_cd}, rsp_msg={rsp_msg}")
-            logger.debug(f"[_fetch_open_orders] error_msg={getattr(resp, 'error_msg', None)}")
+            logger.debug("[_fetch_open_orders] rsp_cd=%s, rsp_msg=%s", rsp_cd, rsp_msg)
+            logger.debug("[_fetch_open_orders] error_msg=%s", getattr(resp, 'error_msg', None))
             
             # "데이터 없음" 응답 → 정상 케이스 (빈 데이터)
             if is_no_data_response(rsp_cd, rsp_msg):
@@ -435,7 +446,7 @@ class FuturesAccountTracker:
                 return
             
             block2_count = len(resp.block2) if hasattr(resp, 'block2') and resp.block2 else 0
-            logger.debug(f"[_fetch_open_orders] block2 개수: {block2_count}")
+            logger.debug("[_fetch_open_orders] block2 개수: %s", block2_count)
             
             # block 데이터 처리 (block이 비어있으면 미체결 없음 = 정상 케이스)
             now = datetime.now()
@@ -467,9 +478,9 @@ class FuturesAccountTracker:
                     )
                     self._open_orders[order.order_no] = order
                     logger.debug(
-                        f"[_fetch_open_orders] 미체결 추가: #{order.order_no} "
-                        f"{order.symbol}@{exchange_code} {'매수' if order.is_long else '매도'} "
-                        f"{order.order_qty}계약 @{order.order_price}"
+                        "[_fetch_open_orders] 미체결 추가: #%s %s@%s %s %s계약 @%s",
+                        order.order_no, order.symbol, exchange_code,
+                        '매수' if order.is_long else '매도', order.order_qty, order.order_price,
                     )
                 
                 logger.info(f"[_fetch_open_orders] 총 {len(self._open_orders)}개 미체결 로드 완료")
@@ -602,8 +613,18 @@ class FuturesAccountTracker:
             logger.error(f"[_on_order_event] 주문 이벤트 처리 오류: {e}")
     
     async def _delayed_refresh(self):
-        """체결 후 지연 재조회"""
-        await asyncio.sleep(self.DEFAULT_ORDER_DELAY)
+        """체결 후 지연 재조회
+
+        대기 중에 들어온 체결 이벤트는 대기 중인 재조회 한 번으로 합친다.
+        """
+        if self._pending_refresh is not None:
+            return
+        self._pending_refresh = True
+        try:
+            await asyncio.sleep(self.DEFAULT_ORDER_DELAY)
+        finally:
+            # 조회 시작 전에 비워, 조회 중 들어온 체결은 다음 재조회로 잡히게 한다
+            self._pending_refresh = None
         await self._fetch_all_data()
     
     async def _periodic_refresh(self):
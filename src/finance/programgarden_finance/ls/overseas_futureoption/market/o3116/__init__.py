@@ -18,7 +18,7 @@ from .blocks import (
     O3116Response,
     O3116ResponseHeader,
 )
-from ....tr_base import TRRequestAbstract, OccursReqAbstract
+from ....tr_base import TRRequestAbstract, OccursReqAbstract, _pooled_client_session
 from programgarden_finance.ls.config import URLS
 from programgarden_finance.ls.status import RequestStatus
 
@@ -93,7 +93,7 @@ class TrO3116(TRRequestAbstract, OccursReqAbstract):
         return self._generic.req()
 
     async def req_async(self) -> O3116Response:
-        async with aiohttp.ClientSession() as session:
+        async with _pooled_client_session() as session:
             return await self._req_async_with_session(session)
 
     async def _req_async_with_session(self, session: aiohttp.ClientSession) -> O3116Response:
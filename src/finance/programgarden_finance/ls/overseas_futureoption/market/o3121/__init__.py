@@ -10,7 +10,7 @@ from .blocks import (
     O3121InBlock,
     O3121ResponseHeader
 )
-from ....tr_base import TRRequestAbstract
+from ....tr_base import TRRequestAbstract, _pooled_client_session
 from programgarden_finance.ls.config import URLS
 import logging
 
@@ -85,7 +85,7 @@ class TrO3121(TRRequestAbstract):
         return self._generic.req()
 
     async def req_async(self) -> O3121Response:
-        async with aiohttp.ClientSession() as session:
+        async with _pooled_client_session() as session:
             return await self._req_async_with_session(session)
 
     async def _req_async_with_session(self, session: aiohttp.ClientSession) -> O3121Response:
@@ -13,7 +13,7 @@ from .blocks import (
     O3126InBlock,
     O3126ResponseHeader
 )
-from ....tr_base import TRRequestAbstract, RetryReqAbstract
+from ....tr_base import TRRequestAbstract, RetryReqAbstract, _pooled_client_session
 from programgarden_finance.ls.status import RequestStatus
 from programgarden_finance.ls.config import URLS
 import logging
@@ -102,7 +102,7 @@ class TrO3126(TRRequestAbstract, RetryReqAbstract):
             return self._build_response(None, None, None, e)
 
     async def req_async(self) -> O3126Response:
-        async with aiohttp.ClientSession() as session:
+        async with _pooled_client_session() as session:
             return await self._req_async_with_session(session)
 
     async def _req_async_with_session(self, session: aiohttp.ClientSession) -> O3126Response:
@@ -148,7 +148,7 @@ class TrO3126(TRRequestAbstract, RetryReqAbstract):
 
     async def retry_req_async(self, callback: Callable[[Optional[O3126Response], RequestStatus], None], max_retries: int = 3, delay: int = 2):
         try:
-            async with aiohttp.ClientSession() as session:
+            async with _pooled_client_session() as session:
                 for attempt in range(max_retries):
                     callback(None, RequestStatus.REQUEST)
                     response = await self._req_async_with_session(session)
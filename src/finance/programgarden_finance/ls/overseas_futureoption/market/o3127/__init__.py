@@ -11,7 +11,7 @@ from .blocks import (
     O3127InBlock1,
     O3127ResponseHeader,
 )
-from ....tr_base import TRRequestAbstract
+from ....tr_base import TRRequestAbstract, _pooled_client_session
 from programgarden_finance.ls.config import URLS
 import logging
 
@@ -99,7 +99,7 @@ class TrO3127(TRRequestAbstract):
             return self._build_response(None, None, None, e)
 
     async def req_async(self) -> O3127Response:
-        async with aiohttp.ClientSession() as session:
+        async with _pooled_client_session() as session:
             return await self._req_async_with_session(session)
 
     async def _req_async_with_session(self, session: aiohttp.ClientSession) -> O3127Response:
@@ -13,7 +13,7 @@ from .blocks import (
     O3136Response,
     O3136ResponseHeader,
 )
-from ....tr_base import TRRequestAbstract, OccursReqAbstract
+from ....tr_base import TRRequestAbstract, OccursReqAbstract, _pooled_client_session
 from programgarden_finance.ls.config import URLS
 from programgarden_finance.ls.status import RequestStatus
 
@@ -99,7 +99,7 @@ class TrO3136(TRRequestAbstract, OccursReqAbstract):
             return self._build_response(None, None, None, e)
 
     async def req_async(self) -> O3136Response:
-        async with aiohttp.ClientSession() as session:
+        async with _pooled_client_session() as session:
             return await self._req_async_with_session(session)
 
     async def _req_async_with_session(self, session: aiohttp.ClientSession) -> O3136Response:
@@ -153,7 +153,7 @@ class TrO3136(TRRequestAbstract, OccursReqAbstract):
     async def occurs_req_async(self, callback: Optional[Callable[[Optional[O3136Response], RequestStatus], None]] = None, delay: int = 1) -> list[O3136Response]:
         results: list[O3136Response] = []
 
-        async with aiohttp.ClientSession() as session:
+        async with _pooled_client_session() as session:
             callback and callback(None, RequestStatus.REQUEST)
             response = await self._req_async_with_session(session)
             callback and callback(response, RequestStatus.RESPONSE)
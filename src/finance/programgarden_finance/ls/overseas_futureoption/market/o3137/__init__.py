@@ -13,7 +13,7 @@ from .blocks import (
     O3137Response,
     O3137ResponseHeader,
 )
-from ....tr_base import TRRequestAbstract, OccursReqAbstract
+from ....tr_base import TRRequestAbstract, OccursReqAbstract, _pooled_client_session
 from programgarden_finance.ls.config import URLS
 from programgarden_finance.ls.status import RequestStatus
 
@@ -81,7 +81,7 @@ class TrO3137(TRRequestAbstract, OccursReqAbstract):
             )
 
     async def req_async(self) -> O3137Response:
-        async with aiohttp.ClientSession() as session:
+        async with _pooled_client_session() as session:
             return await self._req_async_with_session(session)
 
     async def _req_async_with_session(self, session: aiohttp.ClientSession) -> O3137Response:
@@ -160,7 +160,7 @@ class TrO3137(TRRequestAbstract, OccursReqAbstract):
     async def occurs_req_async(self, callback: Optional[Callable[[Optional[O3137Response], RequestStatus], None]] = None, delay: int = 1) -> list[O3137Response]:
         results: list[O3137Response] = []
 
-        async with aiohttp.ClientSession() as session:
+        async with _pooled_client_session() as session:
             callback and callback(None, RequestStatus.REQUEST)
             response = await self._req_async_with_session(session)
             callback and callback(response, RequestStatus.RESPONSE)
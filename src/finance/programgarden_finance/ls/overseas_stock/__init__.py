@@ -3,6 +3,7 @@ from typing import Dict
 
 from programgarden_core.korea_alias import EnforceKoreanAliasMeta, require_korean_alias
 from programgarden_core.bases import BaseOverseasStock
+from programgarden_finance.ls.product_base import NamespaceCacheMixin
 from programgarden_finance.ls.token_manager import TokenManager
 
 from .accno import Accno
@@ -12,7 +13,7 @@ from .order import Order
 from .real import Real
 
 
-class OverseasStock(BaseOverseasStock):
+class OverseasStock(NamespaceCacheMixin, BaseOverseasStock):
 
     _real_instances: Dict[int, "Real"] = {}
 
@@ -23,28 +24,28 @@ class OverseasStock(BaseOverseasStock):
 
     @require_korean_alias
     def accno(self) -> Accno:
-        return Accno(token_manager=self.token_manager)
+        return self._namespace(Accno)
 
     계좌 = accno
     계좌.__doc__ = "계좌 정보를 조회합니다."
 
     @require_korean_alias
     def chart(self) -> Chart:
-        return Chart(token_manager=self.token_manager)
+        return self._namespace(Chart)
 
     차트 = chart
     차트.__doc__ = "차트 데이터를 조회합니다."
 
     @require_korean_alias
     def market(self) -> Market:
-        return Market(token_manager=self.token_manager)
+        return self._namespace(Market)
 
     시세 = market
     시세.__doc__ = "시세 데이터를 조회합니다."
 
     @require_korean_alias
     def order(self):
-        return Order(token_manager=self.token_manager)
+        return self._namespace(Order)
 
     주문 = order
     주문.__doc__ = "주문 정보를 조회합니다."
@@ -14,6 +14,7 @@ from decimal import Decimal
 from typing import Dict, List, Optional, Callable, Any, Set
 from datetime import datetime
 import asyncio
+import threading
 
 from .models import (
     StockPositionItem,
@@ -24,6 +25,7 @@ from .models import (
 )
 from .calculator import StockPnLCalculator
 from .subscription_manager import SubscriptionManager
+from ...tr_base import AccountRequestSpacer
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +35,21 @@ SUCCESS_CODES = {"00000", "00001"}  # 정상 응답
 # "데이터 없음" 판단 패턴 (rsp_msg에서 확인)
 NO_DATA_PATTERNS = ["없습니다", "없음", "no data", "not found", "조회내역"]
 
+# 미체결 조회(COSAQ00102) 고정 입력 — 매 갱신마다 달라지는 건 조회일자(OrdDt) 뿐
+OPEN_ORDERS_QUERY = {
+    "RecCnt": 1,
+    "QryTpCode": "1",
+    "BkseqTpCode": "1",
+    "OrdMktCode": "00",     # 전체
+    "BnsTpCode": "0",       # 전체
+    "IsuNo": "",
+    "SrtOrdNo": 999999999,
+    "ExecYn": "2",          # 2: 미체결
+    "CrcyCode": "000",      # 전체
+    "ThdayBnsAppYn": "0",
+    "LoanBalHldYn": "0",
+}
+
 
 def is_no_data_response(rsp_cd: str, rsp_msg: str) -> bool:
     """응답이 '데이터 없음' 케이스인지 판단"""
@@ -53,6 +70,7 @@ class StockAccountTracker:
     
     DEFAULT_REFRESH_INTERVAL = 60  # 1분
     DEFAULT_ORDER_DELAY = 3  # 체결 후 재조회 대기 시간 (초)
+    ACCOUNT_TR_INTERVAL = 2  # 계좌 TR 시작 간격 (초, LS 는 계좌 단위로 TR 을 합산 제한)
     
     def __init__(
         self,
@@ -105,8 +123,12 @@ class StockAccountTracker:
         
         # Task 관리
         self._refresh_task: Optional[asyncio.Task] = None
+        # 체결 후 지연 재조회가 대기 중인지 여부
+        self._pending_refresh = False
         self._is_running = False
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._account_spacer = AccountRequestSpacer(self.ACCOUNT_TR_INTERVAL)
+        self._loop_thread_id: Optional[int] = None  # self._loop 를 돌리는 스레드
 
         # 에러 상태 저장 (서버 오류 등)
         self._last_errors: Dict[str, str] = {}
@@ -118,6 +140,7 @@ class StockAccountTracker:
         
         self._is_running = True
         self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
 
         # 1. WebSocket 연결 (없으면 예외)
         if not self._real_client:
@@ -156,15 +179,16 @@ class StockAccountTracker:
         await self._cleanup_subscriptions()
     
     async def _fetch_all_data(self):
-        """모든 데이터 조회 (보유종목, 예수금, 미체결)"""
-        # 보유종목 조회 (COSOQ00201)
-        await self._fetch_positions()
-        
-        # 잠시 대기 (rate limit)
-        await asyncio.sleep(2)
-        
-        # 미체결 주문 조회 (COSAQ00102)
-        await self._fetch_open_orders()
+        """모든 데이터 조회 (보유종목, 예수금, 미체결)
+
+        COSOQ00201(보유종목·예수금)과 COSAQ00102(미체결)는 서로 독립이라 동시에 조회한다.
+        TR 별 rate limit 은 클라이언트가 지키고, 계좌 단위 합산 제한 때문에 각 조회의 시작은
+        `ACCOUNT_TR_INTERVAL` 간격으로 벌린다. 각 조회는 실패를 자체 기록한다.
+        """
+        await asyncio.gather(
+            self._fetch_positions(),
+            self._fetch_open_orders(),
+        )
     
     async def _fetch_positions(self):
         """보유종목 조회 (COSOQ00201)"""
@@ -180,6 +204,7 @@ class StockAccountTracker:
                     AstkBalTpCode="00"
                 ),
             )
+            await self._account_spacer.wait()
             resp = await tr.req_async()
             
             # 응답 코드 확인
@@ -231,6 +256,9 @@ class StockAccountTracker:
             if hasattr(resp, 'block4') and resp.block4:
                 for item in resp.block4:
                     symbol = item.ShtnIsuNo  # 단축종목번호 (예: SOXL)
+                    if not symbol:
+                        # 종목코드 없는 행은 모델 검증(생성) 전에 건너뛴다
+                        continue
                     position = StockPositionItem(
                         symbol=symbol,
                         symbol_name=item.JpnMktHanglIsuNm or symbol,
@@ -278,20 +306,11 @@ class StockAccountTracker:
             
             tr = self._accno_client.cosaq00102(
                 body=COSAQ00102InBlock1(
-                    RecCnt=1,
-                    QryTpCode="1",
-                    BkseqTpCode="1",
-                    OrdMktCode="00",  # 전체
-                    BnsTpCode="0",    # 전체
-                    IsuNo="",
-                    SrtOrdNo=999999999,
+                    **OPEN_ORDERS_QUERY,
                     OrdDt=dt.now().strftime("%Y%m%d"),
-                    ExecYn="2",       # 2: 미체결
-                    CrcyCode="000",   # 전체
-                    ThdayBnsAppYn="0",
-                    LoanBalHldYn="0"
                 ),
             )
+            await self._account_spacer.wait()
             resp = await tr.req_async()
             
             # 응답 코드 확인
@@ -468,8 +487,21 @@ class StockAccountTracker:
             print(f"[StockAccountTracker] 주문 이벤트 처리 오류: {e}")
     
     async def _delayed_refresh(self):
-        """체결 후 지연 재조회"""
-        await asyncio.sleep(self.DEFAULT_ORDER_DELAY)
+        """체결 후 지연 재조회
+
+        정정/취소 완료도 묶여 있던 주문가능금액을 풀어 주는데, 이 추적기에서 예수금은
+        COSOQ00201 응답에서만 채워지므로 체결과 똑같이 전체를 다시 조회한다.
+        대기 중에 들어온 주문 이벤트는 새로 예약하지 않고 대기 중인 재조회 한 번으로
+        합친다 (바스켓 주문 체결이 몰려도 TR 은 한 벌).
+        """
+        if self._pending_refresh:
+            return
+        self._pending_refresh = True
+        try:
+            await asyncio.sleep(self.DEFAULT_ORDER_DELAY)
+        finally:
+            # 조회 시작 전에 비워, 조회 중 들어온 이벤트는 다음 재조회로 잡히게 한다
+            self._pending_refresh = False
         await self._fetch_all_data()
     
     async def _periodic_refresh(self):
@@ -481,17 +513,21 @@ class StockAccountTracker:
     
     def _schedule_coroutine(self, coro):
         """스레드 안전하게 코루틴 스케줄링 (WebSocket 콜백 스레드 대응)"""
+        # 실시간 콜백은 대부분 WebSocket 스레드(루프 없음)에서 들어오므로, 예외로
+        # 분기하기 전에 start() 때 기록한 루프 스레드와 비교해 먼저 가른다.
+        loop = self._loop  # 로컬 복사로 TOCTOU 방지
+        if loop is not None and threading.get_ident() != self._loop_thread_id:
+            # WebSocket 콜백 등 별도 스레드에서 호출 시
+            try:
+                asyncio.run_coroutine_threadsafe(coro, loop)
+            except RuntimeError:
+                coro.close()  # loop already closed
+            return
+
         try:
-            asyncio.get_running_loop()
-            asyncio.create_task(coro)
+            asyncio.get_running_loop().create_task(coro)
         except RuntimeError:
-            # WebSocket 콜백 등 별도 스레드에서 호출 시
-            loop = self._loop  # 로컬 복사로 TOCTOU 방지
-            if loop is not None:
-                try:
-                    asyncio.run_coroutine_threadsafe(coro, loop)
-                except RuntimeError:
-                    pass  # loop already closed
+            coro.close()  # No event loop running
 
     # ===== 계좌 수익률 계산 =====
     def _calculate_account_pnl(self) -> AccountPnLInfo:
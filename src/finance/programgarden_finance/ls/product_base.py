@@ -0,0 +1,24 @@
+from typing import Dict, Type, TypeVar
+
+
+N = TypeVar("N")
+
+
+class NamespaceCacheMixin:
+    """상품 래퍼(OverseasStock / OverseasFutureoption / KoreaStock)의 하위 네임스페이스 캐시.
+
+    accno/market/order … 네임스페이스는 token_manager 외 상태가 없어 래퍼당 한 번만 만든다.
+    래퍼는 ``self.token_manager`` 를 가지고 있어야 한다.
+    """
+
+    _namespaces: Dict[type, object]
+
+    def _namespace(self, namespace_cls: Type[N]) -> N:
+        try:
+            namespaces = self._namespaces
+        except AttributeError:
+            namespaces = self._namespaces = {}
+        namespace = namespaces.get(namespace_cls)
+        if namespace is None:
+            namespace = namespaces[namespace_cls] = namespace_cls(token_manager=self.token_manager)
+        return namespace
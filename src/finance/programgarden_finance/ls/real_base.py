@@ -30,6 +30,39 @@ T = TypeVar("T")
 # KO: tr_cd에 대응하는 응답/헤더/바디 모델 캐시입니다 (없으면 None)
 _RESPONSE_CLASS_CACHE: Dict[str, Optional[tuple]] = {}
 
+# EN: per-symbol real-time TRs -> block module holding ``<tr_cd>RealRequest``/``Body``.
+# KO: 종목 단위 실시간 TR 의 요청 블록 모듈입니다 (등록/해제 공용). 모듈은 TR 을
+#     처음 쓸 때 import 하고 클래스는 _REQUEST_CLASS_CACHE 에 둡니다.
+_SYMBOL_REQUEST_MODULES: Dict[str, str] = {
+    # 해외주식 시세
+    "GSC": "programgarden_finance.ls.overseas_stock.real.GSC.blocks",
+    "GSH": "programgarden_finance.ls.overseas_stock.real.GSH.blocks",
+    # 해외선물 시세
+    "OVC": "programgarden_finance.ls.overseas_futureoption.real.OVC.blocks",
+    "OVH": "programgarden_finance.ls.overseas_futureoption.real.OVH.blocks",
+    "WOC": "programgarden_finance.ls.overseas_futureoption.real.WOC.blocks",
+    "WOH": "programgarden_finance.ls.overseas_futureoption.real.WOH.blocks",
+    # 국내주식 시세 (8개)
+    "S3_": "programgarden_finance.ls.korea_stock.real.S3_.blocks",
+    "K3_": "programgarden_finance.ls.korea_stock.real.K3_.blocks",
+    "H1_": "programgarden_finance.ls.korea_stock.real.H1_.blocks",
+    "HA_": "programgarden_finance.ls.korea_stock.real.HA_.blocks",
+    "NH1": "programgarden_finance.ls.korea_stock.real.NH1.blocks",
+    "IJ_": "programgarden_finance.ls.korea_stock.real.IJ_.blocks",
+    "DVI": "programgarden_finance.ls.korea_stock.real.DVI.blocks",
+    "NVI": "programgarden_finance.ls.korea_stock.real.NVI.blocks",
+    # 공용 TR (broker-agnostic): JIF 장운영정보
+    "JIF": "programgarden_finance.ls.common.real.JIF.blocks",
+}
+
+# EN: TRs whose tr_key is fixed regardless of the requested symbols.
+# KO: 종목과 무관하게 tr_key 가 고정인 TR 입니다 (JIF 는 "0" = 전체 시장).
+_FIXED_TR_KEYS: Dict[str, str] = {"JIF": "0"}
+
+# EN: tr_cd -> (request_model, request_body_model)
+# KO: tr_cd 에 대응하는 요청/바디 모델 캐시입니다.
+_REQUEST_CLASS_CACHE: Dict[str, tuple] = {}
+
 # candidate module roots where tr_cd modules may live; keep order from most likely to least
 # EN: search bases for dynamic imports; KO: 동적 import 시도 순서를 정의합니다.
 _RESPONSE_MODULE_BASES = [
@@ -255,6 +288,8 @@ class RealRequestAbstract(ABC):
                         import time as _time
                         self._last_message_time = _time.time()
                         _staleness_warned = False
+                        # 수신 루프는 같은 이벤트 루프에서 돌므로 메시지마다 조회하지 않는다
+                        loop = asyncio.get_running_loop()
 
                         while not self._stop:
                             try:
@@ -357,8 +392,6 @@ class RealRequestAbstract(ABC):
                             if on_message is None:
                                 continue
 
-                            loop = asyncio.get_running_loop()
-
                             # async handler: schedule a task
                             if inspect.iscoroutinefunction(on_message):
                                 try:
@@ -566,16 +599,18 @@ class RealRequestAbstract(ABC):
         if self._ws is None:
             raise RuntimeError("WebSocket is not connected")
 
+        # 배치 내 중복 제거(순서 보존) 후 기존 미구독 심볼만 신규로 집계한다.
+        # 기존 목록은 set 으로 한 번 바꿔, 심볼마다 리스트를 훑지 않는다.
+        existing_for_tr = set(self._subscribed_symbols.get(tr_cd, ()))
+        new_unique = [
+            sym for sym in dict.fromkeys(symbols)
+            if sym not in existing_for_tr
+        ]
+
         # A-6: 연결당 구독 종목 수 cap 검사 (mutate 전에 거부).
         # 이미 구독 중인 심볼은 재구독(재연결 자동 재구독 포함)에서 카운트 0이므로
         # current_total 을 넘기지 않는다. 신규 unique 만 cap 에 더해 검사한다.
         if self._max_subscribe_symbols > 0:
-            existing_for_tr = self._subscribed_symbols.get(tr_cd, [])
-            # 배치 내 중복 제거(순서 보존) 후 기존 미구독 심볼만 신규로 집계
-            new_unique = [
-                sym for sym in dict.fromkeys(symbols)
-                if sym not in existing_for_tr
-            ]
             current_total = self.get_subscription_count()
             projected = current_total + len(new_unique)
             if projected > self._max_subscribe_symbols:
@@ -588,149 +623,9 @@ class RealRequestAbstract(ABC):
                 )
 
         # 구독 심볼 추적 (재연결 시 자동 재구독용)
-        if tr_cd not in self._subscribed_symbols:
-            self._subscribed_symbols[tr_cd] = []
-        for sym in symbols:
-            if sym not in self._subscribed_symbols[tr_cd]:
-                self._subscribed_symbols[tr_cd].append(sym)
-
-        for symbol in symbols:
-
-            if tr_cd == "GSC":
-                from programgarden_finance.ls.overseas_stock.real.GSC.blocks import GSCRealRequest, GSCRealRequestBody
-                req = GSCRealRequest(
-                    body=GSCRealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "3"
-            elif tr_cd == "GSH":
-                from programgarden_finance.ls.overseas_stock.real.GSH.blocks import GSHRealRequest, GSHRealRequestBody
-                req = GSHRealRequest(
-                    body=GSHRealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "3"
-            elif tr_cd == "OVC":
-                from programgarden_finance.ls.overseas_futureoption.real.OVC.blocks import OVCRealRequest, OVCRealRequestBody
-                req = OVCRealRequest(
-                    body=OVCRealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "3"
-            elif tr_cd == "OVH":
-                from programgarden_finance.ls.overseas_futureoption.real.OVH.blocks import OVHRealRequest, OVHRealRequestBody
-                req = OVHRealRequest(
-                    body=OVHRealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "3"
-            elif tr_cd == "WOC":
-                from programgarden_finance.ls.overseas_futureoption.real.WOC.blocks import WOCRealRequest, WOCRealRequestBody
-                req = WOCRealRequest(
-                    body=WOCRealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "3"
-            elif tr_cd == "WOH":
-                from programgarden_finance.ls.overseas_futureoption.real.WOH.blocks import WOHRealRequest, WOHRealRequestBody
-                req = WOHRealRequest(
-                    body=WOHRealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "3"
-            # ─── 국내주식 시세 TR (8개) ───
-            elif tr_cd == "S3_":
-                from programgarden_finance.ls.korea_stock.real.S3_.blocks import S3_RealRequest, S3_RealRequestBody
-                req = S3_RealRequest(
-                    body=S3_RealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "3"
-            elif tr_cd == "K3_":
-                from programgarden_finance.ls.korea_stock.real.K3_.blocks import K3_RealRequest, K3_RealRequestBody
-                req = K3_RealRequest(
-                    body=K3_RealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "3"
-            elif tr_cd == "H1_":
-                from programgarden_finance.ls.korea_stock.real.H1_.blocks import H1_RealRequest, H1_RealRequestBody
-                req = H1_RealRequest(
-                    body=H1_RealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "3"
-            elif tr_cd == "HA_":
-                from programgarden_finance.ls.korea_stock.real.HA_.blocks import HA_RealRequest, HA_RealRequestBody
-                req = HA_RealRequest(
-                    body=HA_RealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "3"
-            elif tr_cd == "NH1":
-                from programgarden_finance.ls.korea_stock.real.NH1.blocks import NH1RealRequest, NH1RealRequestBody
-                req = NH1RealRequest(
-                    body=NH1RealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "3"
-            elif tr_cd == "IJ_":
-                from programgarden_finance.ls.korea_stock.real.IJ_.blocks import IJ_RealRequest, IJ_RealRequestBody
-                req = IJ_RealRequest(
-                    body=IJ_RealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "3"
-            elif tr_cd == "DVI":
-                from programgarden_finance.ls.korea_stock.real.DVI.blocks import DVIRealRequest, DVIRealRequestBody
-                req = DVIRealRequest(
-                    body=DVIRealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "3"
-            elif tr_cd == "NVI":
-                from programgarden_finance.ls.korea_stock.real.NVI.blocks import NVIRealRequest, NVIRealRequestBody
-                req = NVIRealRequest(
-                    body=NVIRealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "3"
-            # ─── 공용 TR (broker-agnostic): JIF 장운영정보 ───
-            elif tr_cd == "JIF":
-                from programgarden_finance.ls.common.real.JIF.blocks import JIFRealRequest, JIFRealRequestBody
-                req = JIFRealRequest(
-                    body=JIFRealRequestBody(
-                        tr_cd="JIF",
-                        tr_key="0",
-                    )
-                )
-                req.header.tr_type = "3"
-            else:
-                continue
-
-            if req is None:
-                break
-
-            req.header.token = self._token_manager.access_token
+        self._subscribed_symbols.setdefault(tr_cd, []).extend(new_unique)
 
-            req = {"header": req.header.model_dump(), "body": req.body.model_dump()}
-
-            # print(f"Sending real request: {req}, {self._ws}")
-            asyncio.create_task(self._ws.send(json.dumps(req)))
+        self._send_symbol_requests(symbols, tr_cd, tr_type="3")
 
     def _remove_message_symbols(self, symbols: List[str], tr_cd: str):
         """Unsubscribe from real-time feeds for given symbols.
@@ -749,145 +644,48 @@ class RealRequestAbstract(ABC):
         if self._ws is None:
             raise RuntimeError("WebSocket is not connected")
 
-        # 구독 추적에서 제거
+        # 구독 추적에서 제거 (해제 목록을 set 으로 한 번 만들어 남길 것만 거른다)
         if tr_cd in self._subscribed_symbols:
-            for sym in symbols:
-                try:
-                    self._subscribed_symbols[tr_cd].remove(sym)
-                except ValueError:
-                    pass
-            if not self._subscribed_symbols[tr_cd]:
+            removed = set(symbols)
+            remaining = [sym for sym in self._subscribed_symbols[tr_cd] if sym not in removed]
+            if remaining:
+                self._subscribed_symbols[tr_cd] = remaining
+            else:
                 del self._subscribed_symbols[tr_cd]
 
-        for symbol in symbols:
+        self._send_symbol_requests(symbols, tr_cd, tr_type="4")
 
-            if tr_cd == "GSC":
-                from programgarden_finance.ls.overseas_stock.real.GSC.blocks import GSCRealRequest, GSCRealRequestBody
-                req = GSCRealRequest(
-                    body=GSCRealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "4"
-            elif tr_cd == "GSH":
-                from programgarden_finance.ls.overseas_stock.real.GSH.blocks import GSHRealRequest, GSHRealRequestBody
-                req = GSHRealRequest(
-                    body=GSHRealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "4"
-            elif tr_cd == "OVC":
-                from programgarden_finance.ls.overseas_futureoption.real.OVC.blocks import OVCRealRequest, OVCRealRequestBody
-                req = OVCRealRequest(
-                    body=OVCRealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "4"
-            elif tr_cd == "OVH":
-                from programgarden_finance.ls.overseas_futureoption.real.OVH.blocks import OVHRealRequest, OVHRealRequestBody
-                req = OVHRealRequest(
-                    body=OVHRealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "4"
-            elif tr_cd == "WOC":
-                from programgarden_finance.ls.overseas_futureoption.real.WOC.blocks import WOCRealRequest, WOCRealRequestBody
-                req = WOCRealRequest(
-                    body=WOCRealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "4"
-            elif tr_cd == "WOH":
-                from programgarden_finance.ls.overseas_futureoption.real.WOH.blocks import WOHRealRequest, WOHRealRequestBody
-                req = WOHRealRequest(
-                    body=WOHRealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "4"
-            # ─── 국내주식 시세 TR (8개) ───
-            elif tr_cd == "S3_":
-                from programgarden_finance.ls.korea_stock.real.S3_.blocks import S3_RealRequest, S3_RealRequestBody
-                req = S3_RealRequest(
-                    body=S3_RealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "4"
-            elif tr_cd == "K3_":
-                from programgarden_finance.ls.korea_stock.real.K3_.blocks import K3_RealRequest, K3_RealRequestBody
-                req = K3_RealRequest(
-                    body=K3_RealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "4"
-            elif tr_cd == "H1_":
-                from programgarden_finance.ls.korea_stock.real.H1_.blocks import H1_RealRequest, H1_RealRequestBody
-                req = H1_RealRequest(
-                    body=H1_RealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "4"
-            elif tr_cd == "HA_":
-                from programgarden_finance.ls.korea_stock.real.HA_.blocks import HA_RealRequest, HA_RealRequestBody
-                req = HA_RealRequest(
-                    body=HA_RealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "4"
-            elif tr_cd == "NH1":
-                from programgarden_finance.ls.korea_stock.real.NH1.blocks import NH1RealRequest, NH1RealRequestBody
-                req = NH1RealRequest(
-                    body=NH1RealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "4"
-            elif tr_cd == "IJ_":
-                from programgarden_finance.ls.korea_stock.real.IJ_.blocks import IJ_RealRequest, IJ_RealRequestBody
-                req = IJ_RealRequest(
-                    body=IJ_RealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "4"
-            elif tr_cd == "DVI":
-                from programgarden_finance.ls.korea_stock.real.DVI.blocks import DVIRealRequest, DVIRealRequestBody
-                req = DVIRealRequest(
-                    body=DVIRealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "4"
-            elif tr_cd == "NVI":
-                from programgarden_finance.ls.korea_stock.real.NVI.blocks import NVIRealRequest, NVIRealRequestBody
-                req = NVIRealRequest(
-                    body=NVIRealRequestBody(
-                        tr_key=symbol
-                    )
-                )
-                req.header.tr_type = "4"
-            # ─── 공용 TR (broker-agnostic): JIF 장운영정보 해제 ───
-            elif tr_cd == "JIF":
-                from programgarden_finance.ls.common.real.JIF.blocks import JIFRealRequest, JIFRealRequestBody
-                req = JIFRealRequest(
-                    body=JIFRealRequestBody(
-                        tr_cd="JIF",
-                        tr_key="0",
-                    )
-                )
-                req.header.tr_type = "4"
+    def _send_symbol_requests(self, symbols: List[str], tr_cd: str, tr_type: str):
+        """Send one register/unregister frame per symbol for a per-symbol TR.
 
-            if req is None:
-                break
+        EN:
+            Looks the TR's request models up once (``_SYMBOL_REQUEST_MODULES``)
+            instead of walking an ``if``/``elif`` ladder for every symbol.
+            Unknown TRs are ignored.
 
+        KO:
+            TR 별 요청 모델을 한 번 찾아 모든 종목에 씁니다 (종목마다 TR 분기를
+            다시 타지 않습니다). 모르는 TR 은 아무것도 보내지 않습니다.
+        """
+        classes = _REQUEST_CLASS_CACHE.get(tr_cd)
+        if classes is None:
+            module_path = _SYMBOL_REQUEST_MODULES.get(tr_cd)
+            if module_path is None:
+                return
+            module = importlib.import_module(module_path)
+            classes = (
+                getattr(module, f"{tr_cd}RealRequest"),
+                getattr(module, f"{tr_cd}RealRequestBody"),
+            )
+            _REQUEST_CLASS_CACHE[tr_cd] = classes
+        request_model, body_model = classes
+        fixed_tr_key = _FIXED_TR_KEYS.get(tr_cd)
+
+        for symbol in symbols:
+            req = request_model(
+                body=body_model(tr_cd=tr_cd, tr_key=fixed_tr_key or symbol)
+            )
+            req.header.tr_type = tr_type
             req.header.token = self._token_manager.access_token
 
             req = {"header": req.header.model_dump(), "body": req.body.model_dump()}
@@ -10,7 +10,7 @@ import logging
 import math
 import threading
 import time
-from typing import Any, Callable, Dict, Literal, Optional, TypeVar
+from typing import Any, AsyncGenerator, Callable, Dict, Literal, Optional, Tuple, TypeVar
 
 import aiohttp
 import requests
@@ -34,6 +34,114 @@ TRresponse = TypeVar("TRresponse")
 _ACCOUNT_RATE_REGISTRY: Dict[str, dict] = {}
 
 
+# Per-thread HTTP session for synchronous TR requests. ``requests.post`` opens a
+# fresh connection (TCP + TLS handshake) on every call; a Session keeps the
+# connection alive so repeated requests from the same worker thread (e.g. the
+# per-symbol quote lookups run via the default thread pool) reuse it.
+# Thread-local because ``requests.Session`` is not documented as thread-safe.
+_SYNC_SESSIONS = threading.local()
+
+
+def _sync_session() -> requests.Session:
+    """Return this thread's shared ``requests.Session`` (created on first use)."""
+    session = getattr(_SYNC_SESSIONS, "session", None)
+    if session is None:
+        session = requests.Session()
+        _SYNC_SESSIONS.session = session
+    return session
+
+
+# Per-event-loop connection pool for async TR requests. ``req_async`` used to
+# open a fresh ``aiohttp.ClientSession`` (and with it a new TCP + TLS
+# connection) per call. Sessions still live for one request, but they share
+# this loop's connector so keep-alive connections are reused across calls.
+# One connector per loop because an aiohttp connector is bound to the loop it
+# was created on. The connector holds a strong reference to its loop, so a
+# weak mapping would never drop it: each entry is instead closed and removed
+# when its loop shuts down (see ``_close_connector_on_loop_shutdown``).
+_ASYNC_CONNECTORS: Dict[asyncio.AbstractEventLoop, Tuple[aiohttp.TCPConnector, AsyncGenerator]] = {}
+# Loops may run in different threads; every read-modify-write of the dict holds this.
+_ASYNC_CONNECTORS_LOCK = threading.Lock()
+
+
+async def _close_connector_on_loop_shutdown(
+    loop: asyncio.AbstractEventLoop, connector: aiohttp.TCPConnector
+) -> AsyncGenerator[None, None]:
+    """Park until the loop finalizes its async generators, then close ``connector``.
+
+    ``asyncio.run`` (and any loop owner calling ``loop.shutdown_asyncgens()``)
+    closes every live async generator before closing the loop, which makes this
+    the loop's shutdown hook.
+    """
+    try:
+        yield
+    finally:
+        with _ASYNC_CONNECTORS_LOCK:
+            entry = _ASYNC_CONNECTORS.get(loop)
+            if entry is not None and entry[0] is connector:
+                _ASYNC_CONNECTORS.pop(loop, None)
+        await connector.close()
+
+
+def _drop_connectors_of_closed_loops() -> None:
+    """Forget connectors whose loop was closed without running the shutdown hook.
+
+    Caller must hold ``_ASYNC_CONNECTORS_LOCK``. The connector cannot be closed
+    any more (its loop is gone), so the leak is logged instead.
+    """
+    for loop in [loop for loop in _ASYNC_CONNECTORS if loop.is_closed()]:
+        entry = _ASYNC_CONNECTORS.pop(loop, None)
+        if entry is not None and not entry[0].closed:
+            logger.warning(
+                "Dropping unclosed aiohttp connector of a loop closed without shutdown_asyncgens(): %r",
+                entry[0],
+            )
+
+
+def _async_connector() -> aiohttp.TCPConnector:
+    """Return the running loop's shared ``aiohttp.TCPConnector`` (created on first use)."""
+    loop = asyncio.get_running_loop()
+    with _ASYNC_CONNECTORS_LOCK:
+        entry = _ASYNC_CONNECTORS.get(loop)
+        if entry is not None and not entry[0].closed:
+            return entry[0]
+        _drop_connectors_of_closed_loops()
+        connector = aiohttp.TCPConnector()
+        shutdown_hook = _close_connector_on_loop_shutdown(loop, connector)
+        _ASYNC_CONNECTORS[loop] = (connector, shutdown_hook)
+    # The first iteration registers the generator with the loop. The loop only
+    # tracks it weakly, so the cache entry keeps it alive.
+    loop.create_task(shutdown_hook.__anext__())
+    return connector
+
+
+def _pooled_client_session() -> aiohttp.ClientSession:
+    """A short-lived ``ClientSession`` over the loop's shared connector."""
+    return aiohttp.ClientSession(connector=_async_connector(), connector_owner=False)
+
+
+class AccountRequestSpacer:
+    """Keep the start of one account's TR requests at least ``interval`` seconds apart.
+
+    LS counts requests per account across all TRs, so the account trackers
+    can overlap their balance / deposit / open-order queries but still
+    must not start them back to back. Each caller reserves the next free
+    slot and sleeps until it comes up. There is no await between reading and
+    advancing the slot, so no lock is needed on a single event loop.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_slot)
+        self._next_slot = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
 class _RateBucket:
     """Sliding-window rate-limit bucket shared across instances by key.
 
@@ -266,7 +374,7 @@ class TRRequestAbstract(ABC):
             else:
                 self.wait_until_available()
 
-            resp = requests.post(
+            resp = _sync_session().post(
                 url=url,
                 headers=request_data.header.model_dump(by_alias=True),
                 json=self._build_json_body(request_data),
@@ -10,7 +10,7 @@ from programgarden_finance.ls.config import URLS
 logger = logging.getLogger("programgarden.ls.tr_helpers")
 from programgarden_finance.ls.status import RequestStatus
 from programgarden_finance.ls.token_manager import TokenManager
-from .tr_base import TRAccnoAbstract
+from .tr_base import TRAccnoAbstract, _pooled_client_session
 
 
 R = TypeVar("R")
@@ -134,7 +134,7 @@ class GenericTR(TRAccnoAbstract, Generic[R]):
 
     async def req_async(self) -> R:
         try:
-            async with aiohttp.ClientSession() as session:
+            async with _pooled_client_session() as session:
                 resp, resp_json, resp_headers = await self._execute_async_with_retry(session)
                 result: R = self._response_builder(resp, resp_json, resp_headers, None)
                 if hasattr(result, "raw_data"):
@@ -266,7 +266,7 @@ class GenericTR(TRAccnoAbstract, Generic[R]):
         """
         results: list[R] = []
 
-        async with aiohttp.ClientSession() as session:
+        async with _pooled_client_session() as session:
             callback and callback(None, RequestStatus.REQUEST)
             response = await self._req_async_with_session(session)
             callback and callback(response, RequestStatus.RESPONSE)
@@ -107,6 +107,20 @@ def test_intra_batch_duplicates_collapse():
     assert real.get_subscription_count() == 2
 
 
+def test_unsubscribe_frees_capacity_in_order():
+    real = _connected_real()
+    _subscribe(real, _syms(5), "GSC")
+    with patch("asyncio.create_task"):
+        real._remove_message_symbols(["SYM0001", "SYM0003", "NOT_TRACKED"], "GSC")
+    assert real.get_subscribed_symbols()["GSC"] == ["SYM0000", "SYM0002", "SYM0004"]
+
+    # 추적 목록 자체를 넘겨도 전부 해제된다 (순회 중 제거로 건너뛰지 않는다)
+    with patch("asyncio.create_task"):
+        real._remove_message_symbols(real.get_subscribed_symbols()["GSC"], "GSC")
+    assert "GSC" not in real.get_subscribed_symbols()
+    assert real.get_subscription_count() == 0
+
+
 # ── cap spans all TR codes on the connection ─────────────────────────────────
 
 def test_cap_is_summed_across_tr_codes():
@@ -0,0 +1,67 @@
+"""Async TR requests share one keep-alive connector per event loop.
+
+``req_async`` used to open a new ``aiohttp.ClientSession`` (and connection)
+per call. Sessions are still per request, but they now borrow the running
+loop's ``TCPConnector`` without owning it, so pooled connections survive.
+The connector is closed and forgotten when its loop shuts down; a loop closed
+without ``shutdown_asyncgens()`` has its entry dropped and the leak logged.
+"""
+
+import asyncio
+import logging
+
+import pytest
+
+from programgarden_finance.ls.tr_base import (
+    _ASYNC_CONNECTORS,
+    _async_connector,
+    _pooled_client_session,
+)
+
+
+@pytest.mark.asyncio
+async def test_same_loop_reuses_connector():
+    assert _async_connector() is _async_connector()
+
+
+@pytest.mark.asyncio
+async def test_closing_session_keeps_shared_connector_open():
+    async with _pooled_client_session() as session:
+        assert session.connector is _async_connector()
+    assert not _async_connector().closed
+
+
+def test_each_loop_gets_its_own_connector():
+    async def _get():
+        return _async_connector()
+
+    first = asyncio.run(_get())
+    second = asyncio.run(_get())
+    assert first is not second
+
+
+def test_connector_closed_and_dropped_when_loop_shuts_down():
+    async def _get():
+        connector = _async_connector()
+        await asyncio.sleep(0)  # let the shutdown hook start
+        return connector
+
+    connectors = [asyncio.run(_get()) for _ in range(3)]
+    assert all(c.closed for c in connectors)
+    assert not any(entry[0] in connectors for entry in _ASYNC_CONNECTORS.values())
+
+
+def test_connector_of_loop_closed_without_shutdown_is_dropped_and_logged(caplog):
+    async def _get():
+        return _async_connector()
+
+    loop = asyncio.new_event_loop()
+    leaked = loop.run_until_complete(_get())
+    loop.close()  # no shutdown_asyncgens(): the hook never runs
+
+    with caplog.at_level(logging.WARNING, logger="programgarden.ls.tr_base"):
+        asyncio.run(_get())
+
+    assert loop not in _ASYNC_CONNECTORS
+    assert not leaked.closed
+    assert "Dropping unclosed aiohttp connector" in caplog.text
@@ -979,6 +979,50 @@ class TestKrStockAccountTrackerCreation:
         tracker = KrStockAccountTracker(accno_client=accno_client)
         assert tracker.get_current_price("005930") is None
 
+    @pytest.mark.asyncio
+    async def test_fetch_all_data_queries_concurrently(self):
+        """보유종목/예수금/미체결 조회가 서로를 기다리지 않고 동시에 진행."""
+        tracker = KrStockAccountTracker(accno_client=self._make_accno_client())
+        started = []
+        release = asyncio.Event()
+
+        def _fake_fetch(name):
+            async def _fetch():
+                started.append(name)
+                await release.wait()
+            return _fetch
+
+        tracker._fetch_positions = _fake_fetch("positions")
+        tracker._fetch_balance = _fake_fetch("balance")
+        tracker._fetch_open_orders = _fake_fetch("open_orders")
+
+        task = asyncio.create_task(tracker._fetch_all_data())
+        await asyncio.sleep(0.05)
+        assert started == ["positions", "balance", "open_orders"]
+
+        release.set()
+        await asyncio.wait_for(task, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_fetch_positions_skips_rows_without_symbol(self):
+        """종목코드가 빈 t0424 행은 포지션으로 만들지 않는다."""
+        def _row(expcode):
+            return MagicMock(
+                expcode=expcode, hname="삼성전자", janqty=10, mdposqt=10,
+                pamt=70000, price=71000, mamt=700000, appamt=710000,
+                dtsunik=10000, sunikrt=1.43, marketgb="1",
+            )
+
+        resp = MagicMock(rsp_cd="00000", rsp_msg="", cont_block=None)
+        resp.block = [_row("005930"), _row("")]
+        accno_client = MagicMock()
+        accno_client.t0424.return_value.req_async = AsyncMock(return_value=resp)
+        tracker = KrStockAccountTracker(accno_client=accno_client)
+
+        await tracker._fetch_positions()
+
+        assert list(tracker.get_positions()) == ["005930"]
+
 
 class TestKrStockAccountTrackerOnTickReceived:
     """_on_tick_received() 메서드 테스트."""
@@ -1263,6 +1307,49 @@ class TestKrStockAccountTrackerSC1AutoRefresh:
 
         tracker._schedule_coroutine.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_cancel_confirm_skips_position_query(self):
+        """정정/취소 확인(12/13)은 잔고(t0424) 없이 예수금·미체결만 재조회."""
+        tracker = self._make_tracker()
+        tracker.DEFAULT_ORDER_DELAY = 0
+        tracker._fetch_positions = AsyncMock()
+        tracker._fetch_balance = AsyncMock()
+        tracker._fetch_open_orders = AsyncMock()
+        scheduled = []
+        tracker._schedule_coroutine = scheduled.append
+
+        tracker._on_order_event(self._make_sc1_resp("13"))
+        await scheduled.pop()
+
+        tracker._fetch_positions.assert_not_called()
+        tracker._fetch_balance.assert_awaited_once()
+        tracker._fetch_open_orders.assert_awaited_once()
+
+        tracker._on_order_event(self._make_sc1_resp("11"))
+        await scheduled.pop()
+
+        tracker._fetch_positions.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_burst_of_events_coalesces_into_one_refresh(self):
+        """재조회 대기 중 들어온 이벤트는 한 번의 재조회로 합치고, 체결이 섞이면 잔고까지 본다."""
+        tracker = self._make_tracker()
+        tracker.DEFAULT_ORDER_DELAY = 0.01
+        tracker._fetch_positions = AsyncMock()
+        tracker._fetch_balance = AsyncMock()
+        tracker._fetch_open_orders = AsyncMock()
+        scheduled = []
+        tracker._schedule_coroutine = scheduled.append
+
+        for order_type in ("13", "11", "12"):
+            tracker._on_order_event(self._make_sc1_resp(order_type))
+        await asyncio.gather(*scheduled)
+
+        tracker._fetch_positions.assert_awaited_once()
+        tracker._fetch_balance.assert_awaited_once()
+        tracker._fetch_open_orders.assert_awaited_once()
+        assert tracker._pending_refresh is None
+
     # ----- _schedule_coroutine 단위 테스트 -----
 
     @pytest.mark.asyncio
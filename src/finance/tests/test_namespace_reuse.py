@@ -0,0 +1,50 @@
+"""LS 상품 래퍼 / 하위 네임스페이스 재사용 단위 테스트.
+
+ls.overseas_stock().accno() 같은 체인이 호출마다 새 객체를 만들지 않고,
+token_manager 가 바뀌면 새로 만드는지 검증합니다.
+"""
+
+from unittest.mock import MagicMock
+
+from programgarden_finance.ls import LS
+from programgarden_finance.ls.korea_stock import KoreaStock
+from programgarden_finance.ls.overseas_futureoption import OverseasFutureoption
+from programgarden_finance.ls.overseas_stock import OverseasStock
+
+
+def _make_ls():
+    ls = LS()
+    ls.token_manager = MagicMock()
+    ls.ensure_token = MagicMock(return_value=True)
+    return ls
+
+
+def test_product_wrappers_are_reused():
+    ls = _make_ls()
+    assert ls.overseas_stock() is ls.해외주식()
+    assert ls.overseas_futureoption() is ls.overseas_futureoption()
+    assert ls.korea_stock() is ls.korea_stock()
+    # 토큰 검증은 매 호출마다 그대로 수행한다
+    assert ls.ensure_token.call_count == 6
+
+
+def test_product_wrapper_rebuilt_when_token_manager_changes():
+    ls = _make_ls()
+    first = ls.overseas_stock()
+    ls.token_manager = MagicMock()
+    second = ls.overseas_stock()
+    assert second is not first
+    assert second.token_manager is ls.token_manager
+
+
+def test_namespaces_are_reused_per_product():
+    tm = MagicMock()
+    for product in (OverseasStock(tm), OverseasFutureoption(tm), KoreaStock(tm)):
+        assert product.accno() is product.accno()
+        assert product.order() is product.order()
+        assert product.market() is product.market()
+        assert product.accno().token_manager is tm
+
+    stock = OverseasStock(tm)
+    assert stock.계좌() is stock.accno()
+    assert OverseasStock(tm).accno() is not stock.accno()
@@ -0,0 +1,54 @@
+"""
+해외선물 계좌 추적기(FuturesAccountTracker) 단위 테스트.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from programgarden_finance.ls.overseas_futureoption.extension.tracker import (
+    FuturesAccountTracker,
+)
+
+
+def _position_row(symbol: str, qty: int = 1):
+    return SimpleNamespace(
+        IsuCodeVal=symbol,
+        IsuNm=symbol,
+        BnsTpCode="2",
+        BalQty=qty,
+        PchsPrc=100,
+        OvrsDrvtNowPrc=101,
+        AbrdFutsEvalPnlAmt=10,
+        CsgnMgn=0,
+        MaintMgn=0,
+        MgnclRat=0,
+        CrcyCodeVal="USD",
+    )
+
+
+class TestFuturesFetchPositions:
+    """_fetch_positions (CIDBQ01500) 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_rows_without_symbol_are_skipped(self):
+        """종목코드가 빈 행은 포지션으로 만들지 않는다."""
+        resp = SimpleNamespace(
+            rsp_cd="00000",
+            rsp_msg="",
+            error_msg=None,
+            block2=[_position_row("NQH25", 2), _position_row(""), _position_row("  ")],
+        )
+        accno = MagicMock()
+        accno.CIDBQ01500.return_value.req_async = AsyncMock(return_value=resp)
+
+        tracker = FuturesAccountTracker(accno_client=accno, market_client=MagicMock())
+        tracker._spec_manager = MagicMock()
+        tracker._spec_manager.get_spec.return_value = None
+
+        await tracker._fetch_positions()
+
+        assert list(tracker._positions) == ["NQH25"]
+        assert tracker._positions["NQH25"].quantity == 2
+        tracker._spec_manager.get_spec.assert_called_once_with("NQH25")
@@ -0,0 +1,69 @@
+"""실시간 종목 등록/해제 프레임.
+
+``RealRequestAbstract._add_message_symbols`` / ``_remove_message_symbols`` 는
+TR 별 요청 모델을 ``_SYMBOL_REQUEST_MODULES`` 에서 찾아 종목마다 프레임 하나를
+보낸다. 웹소켓은 mock 이고, 보낸 JSON 만 확인한다.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from programgarden_finance.ls.korea_stock.real import Real as KoreaStockReal
+from programgarden_finance.ls.overseas_futureoption.real import Real as FuturesReal
+from programgarden_finance.ls.overseas_stock.real import Real as OverseasStockReal
+
+
+def _connected_real(real_cls):
+    tm = MagicMock()
+    tm.access_token = "test-token"
+    tm.appkey = "test-appkey"
+    r = real_cls(token_manager=tm)
+    r._connected_event.set()
+    r._ws = MagicMock()
+    return r
+
+
+def _sent_frames(real, action, symbols, tr_cd):
+    with patch("asyncio.create_task"):
+        getattr(real, action)(symbols, tr_cd)
+    return [json.loads(call.args[0]) for call in real._ws.send.call_args_list]
+
+
+def _bodies(frames):
+    # 요청 body 모델이 TR 별 길이로 tr_key 를 오른쪽 공백 패딩하므로 값만 비교한다
+    return [{**f["body"], "tr_key": f["body"]["tr_key"].strip()} for f in frames]
+
+
+@pytest.mark.parametrize(
+    "real_cls, tr_cd",
+    [
+        (OverseasStockReal, "GSC"),
+        (OverseasStockReal, "GSH"),
+        (FuturesReal, "OVC"),
+        (FuturesReal, "WOH"),
+        (KoreaStockReal, "S3_"),
+        (KoreaStockReal, "NVI"),
+    ],
+)
+@pytest.mark.parametrize("action, tr_type", [("_add_message_symbols", "3"), ("_remove_message_symbols", "4")])
+def test_one_frame_per_symbol(real_cls, tr_cd, action, tr_type):
+    frames = _sent_frames(_connected_real(real_cls), action, ["AAA", "BBB"], tr_cd)
+
+    assert _bodies(frames) == [
+        {"tr_cd": tr_cd, "tr_key": "AAA"},
+        {"tr_cd": tr_cd, "tr_key": "BBB"},
+    ]
+    assert all(f["header"]["tr_type"] == tr_type for f in frames)
+    assert all(f["header"]["token"] == "test-token" for f in frames)
+
+
+def test_jif_uses_fixed_tr_key():
+    frames = _sent_frames(_connected_real(KoreaStockReal), "_add_message_symbols", ["0"], "JIF")
+    assert _bodies(frames) == [{"tr_cd": "JIF", "tr_key": "0"}]
+
+
+@pytest.mark.parametrize("action", ["_add_message_symbols", "_remove_message_symbols"])
+def test_unknown_tr_sends_nothing(action):
+    assert _sent_frames(_connected_real(OverseasStockReal), action, ["AAA"], "ZZZ") == []
@@ -0,0 +1,65 @@
+"""Synchronous TR requests reuse a keep-alive HTTP session per thread.
+
+``requests.post`` used to open a new connection (TCP + TLS) for every call.
+``execute_sync`` now goes through a thread-local ``requests.Session`` so
+repeated requests from the same thread share pooled connections.
+"""
+
+import threading
+
+from programgarden_finance.ls import tr_base
+from programgarden_finance.ls.tr_base import _sync_session
+
+
+def test_same_thread_reuses_session():
+    assert _sync_session() is _sync_session()
+
+
+def test_each_thread_gets_its_own_session():
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(_sync_session()))
+    worker.start()
+    worker.join()
+    assert seen[0] is not _sync_session()
+
+
+def test_execute_sync_posts_through_thread_session(monkeypatch):
+    calls = []
+
+    class _Resp:
+        status_code = 200
+        headers = {}
+
+        def json(self):
+            return {"rsp_cd": "00000"}
+
+        def raise_for_status(self):
+            pass
+
+    class _Session:
+        def post(self, **kwargs):
+            calls.append(kwargs["url"])
+            return _Resp()
+
+    monkeypatch.setattr(tr_base._SYNC_SESSIONS, "session", _Session(), raising=False)
+
+    class _Header:
+        def model_dump(self, by_alias=True):
+            return {}
+
+    class _Request:
+        header = _Header()
+        body = {}
+
+    class _TR(tr_base.TRRequestAbstract):
+        async def req_async(self, **kwargs):  # pragma: no cover - unused
+            return None
+
+        def req(self, **kwargs):  # pragma: no cover - unused
+            return None
+
+    tr = _TR(rate_limit_count=100, rate_limit_seconds=1)
+    _, resp_json, _ = tr.execute_sync("https://example.invalid/tr", _Request())
+
+    assert calls == ["https://example.invalid/tr"]
+    assert resp_json == {"rsp_cd": "00000"}
@@ -84,9 +84,9 @@ from programgarden.tools import (
 )
 
 # Auto-load community plugins on import
+# (패키지 import 시점에 플러그인/노드 등록이 끝나므로 여기서 다시 등록하지 않는다)
 try:
-    from programgarden_community import register_all_plugins
-    register_all_plugins()
+    import programgarden_community  # noqa: F401
 except ImportError:
     # Community package not installed
     pass
@@ -4,9 +4,11 @@ ProgramGarden - Main Client
 Provides user-friendly API
 """
 
-from typing import Optional, List, Dict, Any, Awaitable, TypeVar
+from typing import Optional, List, Dict, Any, Awaitable, Callable, TypeVar
 import asyncio
 import concurrent.futures
+import logging
+import os
 
 from programgarden.resolver import WorkflowResolver, ValidationResult
 from programgarden.executor import WorkflowExecutor
@@ -15,6 +17,24 @@ from programgarden_core.models.resource import ResourceLimits
 
 _T = TypeVar("_T")
 
+logger = logging.getLogger("programgarden.client")
+
+# 동기 래퍼(run/validate_deep)가 쓰는 이벤트 루프 구현. "uvloop" 이면 uvloop 루프로
+# 실행한다 (opt-in, 미설치 시 경고 후 기본 asyncio 루프). 전역 정책은 건드리지 않는다.
+_EVENT_LOOP = os.environ.get("PG_EVENT_LOOP", "").strip().lower()
+
+
+def _loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """``asyncio.Runner(loop_factory=...)`` 에 넘길 루프 팩토리 (None = 기본 루프)."""
+    if _EVENT_LOOP != "uvloop":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning("PG_EVENT_LOOP=uvloop but uvloop is not installed; using default asyncio loop")
+        return None
+    return uvloop.new_event_loop
+
 
 def _run_coro_sync(coro: Awaitable[_T]) -> _T:
     """Run an awaitable to completion from synchronous code without disturbing
@@ -32,9 +52,17 @@ def _run_coro_sync(coro: Awaitable[_T]) -> _T:
     already-running loop (where a direct ``asyncio.run`` would raise). The
     coroutine itself still enforces its own timeout, so this adds no unbounded
     wait.
+
+    ``PG_EVENT_LOOP=uvloop`` 이면 이 전용 루프만 uvloop 으로 만든다 (``_loop_factory``).
     """
+    loop_factory = _loop_factory()
+
+    def _run() -> _T:
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(coro)
+
     with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-        return pool.submit(lambda: asyncio.run(coro)).result()
+        return pool.submit(_run).result()
 
 
 class ProgramGarden:
@@ -9,7 +9,7 @@ Workflow execution context protocol
 - Persistent node lifecycle management
 """
 
-from typing import Optional, Dict, Any, List, Protocol, runtime_checkable, Callable, Awaitable, TYPE_CHECKING, Tuple
+from typing import Optional, Dict, Any, List, Set, Protocol, runtime_checkable, Callable, Awaitable, TYPE_CHECKING, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -104,7 +104,7 @@ class OrderExecutor(Protocol):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeOutput:
     """Node output value"""
 
@@ -114,7 +114,7 @@ class NodeOutput:
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowEvent:
     """Event for realtime updates and triggers"""
     
@@ -137,6 +137,9 @@ class ExecutionContext:
         _resource_context: Resource management context (CPU/RAM/Disk throttling)
     """
 
+    # cleanup_listeners 가 백그라운드 알림을 기다려 주는 최대 시간 (초)
+    NOTIFY_DRAIN_TIMEOUT = 5.0
+
     def __init__(
         self,
         job_id: str,
@@ -192,6 +195,8 @@ class ExecutionContext:
         self._is_paused = False
         self._is_failed = False
         self._failure_reason: Optional[str] = None
+        # stop()/fail() 시 set — 대기 루프가 주기적으로 깨어나 is_running 을 폴링하지 않게 한다
+        self._stopped = asyncio.Event()
 
         # Event handlers
         self._event_handlers: Dict[str, List[callable]] = {}
@@ -221,6 +226,8 @@ class ExecutionContext:
         
         # === New: Execution Listeners (for UI/Server callbacks) ===
         self._listeners: List[ExecutionListener] = []
+        # notify_in_background 로 띄운 알림 태스크 (끝날 때까지 참조 유지, cleanup 에서 마저 대기)
+        self._notify_tasks: Set[asyncio.Task] = set()
         
         # === New: Workflow Position Tracker ===
         # Tracks workflow positions separately using FIFO for competition ranking
@@ -835,6 +842,7 @@ class ExecutionContext:
         self._is_paused = False
         self._is_failed = False
         self._failure_reason = None
+        self._stopped.clear()
 
     def pause(self) -> None:
         """Pause execution"""
@@ -853,12 +861,14 @@ class ExecutionContext:
         """Stop execution"""
         self._is_running = False
         self._shutdown = True
+        self._stopped.set()
 
     def fail(self, reason: str) -> None:
         """Mark execution as failed"""
         self._is_failed = True
         self._is_running = False
         self._failure_reason = reason
+        self._stopped.set()
         self.log("error", f"Job failed: {reason}")
 
     # === Event Queue (for realtime updates) ===
@@ -894,20 +904,37 @@ class ExecutionContext:
         Wait for next event from queue
         
         Args:
-            timeout: Max seconds to wait (None = wait forever)
+            timeout: Max seconds to wait (None = wait until an event or stop)
             
         Returns:
-            WorkflowEvent or None if timeout
+            WorkflowEvent, or None on timeout / stop()·fail()
         """
+        if not self._event_queue.empty():
+            return self._event_queue.get_nowait()
+        if self._stopped.is_set():
+            return None
+        getter = asyncio.ensure_future(self._event_queue.get())
+        stopper = asyncio.ensure_future(self._stopped.wait())
         try:
-            if timeout:
-                return await asyncio.wait_for(
-                    self._event_queue.get(),
-                    timeout=timeout,
-                )
-            return await self._event_queue.get()
+            done, _ = await asyncio.wait(
+                (getter, stopper), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            stopper.cancel()
+            getter.cancel()  # 이미 끝났으면 no-op — 큐에서 꺼낸 이벤트는 아래에서 돌려준다
+        if getter in done:
+            return getter.result()
+        return None
+
+    async def wait_stopped(self, timeout: Optional[float] = None) -> bool:
+        """stop()/fail() 까지 최대 timeout 초 대기. 그 안에 멈췄으면 True."""
+        if self._stopped.is_set():
+            return True
+        try:
+            await asyncio.wait_for(self._stopped.wait(), timeout=timeout)
         except asyncio.TimeoutError:
-            return None
+            return False
+        return True
 
     def has_pending_events(self) -> bool:
         """Check if there are pending events"""
@@ -957,7 +984,7 @@ class ExecutionContext:
         if node_id not in self._persistent_metadata:
             self._persistent_metadata[node_id] = {}
         self._persistent_metadata[node_id][key] = value
-        logger.debug(f"Node state set: {node_id}.{key}")
+        logger.debug("Node state set: %s.%s", node_id, key)
     
     def get_node_state(self, node_id: str, key: str) -> Optional[Any]:
         """
@@ -985,7 +1012,7 @@ class ExecutionContext:
             data: The update payload (e.g., {"symbol": "AAPL", "price": 150.0})
         """
         # Log the realtime update
-        logger.debug(f"Realtime update from {node_id}: {data}")
+        logger.debug("Realtime update from %s: %s", node_id, data)
         
         # Notify listeners if any are registered
         if self._listeners:
@@ -1083,7 +1110,7 @@ class ExecutionContext:
         
         # Add new handler
         self._order_event_handlers[product][tr_cd].append((node_id, event_filter, handler))
-        logger.debug(f"Registered order event handler: product={product}, tr_cd={tr_cd}, node_id={node_id}, filter={event_filter}")
+        logger.debug("Registered order event handler: product=%s, tr_cd=%s, node_id=%s, filter=%s", product, tr_cd, node_id, event_filter)
     
     def _remove_order_event_handler(self, node_id: str) -> None:
         """Remove all handlers for a specific node"""
@@ -1356,13 +1383,31 @@ class ExecutionContext:
         """
         self._listeners = list(listeners) if listeners else []
 
+    def notify_in_background(self, coro: Awaitable[Any]) -> None:
+        """리스너 알림 코루틴을 백그라운드 태스크로 띄운다 (호출 측은 기다리지 않음).
+
+        텔레그램/웹훅 같은 리스너 I/O 가 주문 처리 경로를 붙잡지 않게 한다. 태스크는
+        끝날 때까지 참조를 잡아 두고, cleanup_listeners 가 리스너를 닫기 전에 마저 기다린다.
+        """
+        try:
+            task = asyncio.get_running_loop().create_task(coro)
+        except RuntimeError:
+            coro.close()  # No event loop running (예: WebSocket 콜백 스레드)
+            return
+        self._notify_tasks.add(task)
+        task.add_done_callback(self._notify_tasks.discard)
+
     async def cleanup_listeners(self) -> None:
         """
         Cleanup all registered listeners on job stop/cancel.
 
-        Calls close()/dispose() if available, then clears the list.
+        Waits (bounded) for in-flight background notifications, then calls
+        close()/dispose() if available and clears the list.
         Safe to call multiple times (idempotent).
         """
+        if self._notify_tasks:
+            await asyncio.wait(list(self._notify_tasks), timeout=self.NOTIFY_DRAIN_TIMEOUT)
+
         if not self._listeners:
             return
 
@@ -1507,7 +1552,10 @@ class ExecutionContext:
         data: Any = None,
     ) -> None:
         """Notify all listeners about edge state change."""
-        logger.debug(f"📡 notify_edge_state: {from_node_id}.{from_port} → {to_node_id}.{to_port} ({state.value})")
+        logger.debug(
+            "📡 notify_edge_state: %s.%s → %s.%s (%s)",
+            from_node_id, from_port, to_node_id, to_port, state.value,
+        )
         
         if not self._listeners:
             return
@@ -1600,7 +1648,8 @@ class ExecutionContext:
         if self._shutdown:
             return
 
-        logger.debug(f"📡 notify_output_update: {node_id} outputs={list(outputs.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📡 notify_output_update: %s outputs=%s", node_id, list(outputs.keys()))
 
         if not self._listeners:
             return
@@ -1638,7 +1687,7 @@ class ExecutionContext:
         # (no listener side-effects during virtual validation runs).
         if self.is_dry_run:
             return
-        logger.debug(f"📡 notify_display_data: {node_id} ({chart_type})")
+        logger.debug("📡 notify_display_data: %s (%s)", node_id, chart_type)
 
         if not self._listeners:
             return
@@ -1996,7 +2045,7 @@ class ExecutionContext:
         
         # 디버그 로그
         wf_rate = base_workflow_result.get("workflow_pnl_rate", 0.0)
-        logger.debug(f"📡 notify_workflow_pnl: {broker_node_id} ({product}) wf_rate={wf_rate:.2f}%")
+        logger.debug("📡 notify_workflow_pnl: %s (%s) wf_rate=%.2f%%", broker_node_id, product, wf_rate)
 
     def _calculate_workflow_pnl(
         self,
@@ -2370,7 +2419,7 @@ class ExecutionContext:
                 job_id=self.job_id,
                 node_id=node_id,
             )
-            logger.debug(f"Recorded workflow order: {order_no} ({symbol} {side} {quantity})")
+            logger.debug("Recorded workflow order: %s (%s %s %s)", order_no, symbol, side, quantity)
 
             # ━━━ Risk Tracker 체결 연동 ━━━
             if self._workflow_risk_tracker:
@@ -2632,6 +2681,20 @@ class ExecutionContext:
     SENSITIVE_OUTPUT_KEYS = frozenset(
         {"appkey", "appsecret", "secret", "password", "token", "api_key", "apikey", "private_key"}
     )
+    # 출력 키 → 민감 키 여부. 실시간 출력은 같은 키(필드명·종목코드)가 틱마다 반복되므로
+    # 한 번 판정한 결과를 재사용한다 (키 종류가 비정상적으로 많아지면 더 담지 않는다).
+    SENSITIVE_KEY_MEMO_MAX = 4096
+    _sensitive_key_memo: Dict[Any, bool] = {}
+
+    @classmethod
+    def _is_sensitive_key(cls, key: Any) -> bool:
+        hit = cls._sensitive_key_memo.get(key)
+        if hit is None:
+            lowered = str(key).lower()
+            hit = any(sk in lowered for sk in cls.SENSITIVE_OUTPUT_KEYS)
+            if len(cls._sensitive_key_memo) < cls.SENSITIVE_KEY_MEMO_MAX:
+                cls._sensitive_key_memo[key] = hit
+        return hit
 
     def _sanitize_value(self, value: Any) -> Any:
         """dict/list 를 재귀적으로 훑어 민감 키를 가린다."""
@@ -2651,7 +2714,7 @@ class ExecutionContext:
 
         sanitized = {}
         for k, v in outputs.items():
-            if any(sk in str(k).lower() for sk in self.SENSITIVE_OUTPUT_KEYS):
+            if self._is_sensitive_key(k):
                 sanitized[k] = "[REDACTED]"
             else:
                 sanitized[k] = self._sanitize_value(v)
@@ -2687,11 +2750,7 @@ class ExecutionContext:
         
         # Notify listeners (async, fire-and-forget)
         if self._listeners:
-            try:
-                loop = asyncio.get_running_loop()
-                loop.create_task(self.notify_log(level, message, node_id, data))
-            except RuntimeError:
-                pass  # No event loop running
+            self.notify_in_background(self.notify_log(level, message, node_id, data))
 
     def get_logs(
         self,
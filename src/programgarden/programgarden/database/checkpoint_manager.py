@@ -287,8 +287,8 @@ class CheckpointManager:
             """, (job_id, idempotency_key, result_json, now))
             conn.commit()
         logger.debug(
-            f"Order idempotency 기록: job={job_id}, key={idempotency_key}, "
-            f"order_no={order_result.get('order_no', '?')}"
+            "Order idempotency 기록: job=%s, key=%s, order_no=%s",
+            job_id, idempotency_key, order_result.get("order_no", "?"),
         )
 
     def get_submitted_order(
@@ -23,7 +23,7 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionInfo:
     """포지션 정보"""
     symbol: str
@@ -33,7 +33,7 @@ class PositionInfo:
     classification: str  # "workflow" | "manual" | "unknown_api"
 
 
-@dataclass
+@dataclass(slots=True)
 class LotInfo:
     """FIFO 로트 정보"""
     id: int
@@ -46,7 +46,7 @@ class LotInfo:
     classification: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AnomalyResult:
     """이상 거래 감지 결과"""
     pattern: str  # "sell_without_buy" | "quantity_imbalance" | "unknown_api_ratio"
@@ -55,7 +55,7 @@ class AnomalyResult:
     severity: int  # 감점 점수
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingFill:
     """버퍼링된 체결 정보"""
     order_no: str
@@ -301,7 +301,7 @@ class WorkflowPositionTracker:
             # 동기 환경에서는 버퍼 처리 생략 (체결이 먼저 올 일 없음)
             pass
         
-        logger.debug(f"Recorded workflow order: {order_no} ({symbol} {side} {quantity}@{price})")
+        logger.debug("Recorded workflow order: %s (%s %s %s@%s)", order_no, symbol, side, quantity, price)
     
     async def _process_buffered_fill(self, order_no: str, order_date: str) -> None:
         """버퍼에서 매칭되는 체결 처리"""
@@ -310,7 +310,7 @@ class WorkflowPositionTracker:
         async with self._buffer_lock:
             if key in self._pending_fills:
                 fill = self._pending_fills.pop(key)
-                logger.debug(f"Processing buffered fill: {key}")
+                logger.debug("Processing buffered fill: %s", key)
                 await self._process_fill_internal(fill, "workflow")
     
     async def record_fill(
@@ -380,7 +380,7 @@ class WorkflowPositionTracker:
         # 타임아웃 후 처리
         asyncio.create_task(self._process_timeout_fill(key))
         
-        logger.debug(f"Buffered fill (waiting for order): {key}")
+        logger.debug("Buffered fill (waiting for order): %s", key)
         return "pending"
     
     async def _process_timeout_fill(self, key: str) -> None:
@@ -439,7 +439,7 @@ class WorkflowPositionTracker:
 
             conn.commit()
 
-        logger.debug(f"Processed fill: {fill.symbol} {fill.side} {fill.quantity}@{fill.price} [{classification}] ({self.trading_mode})")
+        logger.debug("Processed fill: %s %s %s@%s [%s] (%s)", fill.symbol, fill.side, fill.quantity, fill.price, classification, self.trading_mode)
     
     def _process_sell_fifo(
         self,
@@ -497,11 +497,13 @@ class WorkflowPositionTracker:
             
             remaining_to_sell -= sell_qty
             
-            logger.debug(f"FIFO sell: lot {lot_id} ({lot_classification}), "
-                        f"qty={sell_qty}, pnl={pnl:.2f}")
+            logger.debug(
+                "FIFO sell: lot %s (%s), qty=%s, pnl=%.2f",
+                lot_id, lot_classification, sell_qty, pnl,
+            )
         
         if remaining_to_sell > 0:
-            logger.warning(f"Sell without enough position: {symbol} remaining={remaining_to_sell}")
+            logger.warning("Sell without enough position: %s remaining=%s", symbol, remaining_to_sell)
         
         return total_realized_pnl
     
@@ -889,7 +891,7 @@ class WorkflowPositionTracker:
             conn.commit()
             
             if updated:
-                logger.debug(f"Updated order fill price: {order_no} @ {fill_price}")
+                logger.debug("Updated order fill price: %s @ %s", order_no, fill_price)
             
             return updated
 
@@ -994,12 +996,12 @@ class WorkflowPositionTracker:
                 
                 if cursor.rowcount > 0:
                     updated_count += 1
-                    logger.debug(f"Synced fill price from history: {order_no} @ {fill_price}")
+                    logger.debug("Synced fill price from history: %s @ %s", order_no, fill_price)
             
             conn.commit()
         
         if updated_count > 0:
-            logger.info(f"Synced {updated_count} order fill prices from history")
+            logger.info("Synced %d order fill prices from history", updated_count)
         
         return updated_count
 
@@ -1034,9 +1036,9 @@ class WorkflowPositionTracker:
             conn.commit()
             
             if deleted:
-                logger.info(f"Cancelled workflow order: {order_no}")
+                logger.info("Cancelled workflow order: %s", order_no)
             else:
-                logger.debug(f"Order not found for cancellation: {order_no}")
+                logger.debug("Order not found for cancellation: %s", order_no)
             
             return deleted
 
@@ -1091,9 +1093,11 @@ class WorkflowPositionTracker:
             conn.commit()
             
             if updated:
-                logger.info(f"Modified workflow order: {order_no} (qty={new_quantity}, price={new_price})")
+                logger.info(
+                    "Modified workflow order: %s (qty=%s, price=%s)", order_no, new_quantity, new_price
+                )
             else:
-                logger.debug(f"Order not found for modification: {order_no}")
+                logger.debug("Order not found for modification: %s", order_no)
             
             return updated
 
@@ -1185,8 +1189,8 @@ class WorkflowPositionTracker:
             try:
                 self.record_fill(fill_event)
                 processed_count += 1
-                logger.info(f"Synced fill from history: {symbol} {side} {quantity}@{price}")
+                logger.info("Synced fill from history: %s %s %s@%s", symbol, side, quantity, price)
             except Exception as e:
-                logger.warning(f"Failed to sync fill from history: {order_no} - {e}")
+                logger.warning("Failed to sync fill from history: %s - %s", order_no, e)
         
         return processed_count
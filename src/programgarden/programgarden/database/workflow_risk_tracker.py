@@ -39,7 +39,7 @@ VALID_FEATURES: Set[str] = {"hwm", "window", "events", "state"}
 # Dataclasses
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class HWMState:
     """인메모리 HWM 상태"""
     symbol: str
@@ -53,7 +53,7 @@ class HWMState:
     dirty: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class HWMUpdateResult:
     """update_price 반환 결과"""
     symbol: str
@@ -63,7 +63,7 @@ class HWMUpdateResult:
     hwm_updated: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class HWMValidationResult:
     """재시작 시 HWM 검증 결과"""
     symbol: str
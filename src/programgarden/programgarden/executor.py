@@ -9,12 +9,19 @@ Workflow execution engine
 """
 
 from typing import Optional, Dict, Any, List, Callable, Awaitable, Set, Tuple
+from collections import OrderedDict, deque
 from datetime import datetime
 import asyncio
 import ast
+import functools
+import hashlib
+import heapq
+import os
 import re
 import uuid
 import logging
+import weakref
+from operator import itemgetter
 
 from programgarden.resolver import WorkflowResolver, ResolvedWorkflow, ValidationResult
 from programgarden_core import (
@@ -403,9 +410,32 @@ class LSClientManager:
     - overseas_futures: LS 인스턴스 #2
     
     인스턴스는 프로세스 종료까지 유지됩니다 (WebSocket 연결 재활용).
+
+    한 product 에 모의/실전 또는 서로 다른 계좌가 번갈아 들어오면 전환마다
+    재로그인하지 않도록, 로그인된 인스턴스를 credential 조합별로도 보관합니다.
+    이 보관함은 product 당 최근 ``MAX_SESSIONS_PER_PRODUCT`` 개까지만 두고, 키에는
+    appkey/appsecret 원문 대신 해시를 씁니다.
     """
+    MAX_SESSIONS_PER_PRODUCT = 4
+
     _instances: Dict[str, Any] = {}  # {product: LS}
     _credentials: Dict[str, tuple] = {}  # {product: (appkey, appsecret, paper_trading)}
+    # {(product, sha256(appkey, appsecret), paper_trading): LS} — 최근 사용 순
+    _sessions: "OrderedDict[tuple, Any]" = OrderedDict()
+
+    @staticmethod
+    def _session_key(product: str, appkey: str, appsecret: str, paper_trading: bool) -> tuple:
+        digest = hashlib.sha256(f"{appkey}\0{appsecret}".encode()).hexdigest()
+        return (product, digest, paper_trading)
+
+    @classmethod
+    def _remember_session(cls, session_key: tuple, ls: Any) -> None:
+        """세션을 가장 최근으로 올리고, 같은 product 의 오래된 세션은 버린다."""
+        cls._sessions[session_key] = ls
+        cls._sessions.move_to_end(session_key)
+        same_product = [key for key in cls._sessions if key[0] == session_key[0]]
+        for stale in same_product[:-cls.MAX_SESSIONS_PER_PRODUCT]:
+            del cls._sessions[stale]
     
     @classmethod
     def get_or_create(
@@ -422,8 +452,6 @@ class LSClientManager:
         Returns:
             (ls_instance, success: bool, error_message: str | None)
         """
-        from programgarden_finance import LS
-        
         # 이미 해당 product의 인스턴스가 있고 로그인된 경우
         if product in cls._instances:
             ls = cls._instances[product]
@@ -433,8 +461,19 @@ class LSClientManager:
             if stored and stored == (appkey, appsecret, paper_trading):
                 if ls.is_logged_in():
                     return ls, True, None
+
+        # 같은 credential 로 이미 로그인해 둔 인스턴스가 있으면 현재 인스턴스로 되돌린다
+        session_key = cls._session_key(product, appkey, appsecret, paper_trading)
+        ls = cls._sessions.get(session_key)
+        if ls is not None and ls.is_logged_in():
+            cls._sessions.move_to_end(session_key)
+            cls._instances[product] = ls
+            cls._credentials[product] = (appkey, appsecret, paper_trading)
+            return ls, True, None
         
-        # 새 인스턴스 생성 (싱글톤 우회)
+        # 새 인스턴스 생성 (싱글톤 우회) — finance 패키지는 이 경로에서만 필요하다
+        from programgarden_finance import LS
+
         ls = object.__new__(LS)
         ls.__init__()
 
@@ -468,6 +507,7 @@ class LSClientManager:
         # 저장
         cls._instances[product] = ls
         cls._credentials[product] = (appkey, appsecret, paper_trading)
+        cls._remember_session(session_key, ls)
         
         context.log("info", f"LS logged in for {product} (paper_trading={paper_trading})", node_id)
         return ls, True, None
@@ -482,6 +522,7 @@ class LSClientManager:
         """모든 인스턴스 초기화 (테스트용)"""
         cls._instances.clear()
         cls._credentials.clear()
+        cls._sessions.clear()
 
 
 def broker_credential_key(product: Optional[str]) -> str:
@@ -558,6 +599,51 @@ def ensure_ls_login(
     )
 
 
+# 종목 단위 LS REST 조회를 동시에 보낼 때의 in-flight 상한.
+# LS finance 클라이언트가 TR/계정 단위 rate-limit 을 자체적으로 대기하므로 이 값은
+# 동시에 열어 두는 요청 수만 제한한다 (1 = 기존처럼 순차 실행).
+_LS_REQUEST_CONCURRENCY = max(1, int(os.environ.get("PG_LS_REQUEST_CONCURRENCY", "4")))
+
+
+async def _gather_bounded(
+    func: Callable[[Any], Awaitable[Any]],
+    items: List[Any],
+    limit: Optional[int] = None,
+) -> List[Any]:
+    """items 각각에 func 를 최대 limit 개씩 동시에 실행하고 입력 순서대로 결과를 반환.
+
+    개별 실패는 예외 객체로 돌려준다 — 한 종목의 실패가 나머지 조회를 막지 않는다.
+    TaskGroup 으로 묶어 호출 측이 취소되면 진행 중인 조회도 함께 취소된다.
+    고정 개수(limit)의 워커가 같은 대기열을 나눠 꺼내는 풀 방식이라, 한 조회가 끝나는 즉시
+    다음 항목이 시작되고(청크 단위 gather 처럼 느린 항목을 기다리지 않음) 항목 수와 무관하게
+    태스크는 limit 개만 만든다.
+    """
+    limit = limit or _LS_REQUEST_CONCURRENCY
+    results: List[Any] = [None] * len(items)
+    if limit <= 1 or len(items) <= 1:
+        for index, item in enumerate(items):
+            try:
+                results[index] = await func(item)
+            except Exception as e:
+                results[index] = e
+        return results
+
+    queue = iter(enumerate(items))
+
+    async def _worker() -> None:
+        # 이터레이터 next() 는 await 없이 끝나므로 워커끼리 같은 항목을 꺼내지 않는다
+        for index, item in queue:
+            try:
+                results[index] = await func(item)
+            except Exception as e:
+                results[index] = e
+
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(min(limit, len(items))):
+            tg.create_task(_worker())
+    return results
+
+
 def evaluate_all_bindings(
     config: Dict[str, Any],
     context: "ExecutionContext",
@@ -1133,6 +1219,20 @@ _BRANCH_PAYLOAD_PORTS = ("result", "value", "data", "ohlcv_data")
 # 종목마다 최초 1회만 실행하고, 틱마다의 분기 재구동에선 건너뛴다(재구독 폭주 방지).
 _SUBSCRIBED_SCOPES_KEY = "_subscribed_branch_scopes"
 
+# SplitNode 분기가 실시간 노드를 포함하는지 — 분기 구성은 아이템마다 같으므로 Split 실행 시
+# 한 번 판정해 SplitNode 의 node_state 에 남기고, 아이템별 실행은 그 값을 읽는다.
+_REALTIME_BRANCH_KEY = "_realtime_branch"
+
+
+def _branch_has_realtime(workflow: Any, branch_order: List[str]) -> bool:
+    """분기 노드 중 실시간 노드가 하나라도 있는가."""
+    nodes = workflow.nodes
+    return any(
+        node.node_type in REALTIME_NODE_TYPES
+        for node in (nodes.get(n) for n in branch_order)
+        if node
+    )
+
 
 def _item_symbol(item: Any) -> Optional[str]:
     """Split 아이템에서 종목코드를 뽑는다 ('005930' 또는 {'symbol': '005930'})."""
@@ -1242,6 +1342,41 @@ _OVERSEAS_STOCK_EXCHANGE = {
     "NYQ": ("NYSE", "81"), "ASE": ("AMEX", "81"),
 }
 
+# 조회용 확장 테이블 — 원래 키에 소문자 표기('nasdaq'/'nms')까지 모듈 로드 때 펼쳐 둔다.
+# 이미 정규 표기인 입력(대부분)은 strip()/upper() 로 새 문자열을 만들지 않고 한 번에 찾는다.
+_OVERSEAS_STOCK_EXCHANGE_LOOKUP = {
+    **{key.lower(): pair for key, pair in _OVERSEAS_STOCK_EXCHANGE.items()},
+    **_OVERSEAS_STOCK_EXCHANGE,
+}
+
+
+# yfinance info["exchange"] 코드 → 표준 거래소명 (ScreenerNode yfinance 갈래). 후보마다
+# dict 를 새로 만들지 않도록 모듈 상수로 둔다.
+_YFINANCE_EXCHANGE_NAMES = {
+    "NMS": "NASDAQ", "NGM": "NASDAQ", "NYQ": "NYSE", "ASE": "AMEX", "NCM": "NASDAQ",
+    "KSC": "KOSPI", "KOE": "KOSDAQ",
+}
+
+# 체결 이벤트/체결내역(AS1·COSAQ00102)의 시장코드 → 거래소 라벨. 체결 건마다 dict 를 새로
+# 만들지 않도록 모듈 상수로 둔다. (기존 매핑 그대로 — '83' 은 LS 가 돌려주지 않는 코드라
+# 실질적으로 81/82 만 쓰인다. 위 _OVERSEAS_STOCK_EXCHANGE 주석 참고.)
+_LS_FILL_MARKET_TO_EXCHANGE = {"81": "NYSE", "82": "NASDAQ", "83": "AMEX"}
+
+# COSAQ00102(해외주식 주문체결내역) 전체 조회용 고정 입력 필드. 호출부마다 달라지는 건
+# 조회일자(OrdDt)와 체결구분(ExecYn) 뿐이라 나머지는 한 곳에 모아 splat 한다.
+_COSAQ00102_ALL_ORDERS_QUERY: Dict[str, Any] = {
+    "RecCnt": 1,
+    "QryTpCode": "1",       # 계좌별
+    "BkseqTpCode": "1",     # 역순
+    "OrdMktCode": "00",     # 전체 시장
+    "BnsTpCode": "0",       # 전체 (매수/매도)
+    "IsuNo": "",            # 전체 종목
+    "SrtOrdNo": 999999999,  # 역순 시작
+    "CrcyCode": "000",      # 전체 통화
+    "ThdayBnsAppYn": "0",
+    "LoanBalHldYn": "0",
+}
+
 
 def normalize_overseas_stock_exchange(raw: Any) -> "tuple[Optional[str], Optional[str]]":
     """해외주식 거래소 원시값 → (표시명, LS코드). 매핑 불가면 (None, None).
@@ -1250,8 +1385,12 @@ def normalize_overseas_stock_exchange(raw: Any) -> "tuple[Optional[str], Optiona
     """
     if raw is None:
         return (None, None)
+    if isinstance(raw, str):
+        hit = _OVERSEAS_STOCK_EXCHANGE_LOOKUP.get(raw)
+        if hit is not None:
+            return hit
     s = str(raw).strip()
-    hit = _OVERSEAS_STOCK_EXCHANGE.get(s) or _OVERSEAS_STOCK_EXCHANGE.get(s.upper())
+    hit = _OVERSEAS_STOCK_EXCHANGE_LOOKUP.get(s) or _OVERSEAS_STOCK_EXCHANGE_LOOKUP.get(s.upper())
     return hit if hit else (None, None)
 
 
@@ -1274,6 +1413,39 @@ def overseas_stock_exchange_pair(raw: Any) -> "tuple[str, str]":
     return ("", "")  # 이름형 미지 표기 → 데이터에 안 박음(빈 값)
 
 
+def _symbol_code(item: Any) -> str:
+    """종목 리스트 항목({"symbol": ...} 또는 문자열)의 공백 제거 코드 (그 외 → 빈 문자열)."""
+    if isinstance(item, dict):
+        return str(item.get("symbol") or "").strip()
+    return item.strip() if isinstance(item, str) else ""
+
+
+@functools.lru_cache(maxsize=512)
+def _plugin_accepts_context(plugin: Callable) -> bool:
+    """플러그인 시그니처에 ``context`` 인자가 있는지 — 플러그인 객체당 한 번만 inspect.
+
+    ConditionNode 는 틱/아이템마다 실행되지만 플러그인 callable 은 워크플로 resolve 때
+    정해진 같은 객체다. 재등록된 플러그인은 새 객체라 캐시 키도 새로 잡힌다.
+    """
+    import inspect
+    try:
+        return "context" in inspect.signature(plugin).parameters
+    except (ValueError, TypeError):
+        return False
+
+
+def _attr_or(obj: Any, attr: str, fallback: str, default: Any = "") -> Any:
+    """obj.attr — 필드가 없을 때만 obj.fallback (없으면 default).
+
+    getattr(obj, attr, getattr(obj, fallback, default)) 는 기본값 자리의 getattr 를
+    매번 먼저 평가한다. 주 필드가 있는 게 보통인 이벤트/레코드 경로에서 그 조회를 건너뛴다.
+    """
+    try:
+        return getattr(obj, attr)
+    except AttributeError:
+        return getattr(obj, fallback, default)
+
+
 # Sentinel: a split branch item that produced no real (public) data this cycle
 # and must NOT contribute a row to the AggregateNode/Display. Used when the
 # terminal branch node emits only internal meta (e.g. ThrottleNode is throttling
@@ -1384,6 +1556,14 @@ class AggregateNodeExecutor(NodeExecutorBase):
     Note: The collected items are stored in context by _execute_main_flow.
     """
 
+    # 수치 집계 모드 → 집계 함수 (비어 있지 않은 숫자 리스트를 받는다)
+    NUMERIC_REDUCERS = {
+        "sum": sum,
+        "avg": lambda values: sum(values) / len(values),
+        "min": min,
+        "max": max,
+    }
+
     async def execute(
         self,
         node_id: str,
@@ -1421,7 +1601,7 @@ class AggregateNodeExecutor(NodeExecutorBase):
                     result_array.append(item)
             result_count = len(result_array)
 
-        elif mode in ("sum", "avg", "min", "max"):
+        elif mode in self.NUMERIC_REDUCERS:
             # Aggregate numeric values
             values = []
             for item in collected_items:
@@ -1436,14 +1616,7 @@ class AggregateNodeExecutor(NodeExecutorBase):
                     values.append(val)
 
             if values:
-                if mode == "sum":
-                    result_value = sum(values)
-                elif mode == "avg":
-                    result_value = sum(values) / len(values)
-                elif mode == "min":
-                    result_value = min(values)
-                elif mode == "max":
-                    result_value = max(values)
+                result_value = self.NUMERIC_REDUCERS[mode](values)
 
             result_count = len(values)
             result_array = collected_items
@@ -1599,11 +1772,9 @@ class ScheduleNodeExecutor(NodeExecutorBase):
                         node_id
                     )
                     
-                    # 대기 (1초 단위로 나눠서 is_running 체크)
-                    while delay > 0 and context.is_running:
-                        sleep_time = min(delay, 1.0)
-                        await asyncio.sleep(sleep_time)
-                        delay -= sleep_time
+                    # 대기 — stop()/fail() 이 오면 다음 틱을 기다리지 않고 바로 깨어난다
+                    if delay > 0:
+                        await context.wait_stopped(delay)
                     
                     if not context.is_running:
                         break
@@ -1671,18 +1842,29 @@ class WatchlistNodeExecutor(NodeExecutorBase):
     ) -> Dict[str, Any]:
         # config 내 {{ }} 표현식 평가 (list-of-dict 중첩 포함 — MarketDataNode
         # 와 동일 사유. evaluate_fields 는 리스트 항목 dict 를 재귀하지 않음).
+        # 노드 자신의 config 에 dict 리터럴로 적힌 항목은 evaluate_all_bindings 가 새 dict 로
+        # 만들어 주므로 그대로 넘겨도 된다. 바인딩({{ nodes.x.symbols }})으로 들어온 항목은
+        # 상류 노드 출력과 같은 객체라 반드시 복사한다.
+        declared = config.get("symbols")
+        literal_positions = (
+            {i for i, entry in enumerate(declared) if isinstance(entry, dict)}
+            if isinstance(declared, list) else set()
+        )
+
         config = evaluate_all_bindings(config, context, node_id)
 
         symbols_raw = config.get("symbols", [])
 
         # symbols 처리: [{exchange, symbol}, ...] 형태로 정규화
         processed_symbols = []
-        for entry in symbols_raw:
+        for i, entry in enumerate(symbols_raw):
             if isinstance(entry, dict):
                 exchange = entry.get("exchange", "")
                 symbol = entry.get("symbol", "")
                 
-                if symbol:
+                if symbol and i in literal_positions and len(entry) == 2 and "exchange" in entry:
+                    processed_symbols.append(entry)
+                elif symbol:
                     processed_symbols.append({
                         "exchange": exchange,
                         "symbol": symbol,
@@ -1723,69 +1905,51 @@ class SymbolFilterNodeExecutor(NodeExecutorBase):
         input_a = config.get("input_a") or []  # None 대응
         input_b = config.get("input_b") or []  # None 대응
         
-        # 종목 코드만 추출하여 집합으로 변환
-        def extract_symbols(symbol_list: List) -> set:
-            if not symbol_list:
-                return set()
-            result = set()
-            for item in symbol_list:
-                if isinstance(item, dict):
-                    symbol = item.get("symbol", "")
-                    if symbol:
-                        result.add(symbol)
-                elif isinstance(item, str):
-                    result.add(item)
-            return result
-        
-        # 원본 종목 정보 유지를 위한 매핑
+        from programgarden_core.models import normalize_symbol
+
+        # 원본 종목 정보 유지를 위한 매핑 — 입력을 한 번만 순회하며, 키는 공백을
+        # 제거한 종목 코드. dict 키 조회가 O(1) 이므로 별도 set 을 만들지 않고
+        # 입력 순서도 그대로 유지된다.
         def build_symbol_map(symbol_list: List) -> Dict[str, Dict]:
-            if not symbol_list:
-                return {}
-            from programgarden_core.models import normalize_symbol
-            result = {}
+            result: Dict[str, Dict] = {}
             for item in symbol_list:
-                if isinstance(item, dict):
-                    symbol = item.get("symbol", "")
-                    if symbol and symbol not in result:
-                        # exchange가 없으면 추정
-                        if item.get("exchange"):
-                            result[symbol] = item
-                        else:
-                            result[symbol] = normalize_symbol(symbol)
-                elif isinstance(item, str):
-                    if item not in result:
-                        result[item] = normalize_symbol(item)
+                code = _symbol_code(item)
+                if not code or code in result:
+                    continue
+                # exchange가 없으면 추정
+                if isinstance(item, dict) and item.get("exchange"):
+                    result[code] = item
+                else:
+                    result[code] = normalize_symbol(code)
             return result
-        
-        set_a = extract_symbols(input_a)
-        set_b = extract_symbols(input_b)
+
+        if operation not in ("difference", "intersection", "union"):
+            context.log("warning", f"Unknown operation: {operation}, using difference", node_id)
+            operation = "difference"
+
         map_a = build_symbol_map(input_a)
-        map_b = build_symbol_map(input_b)
-        
-        # 집합 연산 수행
-        if operation == "difference":
-            result_symbols = set_a - set_b
-            source_map = map_a
-        elif operation == "intersection":
-            result_symbols = set_a & set_b
-            source_map = map_a
-        elif operation == "union":
-            result_symbols = set_a | set_b
-            source_map = {**map_b, **map_a}  # A가 우선
+
+        # 집합 연산 수행 (결과는 A 입력 순서, union 은 A 뒤에 B 전용 종목)
+        if operation == "union":
+            map_b = build_symbol_map(input_b)
+            count_b = len(map_b)
+            output_symbols = list(map_a.values()) + [
+                s for code, s in map_b.items() if code not in map_a
+            ]
         else:
-            context.log("warning", f"Unknown operation: {operation}, using difference", node_id)
-            result_symbols = set_a - set_b
-            source_map = map_a
-        
-        # 결과를 원본 형식으로 복원
-        output_symbols = []
-        for symbol in result_symbols:
-            if symbol in source_map:
-                output_symbols.append(source_map[symbol])
+            # difference / intersection 은 B 의 종목 코드만 쓰므로 B 쪽은
+            # normalize_symbol 없이 코드 set 만 만든다
+            codes_b = {code for code in map(_symbol_code, input_b) if code}
+            count_b = len(codes_b)
+            # 겹치는 종목이 없으면 (작은 쪽만 훑는 isdisjoint) 항목별 조회를 생략
+            if map_a.keys().isdisjoint(codes_b):
+                output_symbols = list(map_a.values()) if operation == "difference" else []
+            elif operation == "intersection":
+                output_symbols = [s for code, s in map_a.items() if code in codes_b]
             else:
-                output_symbols.append({"symbol": symbol, "exchange": ""})
-        
-        context.log("info", f"SymbolFilter ({operation}): {len(set_a)} - {len(set_b)} = {len(output_symbols)} symbols", node_id)
+                output_symbols = [s for code, s in map_a.items() if code not in codes_b]
+
+        context.log("info", f"SymbolFilter ({operation}): {len(map_a)} - {count_b} = {len(output_symbols)} symbols", node_id)
 
         # deep_validate: a set op (e.g. difference = "candidates minus already-held")
         # can legitimately empty out on fixture data, which would unreachably gate
@@ -1898,14 +2062,14 @@ class ExclusionListNodeExecutor(NodeExecutorBase):
         input_symbols = config.get("input_symbols")
         filtered = []
         if input_symbols:
-            excluded_set = set(excluded_map.keys())
-            for item in input_symbols:
-                if isinstance(item, dict):
-                    symbol = item.get("symbol", "")
-                    if symbol and symbol not in excluded_set:
-                        filtered.append(item)
-                elif isinstance(item, str) and item not in excluded_set:
-                    filtered.append({"exchange": "", "symbol": item})
+            # 종목 코드는 항목당 한 번만 공백 제거해 set 조회 (브로커 응답의 패딩 코드 대응).
+            # 코드 추출 · 제외 판정 · 출력 구성을 한 번의 순회로 끝낸다.
+            excluded_codes = {symbol.strip() for symbol in excluded_map}
+            filtered = [
+                item if isinstance(item, dict) else {"exchange": "", "symbol": code}
+                for item in input_symbols
+                if (code := _symbol_code(item)) and code not in excluded_codes
+            ]
 
         context.log(
             "info",
@@ -2339,7 +2503,8 @@ class ScreenerNodeExecutor(NodeExecutorBase):
             and not any(_has_ls_enrichment(s) for s in dict_inputs)
         )
 
-        working_symbols: List[Dict[str, Any]] = list(dict_inputs)
+        # dict_inputs 는 위에서 새로 만든 리스트라 복사 없이 그대로 rebind 한다
+        working_symbols: List[Dict[str, Any]] = dict_inputs
 
         if needs_g3101_enrichment:
             if market_cap_min is not None or market_cap_max is not None:
@@ -2359,7 +2524,8 @@ class ScreenerNodeExecutor(NodeExecutorBase):
                 working_symbols, max_results, context, node_id,
             )
 
-        # 1단계: 가격/시총 정보로 빠르게 필터
+        # 1단계: 가격/시총 정보로 빠르게 필터 (거래소 필터 값은 종목마다 바뀌지 않는다)
+        exchange_filter = exchange.upper() if exchange else ""
         prefilter: List[Dict[str, Any]] = []
         for sym in working_symbols:
             # 거래정지/매도전용 종목 자동 제외 (g3190 enriched 입력에만 존재)
@@ -2382,7 +2548,7 @@ class ScreenerNodeExecutor(NodeExecutorBase):
                 continue
             if market_cap_max and mcap > market_cap_max:
                 continue
-            if exchange and exchange.upper() not in (sym.get("exchange") or "").upper():
+            if exchange_filter and exchange_filter not in (sym.get("exchange") or "").upper():
                 continue
 
             prefilter.append({
@@ -2409,9 +2575,10 @@ class ScreenerNodeExecutor(NodeExecutorBase):
             # 이미 g3101 enrich 한 결과에서 volume_min 적용
             prefilter = [p for p in prefilter if p.get("volume", 0) >= volume_min]
 
-        # 시가총액 큰 순으로 정렬 + max_results 절단
-        prefilter.sort(key=lambda x: x.get("market_cap", 0), reverse=True)
-        result = prefilter[:max_results]
+        # 시가총액 큰 순 상위 max_results — 전체 정렬 없이 O(N log k) 로 고른다
+        # (nlargest 는 sorted(..., reverse=True)[:k] 와 같은 결과·순서를 보장).
+        # market_cap 은 위에서 항상 float 로 채운다.
+        result = heapq.nlargest(max_results, prefilter, key=itemgetter("market_cap"))
 
         # silent failure 차단: 입력은 있었는데 결과 0 + 실 운영 모드 → 명시 raise
         if (
@@ -2481,41 +2648,47 @@ class ScreenerNodeExecutor(NodeExecutorBase):
         enriched: List[Dict[str, Any]] = []
         enrich_failures = 0
 
-        for sym in candidates[:limit]:
-            ticker = sym.get("symbol", "")
-            if not ticker:
-                continue
+        async def _enrich_one(sym: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            ticker = sym["symbol"]
             try:
                 query = ls.overseas_stock().시세().현재가조회(
                     g3101.G3101InBlock(symbol=ticker)
                 )
                 result = await query.req_async()
-                price_val = 0.0
-                vol_val = 0
-                if result and hasattr(result, "block") and result.block:
-                    block = result.block
-                    raw_price = getattr(block, "price", "") or ""
-                    try:
-                        price_val = float(raw_price) if raw_price else 0.0
-                    except (TypeError, ValueError):
-                        price_val = 0.0
-                    vol_val = int(getattr(block, "volume", 0) or 0)
-                if price_val > 0 or vol_val > 0:
-                    new_entry = dict(sym)
-                    new_entry["price"] = price_val
-                    new_entry["volume"] = vol_val
-                    new_entry.setdefault("market_cap", 0)
-                    enriched.append(new_entry)
-                else:
-                    enrich_failures += 1
             except Exception as e:
-                enrich_failures += 1
                 context.log(
                     "debug",
                     f"g3101 enrich {ticker} 실패: {e}",
                     node_id,
                 )
-                continue
+                return None
+            price_val = 0.0
+            vol_val = 0
+            if result and hasattr(result, "block") and result.block:
+                block = result.block
+                raw_price = getattr(block, "price", "") or ""
+                try:
+                    price_val = float(raw_price) if raw_price else 0.0
+                except (TypeError, ValueError):
+                    price_val = 0.0
+                vol_val = int(getattr(block, "volume", 0) or 0)
+            if price_val > 0 or vol_val > 0:
+                new_entry = dict(sym)
+                new_entry["price"] = price_val
+                new_entry["volume"] = vol_val
+                new_entry.setdefault("market_cap", 0)
+                return new_entry
+            return None
+
+        # 종목별 g3101 은 서로 독립이라 상한 안에서 동시에 보낸다 (결과는 입력 순서 유지)
+        fetched = await _gather_bounded(
+            _enrich_one, [sym for sym in candidates[:limit] if sym.get("symbol")]
+        )
+        for entry in fetched:
+            if isinstance(entry, dict):
+                enriched.append(entry)
+            else:
+                enrich_failures += 1
 
         if enrich_failures and not enriched:
             context.log(
@@ -2563,29 +2736,33 @@ class ScreenerNodeExecutor(NodeExecutorBase):
 
         # max_results의 2배까지만 검사 (속도 보호)
         limit = max_results * 2
-        passed: List[Dict[str, Any]] = []
+        targets = [sym for sym in candidates[:limit] if sym.get("symbol")]
 
-        for sym in candidates[:limit]:
-            ticker = sym.get("symbol", "")
-            if not ticker:
-                continue
+        async def _volume_of(sym: Dict[str, Any]) -> Optional[int]:
+            ticker = sym["symbol"]
             try:
                 query = ls.overseas_stock().시세().현재가조회(
                     g3101.G3101InBlock(symbol=ticker)
                 )
                 result = await query.req_async()
-                vol = 0
-                if result and hasattr(result, 'block') and result.block:
-                    # g3101 OutBlock.volume = 누적 거래량
-                    vol = int(getattr(result.block, 'volume', 0) or 0)
-                if vol >= volume_min:
-                    sym["volume"] = vol
-                    passed.append(sym)
-                    if len(passed) >= max_results:
-                        break
             except Exception as e:
                 context.log("debug", f"g3101 {ticker} 호출 실패: {e}", node_id)
-                continue
+                return None
+            if result and hasattr(result, 'block') and result.block:
+                # g3101 OutBlock.volume = 누적 거래량
+                return int(getattr(result.block, 'volume', 0) or 0)
+            return 0
+
+        # 종목별 조회는 상한 안에서 동시에 보내고, 통과 판정은 입력 순서대로 해
+        # 앞쪽 후보 max_results 개를 고르던 기존 결과를 그대로 유지한다.
+        volumes = await _gather_bounded(_volume_of, targets)
+        passed: List[Dict[str, Any]] = []
+        for sym, vol in zip(targets, volumes):
+            if isinstance(vol, int) and vol >= volume_min:
+                sym["volume"] = vol
+                passed.append(sym)
+                if len(passed) >= max_results:
+                    break
 
         return passed
     
@@ -2653,6 +2830,13 @@ class ScreenerNodeExecutor(NodeExecutorBase):
         # yfinance 동기 호출을 thread pool에서 실행 (이벤트 루프 블로킹 방지)
         def _sync_filter():
             import yfinance as yf
+
+            def _normalize_sector(value: str) -> str:
+                return value.lower().replace(" ", "").replace("-", "").replace("_", "")
+
+            # 후보와 무관한 필터 값은 루프 전에 한 번만 정규화
+            sector_filter = _normalize_sector(sector) if sector else ""
+            exchange_filter = exchange.upper() if exchange else ""
             filtered = []
             attempted = 0
             info_succeeded = 0
@@ -2681,8 +2865,7 @@ class ScreenerNodeExecutor(NodeExecutorBase):
                     stock_exchange = info.get("exchange", "") or ""
 
                     # 거래소 매핑 (yfinance 코드 → 표준 이름)
-                    ex_map = {"NMS": "NASDAQ", "NGM": "NASDAQ", "NYQ": "NYSE", "ASE": "AMEX", "NCM": "NASDAQ", "KSC": "KOSPI", "KOE": "KOSDAQ"}
-                    mapped_exchange = ex_map.get(stock_exchange, stock_exchange)
+                    mapped_exchange = _YFINANCE_EXCHANGE_NAMES.get(stock_exchange, stock_exchange)
 
                     if market_cap_min and mcap < market_cap_min:
                         continue
@@ -2695,13 +2878,10 @@ class ScreenerNodeExecutor(NodeExecutorBase):
                     if price_max is not None and price > price_max:
                         continue
                     # sector 정규화 비교 (대소문자, 띄어쓰기 무시)
-                    if sector:
-                        normalized_input = sector.lower().replace(" ", "").replace("-", "").replace("_", "")
-                        normalized_stock = stock_sector.lower().replace(" ", "").replace("-", "").replace("_", "")
-                        if normalized_input != normalized_stock:
-                            continue
+                    if sector_filter and sector_filter != _normalize_sector(stock_sector):
+                        continue
                     # exchange 필터 (매핑된 값으로 비교)
-                    if exchange and exchange.upper() not in mapped_exchange.upper():
+                    if exchange_filter and exchange_filter not in mapped_exchange.upper():
                         continue
 
                     filtered.append({
@@ -2722,8 +2902,8 @@ class ScreenerNodeExecutor(NodeExecutorBase):
                     # 동기 함수에서는 context 사용 불가, 집계만 하고 skip
                     continue
 
-            # 시가총액 내림차순 정렬
-            filtered.sort(key=lambda x: x.get("market_cap", 0), reverse=True)
+            # 시가총액 내림차순 정렬 (max_results 에서 이미 끊겨 전체 정렬로 충분)
+            filtered.sort(key=itemgetter("market_cap"), reverse=True)
             return filtered[:max_results], attempted, info_succeeded
 
         # thread pool에서 실행하여 이벤트 루프 블로킹 방지
@@ -2969,9 +3149,18 @@ class SymbolQueryNodeExecutor(NodeExecutorBase):
             gubun_list.append(("2", "KOSDAQ"))
 
         try:
-            for gubun, market_name in gubun_list:
-                body = T9945InBlock(gubun=gubun)
-                response = api.market().t9945(body=body).req()
+            # 시장별 t9945 는 서로 독립이라 동시에 조회한다. 한 시장이 실패해도 나머지는 쓴다.
+            queries = [
+                api.market().t9945(body=T9945InBlock(gubun=gubun)) for gubun, _ in gubun_list
+            ]
+            responses = await _gather_bounded(lambda query: asyncio.to_thread(query.req), queries)
+            if responses and all(isinstance(r, BaseException) for r in responses):
+                raise responses[0]
+
+            for (_, market_name), response in zip(gubun_list, responses):
+                if isinstance(response, BaseException):
+                    context.log("warning", f"t9945 {market_name} 조회 실패: {response}", node_id)
+                    continue
 
                 if response and response.block:
                     for item in response.block:
@@ -3028,19 +3217,25 @@ class SymbolQueryNodeExecutor(NodeExecutorBase):
 
         all_symbols = []
 
-        try:
-            # gubun 은 거래소 필터가 **아니다** — 실측: 0/1/2/6 어느 값이든 같은 전체 목록을 준다.
-            # 거래소 좁히기는 응답의 ExchCd 로 클라이언트에서 한다(아래). gubun 은 "0" 고정.
-            query = ls.overseas_futureoption().market().해외선물마스터조회(
-                body=o3101.O3101InBlock(gubun="0")
-            )
+        # o3101 은 시장 전체 마스터라 FuturesContractNode 와 같은 TTL 캐시를 공유한다
+        # (스케줄 틱마다, 또는 두 노드가 한 워크플로우에 있을 때 다시 묻지 않는다).
+        # 캐시된 행은 읽기만 하고 출력 dict 는 매번 새로 만든다.
+        rows = FuturesContractNodeExecutor._cached_master_rows(ls, paper_trading)
+        if rows is None:
+            try:
+                # gubun 은 거래소 필터가 **아니다** — 실측: 0/1/2/6 어느 값이든 같은 전체 목록을 준다.
+                # 거래소 좁히기는 응답의 ExchCd 로 클라이언트에서 한다(아래). gubun 은 "0" 고정.
+                query = ls.overseas_futureoption().market().해외선물마스터조회(
+                    body=o3101.O3101InBlock(gubun="0")
+                )
 
-            result = await query.req_async()
-            rows = list(getattr(result, 'block', None) or [])
+                result = await query.req_async()
+                rows = list(getattr(result, 'block', None) or [])
 
-        except Exception as e:
-            context.log("error", f"o3101 API error: {str(e)}", node_id)
-            return {"symbols": [], "count": 0, "error": str(e)}
+            except Exception as e:
+                context.log("error", f"o3101 API error: {str(e)}", node_id)
+                return {"symbols": [], "count": 0, "error": str(e)}
+            FuturesContractNodeExecutor._store_master_rows(ls, paper_trading, rows)
 
         wanted_exchange = self.FUTURES_EXCHANGE_CODES.get(futures_exchange, futures_exchange)
         if wanted_exchange in ("1", "", "ALL"):
@@ -3109,18 +3304,20 @@ class SymbolQueryNodeExecutor(NodeExecutorBase):
             "product": "overseas_futures",
         }
     
+    # 해외주식 거래소 코드 → 이름. 종목 수천 건마다 불리므로 매번 dict 를 만들지 않는다.
+    # Note: AMEX 종목도 exchcd=81로 반환됨 (NYSE/AMEX 통합)
+    STOCK_EXCHANGE_NAMES = {
+        "81": "NYSE/AMEX",
+        "82": "NASDAQ",
+        "84": "SEHK",  # 홍콩
+        "85": "TSE",   # 일본
+        "86": "SSE",   # 상해
+        "87": "SZSE",  # 심천
+    }
+
     def _stock_exchcd_to_name(self, exchcd: str) -> str:
         """해외주식 거래소 코드 → 이름"""
-        # Note: AMEX 종목도 exchcd=81로 반환됨 (NYSE/AMEX 통합)
-        mapping = {
-            "81": "NYSE/AMEX",
-            "82": "NASDAQ",
-            "84": "SEHK",  # 홍콩
-            "85": "TSE",   # 일본
-            "86": "SSE",   # 상해
-            "87": "SZSE",  # 심천
-        }
-        return mapping.get(exchcd, exchcd)
+        return self.STOCK_EXCHANGE_NAMES.get(exchcd, exchcd)
     
     # 노드 스키마의 거래소 enum(1~7) → o3101 응답의 ExchCd.
     # o3101 의 gubun 입력은 거래소 필터가 아니므로(실측), 좁히기는 이 표로 클라이언트에서 한다.
@@ -3152,20 +3349,22 @@ class SymbolQueryNodeExecutor(NodeExecutorBase):
         now = datetime.now()
         return (year, month) < (now.year, now.month)
 
+    # 해외선물 거래소 코드 → 이름
+    FUTURES_EXCHANGE_NAMES = {
+        "CME": "CME",
+        "COMEX": "COMEX",
+        "NYMEX": "NYMEX",
+        "CBOT": "CBOT",
+        "SGX": "SGX",
+        "HKEX": "HKEX",
+        "OSE": "OSE",
+        "EUREX": "EUREX",
+        "ICE": "ICE",
+    }
+
     def _futures_exchcd_to_name(self, exchcd: str) -> str:
         """해외선물 거래소 코드 → 이름"""
-        mapping = {
-            "CME": "CME",
-            "COMEX": "COMEX",
-            "NYMEX": "NYMEX",
-            "CBOT": "CBOT",
-            "SGX": "SGX",
-            "HKEX": "HKEX",
-            "OSE": "OSE",
-            "EUREX": "EUREX",
-            "ICE": "ICE",
-        }
-        return mapping.get(exchcd, exchcd)
+        return self.FUTURES_EXCHANGE_NAMES.get(exchcd, exchcd)
     
     def _filter_by_contract_month(
         self, symbols: List[Dict[str, Any]], month_filter: str
@@ -3237,6 +3436,13 @@ class FuturesContractNodeExecutor(NodeExecutorBase):
     하류(historical/market/condition/order) 배선이 그대로 유지된다.
     """
 
+    # o3101 마스터(상장 월물 목록) 캐시 TTL (초). 마스터는 세션 중 거의 바뀌지 않아 스케줄
+    # 틱마다 다시 묻지 않는다. 만기 경과 판정은 캐시된 행에도 매 실행 다시 적용되므로 월이
+    # 바뀌면 롤오버는 그대로 일어난다. 0 이면 캐시하지 않는다.
+    MASTER_CACHE_TTL = float(os.environ.get("PG_CONTRACT_MASTER_CACHE_TTL", "600"))
+    # {ls 인스턴스: {paper_trading: (만료 monotonic, o3101 행)}} — ls 가 사라지면 항목도 사라진다
+    _master_cache: "weakref.WeakKeyDictionary[Any, Dict[bool, Any]]" = weakref.WeakKeyDictionary()
+
     async def execute(
         self,
         node_id: str,
@@ -3306,39 +3512,7 @@ class FuturesContractNodeExecutor(NodeExecutorBase):
         if not success:
             raise RuntimeError(f"FuturesContractNode[{node_id}]: LS login failed: {error}")
 
-        # LS 는 같은 앱키로 요청이 몰리면 o3101 에 **빈 블록**을 돌려준다(에러가 아니라 빈 배열).
-        # 그 한 번에 워크플로우를 죽이면, 실제로는 멀쩡한 전략이 스케줄 한 틱을 통째로 날린다.
-        # 짧게 몇 번 다시 물어보고, 그래도 비어 있을 때만 (진짜 권한/장애로 보고) 크게 실패한다.
-        rows: List[Any] = []
-        last_error: Optional[Exception] = None
-        for attempt in range(3):
-            if attempt:
-                await asyncio.sleep(1.5 * attempt)
-            try:
-                query = ls.overseas_futureoption().market().해외선물마스터조회(
-                    body=o3101.O3101InBlock(gubun="0")
-                )
-                result = await query.req_async()
-            except Exception as e:  # noqa: BLE001 — 원인을 그대로 사용자에게 전달한다
-                last_error = e
-                context.log("warning", f"o3101 조회 실패 (시도 {attempt + 1}/3): {e}", node_id)
-                continue
-            rows = getattr(result, "block", None) or []
-            if rows:
-                break
-            context.log("warning", f"o3101 이 빈 마스터를 반환 (시도 {attempt + 1}/3)", node_id)
-
-        if not rows:
-            if last_error is not None:
-                raise RuntimeError(
-                    f"FuturesContractNode[{node_id}]: LS contract-master query (o3101) failed "
-                    f"after 3 attempts: {last_error}"
-                ) from last_error
-            raise RuntimeError(
-                f"FuturesContractNode[{node_id}]: LS returned an empty contract master (o3101) "
-                f"on 3 attempts. The broker session may lack overseas-futures entitlement, or too "
-                f"many requests are sharing this app key at once."
-            )
+        rows = await self._master_rows(ls, paper_trading, context, node_id)
 
         # 거래소 필터를 걸기 **전** 목록도 들고 있는다 — 실패 메시지의 "쓸 수 있는 코드" 를
         # 필터 뒤 목록에서 뽑으면, 거래소를 잘못 골랐을 때 "LS 에 아무것도 없다" 로 읽혀
@@ -3397,6 +3571,82 @@ class FuturesContractNodeExecutor(NodeExecutorBase):
         )
         return {"symbols": symbols, "contracts": detail, "count": len(symbols)}
 
+    async def _master_rows(
+        self, ls: Any, paper_trading: bool, context: ExecutionContext, node_id: str
+    ) -> List[Any]:
+        """o3101 마스터 행을 LS 세션별 TTL 캐시를 거쳐 조회한다 (빈 응답은 캐시하지 않는다)."""
+        from programgarden_finance import o3101
+
+        cached = self._cached_master_rows(ls, paper_trading)
+        if cached is not None:
+            return cached
+
+        # LS 는 같은 앱키로 요청이 몰리면 o3101 에 **빈 블록**을 돌려준다(에러가 아니라 빈 배열).
+        # 그 한 번에 워크플로우를 죽이면, 실제로는 멀쩡한 전략이 스케줄 한 틱을 통째로 날린다.
+        # 짧게 몇 번 다시 물어보고, 그래도 비어 있을 때만 (진짜 권한/장애로 보고) 크게 실패한다.
+        rows: List[Any] = []
+        last_error: Optional[Exception] = None
+        for attempt in range(3):
+            if attempt:
+                await asyncio.sleep(1.5 * attempt)
+            try:
+                query = ls.overseas_futureoption().market().해외선물마스터조회(
+                    body=o3101.O3101InBlock(gubun="0")
+                )
+                result = await query.req_async()
+            except Exception as e:  # noqa: BLE001 — 원인을 그대로 사용자에게 전달한다
+                last_error = e
+                context.log("warning", f"o3101 조회 실패 (시도 {attempt + 1}/3): {e}", node_id)
+                continue
+            rows = getattr(result, "block", None) or []
+            if rows:
+                break
+            context.log("warning", f"o3101 이 빈 마스터를 반환 (시도 {attempt + 1}/3)", node_id)
+
+        if not rows:
+            if last_error is not None:
+                raise RuntimeError(
+                    f"FuturesContractNode[{node_id}]: LS contract-master query (o3101) failed "
+                    f"after 3 attempts: {last_error}"
+                ) from last_error
+            raise RuntimeError(
+                f"FuturesContractNode[{node_id}]: LS returned an empty contract master (o3101) "
+                f"on 3 attempts. The broker session may lack overseas-futures entitlement, or too "
+                f"many requests are sharing this app key at once."
+            )
+
+        self._store_master_rows(ls, paper_trading, rows)
+        return rows
+
+    @classmethod
+    def _cached_master_rows(cls, ls: Any, paper_trading: bool) -> Optional[List[Any]]:
+        """캐시에 살아 있는 o3101 행 (없거나 만료면 None).
+
+        OverseasFuturesSymbolQueryNode 도 같은 마스터를 조회하므로 이 캐시를 함께 쓴다.
+        """
+        import time as _time
+
+        try:
+            entry = cls._master_cache.get(ls, {}).get(paper_trading)
+        except TypeError:
+            return None  # weakref 불가 객체 — 캐시 없이 조회
+        if entry is not None and entry[0] > _time.monotonic():
+            return entry[1]
+        return None
+
+    @classmethod
+    def _store_master_rows(cls, ls: Any, paper_trading: bool, rows: List[Any]) -> None:
+        """o3101 행을 TTL 캐시에 넣는다 (빈 응답 · TTL 0 · weakref 불가 객체는 넣지 않음)."""
+        import time as _time
+
+        if not rows or cls.MASTER_CACHE_TTL <= 0:
+            return
+        try:
+            entries = cls._master_cache.setdefault(ls, {})
+        except TypeError:
+            return
+        entries[paper_trading] = (_time.monotonic() + cls.MASTER_CACHE_TTL, rows)
+
     def _parse_master(self, rows: Any, exchange_filter: str) -> List[Dict[str, Any]]:
         """o3101 응답을 파싱하고 **만기 경과 월물을 제거**한다.
 
@@ -3500,7 +3750,7 @@ class BrokerNodeExecutor(NodeExecutorBase):
 
         for key in keys_to_remove:
             del self._active_trackers[key]
-            logger.debug(f"Cleaned up fill subscription: {key}")
+            logger.debug("Cleaned up fill subscription: %s", key)
 
     async def execute(
         self,
@@ -3639,8 +3889,10 @@ class BrokerNodeExecutor(NodeExecutorBase):
         # ========================================
         # Fallback: 체결내역 조회로 시장가 주문 가격 복구
         # 연결 끊김 등으로 실시간 체결 이벤트를 놓친 경우 대비
+        # 복구 대상은 포지션 추적기에만 있으므로, 추적기가 없으면(리스너 없음 /
+        # dry_run) 태스크 자체를 띄우지 않는다.
         # ========================================
-        if appkey and appsecret:
+        if appkey and appsecret and context._workflow_position_tracker is not None:
             asyncio.create_task(
                 self._sync_fill_prices_from_history(
                     node_id=node_id,
@@ -3780,7 +4032,7 @@ class BrokerNodeExecutor(NodeExecutorBase):
         """리스너 중 on_workflow_pnl_update를 실제로 오버라이드한 게 있는지 확인"""
         from programgarden_core.bases import BaseExecutionListener
 
-        logger.debug(f"[_has_workflow_pnl_listener] Checking {len(context._listeners)} listeners")
+        logger.debug("[_has_workflow_pnl_listener] Checking %d listeners", len(context._listeners))
         for listener in context._listeners:
             listener_class = type(listener)
             if 'on_workflow_pnl_update' in listener_class.__dict__:
@@ -3866,7 +4118,7 @@ class BrokerNodeExecutor(NodeExecutorBase):
                 body = getattr(resp, 'body', resp)
                 ord_type_code = getattr(body, 'sOrdxctPtnCode', '')
                 
-                logger.info(f"📡 AS0 event: type={ord_type_code}")
+                logger.info("📡 AS0 event: type=%s", ord_type_code)
                 
                 # 필요한 필드 추출
                 order_no = str(getattr(body, 'sOrdNo', ''))
@@ -3886,7 +4138,7 @@ class BrokerNodeExecutor(NodeExecutorBase):
                         ),
                         loop
                     )
-                    logger.debug(f"📌 Workflow order modified: {order_no}")
+                    logger.debug("📌 Workflow order modified: %s", order_no)
                 
                 elif ord_type_code == '13':  # 취소완료
                     asyncio.run_coroutine_threadsafe(
@@ -3896,7 +4148,7 @@ class BrokerNodeExecutor(NodeExecutorBase):
                         ),
                         loop
                     )
-                    logger.debug(f"📌 Workflow order cancelled: {order_no}")
+                    logger.debug("📌 Workflow order cancelled: %s", order_no)
                     
             except Exception as e:
                 logger.warning(f"Error processing AS0 event: {e}")
@@ -3916,19 +4168,18 @@ class BrokerNodeExecutor(NodeExecutorBase):
                     # 체결 수량이 0이면 체결 이벤트가 아님
                     return
                 
-                logger.info(f"📡 AS1 fill event: qty={exec_qty}, price={exec_price}")
+                logger.info("📡 AS1 fill event: qty=%s, price=%s", exec_qty, exec_price)
                 
                 # 필요한 필드 추출
                 order_no = str(getattr(body, 'sOrdNo', ''))
                 order_date = datetime.now().strftime('%Y%m%d')  # AS1에는 sOrdDt 없음
-                symbol = getattr(body, 'sShtnIsuNo', getattr(body, 'sIsuNo', ''))
+                symbol = _attr_or(body, 'sShtnIsuNo', 'sIsuNo')
                 market_code = getattr(body, 'sOrdMktCode', '82')
                 side_code = getattr(body, 'sOrdPtnCode', '')  # 01: 매도, 02: 매수
                 fill_time = getattr(body, 'proctm', datetime.now().strftime('%H%M%S000'))
                 
                 # 시장코드 → 거래소 변환
-                exchange_map = {'81': 'NYSE', '82': 'NASDAQ', '83': 'AMEX'}
-                exchange = exchange_map.get(market_code, 'NASDAQ')
+                exchange = _LS_FILL_MARKET_TO_EXCHANGE.get(market_code, 'NASDAQ')
                 
                 # 매매구분 (AS1: sOrdPtnCode 또는 sBnsTp)
                 bns_tp = getattr(body, 'sBnsTp', '')  # 1: 매도, 2: 매수
@@ -3958,10 +4209,12 @@ class BrokerNodeExecutor(NodeExecutorBase):
                         tracker = tracker_info["tracker"]
                         if hasattr(tracker, 'refresh_now'):
                             await tracker.refresh_now()
-                            logger.debug(f"📊 AccountTracker refreshed after fill")
+                            logger.debug("📊 AccountTracker refreshed after fill")
                 
+                # 체결이 났으면 캐시된 예수금은 더 이상 믿을 수 없다
+                loop.call_soon_threadsafe(AccountNodeExecutor.invalidate_deposit_cache)
                 asyncio.run_coroutine_threadsafe(record_and_refresh(), loop)
-                logger.info(f"📌 Workflow fill recorded: {symbol} {side} {exec_qty}@{exec_price}")
+                logger.info("📌 Workflow fill recorded: %s %s %s@%s", symbol, side, exec_qty, exec_price)
                     
             except Exception as e:
                 logger.warning(f"Error processing AS1 event: {e}")
@@ -4034,7 +4287,10 @@ class BrokerNodeExecutor(NodeExecutorBase):
                 # 매매구분
                 side = 'buy' if side_code == '1' else 'sell'
 
-                logger.debug(f"[TC2] svc_id={svc_id}, ordr_ccd={ordr_ccd}, order_no={order_no}, symbol={symbol}")
+                logger.debug(
+                    "[TC2] svc_id=%s, ordr_ccd=%s, order_no=%s, symbol=%s",
+                    svc_id, ordr_ccd, order_no, symbol,
+                )
 
                 if svc_id == 'HO02':  # 주문 확인
                     if ordr_ccd == '2':  # 정정 완료
@@ -4093,10 +4349,12 @@ class BrokerNodeExecutor(NodeExecutorBase):
                 # 매매구분
                 side = 'buy' if side_code == '1' else 'sell'
 
-                logger.info(f"[TC3] 체결: svc_id={svc_id}, order_no={order_no}, symbol={symbol}, side={side}, qty={quantity}, price={price}")
+                logger.info("[TC3] 체결: svc_id=%s, order_no=%s, symbol=%s, side=%s, qty=%s, price=%s", svc_id, order_no, symbol, side, quantity, price)
 
                 if svc_id == 'CH01':  # 체결 통보
                     if price > 0 and quantity > 0:
+                        # 체결이 났으면 캐시된 예수금은 더 이상 믿을 수 없다
+                        loop.call_soon_threadsafe(AccountNodeExecutor.invalidate_deposit_cache)
                         asyncio.run_coroutine_threadsafe(
                             context.record_workflow_fill(
                                 order_no=order_no,
@@ -4169,7 +4427,7 @@ class BrokerNodeExecutor(NodeExecutorBase):
                     if exec_qty <= 0 or exec_price <= 0:
                         return
 
-                    logger.info(f"[SC1] 국내주식 체결: qty={exec_qty}, price={exec_price}")
+                    logger.info("[SC1] 국내주식 체결: qty=%s, price=%s", exec_qty, exec_price)
 
                     order_no = str(getattr(body, 'ordno', ''))
                     order_date = datetime.now().strftime('%Y%m%d')
@@ -4201,10 +4459,12 @@ class BrokerNodeExecutor(NodeExecutorBase):
                             tracker = tracker_info["tracker"]
                             if hasattr(tracker, 'refresh_now'):
                                 await tracker.refresh_now()
-                                logger.debug(f"KoreaStockAccountTracker refreshed after fill")
+                                logger.debug("KoreaStockAccountTracker refreshed after fill")
 
+                    # 체결이 났으면 캐시된 예수금은 더 이상 믿을 수 없다
+                    loop.call_soon_threadsafe(AccountNodeExecutor.invalidate_deposit_cache)
                     asyncio.run_coroutine_threadsafe(record_and_refresh(), loop)
-                    logger.info(f"Workflow fill recorded: {symbol} {side} {exec_qty}@{exec_price}")
+                    logger.info("Workflow fill recorded: %s %s %s@%s", symbol, side, exec_qty, exec_price)
 
                 elif ord_type_code == '12':  # 정정확인
                     order_no = str(getattr(body, 'ordno', ''))
@@ -4220,7 +4480,7 @@ class BrokerNodeExecutor(NodeExecutorBase):
                         ),
                         loop
                     )
-                    logger.debug(f"Workflow order modified (korea_stock): {order_no}")
+                    logger.debug("Workflow order modified (korea_stock): %s", order_no)
 
                 elif ord_type_code == '13':  # 취소확인
                     order_no = str(getattr(body, 'ordno', ''))
@@ -4232,7 +4492,7 @@ class BrokerNodeExecutor(NodeExecutorBase):
                         ),
                         loop
                     )
-                    logger.debug(f"Workflow order cancelled (korea_stock): {order_no}")
+                    logger.debug("Workflow order cancelled (korea_stock): %s", order_no)
 
             except Exception as e:
                 logger.warning(f"Error processing SC1 event: {e}")
@@ -4279,10 +4539,16 @@ class BrokerNodeExecutor(NodeExecutorBase):
                 context.log("warning", f"Failed to login for fill price sync: {error}", node_id)
                 return
             
+            # 조회일자는 한 번만 계산해 상품별 갈래에 그대로 넘긴다
+            query_date = datetime.now().strftime("%Y%m%d")
             if product == "overseas_stock":
-                await self._sync_overseas_stock_fill_prices(ls, orders_without_price, context, node_id)
+                await self._sync_overseas_stock_fill_prices(
+                    ls, orders_without_price, context, node_id, query_date=query_date
+                )
             elif product == "overseas_futures":
-                await self._sync_overseas_futures_fill_prices(ls, orders_without_price, context, node_id)
+                await self._sync_overseas_futures_fill_prices(
+                    ls, orders_without_price, context, node_id, query_date=query_date
+                )
             elif product == "korea_stock":
                 # 국내주식 체결가격 복구는 향후 구현 (t0425 미체결 조회 활용)
                 context.log("debug", f"korea_stock fill price sync not yet implemented", node_id)
@@ -4296,33 +4562,26 @@ class BrokerNodeExecutor(NodeExecutorBase):
         orders: list,
         context: ExecutionContext,
         node_id: str,
+        query_date: Optional[str] = None,
     ) -> None:
         """해외주식 체결내역에서 FIFO 포지션 동기화
         
         연결 끊김 등으로 실시간 체결 이벤트를 놓친 경우,
         체결내역 API를 조회하여 FIFO 포지션을 생성합니다.
+        query_date 가 주어지면 그 날짜(YYYYMMDD)로 조회합니다 (기본: 오늘).
         """
         try:
             from programgarden_finance import COSAQ00102
 
             
             # 오늘 날짜 기준 체결내역 조회 (COSAQ00102 = 주문체결내역조회)
-            today = datetime.now().strftime("%Y%m%d")
+            today = query_date or datetime.now().strftime("%Y%m%d")
             
             response = ls.overseas_stock().accno().cosaq00102(
                 body=COSAQ00102.COSAQ00102InBlock1(
-                    RecCnt=1,
-                    QryTpCode="1",  # 계좌별
-                    BkseqTpCode="1",  # 역순
-                    OrdMktCode="00",  # 전체 시장
-                    BnsTpCode="0",  # 전체 (매수/매도)
-                    IsuNo="",  # 전체 종목
-                    SrtOrdNo=999999999,  # 역순 시작
-                    OrdDt=today,  # 오늘 날짜
+                    **_COSAQ00102_ALL_ORDERS_QUERY,
+                    OrdDt=today,
                     ExecYn="1",  # 체결만 조회
-                    CrcyCode="000",  # 전체 통화
-                    ThdayBnsAppYn="0",
-                    LoanBalHldYn="0",
                 ),
             )
             result = await response.req_async()
@@ -4331,22 +4590,19 @@ class BrokerNodeExecutor(NodeExecutorBase):
                 context.log("debug", "No fill history found for today", node_id)
                 return
             
-            # 시장코드 → 거래소 매핑
-            market_to_exchange = {'81': 'NYSE', '82': 'NASDAQ', '83': 'AMEX'}
-            
             # 체결내역에서 상세 정보 추출 (block3 = 주문/체결 상세)
             fill_history = []
             for item in result.block3:
                 order_no = str(getattr(item, 'OrdNo', 0))
                 fill_price = float(getattr(item, 'OvrsExecPrc', 0))
                 fill_qty = int(getattr(item, 'ExecQty', 0))
-                symbol = str(getattr(item, 'ShtnIsuNo', getattr(item, 'IsuNo', '')))
+                symbol = str(_attr_or(item, 'ShtnIsuNo', 'IsuNo'))
                 market_code = str(getattr(item, 'OrdMktCode', '82'))
                 side_code = str(getattr(item, 'BnsTpCode', ''))  # 1=매도, 2=매수
                 fill_time = str(getattr(item, 'ExecTime', ''))
                 
                 # 시장코드 → 거래소
-                exchange = market_to_exchange.get(market_code, 'NASDAQ')
+                exchange = _LS_FILL_MARKET_TO_EXCHANGE.get(market_code, 'NASDAQ')
                 # 매매구분
                 side = 'sell' if side_code == '1' else 'buy'
                 
@@ -4383,33 +4639,61 @@ class BrokerNodeExecutor(NodeExecutorBase):
         orders: list,
         context: ExecutionContext,
         node_id: str,
+        query_date: Optional[str] = None,
     ) -> None:
-        """해외선물 체결내역에서 가격 동기화"""
+        """해외선물 주문내역(CIDBQ01800)에서 가격 동기화 (query_date 기본: 오늘)
+
+        종목별로 나눠 묻지 않고 전체 종목(IsuCodeVal="") 체결분을 한 번에 조회한 뒤
+        가격이 비어 있는 주문번호만 골라낸다. 전체 조회가 거부되면 해당 종목들만
+        종목별 조회로 대체한다.
+        """
         try:
-            from programgarden_finance import CIDBQ01800
-            
-            # 오늘 날짜 기준 체결내역 조회
-            today = datetime.now().strftime("%Y%m%d")
-            
-            response = ls.overseas_futureoption().accno().해외선물체결내역조회(
-                body=CIDBQ01800.CIDBQ01800InBlock(
-                    QryDt=today,
-                )
+            from programgarden_finance.ls.overseas_futureoption.accno.CIDBQ01800.blocks import (
+                CIDBQ01800InBlock1,
             )
-            result = await response.req_async()
-            
-            if not result or not hasattr(result, 'block1') or not result.block1:
+
+            today = query_date or datetime.now().strftime("%Y%m%d")
+            pending = {str(o.get("order_no", "")).strip() for o in orders} - {""}
+            if not pending:
                 return
-            
-            # 체결내역에서 주문번호별 가격 추출
-            fill_history = []
-            for item in result.block1:
-                fill_history.append({
-                    "order_no": str(getattr(item, 'OrdNo', '')),
-                    "order_date": today,
-                    "fill_price": float(getattr(item, 'ExecPrc', 0)),
-                })
-            
+
+            async def _query(isu_code: str):
+                return await ls.overseas_futureoption().accno().CIDBQ01800(
+                    body=CIDBQ01800InBlock1(
+                        IsuCodeVal=isu_code,    # 빈값: 전체 종목
+                        OrdDt=today,
+                        OrdStatCode="1",        # 1: 체결
+                    )
+                ).req_async()
+
+            result = await _query("")
+            if getattr(result, "error_msg", None):
+                context.log("debug", f"CIDBQ01800 (all symbols) error: {result.error_msg} - per-symbol fallback", node_id)
+                symbols = sorted({o.get("symbol") for o in orders if o.get("symbol")})
+                responses = await _gather_bounded(_query, symbols)
+            else:
+                responses = [result]
+
+            # 주문번호별 체결 합산 (한 주문에 다중 체결이면 행이 여럿 → 가중평균)
+            fills: Dict[str, List[float]] = {}
+            for response in responses:
+                if isinstance(response, BaseException) or getattr(response, "error_msg", None):
+                    continue
+                for item in getattr(response, "block2", None) or []:
+                    order_no = _ls_str(item, "OvrsFutsOrdNo")
+                    if order_no not in pending:
+                        continue
+                    qty = int(getattr(item, "ExecQty", 0) or 0)
+                    price = float(getattr(item, "AbrdFutsExecPrc", 0) or 0)
+                    if qty > 0 and price > 0:
+                        acc = fills.setdefault(order_no, [0, 0.0])
+                        acc[0] += qty
+                        acc[1] += qty * price
+
+            fill_history = [
+                {"order_no": order_no, "order_date": today, "fill_price": amount / qty}
+                for order_no, (qty, amount) in fills.items()
+            ]
             if fill_history:
                 updated = context.sync_workflow_fill_prices_from_history(fill_history)
                 if updated > 0:
@@ -4688,6 +4972,49 @@ class BrokerNodeExecutor(NodeExecutorBase):
         return config
 
 
+# LS 잔고 블록 → 출력 dict 패커 테이블: (출력 키, LS 필드명).
+# 레코드마다 `float(item.X) if item.X else 0.0` 를 필드 수만큼 풀어 쓰는 대신 모듈 로드 시
+# 한 번 정의한 튜플을 _pack_ls_floats 로 순회한다. 출력 키 순서는 기존 응답과 동일하다.
+_CIDBQ05300_CURRENCY_FIELDS = (
+    ("deposit", "OvrsFutsDps"),
+    ("orderable_amount", "AbrdFutsOrdAbleAmt"),
+    ("withdrawable_amount", "AbrdFutsWthdwAbleAmt"),
+    ("eval_pnl", "AbrdFutsEvalPnlAmt"),
+)
+_CIDBQ05300_SUMMARY_FIELDS = (
+    ("margin", "AbrdFutsCsgnMgn"),
+    ("maintenance_margin", "OvrsFutsMaintMgn"),
+    ("margin_call_rate", "MgnclRat"),
+    ("total_eval", "AbrdFutsEvalDpstgTotAmt"),
+    ("settlement_pnl", "AbrdFutsLqdtPnlAmt"),
+)
+_COSOQ02701_CURRENCY_FIELDS = (
+    ("orderable_amount", "FcurrOrdAbleAmt"),
+    ("foreign_cash", "FcurrDps"),
+    ("exchange_rate", "BaseXchrat"),
+)
+
+
+def _pack_ls_floats(blk: Any, fields: "tuple[tuple[str, str], ...]") -> Dict[str, float]:
+    """LS 응답 레코드의 숫자 필드를 테이블대로 float dict 로 변환 (빈 값/누락 → 0.0)."""
+    return {
+        key: float(value) if (value := getattr(blk, attr, None)) else 0.0
+        for key, attr in fields
+    }
+
+
+# 경고 없이 통과시키는 LS 응답코드 (00000 정상 / 00136 SOAP 계열 정상 / 00707 조회할 내역 없음)
+_LS_OK_RSP_CODES = frozenset({"00000", "00136", "00707"})
+
+
+def _ls_str(blk: Any, attr: str, default: str = "") -> str:
+    """LS 응답 레코드의 문자열 필드를 strip 해서 반환 (빈 값/누락 → default)."""
+    value = getattr(blk, attr, None)
+    if not value:
+        return default
+    return value.strip() if isinstance(value, str) else str(value).strip()
+
+
 class AccountNodeExecutor(NodeExecutorBase):
     """
     AccountNode executor - 계좌 잔고 1회 조회 (REST API)
@@ -4698,6 +5025,104 @@ class AccountNodeExecutor(NodeExecutorBase):
     - product_scope + broker_provider 매칭으로 BrokerNode에서 자동 주입 (Phase 5)
     """
 
+    # 예수금/주문가능금액 TR(COSOQ02701 · CSPAQ22200 · CIDBQ05300) 단기 캐시 TTL (초).
+    # 같은 LS 세션에서 잇따르거나 동시에 도는 AccountNode(분기/반복)가 예수금을 중복 조회하지
+    # 않게 한다. 주문/정정/취소가 나가거나 체결 통보가 오면 invalidate_deposit_cache 로 즉시
+    # 비운다 — 주문/체결 이후 잔고를 캐시로 돌려주지 않는다. 0 이면 캐시하지 않는다.
+    DEPOSIT_CACHE_TTL = float(os.environ.get("PG_DEPOSIT_CACHE_TTL", "3"))
+    # {ls 인스턴스: {캐시 키: (만료 monotonic, 응답) | 진행 중 Task}} — ls 가 사라지면 항목도 사라진다
+    _deposit_cache: "weakref.WeakKeyDictionary[Any, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+    # 예수금 TR InBlock 은 입력이 고정(통화 코드 정도)이라 키별로 한 번 만들어 재사용한다.
+    _deposit_in_blocks: Dict[str, Any] = {}
+
+    @classmethod
+    def _deposit_in_block(cls, key: str, build: Callable[[], Any]) -> Any:
+        """예수금 TR 요청 InBlock 을 키별로 한 번만 생성해 돌려준다."""
+        block = cls._deposit_in_blocks.get(key)
+        if block is None:
+            block = cls._deposit_in_blocks[key] = build()
+        return block
+
+    @classmethod
+    def invalidate_deposit_cache(cls, ls: Any = None) -> None:
+        """예수금 캐시를 비운다 (주문 접수 후: 해당 LS 세션, 체결 통보: ls=None 으로 전체)."""
+        if ls is None:
+            cls._deposit_cache.clear()
+            return
+        try:
+            cls._deposit_cache.pop(ls, None)
+        except TypeError:
+            pass  # weakref 불가 객체 — 애초에 캐시되지 않았다
+
+    @classmethod
+    def peek_deposit(cls, ls: Any, key: str) -> Any:
+        """TTL 안에 캐시된 예수금 TR 응답을 조회 없이 돌려준다 (없음/만료/진행 중 → None)."""
+        import time as _time
+
+        try:
+            entry = cls._deposit_cache.get(ls, {}).get(key)
+        except TypeError:
+            return None  # weakref 불가 객체 — 애초에 캐시되지 않았다
+        if isinstance(entry, tuple) and entry[0] > _time.monotonic():
+            return entry[1]
+        return None
+
+    async def _cached_deposit(
+        self,
+        ls: Any,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """예수금 TR 응답을 TTL 캐시 + single-flight 로 조회.
+
+        동시에 들어온 호출은 진행 중인 한 요청을 함께 기다린다. 에러 응답/예외는
+        캐시하지 않는다.
+        """
+        import time as _time
+
+        if self.DEPOSIT_CACHE_TTL <= 0:
+            return await fetch()
+
+        try:
+            entries = self._deposit_cache.setdefault(ls, {})
+        except TypeError:
+            entries = {}  # weakref 불가 객체 — 캐시 없이 조회
+
+        entry = entries.get(key)
+        if isinstance(entry, asyncio.Future):
+            if entry.get_loop() is asyncio.get_running_loop():
+                return await asyncio.shield(entry)
+        elif entry is not None and entry[0] > _time.monotonic():
+            return entry[1]
+
+        task = asyncio.ensure_future(fetch())
+        entries[key] = task
+        try:
+            response = await task
+        except BaseException:
+            if entries.get(key) is task:
+                entries.pop(key, None)
+            raise
+
+        if entries.get(key) is task:
+            if getattr(response, "error_msg", None):
+                entries.pop(key, None)
+            else:
+                entries[key] = (_time.monotonic() + self.DEPOSIT_CACHE_TTL, response)
+        return response
+
+    async def _fetch_cosoq02701(self, ls: Any, crcy_code: str = "USD") -> Any:
+        """COSOQ02701(해외주식 외화예수금) 조회 — 통화별 캐시."""
+        from programgarden_finance import COSOQ02701
+
+        key = f"COSOQ02701:{crcy_code}"
+        body = self._deposit_in_block(
+            key, lambda: COSOQ02701.COSOQ02701InBlock1(RecCnt=1, CrcyCode=crcy_code)
+        )
+        return await self._cached_deposit(
+            ls, key, lambda: ls.overseas_stock().accno().cosoq02701(body).req_async()
+        )
+
     async def execute(
         self,
         node_id: str,
@@ -4810,9 +5235,20 @@ class AccountNodeExecutor(NodeExecutorBase):
                 AstkBalTpCode="00",
             ),
         )
-        
-        response = await cosoq00201.req_async()
-        
+
+        # 1. COSOQ00201(잔고) 와 2. COSOQ02701(외화예수금) 은 서로 독립 — 동시에 조회한다.
+        # 예수금 쪽 실패는 아래 partial-failure 처리로 넘기고, 잔고 쪽 예외는 그대로 올린다.
+        async def _fetch_balance():
+            return await cosoq00201.req_async()
+
+        response, cash_result = await asyncio.gather(
+            _fetch_balance(),
+            self._fetch_cosoq02701(ls, "USD"),
+            return_exceptions=True,
+        )
+        if isinstance(response, BaseException):
+            raise response
+
         if response.error_msg:
             context.log("error", f"API error: {response.error_msg}", node_id)
             return self._empty_result(response.error_msg)
@@ -4840,7 +5276,7 @@ class AccountNodeExecutor(NodeExecutorBase):
                 "pnl_rate": item.PnlRat,
                 "pnl_amount": item.FcurrEvalPnlAmt,
                 "currency": item.CrcyCode,
-                "market": item.MktTpNm.strip() if item.MktTpNm else "",
+                "market": _ls_str(item, "MktTpNm"),
                 "exchange": _ex_name,          # 영문 표시명 (NASDAQ)
                 "exchange_code": _ex_code,     # LS 코드 (82)
                 "eval_amount": item.FcurrEvalAmt,
@@ -4863,13 +5299,14 @@ class AccountNodeExecutor(NodeExecutorBase):
             "total_value": 0.0,
             "orderable_amount": None,
         }
-        if response.block2:
+        b2 = response.block2
+        if b2:
             balance_info = {
-                "total_pnl_rate": response.block2.ErnRat,
-                "cash_krw": response.block2.WonDpsBalAmt,
-                "stock_eval_krw": response.block2.StkConvEvalAmt,
-                "total_eval_krw": response.block2.WonEvalSumAmt,
-                "total_pnl_krw": response.block2.ConvEvalPnlAmt,
+                "total_pnl_rate": b2.ErnRat,
+                "cash_krw": b2.WonDpsBalAmt,
+                "stock_eval_krw": b2.StkConvEvalAmt,
+                "total_eval_krw": b2.WonEvalSumAmt,
+                "total_pnl_krw": b2.ConvEvalPnlAmt,
                 "orderable_amount": None,
             }
 
@@ -4878,29 +5315,28 @@ class AccountNodeExecutor(NodeExecutorBase):
         cosoq02701_ok = False
         cosoq02701_failure_reason: Optional[str] = None
         try:
-            from programgarden_finance import COSOQ02701
-
-            cosoq02701 = ls.overseas_stock().accno().cosoq02701(
-                COSOQ02701.COSOQ02701InBlock1(RecCnt=1, CrcyCode="USD"),
-            )
-            cash_response = await cosoq02701.req_async()
+            if isinstance(cash_result, BaseException):
+                raise cash_result
+            cash_response = cash_result
 
             if not cash_response.error_msg:
-                # block3: 국가별 외화 정보 (USD 기준)
-                for item in cash_response.block3 or []:
-                    if item.CrcyCode.strip() == "USD":
-                        balance_info["orderable_amount"] = float(item.FcurrOrdAbleAmt) if item.FcurrOrdAbleAmt else 0.0
-                        balance_info["foreign_cash"] = float(item.FcurrDps) if item.FcurrDps else 0.0
-                        balance_info["exchange_rate"] = float(item.BaseXchrat) if item.BaseXchrat else 0.0
-                        cosoq02701_ok = True
-                        break
-                if not cosoq02701_ok:
+                # block3: 국가별 외화 정보 (USD 기준). 첫 USD 행에서 순회를 멈춘다
+                # (중복 통화는 첫 행 우선).
+                item = next(
+                    (row for row in cash_response.block3 or [] if _ls_str(row, "CrcyCode") == "USD"),
+                    None,
+                )
+                if item is not None:
+                    balance_info.update(_pack_ls_floats(item, _COSOQ02701_CURRENCY_FIELDS))
+                    cosoq02701_ok = True
+                else:
                     cosoq02701_failure_reason = "COSOQ02701 returned no USD currency block"
 
                 # block4: 원화 출금/증거금
-                if cash_response.block4:
-                    balance_info["withdrawable_krw"] = float(cash_response.block4.MnyoutAbleAmt) if cash_response.block4.MnyoutAbleAmt else 0.0
-                    balance_info["overseas_margin"] = float(cash_response.block4.OvrsMgn) if cash_response.block4.OvrsMgn else 0.0
+                b4 = cash_response.block4
+                if b4:
+                    balance_info["withdrawable_krw"] = float(b4.MnyoutAbleAmt) if b4.MnyoutAbleAmt else 0.0
+                    balance_info["overseas_margin"] = float(b4.OvrsMgn) if b4.OvrsMgn else 0.0
             else:
                 cosoq02701_failure_reason = f"COSOQ02701 error: {cash_response.error_msg}"
                 context.log("warning", f"COSOQ02701 조회 실패: {cash_response.error_msg}", node_id)
@@ -4931,10 +5367,27 @@ class AccountNodeExecutor(NodeExecutorBase):
             from programgarden_finance.ls.korea_stock.accno.CSPAQ12300.blocks import CSPAQ12300InBlock1
             from programgarden_finance.ls.korea_stock.accno.CSPAQ22200.blocks import CSPAQ22200InBlock1
 
-            # 1. CSPAQ12300: 종목별 잔고내역
-            response = await ls.korea_stock().accno().cspaq12300(
-                body=CSPAQ12300InBlock1()
-            ).req_async()
+            async def _fetch_positions():
+                return await ls.korea_stock().accno().cspaq12300(
+                    body=CSPAQ12300InBlock1()
+                ).req_async()
+
+            async def _fetch_cash():
+                body = self._deposit_in_block("CSPAQ22200", CSPAQ22200InBlock1)
+                return await self._cached_deposit(
+                    ls,
+                    "CSPAQ22200",
+                    lambda: ls.korea_stock().accno().cspaq22200(body=body).req_async(),
+                )
+
+            # 1. CSPAQ12300: 종목별 잔고내역 — 2. CSPAQ22200(예수금)과 서로 독립이라 동시에 조회
+            response, cash_result = await asyncio.gather(
+                _fetch_positions(),
+                _fetch_cash(),
+                return_exceptions=True,
+            )
+            if isinstance(response, BaseException):
+                raise response
 
             positions = []
             # Pre-seed orderable_amount as None so a partial failure is
@@ -4999,9 +5452,9 @@ class AccountNodeExecutor(NodeExecutorBase):
             # 2. CSPAQ22200: 예수금/주문가능금액
             cspaq22200_ok = False
             try:
-                cash_response = await ls.korea_stock().accno().cspaq22200(
-                    body=CSPAQ22200InBlock1()
-                ).req_async()
+                if isinstance(cash_result, BaseException):
+                    raise cash_result
+                cash_response = cash_result
 
                 if not cash_response.error_msg and cash_response.block2:
                     b2 = cash_response.block2
@@ -5064,26 +5517,50 @@ class AccountNodeExecutor(NodeExecutorBase):
 
             today = datetime.now().strftime("%Y%m%d")
 
-            # 1. CIDBQ01500: 보유 포지션 조회
-            response = await ls.overseas_futureoption().accno().CIDBQ01500(
-                body=CIDBQ01500InBlock1(
-                    RecCnt=1,
-                    AcntTpCode="1",      # 1: 위탁
-                    QryDt=today,         # 조회일자
-                    BalTpCode="2",       # 1: 합산, 2: 건별 (건별이 더 안정적)
-                    FcmAcntNo=""
+            async def _fetch_positions():
+                return await ls.overseas_futureoption().accno().CIDBQ01500(
+                    body=CIDBQ01500InBlock1(
+                        RecCnt=1,
+                        AcntTpCode="1",      # 1: 위탁
+                        QryDt=today,         # 조회일자
+                        BalTpCode="2",       # 1: 합산, 2: 건별 (건별이 더 안정적)
+                        FcmAcntNo=""
+                    )
+                ).req_async()
+
+            async def _fetch_balance():
+                body = self._deposit_in_block(
+                    "CIDBQ05300:ALL",
+                    lambda: CIDBQ05300InBlock1(
+                        RecCnt=1,
+                        OvrsAcntTpCode="1",
+                        CrcyCode="ALL"
+                    ),
                 )
-            ).req_async()
+                return await self._cached_deposit(
+                    ls,
+                    "CIDBQ05300:ALL",
+                    lambda: ls.overseas_futureoption().accno().CIDBQ05300(body=body).req_async(),
+                )
+
+            # 1. CIDBQ01500: 보유 포지션 조회 — 2. CIDBQ05300(예탁자산)과 서로 독립이라 동시에 조회
+            response, balance_result = await asyncio.gather(
+                _fetch_positions(),
+                _fetch_balance(),
+                return_exceptions=True,
+            )
+            if isinstance(response, BaseException):
+                raise response
 
             # 응답 코드 확인 (00707: 조회할 내역 없음 - 정상)
-            if response.rsp_cd and response.rsp_cd not in ["00000", "00136", "00707"]:
+            if response.rsp_cd and response.rsp_cd not in _LS_OK_RSP_CODES:
                 context.log("warning", f"CIDBQ01500 response: {response.rsp_cd} - {response.rsp_msg}", node_id)
 
             # block2 = 종목별 잔고 (list 형태로 변환, NewOrderNode 호환)
             positions = []
             held_symbols = []
             for item in (response.block2 or []):
-                symbol = item.IsuCodeVal.strip() if item.IsuCodeVal else ""
+                symbol = _ls_str(item, "IsuCodeVal")
                 if not symbol:
                     continue
 
@@ -5097,7 +5574,7 @@ class AccountNodeExecutor(NodeExecutorBase):
                 positions.append({
                     "symbol": symbol,
                     "exchange": "HKEX",  # 해외선물 기본 거래소
-                    "name": item.IsuNm.strip() if hasattr(item, 'IsuNm') and item.IsuNm else symbol,
+                    "name": _ls_str(item, "IsuNm", symbol),
                     "direction": position_side,  # long/short
                     "close_side": close_side,  # 청산 시 주문 방향: sell/buy
                     "quantity": quantity,  # NewOrderNode 호환
@@ -5105,7 +5582,7 @@ class AccountNodeExecutor(NodeExecutorBase):
                     "entry_price": float(item.PchsPrc) if item.PchsPrc else 0.0,
                     "current_price": current_price,
                     "pnl_amount": float(item.AbrdFutsEvalPnlAmt) if item.AbrdFutsEvalPnlAmt else 0.0,
-                    "currency": item.CrcyCodeVal.strip() if item.CrcyCodeVal else "USD",
+                    "currency": _ls_str(item, "CrcyCodeVal", "USD"),
                 })
                 held_symbols.append({"exchange": "HKEX", "symbol": symbol})
 
@@ -5115,36 +5592,27 @@ class AccountNodeExecutor(NodeExecutorBase):
             # _partial_failure on the balance dict.
             balance_by_currency: Dict[str, Dict[str, float]] = {}
             total_orderable = 0.0
+            total_deposit = 0.0
             cidbq05300_ok = False
             cidbq05300_failure_reason: Optional[str] = None
             balance_response = None
             try:
-                balance_response = await ls.overseas_futureoption().accno().CIDBQ05300(
-                    body=CIDBQ05300InBlock1(
-                        RecCnt=1,
-                        OvrsAcntTpCode="1",
-                        CrcyCode="ALL"
-                    )
-                ).req_async()
+                if isinstance(balance_result, BaseException):
+                    raise balance_result
+                balance_response = balance_result
 
                 # Note: we deliberately do not gate on `error_msg` here.
                 # The LS finance client returns a real str for that field
                 # only on actual errors; checking it would also trip on
                 # MagicMock attribute auto-vivification in unit tests,
                 # which masks legitimate balance fetches.
-                # block2: 통화별 예수금 정보
+                # block2: 통화별 예수금 정보 — 통화 합계도 같은 순회에서 누적한다
                 for item in (balance_response.block2 or []):
-                    currency = item.CrcyCode.strip() if item.CrcyCode else "USD"
-                    orderable = float(item.AbrdFutsOrdAbleAmt) if item.AbrdFutsOrdAbleAmt else 0.0
-                    deposit = float(item.OvrsFutsDps) if item.OvrsFutsDps else 0.0
-
-                    balance_by_currency[currency] = {
-                        "deposit": deposit,
-                        "orderable_amount": orderable,
-                        "withdrawable_amount": float(item.AbrdFutsWthdwAbleAmt) if item.AbrdFutsWthdwAbleAmt else 0.0,
-                        "eval_pnl": float(item.AbrdFutsEvalPnlAmt) if item.AbrdFutsEvalPnlAmt else 0.0,
-                    }
-                    total_orderable += orderable
+                    currency = _ls_str(item, "CrcyCode", "USD")
+                    packed = _pack_ls_floats(item, _CIDBQ05300_CURRENCY_FIELDS)
+                    balance_by_currency[currency] = packed
+                    total_orderable += packed["orderable_amount"]
+                    total_deposit += packed["deposit"]
 
                 if balance_by_currency:
                     cidbq05300_ok = True
@@ -5170,17 +5638,14 @@ class AccountNodeExecutor(NodeExecutorBase):
                 "orderable_amount": (
                     balance_by_currency.get("USD", {}).get("orderable_amount", 0.0) or total_orderable
                 ) if cidbq05300_ok else None,
-                "deposit": sum(b.get("deposit", 0) for b in balance_by_currency.values()),
+                "deposit": total_deposit,
             }
 
             # block3: 전체 요약 (증거금/마진콜율 등)
             if cidbq05300_ok and balance_response is not None and balance_response.block3:
-                b3 = balance_response.block3
-                balance_info["margin"] = float(b3.AbrdFutsCsgnMgn) if b3.AbrdFutsCsgnMgn else 0.0
-                balance_info["maintenance_margin"] = float(b3.OvrsFutsMaintMgn) if b3.OvrsFutsMaintMgn else 0.0
-                balance_info["margin_call_rate"] = float(b3.MgnclRat) if b3.MgnclRat else 0.0
-                balance_info["total_eval"] = float(b3.AbrdFutsEvalDpstgTotAmt) if b3.AbrdFutsEvalDpstgTotAmt else 0.0
-                balance_info["settlement_pnl"] = float(b3.AbrdFutsLqdtPnlAmt) if b3.AbrdFutsLqdtPnlAmt else 0.0
+                balance_info.update(
+                    _pack_ls_floats(balance_response.block3, _CIDBQ05300_SUMMARY_FIELDS)
+                )
 
             if not cidbq05300_ok:
                 balance_info["_partial_failure"] = True
@@ -5235,6 +5700,14 @@ class OpenOrdersNodeExecutor(NodeExecutorBase):
     - count: 미체결 주문 수
     """
 
+    # 상품 → 미체결 조회 메서드 이름 (NewOrderNodeExecutor.PRODUCT_ORDER_HANDLERS 와 같은 방식)
+    PRODUCT_QUERIES = {
+        "overseas_stock": "_ls_overseas_stock",
+        "overseas_futures": "_ls_overseas_futures",
+        "overseas_futureoption": "_ls_overseas_futures",
+        "korea_stock": "_ls_korea_stock",
+    }
+
     async def execute(
         self,
         node_id: str,
@@ -5296,6 +5769,12 @@ class OpenOrdersNodeExecutor(NodeExecutorBase):
             context.log("error", "appkey/appsecret not found", node_id)
             return self._empty_result("Missing appkey/appsecret")
 
+        # 지원하지 않는 상품은 로그인(토큰 발급) 전에 돌려보낸다
+        query_name = self.PRODUCT_QUERIES.get(product)
+        if query_name is None:
+            context.log("warning", f"Unsupported product: {product}", node_id)
+            return self._empty_result(f"Unsupported product: {product}")
+
         try:
             ls, success, error = ensure_ls_login(
                 appkey, appsecret, paper_trading, context, node_id,
@@ -5305,15 +5784,7 @@ class OpenOrdersNodeExecutor(NodeExecutorBase):
             if not success:
                 return self._empty_result(error)
 
-            if product == "overseas_stock":
-                return await self._ls_overseas_stock(ls, node_id, context)
-            elif product in ("overseas_futures", "overseas_futureoption"):
-                return await self._ls_overseas_futures(ls, node_id, context)
-            elif product == "korea_stock":
-                return await self._ls_korea_stock(ls, node_id, context)
-            else:
-                context.log("warning", f"Unsupported product: {product}", node_id)
-                return self._empty_result(f"Unsupported product: {product}")
+            return await getattr(self, query_name)(ls, node_id, context)
 
         except Exception as e:
             context.log("error", f"Unexpected error: {e}", node_id)
@@ -5386,18 +5857,9 @@ class OpenOrdersNodeExecutor(NodeExecutorBase):
 
         response = await ls.overseas_stock().accno().cosaq00102(
             COSAQ00102InBlock1(
-                RecCnt=1,
-                QryTpCode="1",      # 1: 역순
-                BkseqTpCode="1",    # 1: 역순
-                OrdMktCode="00",    # 00: 전체
-                BnsTpCode="0",      # 0: 전체
-                IsuNo="",           # 빈값: 전체 종목
-                SrtOrdNo=999999999,
+                **_COSAQ00102_ALL_ORDERS_QUERY,
                 OrdDt=today,
-                ExecYn="2",         # 2: 미체결
-                CrcyCode="000",     # 000: 전체 통화
-                ThdayBnsAppYn="0",
-                LoanBalHldYn="0"
+                ExecYn="2",  # 2: 미체결
             ),
         ).req_async()
 
@@ -5407,7 +5869,7 @@ class OpenOrdersNodeExecutor(NodeExecutorBase):
 
         open_orders = []
         for item in response.block3 or []:
-            order_id = str(item.OrdNo) if item.OrdNo else ""
+            order_id = _ls_str(item, "OrdNo")
             if not order_id:
                 continue
 
@@ -5417,8 +5879,8 @@ class OpenOrdersNodeExecutor(NodeExecutorBase):
             open_orders.append({
                 "order_id": order_id,
                 "exchange": item.OrdMktCode or "",
-                "symbol": item.ShtnIsuNo.strip() if item.ShtnIsuNo else (item.IsuNo.strip() if item.IsuNo else ""),
-                "name": item.JpnMktHanglIsuNm.strip() if item.JpnMktHanglIsuNm else "",
+                "symbol": _ls_str(item, "ShtnIsuNo") or _ls_str(item, "IsuNo"),
+                "name": _ls_str(item, "JpnMktHanglIsuNm"),
                 "side": side,
                 "order_type": "limit",  # 해외주식은 대부분 지정가
                 "quantity": int(item.OrdQty) if item.OrdQty else 0,
@@ -5458,13 +5920,13 @@ class OpenOrdersNodeExecutor(NodeExecutorBase):
         ).req_async()
 
         # 응답 코드 확인
-        if response.rsp_cd and response.rsp_cd not in ["00000", "00136", "00707"]:
+        if response.rsp_cd and response.rsp_cd not in _LS_OK_RSP_CODES:
             context.log("warning", f"CIDBQ02400 response: {response.rsp_cd} - {response.rsp_msg}", node_id)
 
         open_orders = []
         for item in response.block2 or []:
             # 해외선물 주문번호는 OvrsFutsOrdNo
-            order_id = str(item.OvrsFutsOrdNo) if hasattr(item, 'OvrsFutsOrdNo') and item.OvrsFutsOrdNo else ""
+            order_id = _ls_str(item, "OvrsFutsOrdNo")
             if not order_id:
                 continue
 
@@ -5478,8 +5940,8 @@ class OpenOrdersNodeExecutor(NodeExecutorBase):
             open_orders.append({
                 "order_id": order_id,
                 "exchange": "HKEX",  # 해외선물 기본
-                "symbol": item.IsuCodeVal.strip() if hasattr(item, 'IsuCodeVal') and item.IsuCodeVal else "",
-                "name": item.IsuNm.strip() if hasattr(item, 'IsuNm') and item.IsuNm else "",
+                "symbol": _ls_str(item, "IsuCodeVal"),
+                "name": _ls_str(item, "IsuNm"),
                 "side": side,
                 "order_type": "limit",
                 "quantity": order_qty,
@@ -5733,7 +6195,7 @@ class RealAccountNodeExecutor(NodeExecutorBase):
             
             # 트리거할 하위 노드 목록 (클로저로 캡처)
             trigger_nodes = config.get("_trigger_on_update_nodes", [])
-            logger.debug(f"[RealAccountNode] 트리거 대상 노드: {trigger_nodes}")
+            logger.debug("[RealAccountNode] 트리거 대상 노드: %s", trigger_nodes)
             
             # 현재 이벤트 루프 캡처 (콜백에서 사용)
             loop = asyncio.get_running_loop()
@@ -5783,11 +6245,12 @@ class RealAccountNodeExecutor(NodeExecutorBase):
                 
                 # 디버깅용 logger
                 from datetime import datetime
-                logger.debug(f"[{datetime.now().strftime('%H:%M:%S')}] 📊 해외주식 포지션 업데이트:")
-                for sym, pos in positions.items():
-                    if hasattr(pos, 'pnl_rate'):
-                        logger.debug(f"  {sym}: 현재가=${pos.current_price:.2f}, 수익률={pos.pnl_rate:.2f}%")
-                logger.debug(f"  → 트리거할 노드: {trigger_nodes}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"[{datetime.now().strftime('%H:%M:%S')}] 📊 해외주식 포지션 업데이트:")
+                    for sym, pos in positions.items():
+                        if hasattr(pos, 'pnl_rate'):
+                            logger.debug(f"  {sym}: 현재가=${pos.current_price:.2f}, 수익률={pos.pnl_rate:.2f}%")
+                    logger.debug(f"  → 트리거할 노드: {trigger_nodes}")
                 
                 # 이벤트 큐에 추가 (스레드 안전하게)
                 asyncio.run_coroutine_threadsafe(
@@ -5846,15 +6309,16 @@ class RealAccountNodeExecutor(NodeExecutorBase):
                 outputs=result,
             ))
             
-            logger.debug(f"\n{'='*60}")
-            logger.debug(f"[RealAccountNode] 해외주식 실시간 계좌 데이터")
-            logger.debug(f"{'='*60}")
-            logger.debug(f"보유 종목: {result.get('symbols', [])}")
-            logger.debug(f"잔고: {result.get('balance', {})}")
-            for pos in result.get('positions', []):
-                sym = pos.get('symbol', '')
-                logger.debug(f"  - {sym}: 수량={pos.get('qty')}, 평단가=${pos.get('avg_price', 0):.2f}, 현재가=${pos.get('current_price', 0):.2f}, 수익률={pos.get('pnl_rate', 0):.2f}%")
-            logger.debug(f"{'='*60}\n")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"\n{'='*60}")
+                logger.debug(f"[RealAccountNode] 해외주식 실시간 계좌 데이터")
+                logger.debug(f"{'='*60}")
+                logger.debug(f"보유 종목: {result.get('symbols', [])}")
+                logger.debug(f"잔고: {result.get('balance', {})}")
+                for pos in result.get('positions', []):
+                    sym = pos.get('symbol', '')
+                    logger.debug(f"  - {sym}: 수량={pos.get('qty')}, 평단가=${pos.get('avg_price', 0):.2f}, 현재가=${pos.get('current_price', 0):.2f}, 수익률={pos.get('pnl_rate', 0):.2f}%")
+                logger.debug(f"{'='*60}\n")
 
             context.log("info", f"Initial account data loaded: {len(result.get('positions', []))} positions", node_id)
             return result
@@ -5930,7 +6394,7 @@ class RealAccountNodeExecutor(NodeExecutorBase):
             
             # 트리거할 하위 노드 목록 (클로저로 캡처)
             trigger_nodes = config.get("_trigger_on_update_nodes", [])
-            logger.debug(f"[RealAccountNode/Futures] 트리거 대상 노드: {trigger_nodes}")
+            logger.debug("[RealAccountNode/Futures] 트리거 대상 노드: %s", trigger_nodes)
             
             # 현재 이벤트 루프 캡처 (콜백에서 사용)
             loop = asyncio.get_running_loop()
@@ -5985,13 +6449,14 @@ class RealAccountNodeExecutor(NodeExecutorBase):
                 
                 # 디버깅용 logger
                 from datetime import datetime
-                logger.debug(f"[{datetime.now().strftime('%H:%M:%S')}] 📊 해외선물 포지션 업데이트:")
-                for sym, pos in positions.items():
-                    direction = 'LONG' if getattr(pos, 'is_long', True) else 'SHORT'
-                    exchange = getattr(pos, 'exchange_code', '')
-                    pnl = getattr(pos, 'pnl_amount', 0)
-                    logger.debug(f"  {sym}@{exchange} ({direction}): 현재가=${getattr(pos, 'current_price', 0):.2f}, 손익=${pnl:.2f}")
-                logger.debug(f"  → 트리거할 노드: {trigger_nodes}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"[{datetime.now().strftime('%H:%M:%S')}] 📊 해외선물 포지션 업데이트:")
+                    for sym, pos in positions.items():
+                        direction = 'LONG' if getattr(pos, 'is_long', True) else 'SHORT'
+                        exchange = getattr(pos, 'exchange_code', '')
+                        pnl = getattr(pos, 'pnl_amount', 0)
+                        logger.debug(f"  {sym}@{exchange} ({direction}): 현재가=${getattr(pos, 'current_price', 0):.2f}, 손익=${pnl:.2f}")
+                    logger.debug(f"  → 트리거할 노드: {trigger_nodes}")
                 
                 # 이벤트 큐에 추가 (스레드 안전하게)
                 asyncio.run_coroutine_threadsafe(
@@ -6062,17 +6527,18 @@ class RealAccountNodeExecutor(NodeExecutorBase):
                 outputs=result,
             ))
             
-            logger.debug(f"\n{'='*60}")
-            logger.debug(f"[RealAccountNode] 해외선물 실시간 계좌 데이터")
-            logger.debug(f"{'='*60}")
-            logger.debug(f"보유 종목: {result.get('symbols', [])}")
-            logger.debug(f"잔고: {result.get('balance', {})}")
-            for pos in result.get('positions', []):
-                sym = pos.get('symbol', '')
-                direction = '롱' if pos.get('direction') == 'long' else '숏'
-                logger.debug(f"  - {sym} ({direction}): 수량={pos.get('quantity')}, 진입가=${pos.get('entry_price', 0):.2f}, 현재가=${pos.get('current_price', 0):.2f}, 손익=${pos.get('pnl_amount', 0):.2f}")
-            logger.debug(f"미체결: {list(result.get('open_orders', {}).keys())}")
-            logger.debug(f"{'='*60}\n")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"\n{'='*60}")
+                logger.debug(f"[RealAccountNode] 해외선물 실시간 계좌 데이터")
+                logger.debug(f"{'='*60}")
+                logger.debug(f"보유 종목: {result.get('symbols', [])}")
+                logger.debug(f"잔고: {result.get('balance', {})}")
+                for pos in result.get('positions', []):
+                    sym = pos.get('symbol', '')
+                    direction = '롱' if pos.get('direction') == 'long' else '숏'
+                    logger.debug(f"  - {sym} ({direction}): 수량={pos.get('quantity')}, 진입가=${pos.get('entry_price', 0):.2f}, 현재가=${pos.get('current_price', 0):.2f}, 손익=${pos.get('pnl_amount', 0):.2f}")
+                logger.debug(f"미체결: {list(result.get('open_orders', {}).keys())}")
+                logger.debug(f"{'='*60}\n")
 
             context.log("info", f"Initial futures data loaded: {len(result.get('positions', []))} positions", node_id)
             return result
@@ -6226,7 +6692,7 @@ class RealAccountNodeExecutor(NodeExecutorBase):
             _ex_name, _ex_code = overseas_stock_exchange_pair(getattr(pos, 'market_code', ''))
             positions.append({
                 "symbol": symbol,
-                "name": getattr(pos, 'name', getattr(pos, 'symbol_name', symbol)),
+                "name": _attr_or(pos, 'name', 'symbol_name', symbol),
                 "exchange": _ex_name,          # 영문 표시명 (NASDAQ)
                 "exchange_code": _ex_code,     # LS 코드 (82)
                 "market_code": getattr(pos, 'market_code', ''),  # 후속: exchange_code 로 수렴/제거
@@ -6293,12 +6759,12 @@ class RealAccountNodeExecutor(NodeExecutorBase):
                 open_orders[order_no] = {
                     "order_no": order_no,
                     "symbol": getattr(order, 'symbol', ''),
-                    "exchange": getattr(order, 'exchange_code', getattr(order, 'market_code', '')),
+                    "exchange": _attr_or(order, 'exchange_code', 'market_code'),
                     "order_type": getattr(order, 'order_type', ''),
                     "order_price": float(getattr(order, 'order_price', 0)),
                     "order_qty": int(getattr(order, 'order_qty', 0)),
                     "filled_qty": int(getattr(order, 'filled_qty', 0)),
-                    "remaining_qty": int(getattr(order, 'remaining_qty', getattr(order, 'order_qty', 0)) or 0),
+                    "remaining_qty": int(_attr_or(order, 'remaining_qty', 'order_qty', 0) or 0),
                 }
         
         return {
@@ -6712,11 +7178,12 @@ class RealMarketDataNodeExecutor(NodeExecutorBase):
                     context.set_node_state(node_id, "ohlcv_bars", ohlcv_bars)
 
                     # 콘솔 출력
-                    logger.debug(f"\n{'='*60}")
-                    logger.debug(f"[{datetime.now().strftime('%H:%M:%S')}] [{node_id}] GSC tick")
-                    logger.debug(f"  symbol: {symbol}  price: ${price:,.2f}  volume: {volume:,}")
-                    logger.debug(f"  OHLCV: O={ohlcv_bars[symbol]['open']:.2f} H={ohlcv_bars[symbol]['high']:.2f} L={ohlcv_bars[symbol]['low']:.2f} C={price:.2f}")
-                    logger.debug(f"{'='*60}\n")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"\n{'='*60}")
+                        logger.debug(f"[{datetime.now().strftime('%H:%M:%S')}] [{node_id}] GSC tick")
+                        logger.debug(f"  symbol: {symbol}  price: ${price:,.2f}  volume: {volume:,}")
+                        logger.debug(f"  OHLCV: O={ohlcv_bars[symbol]['open']:.2f} H={ohlcv_bars[symbol]['high']:.2f} L={ohlcv_bars[symbol]['low']:.2f} C={price:.2f}")
+                        logger.debug(f"{'='*60}\n")
 
                     # OHLCV 데이터 형식으로 변환: {symbol: [bar]}
                     ohlcv_data = {s: [bar] for s, bar in ohlcv_bars.items()}
@@ -6880,11 +7347,12 @@ class RealMarketDataNodeExecutor(NodeExecutorBase):
                         bar["volume"] = volume
                     
                     # 콘솔 출력
-                    logger.debug(f"\n{'='*60}")
-                    logger.debug(f"[{datetime.now().strftime('%H:%M:%S')}] 📈 [{node_id}] OVC 체결")
-                    logger.debug(f"  종목: {symbol}  가격: {price:,.2f}  거래량: {volume:,}")
-                    logger.debug(f"  OHLCV: O={ohlcv_bars[symbol]['open']:.2f} H={ohlcv_bars[symbol]['high']:.2f} L={ohlcv_bars[symbol]['low']:.2f} C={price:.2f}")
-                    logger.debug(f"{'='*60}\n")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"\n{'='*60}")
+                        logger.debug(f"[{datetime.now().strftime('%H:%M:%S')}] 📈 [{node_id}] OVC 체결")
+                        logger.debug(f"  종목: {symbol}  가격: {price:,.2f}  거래량: {volume:,}")
+                        logger.debug(f"  OHLCV: O={ohlcv_bars[symbol]['open']:.2f} H={ohlcv_bars[symbol]['high']:.2f} L={ohlcv_bars[symbol]['low']:.2f} C={price:.2f}")
+                        logger.debug(f"{'='*60}\n")
                     
                     # OHLCV 데이터 형식으로 변환
                     ohlcv_data = {s: [bar] for s, bar in ohlcv_bars.items()}
@@ -7196,6 +7664,39 @@ class RealOrderEventNodeExecutor(NodeExecutorBase):
     - False: WebSocket 연결, 플로우 끝나면 cleanup (연결 종료)
     """
 
+    # 해외주식 주문체결유형코드(sOrdxctPtnCode) → (출력 포트, 상태명)
+    STOCK_ORDER_EVENT_PORTS = {
+        '01': ('accepted', '신규접수'),
+        '02': ('accepted', '정정접수'),
+        '03': ('accepted', '취소접수'),
+        '11': ('filled', '체결'),
+        '12': ('modified', '정정완료'),
+        '13': ('cancelled', '취소완료'),
+        '14': ('rejected', '거부'),
+    }
+
+    # 국내주식 주문 TR(SC0~SC4) → (출력 포트, 상태명)
+    KOREA_STOCK_ORDER_EVENT_PORTS = {
+        'SC0': ('accepted', '주문접수'),
+        'SC1': ('filled', '체결'),
+        'SC2': ('modified', '정정확인'),
+        'SC3': ('cancelled', '취소확인'),
+        'SC4': ('rejected', '거부'),
+    }
+
+    # 해외선물 TC1 서비스ID(svc_id) → (출력 포트, 상태명)
+    FUTURES_TC1_PORTS = {
+        'HO01': ('accepted', '주문접수'),
+        'HO04': ('accepted', '주문대기'),
+    }
+
+    # 해외선물 TC2 (svc_id, 주문구분 ordr_ccd) → (출력 포트, 상태명).
+    # HO03(거부)은 주문구분과 무관하므로 _get_tc2_port_status 에서 svc_id 만으로 먼저 본다.
+    FUTURES_TC2_PORTS = {
+        ('HO02', '2'): ('modified', '정정완료'),
+        ('HO02', '3'): ('cancelled', '취소완료'),
+    }
+
     async def execute(
         self,
         node_id: str,
@@ -7386,7 +7887,7 @@ class RealOrderEventNodeExecutor(NodeExecutorBase):
                         "timestamp": datetime.now().isoformat(),
                         "tr_cd": tr_cd,
                         "event_code": ord_type_code,
-                        "symbol": getattr(body, 'sShtnIsuNo', getattr(body, 'sIsuNo', '')),
+                        "symbol": _attr_or(body, 'sShtnIsuNo', 'sIsuNo'),
                         "symbol_name": getattr(body, 'sIsuNm', ''),
                         "order_no": getattr(body, 'sOrdNo', 0),
                         "orig_order_no": getattr(body, 'sOrgOrdNo', 0),
@@ -7401,17 +7902,9 @@ class RealOrderEventNodeExecutor(NodeExecutorBase):
                     }
                     
                     # 주문체결유형코드에 따라 포트 및 상태명 결정
-                    port_map = {
-                        '01': ('accepted', '신규접수'),
-                        '02': ('accepted', '정정접수'),
-                        '03': ('accepted', '취소접수'),
-                        '11': ('filled', '체결'),
-                        '12': ('modified', '정정완료'),
-                        '13': ('cancelled', '취소완료'),
-                        '14': ('rejected', '거부'),
-                    }
-                    
-                    port, status_name = port_map.get(ord_type_code, ('accepted', f'코드:{ord_type_code}'))
+                    port, status_name = self.STOCK_ORDER_EVENT_PORTS.get(
+                        ord_type_code, ('accepted', f'코드:{ord_type_code}')
+                    )
                     event_data["status"] = status_name
                     
                     # 체결 이벤트('11')일 때 시장가 주문의 가격 업데이트
@@ -7428,11 +7921,12 @@ class RealOrderEventNodeExecutor(NodeExecutorBase):
                     
                     side_name = "매수" if event_data['side'] == '02' else "매도"
                     
-                    logger.debug(f"\n{'='*60}")
-                    logger.debug(f"[{datetime.now().strftime('%H:%M:%S')}] 📣 [{_node_id}] 해외주식 {status_name} ({side_name})")
-                    logger.debug(f"  종목: {event_data['symbol']} ({event_data['symbol_name']})")
-                    logger.debug(f"  주문번호: {event_data['order_no']}")
-                    logger.debug(f"{'='*60}\n")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"\n{'='*60}")
+                        logger.debug(f"[{datetime.now().strftime('%H:%M:%S')}] 📣 [{_node_id}] 해외주식 {status_name} ({side_name})")
+                        logger.debug(f"  종목: {event_data['symbol']} ({event_data['symbol_name']})")
+                        logger.debug(f"  주문번호: {event_data['order_no']}")
+                        logger.debug(f"{'='*60}\n")
                     
                     asyncio.run_coroutine_threadsafe(
                         context.notify_output_update(
@@ -7590,11 +8084,12 @@ class RealOrderEventNodeExecutor(NodeExecutorBase):
                     
                     # 콘솔 출력
                     side_name = "매수" if event_data.get('side') == '2' else "매도"
-                    logger.debug(f"\n{'='*60}")
-                    logger.debug(f"[{datetime.now().strftime('%H:%M:%S')}] 📣 [{_node_id}] 해외선물 {status_name} ({side_name})")
-                    logger.debug(f"  종목: {event_data.get('symbol', '')}")
-                    logger.debug(f"  주문번호: {event_data.get('order_no', '')}")
-                    logger.debug(f"{'='*60}\n")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"\n{'='*60}")
+                        logger.debug(f"[{datetime.now().strftime('%H:%M:%S')}] 📣 [{_node_id}] 해외선물 {status_name} ({side_name})")
+                        logger.debug(f"  종목: {event_data.get('symbol', '')}")
+                        logger.debug(f"  주문번호: {event_data.get('order_no', '')}")
+                        logger.debug(f"{'='*60}\n")
                     
                     # SSE 브로드캐스트
                     asyncio.run_coroutine_threadsafe(
@@ -7706,12 +8201,7 @@ class RealOrderEventNodeExecutor(NodeExecutorBase):
     def _get_tc1_port_status(self, event_data: Dict) -> tuple:
         """TC1 포트 및 상태명 결정"""
         svc_id = event_data.get("svc_id", "")
-        if svc_id == 'HO01':
-            return 'accepted', '주문접수'
-        elif svc_id == 'HO04':
-            return 'accepted', '주문대기'
-        else:
-            return 'accepted', f'TC1({svc_id})'
+        return self.FUTURES_TC1_PORTS.get(svc_id) or ('accepted', f'TC1({svc_id})')
     
     def _parse_tc2_data(self, body) -> Dict[str, Any]:
         """TC2 응답 파싱"""
@@ -7736,19 +8226,14 @@ class RealOrderEventNodeExecutor(NodeExecutorBase):
     def _get_tc2_port_status(self, event_data: Dict) -> tuple:
         """TC2 포트 및 상태명 결정"""
         svc_id = event_data.get("svc_id", "")
-        ordr_ccd = event_data.get("order_type", "1")
-        
         if svc_id == 'HO03':
             return 'rejected', '주문거부'
-        elif svc_id == 'HO02':
-            if ordr_ccd == '2':
-                return 'modified', '정정완료'
-            elif ordr_ccd == '3':
-                return 'cancelled', '취소완료'
-            else:
-                return 'accepted', '주문확인'
-        else:
-            return 'accepted', f'TC2({svc_id})'
+        ported = self.FUTURES_TC2_PORTS.get((svc_id, event_data.get("order_type", "1")))
+        if ported:
+            return ported
+        if svc_id == 'HO02':
+            return 'accepted', '주문확인'
+        return 'accepted', f'TC2({svc_id})'
     
     def _parse_tc3_data(self, body) -> Dict[str, Any]:
         """TC3 응답 파싱"""
@@ -7811,7 +8296,7 @@ class RealOrderEventNodeExecutor(NodeExecutorBase):
                     event_data = {
                         "timestamp": datetime.now().isoformat(),
                         "tr_cd": tr_cd,
-                        "symbol": getattr(body, 'shtnIsuNo', getattr(body, 'IsuNo', '')),
+                        "symbol": _attr_or(body, 'shtnIsuNo', 'IsuNo'),
                         "symbol_name": getattr(body, 'IsuNm', ''),
                         "order_no": getattr(body, 'OrdNo', 0),
                         "orig_order_no": getattr(body, 'OrgOrdNo', 0),
@@ -7826,15 +8311,9 @@ class RealOrderEventNodeExecutor(NodeExecutorBase):
                     }
 
                     # TR별 포트/상태 결정
-                    port_map = {
-                        'SC0': ('accepted', '주문접수'),
-                        'SC1': ('filled', '체결'),
-                        'SC2': ('modified', '정정확인'),
-                        'SC3': ('cancelled', '취소확인'),
-                        'SC4': ('rejected', '거부'),
-                    }
-
-                    port, status_name = port_map.get(tr_cd, ('accepted', f'코드:{tr_cd}'))
+                    port, status_name = self.KOREA_STOCK_ORDER_EVENT_PORTS.get(
+                        tr_cd, ('accepted', f'코드:{tr_cd}')
+                    )
                     event_data["status"] = status_name
 
                     # 체결 이벤트(SC1)일 때 가격 업데이트
@@ -7851,8 +8330,9 @@ class RealOrderEventNodeExecutor(NodeExecutorBase):
 
                     side_name = "매수" if event_data['side'] == '2' else "매도"
 
-                    logger.debug(f"[{datetime.now().strftime('%H:%M:%S')}] [{_node_id}] 국내주식 {status_name} ({side_name})")
-                    logger.debug(f"  종목: {event_data['symbol']} ({event_data['symbol_name']})")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"[{datetime.now().strftime('%H:%M:%S')}] [{_node_id}] 국내주식 {status_name} ({side_name})")
+                        logger.debug(f"  종목: {event_data['symbol']} ({event_data['symbol_name']})")
 
                     asyncio.run_coroutine_threadsafe(
                         context.notify_output_update(
@@ -7989,7 +8469,7 @@ class MarketStatusNodeExecutor(NodeExecutorBase):
 
         for key in keys_to_remove:
             del self._active_subscriptions[key]
-            logger.debug(f"Cleaned up JIF subscription: {key}")
+            logger.debug("Cleaned up JIF subscription: %s", key)
 
     async def execute(
         self,
@@ -8829,6 +9309,10 @@ class ConditionNodeExecutor(NodeExecutorBase):
     - values: [{symbol, exchange, time_series: [...], ...}, ...]
     """
 
+    # 대량 종목 플러그인 실행 시 동시에 돌릴 배치 수 (PluginSandbox.execute_batched).
+    # 1 이면 기존처럼 배치를 하나씩 실행한다.
+    PLUGIN_BATCH_CONCURRENCY = max(1, int(os.environ.get("PG_PLUGIN_BATCH_CONCURRENCY", "4")))
+
     def _process_items_with_extract(
         self,
         items_config: Dict[str, Any],
@@ -8884,29 +9368,40 @@ class ConditionNodeExecutor(NodeExecutorBase):
         # 기본 컨텍스트 dict (row 제외)
         base_dict = expr_context.to_dict()
 
+        # 필드별 처리 방식은 row 와 무관하므로 루프 밖에서 한 번만 정한다.
+        # (target_field, row 표현식 또는 None, 고정값) — extract 순서 유지
+        plan: List[Tuple[str, Optional[str], Any]] = []
+        for target_field, source_expr in extract.items():
+            if target_field in external_values:
+                # 외부 바인딩 (캐시된 값 사용)
+                plan.append((target_field, None, external_values[target_field]))
+            elif isinstance(source_expr, str) and "{{" in source_expr:
+                # row 포함 표현식
+                plan.append((target_field, source_expr, None))
+            else:
+                # 리터럴 값
+                plan.append((target_field, None, source_expr))
+        uses_row = any(row_expr is not None for _, row_expr, _ in plan)
+
         # 각 row 처리
         for row in from_data:
             record = {}
 
-            # row 컨텍스트 추가: 기본 dict에 row 추가
-            row_ctx = ExpressionContext()
-            row_ctx.variables = {**base_dict, "row": row}
-            row_evaluator = ExpressionEvaluator(row_ctx)
-
-            for target_field, source_expr in extract.items():
-                if target_field in external_values:
-                    # 외부 바인딩 (캐시된 값 사용)
-                    record[target_field] = external_values[target_field]
-                elif isinstance(source_expr, str) and "{{" in source_expr:
-                    # row 포함 표현식 평가
-                    try:
-                        record[target_field] = row_evaluator.evaluate(source_expr)
-                    except Exception as e:
-                        context.log("debug", f"Row expression failed for {target_field}: {e}", node_id)
-                        record[target_field] = None
-                else:
-                    # 리터럴 값
-                    record[target_field] = source_expr
+            if uses_row:
+                # row 컨텍스트 추가: 기본 dict에 row 추가
+                row_ctx = ExpressionContext()
+                row_ctx.variables = {**base_dict, "row": row}
+                row_evaluator = ExpressionEvaluator(row_ctx)
+
+            for target_field, row_expr, value in plan:
+                if row_expr is None:
+                    record[target_field] = value
+                    continue
+                try:
+                    record[target_field] = row_evaluator.evaluate(row_expr)
+                except Exception as e:
+                    context.log("debug", f"Row expression failed for {target_field}: {e}", node_id)
+                    record[target_field] = None
 
             result.append(record)
 
@@ -8994,6 +9489,7 @@ class ConditionNodeExecutor(NodeExecutorBase):
             resource_context=context.resource,
             default_timeout=hints.max_execution_sec if hasattr(hints, 'max_execution_sec') else 30.0,
             default_batch_size=hints.max_symbols_per_call if hasattr(hints, 'max_symbols_per_call') else 100,
+            max_concurrent_batches=self.PLUGIN_BATCH_CONCURRENCY,
         )
         
         try:
@@ -9178,19 +9674,21 @@ class ConditionNodeExecutor(NodeExecutorBase):
                     "values": [],
                 }
 
-            # symbols 자동 추출 (data에서)
-            symbols = []
+            # symbols 자동 추출 (data에서) — 종목당 한 번만 {exchange, symbol} 을 만들고
+            # 그대로 플러그인 입력(normalized_symbols)으로 쓴다. 이미 두 키를 갖춘 dict 라
+            # symbols_to_dict_list 로 다시 복사할 필요가 없다.
+            normalized_symbols: List[Dict[str, str]] = []
             seen = set()
             for item in data:
                 if isinstance(item, dict):
                     sym = item.get("symbol", "")
                     if sym and sym not in seen:
                         seen.add(sym)
-                        symbols.append({
+                        normalized_symbols.append({
+                            "exchange": item.get("exchange", "NASDAQ"),
                             "symbol": sym,
-                            "exchange": item.get("exchange", "NASDAQ")
                         })
-            context.log("debug", f"symbols 자동 추출: {len(symbols)}개, data: {len(data)} rows", node_id)
+            context.log("debug", f"symbols 자동 추출: {len(normalized_symbols)}개, data: {len(data)} rows", node_id)
 
             # fields 표현식 평가
             evaluated_fields = fields or config.get("fields", {}) or config.get("params", {})
@@ -9199,11 +9697,6 @@ class ConditionNodeExecutor(NodeExecutorBase):
                 evaluator = ExpressionEvaluator(expr_context)
                 evaluated_fields = evaluator.evaluate_fields(evaluated_fields)
 
-            # symbols 정규화 (거래소 정보 포함)
-            from programgarden_core.models import symbols_to_dict_list, extract_symbol_codes
-            normalized_symbols = symbols_to_dict_list(symbols)
-            symbol_codes = extract_symbol_codes(symbols)  # 플러그인 호출용
-
             # 플러그인 실행 (새 형식: 필드 매핑 불필요 - extract에서 이미 정규화됨)
             context.log("info", f"Condition running with {len(data)} data rows", node_id)
 
@@ -9289,13 +9782,13 @@ class ConditionNodeExecutor(NodeExecutorBase):
             }
 
             # context는 시그니처에 있는 플러그인에만 전달 (trailing_stop 등)
-            import inspect
             try:
-                sig = inspect.signature(plugin)
-                if "context" in sig.parameters:
-                    plugin_kwargs["context"] = context
-            except (ValueError, TypeError):
-                pass
+                accepts_context = _plugin_accepts_context(plugin)
+            except TypeError:
+                # 해시 불가 callable 은 캐시 없이 매번 확인
+                accepts_context = _plugin_accepts_context.__wrapped__(plugin)
+            if accepts_context:
+                plugin_kwargs["context"] = context
 
             # 추가 포트 데이터
             if held_symbols:
@@ -9304,15 +9797,13 @@ class ConditionNodeExecutor(NodeExecutorBase):
                 plugin_kwargs["position_data"] = position_data
             
             try:
-                # 종목 수에 따라 배치 처리 결정
-                symbol_codes = [s["symbol"] for s in normalized_symbols]
-                
-                if len(symbol_codes) > sandbox._default_batch_size:
+                # 종목 수에 따라 배치 처리 결정 (종목 코드 목록은 배치 경로에서만 만든다)
+                if len(normalized_symbols) > sandbox._default_batch_size:
                     # 대량 종목은 배치 처리
                     result = await sandbox.execute_batched(
                         plugin_id=plugin_id,
                         plugin_callable=plugin,
-                        symbols=symbol_codes,
+                        symbols=[s["symbol"] for s in normalized_symbols],
                         data=data,
                         fields=fields,
                         field_mapping=field_mapping,
@@ -9554,9 +10045,23 @@ class LogicNodeExecutor(NodeExecutorBase):
         Returns:
             (final_result: bool, final_passed_symbols: List[str])
         """
-        # 각 조건의 bool 결과 목록
-        bool_results = [r["result"] for r in results]
-        passed_count = sum(1 for r in bool_results if r)
+        # all/any/not 은 all()/any() 가 첫 결정 조건에서 멈추므로 사전 집계가 필요 없다.
+        # 개수·가중치 기반 연산자만 통과한 위치 목록을 한 번 만들고, 가중치 합은
+        # weighted 일 때만 그 목록 위에서 더한다.
+        passed_count = 0
+        total_weight = 0.0
+        first_passed: Optional[int] = None
+        if operator not in ("all", "any", "not"):
+            passed_positions = [i for i, r in enumerate(results) if r["result"]]
+            passed_count = len(passed_positions)
+            if passed_positions:
+                first_passed = passed_positions[0]
+            if operator == "weighted":
+                # weights 는 conditions 원래 index 기준 — dict 가 아닌 조건을 건너뛰면
+                # results 위치와 어긋나므로 r["index"] 로 찾는다. 없으면 기본 1.0
+                total_weight = sum(
+                    weights.get(results[i]["index"], 1.0) for i in passed_positions
+                )
         
         # 종목 코드 → 전체 정보 매핑 (거래소 정보 보존)
         # passed_symbols가 [{exchange, symbol}] 또는 ["AAPL"] 형식일 수 있음
@@ -9575,13 +10080,19 @@ class LogicNodeExecutor(NodeExecutorBase):
                         result[sym] = normalize_symbol(sym)
             return result
         
-        # 모든 조건의 종목 매핑 통합
-        all_symbol_maps = [build_symbol_map(s) for s in all_passed_symbols]
-        combined_map: Dict[str, Dict[str, str]] = {}
-        for m in all_symbol_maps:
-            for code, info in m.items():
-                if code not in combined_map:
-                    combined_map[code] = info
+        # 모든 조건의 종목 매핑 통합 — 판정이 참일 때만 필요하므로 처음 쓰일 때 만든다.
+        # (불만족 판정은 종목 정규화 없이 바로 빈 배열로 끝난다)
+        combined_cache: List[Dict[str, Dict[str, str]]] = []
+
+        def combined_map() -> Dict[str, Dict[str, str]]:
+            if not combined_cache:
+                merged: Dict[str, Dict[str, str]] = {}
+                for symbols in all_passed_symbols:
+                    for code, info in build_symbol_map(symbols).items():
+                        if code not in merged:
+                            merged[code] = info
+                combined_cache.append(merged)
+            return combined_cache[0]
         
         # 기본: 모든 조건이 공유하는 종목 (intersection)
         def intersection_symbols() -> List[Dict[str, str]]:
@@ -9612,7 +10123,8 @@ class LogicNodeExecutor(NodeExecutorBase):
             for s in sets[1:]:
                 common &= s
             # 코드를 {exchange, symbol} 형식으로 복원
-            return [combined_map.get(code, {"exchange": "", "symbol": code}) for code in common if code]
+            symbol_map = combined_map()
+            return [symbol_map.get(code, {"exchange": "", "symbol": code}) for code in common if code]
         
         # union: 하나라도 포함된 종목
         def union_symbols() -> List[Dict[str, str]]:
@@ -9626,36 +10138,31 @@ class LogicNodeExecutor(NodeExecutorBase):
                     elif isinstance(sym, str):
                         codes.add(sym)
             # 코드를 {exchange, symbol} 형식으로 복원
-            return [combined_map.get(code, {"exchange": "", "symbol": code}) for code in codes if code]
+            symbol_map = combined_map()
+            return [symbol_map.get(code, {"exchange": "", "symbol": code}) for code in codes if code]
         
         # 연산자별 처리
         if operator == "all":
             # AND: 모든 조건 만족
-            final_result = all(bool_results)
+            final_result = all(r["result"] for r in results)
             final_passed = intersection_symbols() if final_result else []
             
         elif operator == "any":
             # OR: 하나 이상 만족
-            final_result = any(bool_results)
+            final_result = any(r["result"] for r in results)
             final_passed = union_symbols() if final_result else []
             
         elif operator == "not":
             # NOT: 모든 조건 불만족
-            final_result = not any(bool_results)
+            final_result = not any(r["result"] for r in results)
             # not이면 passed_symbols는 빈 배열 (조건 불만족이 목표)
             final_passed = []
             
         elif operator == "xor":
-            # XOR: 정확히 하나만 만족
+            # XOR: 정확히 하나만 만족 → 만족한 조건의 passed_symbols 반환
             final_result = passed_count == 1
-            if final_result:
-                # 만족한 조건의 passed_symbols 반환
-                for i, r in enumerate(bool_results):
-                    if r:
-                        final_passed = all_passed_symbols[i] if all_passed_symbols else []
-                        break
-                else:
-                    final_passed = []
+            if final_result and all_passed_symbols:
+                final_passed = all_passed_symbols[first_passed]
             else:
                 final_passed = []
                 
@@ -9689,20 +10196,13 @@ class LogicNodeExecutor(NodeExecutorBase):
                 context.log("warning", "weighted requires threshold, defaulting to 0.5", node_id)
                 threshold = 0.5
             
-            total_weight = 0.0
-            for i, r in enumerate(results):
-                if r["result"]:
-                    # weights에 index가 없으면 기본 1.0
-                    w = weights.get(i, 1.0)
-                    total_weight += w
-            
             final_result = total_weight >= threshold
             final_passed = union_symbols() if final_result else []
             context.log("debug", f"Weighted sum: {total_weight} >= {threshold} = {final_result}", node_id)
             
         else:
             context.log("warning", f"Unknown operator: {operator}, defaulting to 'all'", node_id)
-            final_result = all(bool_results)
+            final_result = passed_count == len(results)
             final_passed = intersection_symbols() if final_result else []
         
         return final_result, final_passed
@@ -9866,6 +10366,15 @@ class MarketDataNodeExecutor(NodeExecutorBase):
         "81": "NYSE",
     }
 
+    # 상품 → 현재가 조회 메서드 이름 (NewOrderNodeExecutor.PRODUCT_ORDER_HANDLERS 와 같은 방식).
+    # overseas_futureoption 은 해외선물과 같은 o3105 경로.
+    PRODUCT_FETCHERS = {
+        "overseas_stock": "_fetch_overseas_stock",
+        "overseas_futures": "_fetch_overseas_futures",
+        "overseas_futureoption": "_fetch_overseas_futures",
+        "korea_stock": "_fetch_korea_stock",
+    }
+
     async def execute(
         self,
         node_id: str,
@@ -9950,18 +10459,13 @@ class MarketDataNodeExecutor(NodeExecutorBase):
             node_id
         )
         
-        # product별 분기 (overseas_futures와 overseas_futureoption은 동일)
-        if product == "overseas_stock":
-            result = await self._fetch_overseas_stock(symbols, context, node_id)
-        elif product in ("overseas_futureoption", "overseas_futures"):
-            result = await self._fetch_overseas_futures(symbols, context, node_id)
-        elif product == "korea_stock":
-            result = await self._fetch_korea_stock(symbols, context, node_id)
-        else:
+        # product별 조회 메서드 (overseas_futures와 overseas_futureoption은 동일)
+        fetcher_name = self.PRODUCT_FETCHERS.get(product)
+        if fetcher_name is None:
             context.log("error", f"Unsupported product for MarketDataNode: {product}", node_id)
-            result = self._empty_result(f"i18n:errors.UNSUPPORTED_PRODUCT|product={product}")
+            return self._empty_result(f"i18n:errors.UNSUPPORTED_PRODUCT|product={product}")
 
-        return result
+        return await getattr(self, fetcher_name)(symbols, context, node_id)
 
     async def _fetch_overseas_stock(
         self,
@@ -9992,17 +10496,13 @@ class MarketDataNodeExecutor(NodeExecutorBase):
                 return self._empty_result(f"i18n:errors.LS_LOGIN_FAILED|error={error}")
             
             api = ls.overseas_stock()
-            
-            values = []
-            
-            for symbol_entry in symbols:
+
+            async def _fetch_one(symbol_entry: Dict[str, str]) -> Optional[tuple]:
+                # 거래소와 심볼 추출
+                exchange = symbol_entry.get("exchange", "NASDAQ")
+                symbol = symbol_entry["symbol"]
+
                 try:
-                    # 거래소와 심볼 추출
-                    exchange = symbol_entry.get("exchange", "NASDAQ")
-                    symbol = symbol_entry.get("symbol", "")
-                    if not symbol:
-                        continue
-                    
                     # 거래소 코드 변환 (81: NYSE/AMEX, 82: NASDAQ)
                     # 라벨을 조용히 82 로 떨어뜨리면 NYSE 종목이 "No data" 로 무음 유실된다
                     # (실측: 예제 08 이 30종목 중 8건만 수신).
@@ -10024,55 +10524,68 @@ class MarketDataNodeExecutor(NodeExecutorBase):
                         # KEY종목코드 생성 (거래소코드 + 심볼, 예: "82AAPL")
                         keysymbol = f"{exchange_code}{symbol}"
 
-                        # g3101 현재가 조회
+                        # g3101 현재가 조회 — 동기 req() 는 워커 스레드에서 돌려
+                        # 다른 종목 조회와 겹치게 한다 (이벤트 루프 블로킹 방지)
                         body = G3101InBlock(
                             keysymbol=keysymbol,
                             exchcd=exchange_code,
                             symbol=symbol,
                         )
 
-                        response = api.market().g3101(body=body).req()
+                        response = await asyncio.to_thread(api.market().g3101(body=body).req)
                         if response and response.block:
                             used_code = exchange_code
                             break
 
-                    if response and response.block:
-                        out_block = response.block
-                        from datetime import datetime
+                    if not (response and response.block):
+                        context.log("warning", f"No data for {exchange}:{symbol}", node_id)
+                        return None
 
-                        # 라벨대로 조회에 성공했으면 그대로 둔다(AMEX 처럼 81 을 공유하는 라벨이
-                        # NYSE 로 덮이지 않게). 다른 원장으로 성공했을 때만 실제 응답한 거래소로
-                        # 정정해 하류(주문 노드 등)가 같은 거래소를 쓰게 한다.
-                        if known_code and used_code == known_code:
-                            resolved_exchange = exchange
-                        else:
-                            resolved_exchange = self.CODE_EXCHANGES.get(used_code, exchange)
+                    out_block = response.block
 
-                        # values 배열에 단일 항목 추가
-                        values.append({
-                            "symbol": symbol,
-                            "exchange": resolved_exchange,
-                            "price": float(out_block.price or 0),
-                            # g3101 `diff` 는 절댓값 — 부호는 `sign` 에 따로 온다.
-                            "change": _ls_signed_change(out_block.diff, getattr(out_block, "sign", "")),
-                            "change_pct": float(out_block.rate or 0),
-                            "volume": int(out_block.volume or 0),
-                            "open": float(out_block.open or 0),
-                            "high": float(out_block.high or 0),
-                            "low": float(out_block.low or 0),
-                            "close": float(out_block.price or 0),
-                            "per": float(out_block.perv or 0) if hasattr(out_block, 'perv') else 0.0,
-                            "eps": float(out_block.epsv or 0) if hasattr(out_block, 'epsv') else 0.0,
-                        })
-                        
-                        context.log("debug", f"Fetched {exchange}:{symbol}: price={out_block.price}", node_id)
+                    # 라벨대로 조회에 성공했으면 그대로 둔다(AMEX 처럼 81 을 공유하는 라벨이
+                    # NYSE 로 덮이지 않게). 다른 원장으로 성공했을 때만 실제 응답한 거래소로
+                    # 정정해 하류(주문 노드 등)가 같은 거래소를 쓰게 한다.
+                    if known_code and used_code == known_code:
+                        resolved_exchange = exchange
                     else:
-                        context.log("warning", f"No data for {exchange}:{symbol}", node_id)
-                        
+                        resolved_exchange = self.CODE_EXCHANGES.get(used_code, exchange)
+
+                    context.log("debug", f"Fetched {exchange}:{symbol}: price={out_block.price}", node_id)
+                    return symbol, resolved_exchange, out_block
+
                 except Exception as e:
                     context.log("warning", f"Failed to fetch {exchange}:{symbol}: {e}", node_id)
+                    return None
+
+            # 종목별 조회는 서로 독립 — 상한(_LS_REQUEST_CONCURRENCY) 안에서 동시에 보내고
+            # 결과는 입력 순서대로 모은다.
+            fetched = await _gather_bounded(
+                _fetch_one, self._active_symbols(symbols, context, node_id)
+            )
+
+            values = []
+            for hit in fetched:
+                if not isinstance(hit, tuple):
                     continue
-            
+                symbol, resolved_exchange, out_block = hit
+                # values 배열에 단일 항목 추가
+                values.append({
+                    "symbol": symbol,
+                    "exchange": resolved_exchange,
+                    "price": float(out_block.price or 0),
+                    # g3101 `diff` 는 절댓값 — 부호는 `sign` 에 따로 온다.
+                    "change": _ls_signed_change(out_block.diff, getattr(out_block, "sign", "")),
+                    "change_pct": float(out_block.rate or 0),
+                    "volume": int(out_block.volume or 0),
+                    "open": float(out_block.open or 0),
+                    "high": float(out_block.high or 0),
+                    "low": float(out_block.low or 0),
+                    "close": float(out_block.price or 0),
+                    "per": float(out_block.perv or 0) if hasattr(out_block, 'perv') else 0.0,
+                    "eps": float(out_block.epsv or 0) if hasattr(out_block, 'epsv') else 0.0,
+                })
+
             return {"values": values}
             
         except ImportError as e:
@@ -10111,53 +10624,59 @@ class MarketDataNodeExecutor(NodeExecutorBase):
                 return self._empty_result(f"i18n:errors.LS_LOGIN_FAILED|error={error}")
             
             api = ls.overseas_futureoption()
-            
-            values = []
-            
-            for symbol_entry in symbols:
+
+            async def _fetch_one(symbol: str) -> Any:
                 try:
-                    # 해외선물은 exchange 대신 symbol만 사용 (예: "GCGF25", "CLH25")
-                    exchange = symbol_entry.get("exchange", "CME")
-                    symbol = symbol_entry.get("symbol", "")
-                    if not symbol:
-                        continue
-                    
-                    # o3105 현재가 조회 (종목심볼만 필요)
-                    body = O3105InBlock(symbol=symbol)
-                    
+                    # o3105 현재가 조회 (종목심볼만 필요) — 동기 req() 는 워커 스레드에서
                     context.log("debug", f"Calling o3105 for symbol={symbol}", node_id)
-                    response = api.market().o3105(body=body).req()
+                    response = await asyncio.to_thread(
+                        api.market().o3105(body=O3105InBlock(symbol=symbol)).req
+                    )
                     context.log("debug", f"o3105 response: {response}", node_id)
-                    
-                    if response and response.block:
-                        out_block = response.block
-                        from datetime import datetime
-                        
-                        # values 배열에 단일 항목 추가
-                        values.append({
-                            "symbol": symbol,
-                            "exchange": exchange,
-                            "symbol_name": out_block.SymbolNm or symbol,
-                            "price": float(out_block.TrdP or 0),
-                            # o3105 `YdiffP` 는 이미 부호를 포함한다(실측). 헬퍼는 멱등이라 값이 안 바뀌며,
-                            # LS 가 언젠가 절댓값으로 바꿔 보내도 `YdiffSign` 으로 방어된다.
-                            "change": _ls_signed_change(out_block.YdiffP, getattr(out_block, "YdiffSign", "")),
-                            "change_pct": float(out_block.Diff or 0),
-                            "volume": int(out_block.TotQ or 0),
-                            "open": float(out_block.OpenP or 0),
-                            "high": float(out_block.HighP or 0),
-                            "low": float(out_block.LowP or 0),
-                            "close": float(out_block.TrdP or 0),  # 현재가 = 종가
-                        })
-                        
-                        context.log("debug", f"Fetched {exchange}:{symbol}: price={out_block.TrdP}", node_id)
-                    else:
-                        context.log("warning", f"No data for {exchange}:{symbol}", node_id)
-                        
+                    return response.block if response else None
                 except Exception as e:
-                    context.log("warning", f"Failed to fetch {exchange}:{symbol}: {e}", node_id)
+                    return e
+
+            # 해외선물은 exchange 대신 symbol만 사용 (예: "GCGF25", "CLH25").
+            # 같은 심볼은 한 번만 조회하고, 서로 다른 심볼은 상한 안에서 동시에 보낸다.
+            active = self._active_symbols(symbols, context, node_id)
+            unique_symbols = list(dict.fromkeys(entry["symbol"] for entry in active))
+            blocks = dict(zip(unique_symbols, await _gather_bounded(_fetch_one, unique_symbols)))
+
+            values = []
+            for symbol_entry in active:
+                exchange = symbol_entry.get("exchange", "CME")
+                symbol = symbol_entry["symbol"]
+                out_block = blocks.get(symbol)
+
+                if isinstance(out_block, BaseException):
+                    context.log("warning", f"Failed to fetch {exchange}:{symbol}: {out_block}", node_id)
                     continue
-            
+                if not out_block:
+                    context.log("warning", f"No data for {exchange}:{symbol}", node_id)
+                    continue
+
+                try:
+                    # values 배열에 단일 항목 추가
+                    values.append({
+                        "symbol": symbol,
+                        "exchange": exchange,
+                        "symbol_name": out_block.SymbolNm or symbol,
+                        "price": float(out_block.TrdP or 0),
+                        # o3105 `YdiffP` 는 이미 부호를 포함한다(실측). 헬퍼는 멱등이라 값이 안 바뀌며,
+                        # LS 가 언젠가 절댓값으로 바꿔 보내도 `YdiffSign` 으로 방어된다.
+                        "change": _ls_signed_change(out_block.YdiffP, getattr(out_block, "YdiffSign", "")),
+                        "change_pct": float(out_block.Diff or 0),
+                        "volume": int(out_block.TotQ or 0),
+                        "open": float(out_block.OpenP or 0),
+                        "high": float(out_block.HighP or 0),
+                        "low": float(out_block.LowP or 0),
+                        "close": float(out_block.TrdP or 0),  # 현재가 = 종가
+                    })
+                    context.log("debug", f"Fetched {exchange}:{symbol}: price={out_block.TrdP}", node_id)
+                except Exception as e:
+                    context.log("warning", f"Failed to fetch {exchange}:{symbol}: {e}", node_id)
+
             return {"values": values}
             
         except ImportError as e:
@@ -10197,50 +10716,52 @@ class MarketDataNodeExecutor(NodeExecutorBase):
 
             api = ls.korea_stock()
 
-            values = []
-
-            for symbol_entry in symbols:
+            async def _fetch_one(symbol_entry: Dict[str, str]) -> Optional[tuple]:
+                symbol = symbol_entry["symbol"]
                 try:
-                    symbol = symbol_entry.get("symbol", "")
-                    if not symbol:
-                        continue
-
-                    # t1102 현재가 조회 (6자리 종목코드)
+                    # t1102 현재가 조회 (6자리 종목코드) — 동기 req() 는 워커 스레드에서
                     body = T1102InBlock(shcode=symbol)
-
-                    response = api.market().t1102(body=body).req()
-
-                    if response and response.block:
-                        blk = response.block
-
-                        # sign: 1=상한/2=상승 → 양수, 4=하한/5=하락 → 음수
-                        # 국내 현재가 `change` 도 절댓값 — 부호는 `sign` 에 따로 온다 (해외와 동일 규칙).
-                        # 국내 호가는 원 단위 정수라 기존 int 출력 타입을 유지한다.
-                        change_val = int(_ls_signed_change(blk.change, getattr(blk, "sign", "")))
-
-                        values.append({
-                            "symbol": symbol,
-                            "exchange": "KRX",
-                            "name": str(blk.hname or ""),
-                            "price": int(blk.price or 0),
-                            "change": change_val,
-                            "change_pct": float(blk.diff or 0),
-                            "volume": int(blk.volume or 0),
-                            "open": int(blk.open or 0),
-                            "high": int(blk.high or 0),
-                            "low": int(blk.low or 0),
-                            "close": int(blk.price or 0),
-                            "per": float(blk.per or 0),
-                            "pbr": float(blk.pbrx or 0),
-                        })
-
-                        context.log("debug", f"Fetched KRX:{symbol}: price={blk.price}", node_id)
-                    else:
+                    response = await asyncio.to_thread(api.market().t1102(body=body).req)
+                    if not (response and response.block):
                         context.log("warning", f"No data for KRX:{symbol}", node_id)
-
+                        return None
+                    context.log("debug", f"Fetched KRX:{symbol}: price={response.block.price}", node_id)
+                    return symbol, response.block
                 except Exception as e:
                     context.log("warning", f"Failed to fetch KRX:{symbol}: {e}", node_id)
+                    return None
+
+            # 종목별 조회는 서로 독립 — 상한 안에서 동시에 보내고 결과는 입력 순서대로 모은다
+            fetched = await _gather_bounded(
+                _fetch_one, self._active_symbols(symbols, context, node_id)
+            )
+
+            values = []
+            for hit in fetched:
+                if not isinstance(hit, tuple):
                     continue
+                symbol, blk = hit
+
+                # sign: 1=상한/2=상승 → 양수, 4=하한/5=하락 → 음수
+                # 국내 현재가 `change` 도 절댓값 — 부호는 `sign` 에 따로 온다 (해외와 동일 규칙).
+                # 국내 호가는 원 단위 정수라 기존 int 출력 타입을 유지한다.
+                change_val = int(_ls_signed_change(blk.change, getattr(blk, "sign", "")))
+
+                values.append({
+                    "symbol": symbol,
+                    "exchange": "KRX",
+                    "name": str(blk.hname or ""),
+                    "price": int(blk.price or 0),
+                    "change": change_val,
+                    "change_pct": float(blk.diff or 0),
+                    "volume": int(blk.volume or 0),
+                    "open": int(blk.open or 0),
+                    "high": int(blk.high or 0),
+                    "low": int(blk.low or 0),
+                    "close": int(blk.price or 0),
+                    "per": float(blk.per or 0),
+                    "pbr": float(blk.pbrx or 0),
+                })
 
             return {"values": values}
 
@@ -10258,6 +10779,23 @@ class MarketDataNodeExecutor(NodeExecutorBase):
             result["error"] = error_msg
         return result
 
+    @staticmethod
+    def _active_symbols(
+        symbols: List[Dict[str, str]],
+        context: ExecutionContext,
+        node_id: str,
+    ) -> List[Dict[str, str]]:
+        """조회할 수 없는 항목(symbol 없음)을 미리 걸러낸다.
+
+        종목별 조회 루프/동시 실행 슬롯에 빈 항목이 들어가지 않게 하고,
+        걸러낸 건수는 debug 로그 한 줄로만 남긴다.
+        """
+        active = [s for s in symbols if isinstance(s, dict) and s.get("symbol")]
+        skipped = len(symbols) - len(active)
+        if skipped:
+            context.log("debug", f"Skipped {skipped} entries without symbol", node_id)
+        return active
+
 
 class FundamentalNodeExecutor(NodeExecutorBase):
     """
@@ -10343,15 +10881,10 @@ class FundamentalNodeExecutor(NodeExecutorBase):
 
             api = ls.overseas_stock()
 
-            values = []
-
-            for symbol_entry in symbols:
+            async def _fetch_one(symbol_entry: Dict[str, str]) -> Optional[Dict[str, Any]]:
+                exchange = symbol_entry.get("exchange", "NASDAQ")
+                symbol = symbol_entry["symbol"]
                 try:
-                    exchange = symbol_entry.get("exchange", "NASDAQ")
-                    symbol = symbol_entry.get("symbol", "")
-                    if not symbol:
-                        continue
-
                     exchange_code = self.EXCHANGE_CODES.get(exchange.upper(), "82")
                     keysymbol = f"{exchange_code}{symbol}"
 
@@ -10361,44 +10894,49 @@ class FundamentalNodeExecutor(NodeExecutorBase):
                         symbol=symbol,
                     )
 
-                    response = api.market().g3104(body=body).req()
+                    response = await asyncio.to_thread(api.market().g3104(body=body).req)
 
-                    if response and response.block:
-                        blk = response.block
+                    if not (response and response.block):
+                        context.log("warning", f"No data for {exchange}:{symbol}", node_id)
+                        return None
 
-                        # 등락률 계산 (전일종가 대비)
-                        pcls = float(blk.pcls or 0)
-                        clos = float(blk.clos or 0)
-                        change_percent = ((clos - pcls) / pcls * 100) if pcls else 0.0
+                    blk = response.block
 
-                        values.append({
-                            "exchange": exchange,
-                            "symbol": symbol,
-                            "name": str(blk.engname or ""),
-                            "industry": str(blk.induname or ""),
-                            "nation": str(blk.nation_name or ""),
-                            "exchange_name": str(blk.exchange_name or ""),
-                            "current_price": clos,
-                            "volume": int(blk.volume or 0),
-                            "change_percent": round(change_percent, 2),
-                            "per": float(blk.perv or 0),
-                            "eps": float(blk.epsv or 0),
-                            "market_cap": int(blk.shareprc or 0),
-                            "shares_outstanding": int(blk.share or 0),
-                            "high_52w": float(blk.high52p or 0),
-                            "low_52w": float(blk.low52p or 0),
-                            "exchange_rate": float(blk.exrate or 0),
-                        })
+                    # 등락률 계산 (전일종가 대비)
+                    pcls = float(blk.pcls or 0)
+                    clos = float(blk.clos or 0)
+                    change_percent = ((clos - pcls) / pcls * 100) if pcls else 0.0
 
-                        context.log("debug", f"Fetched fundamental {exchange}:{symbol}: PER={blk.perv}, EPS={blk.epsv}", node_id)
-                    else:
-                        context.log("warning", f"No data for {exchange}:{symbol}", node_id)
+                    context.log("debug", f"Fetched fundamental {exchange}:{symbol}: PER={blk.perv}, EPS={blk.epsv}", node_id)
+                    return {
+                        "exchange": exchange,
+                        "symbol": symbol,
+                        "name": str(blk.engname or ""),
+                        "industry": str(blk.induname or ""),
+                        "nation": str(blk.nation_name or ""),
+                        "exchange_name": str(blk.exchange_name or ""),
+                        "current_price": clos,
+                        "volume": int(blk.volume or 0),
+                        "change_percent": round(change_percent, 2),
+                        "per": float(blk.perv or 0),
+                        "eps": float(blk.epsv or 0),
+                        "market_cap": int(blk.shareprc or 0),
+                        "shares_outstanding": int(blk.share or 0),
+                        "high_52w": float(blk.high52p or 0),
+                        "low_52w": float(blk.low52p or 0),
+                        "exchange_rate": float(blk.exrate or 0),
+                    }
 
                 except Exception as e:
                     context.log("warning", f"Failed to fetch {exchange}:{symbol}: {e}", node_id)
-                    continue
+                    return None
 
-            return {"values": values}
+            # symbol 없는 항목은 동시 실행 슬롯에 넣기 전에 한 번만 걸러내고,
+            # 종목별 조회는 상한 안에서 동시에 보낸다 (결과는 입력 순서 유지).
+            fetched = await _gather_bounded(
+                _fetch_one, MarketDataNodeExecutor._active_symbols(symbols, context, node_id)
+            )
+            return {"values": [value for value in fetched if isinstance(value, dict)]}
 
         except ImportError as e:
             context.log("error", f"Finance package not available: {e}", node_id)
@@ -10433,45 +10971,44 @@ class FundamentalNodeExecutor(NodeExecutorBase):
 
             api = ls.korea_stock()
 
-            values = []
-
-            for symbol_entry in symbols:
+            async def _fetch_one(symbol_entry: Dict[str, str]) -> Optional[Dict[str, Any]]:
+                symbol = symbol_entry["symbol"]
                 try:
-                    symbol = symbol_entry.get("symbol", "")
-                    if not symbol:
-                        continue
-
                     body = T1102InBlock(shcode=symbol)
-                    response = api.market().t1102(body=body).req()
+                    response = await asyncio.to_thread(api.market().t1102(body=body).req)
 
-                    if response and response.block:
-                        blk = response.block
+                    if not (response and response.block):
+                        context.log("warning", f"No data for KRX:{symbol}", node_id)
+                        return None
 
-                        values.append({
-                            "exchange": "KRX",
-                            "symbol": symbol,
-                            "name": str(blk.hname or ""),
-                            "current_price": int(blk.price or 0),
-                            "volume": int(blk.volume or 0),
-                            "change_percent": float(blk.diff or 0),
-                            "per": float(blk.per or 0),
-                            "pbr": float(blk.pbrx or 0),
-                            "market_cap": int(blk.total or 0),  # 억원
-                            "shares_outstanding": int(blk.listing or 0),  # 천 단위
-                            "high_52w": int(blk.high52w or 0),
-                            "low_52w": int(blk.low52w or 0),
-                            "eps": float(blk.bfeps or 0),  # 전분기 EPS
-                        })
+                    blk = response.block
 
-                        context.log("debug", f"Fetched fundamental KRX:{symbol}: PER={blk.per}, PBR={blk.pbrx}", node_id)
-                    else:
-                        context.log("warning", f"No data for KRX:{symbol}", node_id)
+                    context.log("debug", f"Fetched fundamental KRX:{symbol}: PER={blk.per}, PBR={blk.pbrx}", node_id)
+                    return {
+                        "exchange": "KRX",
+                        "symbol": symbol,
+                        "name": str(blk.hname or ""),
+                        "current_price": int(blk.price or 0),
+                        "volume": int(blk.volume or 0),
+                        "change_percent": float(blk.diff or 0),
+                        "per": float(blk.per or 0),
+                        "pbr": float(blk.pbrx or 0),
+                        "market_cap": int(blk.total or 0),  # 억원
+                        "shares_outstanding": int(blk.listing or 0),  # 천 단위
+                        "high_52w": int(blk.high52w or 0),
+                        "low_52w": int(blk.low52w or 0),
+                        "eps": float(blk.bfeps or 0),  # 전분기 EPS
+                    }
 
                 except Exception as e:
                     context.log("warning", f"Failed to fetch KRX:{symbol}: {e}", node_id)
-                    continue
+                    return None
 
-            return {"values": values}
+            # symbol 없는 항목은 미리 걸러내고 종목별 조회는 상한 안에서 동시에 보낸다
+            fetched = await _gather_bounded(
+                _fetch_one, MarketDataNodeExecutor._active_symbols(symbols, context, node_id)
+            )
+            return {"values": [value for value in fetched if isinstance(value, dict)]}
 
         except ImportError as e:
             context.log("error", f"Finance package not available: {e}", node_id)
@@ -10774,9 +11311,7 @@ class HistoricalDataNodeExecutor(NodeExecutorBase):
                         if sym and mc:
                             position_market_code[sym] = mc
 
-            result_list = []  # [{symbol, exchange, time_series: [...]}, ...]
-
-            for symbol in symbols:
+            async def _fetch_one(symbol: str) -> Dict[str, Any]:
                 try:
                     # positions에서 market_code 가져오기 (LS증권 거래소 코드: 81=NYSE/AMEX, 82=NASDAQ)
                     exchcd = position_market_code.get(symbol) or "82"  # 기본값 NASDAQ
@@ -10816,31 +11351,32 @@ class HistoricalDataNodeExecutor(NodeExecutorBase):
                             })
                         # 날짜순 정렬 (오래된 것부터)
                         bars.sort(key=lambda x: x["date"])
-                        result_list.append({
-                            "symbol": symbol,
-                            "exchange": exchange,
-                            "time_series": bars,
-                        })
                         context.log("debug", f"Fetched {len(bars)} bars for {symbol} ({start_date}~{end_date})", node_id)
-                    else:
-                        context.log("warning", f"No data for {symbol}", node_id)
-                        result_list.append({
+                        return {
                             "symbol": symbol,
                             "exchange": exchange,
-                            "time_series": [],
-                        })
-                        
+                            "time_series": bars,
+                        }
+                    context.log("warning", f"No data for {symbol}", node_id)
+                    return {
+                        "symbol": symbol,
+                        "exchange": exchange,
+                        "time_series": [],
+                    }
+
                 except Exception as e:
                     context.log("warning", f"Error fetching {symbol}: {e}", node_id)
                     # symbols_raw에서 exchange 정보 가져오기
                     exchange = symbol_to_exchange.get(symbol, "NASDAQ")
-                    result_list.append({
+                    return {
                         "symbol": symbol,
                         "exchange": exchange,
                         "time_series": [],
-                    })
-            
-            return result_list
+                    }
+
+            # 종목별 g3204 왕복을 상한 안에서 겹쳐 보낸다 — 결과는 입력 순서 그대로.
+            # [{symbol, exchange, time_series: [...]}, ...]
+            return await _gather_bounded(_fetch_one, list(symbols))
             
         except ImportError as e:
             context.log("error", f"Finance package not available: {e}", node_id)
@@ -10886,8 +11422,7 @@ class HistoricalDataNodeExecutor(NodeExecutorBase):
                 return self._empty_historical_result(symbols_raw or [], f"i18n:errors.LS_LOGIN_FAILED|error={error}")
             
             api = ls.overseas_futureoption()
-            result_list = []
-            
+
             # symbols_raw에서 exchange 정보 추출
             symbol_to_exchange = {}
             if symbols_raw:
@@ -10900,7 +11435,7 @@ class HistoricalDataNodeExecutor(NodeExecutorBase):
             # interval별 분기
             is_minute_data = interval in ["1min", "5min", "15min", "30min", "30s"]
             
-            for symbol in symbols:
+            async def _fetch_one(symbol: str) -> Dict[str, Any]:
                 try:
                     if is_minute_data:
                         # 분봉: o3103
@@ -10908,25 +11443,24 @@ class HistoricalDataNodeExecutor(NodeExecutorBase):
                     else:
                         # 일봉/주봉/월봉: o3108
                         bars = await self._fetch_futures_daily_chart(api, symbol, start_date, end_date, interval, context, node_id)
-                    
-                    exchange = symbol_to_exchange.get(symbol, "CME")
-                    result_list.append({
+
+                    context.log("debug", f"Fetched {len(bars)} bars for {symbol}", node_id)
+                    return {
                         "symbol": symbol,
-                        "exchange": exchange,
+                        "exchange": symbol_to_exchange.get(symbol, "CME"),
                         "time_series": bars,
-                    })
-                    context.log("debug", f"Fetched {len(bars)} bars for {symbol}", node_id)
-                    
+                    }
+
                 except Exception as e:
                     context.log("warning", f"Error fetching futures {symbol}: {e}", node_id)
-                    exchange = symbol_to_exchange.get(symbol, "CME")
-                    result_list.append({
+                    return {
                         "symbol": symbol,
-                        "exchange": exchange,
+                        "exchange": symbol_to_exchange.get(symbol, "CME"),
                         "time_series": [],
-                    })
-            
-            return result_list
+                    }
+
+            # 종목별 차트 조회를 상한 안에서 동시에 보낸다 — 결과는 입력 순서 그대로
+            return await _gather_bounded(_fetch_one, list(symbols))
             
         except ImportError as e:
             context.log("error", f"Finance package not available: {e}", node_id)
@@ -11074,9 +11608,7 @@ class HistoricalDataNodeExecutor(NodeExecutorBase):
             gubun_map = {"1d": "2", "1w": "3", "1M": "4", "1Y": "5"}
             gubun = gubun_map.get(interval, "2")
 
-            result_list = []
-
-            for symbol in symbols:
+            async def _fetch_one(symbol: str) -> Dict[str, Any]:
                 try:
                     body = T8451InBlock(
                         shcode=symbol,
@@ -11087,7 +11619,8 @@ class HistoricalDataNodeExecutor(NodeExecutorBase):
                         sujung="Y",  # 수정주가 적용
                     )
 
-                    response = api.chart().t8451(body=body).req()
+                    # 동기 req() 는 워커 스레드에서 — 다른 종목 조회와 겹치도록
+                    response = await asyncio.to_thread(api.chart().t8451(body=body).req)
 
                     time_series = []
                     if response and response.block1:
@@ -11104,27 +11637,25 @@ class HistoricalDataNodeExecutor(NodeExecutorBase):
                     # 시간순 정렬 (오래된 것부터)
                     time_series.sort(key=lambda x: x["date"])
 
-                    # symbols_raw에서 exchange 정보 추출
-                    exchange = "KRX"
+                    context.log("debug", f"Fetched KRX:{symbol}: {len(time_series)} bars", node_id)
 
-                    result_list.append({
+                    return {
                         "symbol": symbol,
-                        "exchange": exchange,
+                        "exchange": "KRX",
                         "time_series": time_series,
-                    })
-
-                    context.log("debug", f"Fetched KRX:{symbol}: {len(time_series)} bars", node_id)
+                    }
 
                 except Exception as e:
                     context.log("warning", f"Failed to fetch KRX:{symbol}: {e}", node_id)
-                    result_list.append({
+                    return {
                         "symbol": symbol,
                         "exchange": "KRX",
                         "time_series": [],
                         "_error": str(e),
-                    })
+                    }
 
-            return result_list
+            # 종목별 t8451 조회를 상한 안에서 동시에 보낸다 — 결과는 입력 순서 그대로
+            return await _gather_bounded(_fetch_one, list(symbols))
 
         except ImportError as e:
             context.log("error", f"Finance package not available: {e}", node_id)
@@ -11240,23 +11771,33 @@ class BacktestEngineNodeExecutor(NodeExecutorBase):
         # 크래시했다 (dry_run 은 mock 이 빈 time_series 를 줘 루프가 안 돌아 은폐됨).
         base_dict = expr_context.to_dict()
 
+        # 필드별 처리 방식은 row 와 무관 — 루프 밖에서 한 번만 정한다 (ConditionNode 와 동일)
+        plan: List[Tuple[str, Optional[str], Any]] = []
+        for target_field, source_expr in extract.items():
+            if target_field in external_values:
+                plan.append((target_field, None, external_values[target_field]))
+            elif isinstance(source_expr, str) and "{{" in source_expr:
+                plan.append((target_field, source_expr, None))
+            else:
+                plan.append((target_field, None, source_expr))
+        uses_row = any(row_expr is not None for _, row_expr, _ in plan)
+
         # 각 row 처리
         for row in from_data:
             record = {}
-            row_ctx = ExpressionContext()
-            row_ctx.variables = {**base_dict, "row": row}
-            row_evaluator = ExpressionEvaluator(row_ctx)
-
-            for target_field, source_expr in extract.items():
-                if target_field in external_values:
-                    record[target_field] = external_values[target_field]
-                elif isinstance(source_expr, str) and "{{" in source_expr:
-                    try:
-                        record[target_field] = row_evaluator.evaluate(source_expr)
-                    except Exception:
-                        record[target_field] = None
-                else:
-                    record[target_field] = source_expr
+            if uses_row:
+                row_ctx = ExpressionContext()
+                row_ctx.variables = {**base_dict, "row": row}
+                row_evaluator = ExpressionEvaluator(row_ctx)
+
+            for target_field, row_expr, value in plan:
+                if row_expr is None:
+                    record[target_field] = value
+                    continue
+                try:
+                    record[target_field] = row_evaluator.evaluate(row_expr)
+                except Exception:
+                    record[target_field] = None
 
             result.append(record)
 
@@ -12322,6 +12863,12 @@ class PositionSizingNodeExecutor(NodeExecutorBase):
     - config: 사이징 설정 정보
     """
 
+    # balance dict 에서 매수가능금액을 찾는 키 (우선순위 순)
+    BALANCE_KEYS = (
+        "orderable_amount", "total_orderable", "fcurr_ord_able_amt", "ord_able_amt",
+        "available", "balance", "cash_krw", "cash_usd",
+    )
+
     async def execute(
         self,
         node_id: str,
@@ -12393,30 +12940,35 @@ class PositionSizingNodeExecutor(NodeExecutorBase):
                 failure_reason=str(failure_reason),
             )
 
-        # 예수금 추출 (해외주식/해외선물 공통)
-        available_balance = self._extract_balance(balance_data)
-
-        # fixed_quantity 메서드는 balance 없이도 동작 (테스트용)
-        if available_balance <= 0 and method != "fixed_quantity":
-            context.log("warning", f"No available balance: {available_balance}", node_id)
-            # A zero balance caused by a partial fetch failure is a pipeline
-            # error (fetch_failed), not a normal "no signal" no-op. The hard
-            # _partial_failure raise above already covers non-dry-run; in
-            # dry_run (exempt) still surface the failure reason in the result.
-            if isinstance(balance_data, dict) and balance_data.get("_partial_failure") is True:
-                detail = str(
-                    balance_data.get("_failure_reason")
-                    or "balance fetch partially failed"
+        # 예수금 추출 (해외주식/해외선물 공통).
+        # fixed_quantity 메서드는 balance 없이도 동작 (테스트용) — 잔고를 쓰지 않으므로
+        # balance 구조를 뒤지지 않고 바로 사이징으로 넘어간다. 잔고 0 처리는 잔고를 쓰는
+        # 메서드 안쪽 분기로만 두어, 잔고가 있는 일반 경로는 그대로 아래로 흘러간다.
+        uses_balance = method != "fixed_quantity"
+        available_balance = 0.0
+        if uses_balance:
+            available_balance = self._extract_balance(balance_data)
+            if available_balance <= 0:
+                context.log("warning", f"No available balance: {available_balance}", node_id)
+                # A zero balance caused by a partial fetch failure is a pipeline
+                # error (fetch_failed), not a normal "no signal" no-op. The hard
+                # _partial_failure raise above already covers non-dry-run; in
+                # dry_run (exempt) still surface the failure reason in the result.
+                if isinstance(balance_data, dict) and balance_data.get("_partial_failure") is True:
+                    detail = str(
+                        balance_data.get("_failure_reason")
+                        or "balance fetch partially failed"
+                    )
+                    return self._empty_result(EmptyOrderReason.FETCH_FAILED, detail)
+                return self._empty_result(
+                    EmptyOrderReason.NO_SIGNAL,
+                    "No available balance for position sizing",
                 )
-                return self._empty_result(EmptyOrderReason.FETCH_FAILED, detail)
-            return self._empty_result(
-                EmptyOrderReason.NO_SIGNAL,
-                "No available balance for position sizing",
-            )
         
         context.log(
             "info",
-            f"Position sizing: method={method}, symbols={len(symbols)}, balance={available_balance:,.0f}",
+            f"Position sizing: method={method}, symbols={len(symbols)}, "
+            f"balance={f'{available_balance:,.0f}' if uses_balance else 'n/a'}",
             node_id
         )
         
@@ -12506,10 +13058,11 @@ class PositionSizingNodeExecutor(NodeExecutorBase):
         
         if isinstance(balance_data, dict):
             # 예수금 필드 (해외주식/해외선물 공통)
-            for key in ["orderable_amount", "total_orderable", "fcurr_ord_able_amt", "ord_able_amt", "available", "balance", "cash_krw", "cash_usd"]:
-                if key in balance_data and balance_data[key]:
+            for key in self.BALANCE_KEYS:
+                value = balance_data.get(key)
+                if value:
                     try:
-                        return float(balance_data[key])
+                        return float(value)
                     except (ValueError, TypeError):
                         continue
         
@@ -13397,6 +13950,54 @@ class BenchmarkCompareNodeExecutor(NodeExecutorBase):
         return result
 
 
+def _order_node_product(node_type: str, broker_connection: Dict[str, Any]) -> "tuple[str, bool]":
+    """정정/취소 노드 타입에서 (product, paper_trading) 결정 (국내주식은 모의투자 미지원)."""
+    if "KoreaStock" in node_type:
+        product = "korea_stock"
+    elif node_type.startswith("Stock"):
+        product = "overseas_stock"
+    elif node_type.startswith("Futures"):
+        product = "overseas_futures"
+    else:
+        product = broker_connection.get("product", "overseas_stock")
+    paper_trading = broker_connection.get("paper_trading", False) if product != "korea_stock" else False
+    return product, paper_trading
+
+
+def _order_node_login(
+    node_type: str,
+    paper_trading: bool,
+    product: str,
+    context: "ExecutionContext",
+    node_id: str,
+) -> "tuple[Any, Optional[str]]":
+    """신규/정정/취소 주문 노드 공통 LS 로그인 (credential 확인 포함).
+
+    Returns:
+        (ls_instance, None) 또는 실패 시 (None, error_message)
+    """
+    credential = context.get_credential()
+    if not credential:
+        context.log("error", f"{node_type}: Credential not found", node_id)
+        return None, "Missing credentials"
+
+    appkey = credential.get("appkey")
+    appsecret = credential.get("appsecret")
+
+    if not appkey or not appsecret:
+        context.log("error", f"{node_type}: appkey/appsecret not found", node_id)
+        return None, "Missing appkey/appsecret"
+
+    ls, success, error = ensure_ls_login(
+        appkey, appsecret, paper_trading, context, node_id,
+        product=product,
+        caller_name=node_type
+    )
+    if not success:
+        return None, error
+    return ls, None
+
+
 class NewOrderNodeExecutor(NodeExecutorBase):
     """
     신규 주문 Executor (단일 종목)
@@ -13433,12 +14034,33 @@ class NewOrderNodeExecutor(NodeExecutorBase):
         "MOC": "M4",
     }
 
+    # 매매구분 코드 매핑 (sell 이 아니면 매수로 본다 — 기본값 매수 코드)
+    # 해외주식 COSAT00301 OrdPtnCode: 01=매도, 02=매수
+    STOCK_SIDE_CODES = {"sell": "01", "buy": "02"}
+    # 해외선물 CIDBT00100/00900 · 국내주식 CSPAT00601 BnsTpCode: 1=매도, 2=매수
+    BNS_TP_CODES = {"sell": "1", "buy": "2"}
+
     # 해외선물 주문 유형 코드 매핑
     FUTURES_ORDER_TYPE_CODES = {
         "market": "1",
         "limit": "2",
     }
 
+    # 국내주식 호가 유형 코드 매핑 (CSPAT00601 OrdprcPtnCode)
+    KOREA_PRICE_TYPE_CODES = {
+        "limit": "00",
+        "market": "03",
+    }
+
+    # 상품 → 주문 실행 메서드 이름 (overseas_futureoption 은 해외선물과 같은 CIDBT00100 경로).
+    # 메서드 객체가 아니라 이름을 두어 인스턴스 단위 override(테스트 monkeypatch 등)를 존중한다.
+    PRODUCT_ORDER_HANDLERS = {
+        "overseas_stock": "_execute_overseas_stock",
+        "overseas_futures": "_execute_overseas_futures",
+        "overseas_futureoption": "_execute_overseas_futures",
+        "korea_stock": "_execute_korea_stock",
+    }
+
     async def execute(
         self,
         node_id: str,
@@ -13577,44 +14199,52 @@ class NewOrderNodeExecutor(NodeExecutorBase):
             )
             return existing_order
 
-        # === 4. LS 로그인 ===
-        credential = context.get_credential()
-        if not credential:
-            context.log("error", f"{node_type}: Credential not found", node_id)
-            return self._error_result("Missing credentials")
-
-        appkey = credential.get("appkey")
-        appsecret = credential.get("appsecret")
-
-        if not appkey or not appsecret:
-            context.log("error", f"{node_type}: appkey/appsecret not found", node_id)
-            return self._error_result("Missing appkey/appsecret")
+        # 지원하지 않는 상품은 로그인(토큰 발급) 전에 돌려보낸다
+        handler_name = self.PRODUCT_ORDER_HANDLERS.get(product)
+        if handler_name is None:
+            context.log("error", f"{node_type}: Unsupported product: {product}", node_id)
+            return self._error_result(f"Unsupported product: {product}")
 
+        # === 4. LS 로그인 ===
         try:
-            ls, success, error = ensure_ls_login(
-                appkey, appsecret, paper_trading, context, node_id,
-                product=product,
-                caller_name=f"{node_type}"
-            )
-            if not success:
+            ls, error = _order_node_login(node_type, paper_trading, product, context, node_id)
+            if error is not None:
                 return self._error_result(error)
 
             # === 5. 상품별 주문 실행 ===
-            if product == "overseas_stock":
-                order_result = await self._execute_overseas_stock(
-                    ls, normalized_order, side, order_type, config, context, node_id
-                )
-            elif product in ("overseas_futures", "overseas_futureoption"):
-                order_result = await self._execute_overseas_futures(
-                    ls, normalized_order, side, order_type, config, context, node_id
-                )
-            elif product == "korea_stock":
-                order_result = await self._execute_korea_stock(
+
+            # 직전 AccountNode 가 캐시해 둔 주문가능금액이 0 이하면 브로커 거부가 확실하므로
+            # 매수 주문을 보내지 않는다 (캐시가 없으면 판단을 보류하고 그대로 진행).
+            if side == "buy":
+                orderable = self._cached_orderable_amount(ls, product)
+                if orderable is not None and orderable <= 0:
+                    symbol = normalized_order["symbol"]
+                    context.log(
+                        "warning",
+                        f"{node_type}: 주문가능금액 {orderable} — {symbol} 매수 주문을 보내지 않습니다",
+                        node_id,
+                    )
+                    reject = OrderRejectInfo(
+                        rsp_cd="",
+                        cause="Orderable amount is zero; the buy order was not sent to the broker.",
+                        tip="Deposit funds or reduce open orders, then re-run the workflow.",
+                        raw_msg=f"orderable_amount={orderable}",
+                        known=True,
+                    )
+                    await self._notify_order_reject(context, node_id, symbol, reject, node_type)
+                    return self._order_result(
+                        False, symbol, normalized_order["exchange"], side,
+                        normalized_order["quantity"], normalized_order["price"],
+                        "Insufficient orderable amount", reject_info=reject,
+                    )
+
+            try:
+                order_result = await getattr(self, handler_name)(
                     ls, normalized_order, side, order_type, config, context, node_id
                 )
-            else:
-                context.log("error", f"{node_type}: Unsupported product: {product}", node_id)
-                return self._error_result(f"Unsupported product: {product}")
+            finally:
+                # 주문이 나갔으면(성공/실패 무관) 직전 예수금 캐시는 더 이상 믿을 수 없다
+                AccountNodeExecutor.invalidate_deposit_cache(ls)
 
             # === 5.4. DEF-27: 접수(order number) ≠ 체결. 주문 TR 응답은 주문번호만
             # 돌려주므로, 방금 접수된 주문의 체결 여부를 best-effort 로 재조회해
@@ -13642,6 +14272,31 @@ class NewOrderNodeExecutor(NodeExecutorBase):
             context.log("error", f"{node_type}: Unexpected error: {e}", node_id)
             return self._error_result(str(e))
 
+    def _cached_orderable_amount(self, ls: Any, product: str) -> Optional[float]:
+        """예수금 캐시에 남아 있는 해외주식 USD 주문가능금액 (COSOQ02701). 모르면 None.
+
+        조회는 하지 않는다 — 캐시가 비었거나 값이 비어 있으면 None 으로 판단을 보류한다.
+        """
+        if product != "overseas_stock":
+            return None
+        response = AccountNodeExecutor.peek_deposit(ls, "COSOQ02701:USD")
+        if response is None:
+            return None
+        item = next(
+            (
+                row for row in getattr(response, "block3", None) or []
+                if _ls_str(row, "CrcyCode") == "USD"
+            ),
+            None,
+        )
+        value = getattr(item, "FcurrOrdAbleAmt", None)
+        if isinstance(value, (int, float, str)) and value != "":
+            try:
+                return float(value)
+            except ValueError:
+                return None
+        return None
+
     def _normalize_order(
         self,
         order_raw: Any,
@@ -13869,7 +14524,7 @@ class NewOrderNodeExecutor(NodeExecutorBase):
         price = order["price"]
 
         # 주문유형코드: 01=매도, 02=매수
-        ord_ptn_code = "01" if side == "sell" else "02"
+        ord_ptn_code = self.STOCK_SIDE_CODES.get(side, "02")
 
         # 호가유형코드
         price_type = config.get("price_type", order_type)
@@ -13934,9 +14589,7 @@ class NewOrderNodeExecutor(NodeExecutorBase):
                     response.error_msg, reject_info=reject,
                 )
 
-            order_no = ""
-            if response.block2:
-                order_no = str(response.block2.OrdNo) if response.block2.OrdNo else ""
+            order_no = _ls_str(response.block2, "OrdNo")
 
             # 주문번호가 없으면 경고 (장 마감, 서버 오류 등)
             if not order_no:
@@ -13957,7 +14610,12 @@ class NewOrderNodeExecutor(NodeExecutorBase):
                     f"Empty OrderNo: {msg}", reject_info=reject,
                 )
 
-            context.log("info", f"Order submitted: {symbol} {side} {qty}@{price} → order_id={order_no}", node_id)
+            context.log(
+                "info",
+                f"Order submitted: {symbol} {side} {qty}@{price} → order_id={order_no}",
+                node_id,
+                data=self._order_log_data("overseas_stock", symbol, side, qty, price, order_no),
+            )
 
             # Record workflow order for FIFO tracking (OrderNo가 있는 경우만)
             context.record_workflow_order(
@@ -14041,8 +14699,9 @@ class NewOrderNodeExecutor(NodeExecutorBase):
                 context.log("debug", f"현재가 조회 실패: {symbol} - {response.error_msg}", node_id)
                 return None
             
-            if response.block and response.block.price:
-                return float(response.block.price)
+            price = getattr(response.block, "price", None)
+            if price:
+                return float(price)
             
             return None
             
@@ -14078,18 +14737,9 @@ class NewOrderNodeExecutor(NodeExecutorBase):
             # 참고: run_cosaq00102.py example
             response = ls.overseas_stock().accno().cosaq00102(
                 body=COSAQ00102.COSAQ00102InBlock1(
-                    RecCnt=1,
-                    QryTpCode="1",  # 계좌별
-                    BkseqTpCode="1",  # 역순
-                    OrdMktCode="00",  # 전체 시장
-                    BnsTpCode="0",  # 전체 (매수/매도)
-                    IsuNo="",  # 전체 종목
-                    SrtOrdNo=999999999,  # 역순 시작
-                    OrdDt=today,  # 오늘 날짜
+                    **_COSAQ00102_ALL_ORDERS_QUERY,
+                    OrdDt=today,
                     ExecYn="1",  # 체결만 조회
-                    CrcyCode="000",  # 전체 통화
-                    ThdayBnsAppYn="0",
-                    LoanBalHldYn="0",
                 ),
             )
             result = await response.req_async()
@@ -14107,9 +14757,6 @@ class NewOrderNodeExecutor(NodeExecutorBase):
                 if order.get("status") == "submitted" and order.get("order_id")
             }
             
-            # 시장코드 → 거래소 매핑
-            market_to_exchange = {'81': 'NYSE', '82': 'NASDAQ', '83': 'AMEX'}
-            
             fill_history = []
             for item in result.block3:
                 # COSAQ00102OutBlock3 필드명 사용
@@ -14204,7 +14851,8 @@ class NewOrderNodeExecutor(NodeExecutorBase):
             # short bounded window for every order type, breaking as soon as the
             # fill lands. A genuinely resting limit order simply exhausts the window
             # and is reported "open" (honest). Both knobs are configurable; set
-            # fill_confirm_attempts=1 to disable polling for latency-sensitive flows.
+            # fill_confirm_attempts=1 to disable polling for latency-sensitive flows,
+            # or 0 to skip the re-query entirely (no extra TR; status stays "submitted").
             try:
                 attempts = int(config.get("fill_confirm_attempts", 4))
             except (TypeError, ValueError):
@@ -14213,27 +14861,28 @@ class NewOrderNodeExecutor(NodeExecutorBase):
                 delay = float(config.get("fill_confirm_delay_seconds", 2.0))
             except (TypeError, ValueError):
                 delay = 2.0
-            attempts = max(1, attempts)
+            if attempts <= 0:
+                context.log("debug", f"Fill confirm disabled: order {order_id} left as submitted", node_id)
+                return
+
+            # The product never changes across retries, so pick the query once
+            # instead of re-dispatching on every poll.
+            if product == "korea_stock":
+                query_fill = functools.partial(
+                    self._query_korea_fill, ls, order_id, inner.get("symbol", "")
+                )
+            elif product == "overseas_stock":
+                query_fill = functools.partial(self._query_overseas_stock_fill, ls, order_id)
+            else:  # overseas_futures / overseas_futureoption
+                query_fill = functools.partial(self._query_overseas_futures_fill, ls, order_id)
 
-            symbol = inner.get("symbol", "")
             filled_qty, fill_price = 0, 0.0
             for i in range(attempts):
                 # Query immediately first (catches an already-recorded fill at no
                 # cost), then wait between retries for the lagged fill to land.
                 if i > 0:
                     await asyncio.sleep(delay)
-                if product == "korea_stock":
-                    filled_qty, fill_price = await self._query_korea_fill(
-                        ls, order_id, symbol, context, node_id
-                    )
-                elif product == "overseas_stock":
-                    filled_qty, fill_price = await self._query_overseas_stock_fill(
-                        ls, order_id, context, node_id
-                    )
-                else:  # overseas_futures / overseas_futureoption
-                    filled_qty, fill_price = await self._query_overseas_futures_fill(
-                        ls, order_id, context, node_id
-                    )
+                filled_qty, fill_price = await query_fill(context, node_id)
                 if ordered_qty > 0 and filled_qty >= ordered_qty:
                     break
 
@@ -14320,18 +14969,9 @@ class NewOrderNodeExecutor(NodeExecutorBase):
             today = _dt.now().strftime("%Y%m%d")
             response = ls.overseas_stock().accno().cosaq00102(
                 body=COSAQ00102.COSAQ00102InBlock1(
-                    RecCnt=1,
-                    QryTpCode="1",       # 계좌별
-                    BkseqTpCode="1",     # 역순
-                    OrdMktCode="00",     # 전체 시장
-                    BnsTpCode="0",       # 전체(매수/매도)
-                    IsuNo="",            # 전체 종목
-                    SrtOrdNo=999999999,  # 역순 시작
+                    **_COSAQ00102_ALL_ORDERS_QUERY,
                     OrdDt=today,
-                    ExecYn="1",          # 1: 체결만
-                    CrcyCode="000",      # 전체 통화
-                    ThdayBnsAppYn="0",
-                    LoanBalHldYn="0",
+                    ExecYn="1",  # 1: 체결만
                 ),
             )
             result = await response.req_async()
@@ -14427,7 +15067,7 @@ class NewOrderNodeExecutor(NodeExecutorBase):
         price = order["price"]
 
         # 매매구분코드: 1=매도, 2=매수
-        bns_tp_code = "1" if side == "sell" else "2"
+        bns_tp_code = self.BNS_TP_CODES.get(side, "2")
 
         # 주문유형코드: 1=시장가, 2=지정가
         abrd_futs_ord_ptn_code = self.FUTURES_ORDER_TYPE_CODES.get(order_type, "2")
@@ -14482,10 +15122,8 @@ class NewOrderNodeExecutor(NodeExecutorBase):
                     response.error_msg, reject_info=reject,
                 )
 
-            order_no = ""
-            if response.block2:
-                # 해외선물 주문번호 필드: OvrsFutsOrdNo (str, default "")
-                order_no = str(response.block2.OvrsFutsOrdNo) if hasattr(response.block2, "OvrsFutsOrdNo") and response.block2.OvrsFutsOrdNo else ""
+            # 해외선물 주문번호 필드: OvrsFutsOrdNo (str, default "")
+            order_no = _ls_str(response.block2, "OvrsFutsOrdNo")
 
             # 주문번호가 없으면 경고 + 기록 거부
             if not order_no:
@@ -14509,12 +15147,18 @@ class NewOrderNodeExecutor(NodeExecutorBase):
                     f"Empty OrderNo: {msg}", reject_info=reject,
                 )
 
-            context.log("info", f"Futures order submitted: {symbol} {side} {qty}@{price} → order_id={order_no}", node_id)
+            context.log(
+                "info",
+                f"Futures order submitted: {symbol} {side} {qty}@{price} → order_id={order_no}",
+                node_id,
+                data=self._order_log_data("overseas_futures", symbol, side, qty, price, order_no),
+            )
 
-            # Record workflow order for FIFO tracking (OrderNo가 있는 경우만)
+            # Record workflow order for FIFO tracking (OrderNo가 있는 경우만).
+            # order_date 는 CIDBT00100 에 보낸 OrdDt 와 같은 값을 재사용한다.
             context.record_workflow_order(
                 order_no=order_no,
-                order_date=dt.now().strftime("%Y%m%d"),
+                order_date=today,
                 symbol=symbol,
                 exchange=exchange,
                 side=side,
@@ -14544,15 +15188,17 @@ class NewOrderNodeExecutor(NodeExecutorBase):
             (is_excluded: bool, reason: str)
         """
         for nid, ntype in context._node_types.items():
-            if ntype == "ExclusionListNode":
-                outputs = context.get_all_outputs(nid)
-                if not outputs:
-                    continue
-                excluded = outputs.get("excluded", [])
-                excluded_symbols = {s["symbol"] for s in excluded if isinstance(s, dict) and s.get("symbol")}
-                if symbol in excluded_symbols:
-                    reason = outputs.get("reasons", {}).get(symbol, "")
-                    return True, reason
+            if ntype != "ExclusionListNode":
+                continue
+            outputs = context.get_all_outputs(nid)
+            if not outputs:
+                continue
+            # 종목 1개 판정 — 제외 목록 전체를 set 으로 쌓지 않고 첫 일치에서 멈춘다
+            if any(
+                isinstance(s, dict) and s.get("symbol") == symbol
+                for s in outputs.get("excluded", [])
+            ):
+                return True, outputs.get("reasons", {}).get(symbol, "")
         return False, ""
 
     async def _execute_korea_stock(
@@ -14579,14 +15225,10 @@ class NewOrderNodeExecutor(NodeExecutorBase):
         price = order["price"]
 
         # 매매구분: 1=매도, 2=매수
-        bns_tp_code = "1" if side == "sell" else "2"
+        bns_tp_code = self.BNS_TP_CODES.get(side, "2")
 
         # 호가유형코드
-        korea_price_type_map = {
-            "limit": "00",
-            "market": "03",
-        }
-        ordprc_ptn_code = korea_price_type_map.get(order_type, "00")
+        ordprc_ptn_code = self.KOREA_PRICE_TYPE_CODES.get(order_type, "00")
 
         # 시장가 주문 시 가격 0
         ord_prc = 0.0 if ordprc_ptn_code == "03" else float(price)
@@ -14624,8 +15266,7 @@ class NewOrderNodeExecutor(NodeExecutorBase):
             # CSPAT00601 OrdNo 는 int(default 0). str(0)=='0' 은 truthy 라서
             # OrdNo 가 0/garbage 면 성공으로 silently 기록되는 위험이 있다.
             # stock 경로와 동일하게 빈/0 OrderNo 를 명시 거부로 본다.
-            ord_no_raw = response.block2.OrdNo if response.block2 else None
-            order_no = str(ord_no_raw) if ord_no_raw else ""
+            order_no = _ls_str(response.block2, "OrdNo")
 
             if not order_no:
                 msg = response.rsp_msg or "주문번호 없음"
@@ -14649,7 +15290,8 @@ class NewOrderNodeExecutor(NodeExecutorBase):
             context.log(
                 "info",
                 f"Korea stock order: {side} {symbol} qty={qty} price={ord_prc} → OrdNo={order_no}",
-                node_id
+                node_id,
+                data=self._order_log_data("korea_stock", symbol, side, qty, ord_prc, order_no),
             )
 
             result = self._order_result(
@@ -14679,9 +15321,10 @@ class NewOrderNodeExecutor(NodeExecutorBase):
         on_log warning 과 별개로, AI/UI/텔레그램 소비자가 거부 사유(cause)와 대응
         팁(tip)을 구조화 payload 로 받도록 한다. ``node_type`` 은 시장별 주문 노드
         이름(해외주식/해외선물/국내주식)을 정확히 라벨링하기 위해 호출자가 전달한다.
+        리스너 I/O 는 백그라운드에서 돌고 주문 결과 반환은 기다리지 않는다.
         """
         try:
-            await context.send_notification(
+            context.notify_in_background(context.send_notification(
                 # ORDER_REJECTED is the semantically correct category for a
                 # broker reject (RISK_ALERT means drawdown/risk-halt).
                 category=NotificationCategory.ORDER_REJECTED,
@@ -14698,11 +15341,25 @@ class NewOrderNodeExecutor(NodeExecutorBase):
                     "raw_msg": reject.raw_msg,
                     "known": reject.known,
                 },
-            )
+            ))
         except Exception:
             # 알림 전파 실패가 주문 결과 반환을 막아서는 안 된다.
             pass
 
+    @staticmethod
+    def _order_log_data(
+        product: str, symbol: str, side: str, quantity: int, price: float, order_id: str,
+    ) -> Dict[str, Any]:
+        """주문 접수 로그의 구조화 필드 (LogEvent.data) — 소비자가 메시지 문자열을 파싱하지 않게 한다."""
+        return {
+            "product": product,
+            "symbol": symbol,
+            "side": side,
+            "quantity": quantity,
+            "price": price,
+            "order_id": order_id,
+        }
+
     def _order_result(
         self,
         success: bool,
@@ -14810,6 +15467,14 @@ class ModifyOrderNodeExecutor(NodeExecutorBase):
         "AMEX": "83",
     }
 
+    # 상품 → 정정 실행 메서드 이름 (NewOrderNodeExecutor.PRODUCT_ORDER_HANDLERS 와 같은 방식)
+    PRODUCT_MODIFY_HANDLERS = {
+        "overseas_stock": "_modify_overseas_stock",
+        "overseas_futures": "_modify_overseas_futures",
+        "overseas_futureoption": "_modify_overseas_futures",
+        "korea_stock": "_modify_korea_stock",
+    }
+
     async def execute(
         self,
         node_id: str,
@@ -14853,15 +15518,7 @@ class ModifyOrderNodeExecutor(NodeExecutorBase):
             return self._error_result("Invalid connection type")
 
         # 노드 타입에서 상품 결정
-        if "KoreaStock" in node_type:
-            product = "korea_stock"
-        elif node_type.startswith("Stock"):
-            product = "overseas_stock"
-        elif node_type.startswith("Futures"):
-            product = "overseas_futures"
-        else:
-            product = broker_connection.get("product", "overseas_stock")
-        paper_trading = broker_connection.get("paper_trading", False) if product != "korea_stock" else False
+        product, paper_trading = _order_node_product(node_type, broker_connection)
 
         # === 2. 바인딩 표현식 평가 ===
         config = evaluate_all_bindings(config, context, node_id)
@@ -14888,45 +15545,32 @@ class ModifyOrderNodeExecutor(NodeExecutorBase):
             node_id
         )
         
+        # 지원하지 않는 상품은 로그인(토큰 발급) 전에 돌려보낸다
+        handler_name = self.PRODUCT_MODIFY_HANDLERS.get(product)
+        if handler_name is None:
+            context.log("error", f"{node_type}: Unsupported product: {product}", node_id)
+            return self._error_result(f"Unsupported product: {product}")
+
         # === 4. LS 로그인 ===
-        credential = context.get_credential()
-        if not credential:
-            context.log("error", f"{node_type}: Credential not found", node_id)
-            return self._error_result("Missing credentials")
-        
-        appkey = credential.get("appkey")
-        appsecret = credential.get("appsecret")
-        
-        if not appkey or not appsecret:
-            context.log("error", f"{node_type}: appkey/appsecret not found", node_id)
-            return self._error_result("Missing appkey/appsecret")
-        
         try:
-            ls, success, error = ensure_ls_login(
-                appkey, appsecret, paper_trading, context, node_id,
-                product=product,
-                caller_name=node_type
-            )
-            if not success:
+            ls, error = _order_node_login(node_type, paper_trading, product, context, node_id)
+            if error is not None:
                 return self._error_result(error)
-            
+
             # === 5. 상품별 정정 실행 ===
-            if product == "overseas_stock":
-                return await self._modify_overseas_stock(
-                    ls, original_order_id, symbol, exchange, new_quantity, new_price, side, config, context, node_id
-                )
-            elif product in ("overseas_futures", "overseas_futureoption"):
-                return await self._modify_overseas_futures(
+            handler = getattr(self, handler_name)
+            try:
+                if product == "korea_stock":  # KRX 단일 시장 — exchange/side 인자 없음
+                    return await handler(
+                        ls, original_order_id, symbol, new_quantity, new_price, config, context, node_id
+                    )
+                return await handler(
                     ls, original_order_id, symbol, exchange, new_quantity, new_price, side, config, context, node_id
                 )
-            elif product == "korea_stock":
-                return await self._modify_korea_stock(
-                    ls, original_order_id, symbol, new_quantity, new_price, config, context, node_id
-                )
-            else:
-                context.log("error", f"{node_type}: Unsupported product: {product}", node_id)
-                return self._error_result(f"Unsupported product: {product}")
-                
+            finally:
+                # 주문이 바뀌었으면 직전 예수금 캐시는 더 이상 믿을 수 없다
+                AccountNodeExecutor.invalidate_deposit_cache(ls)
+
         except Exception as e:
             context.log("error", f"{node_type}: Unexpected error: {e}", node_id)
             return self._error_result(str(e))
@@ -14983,9 +15627,7 @@ class ModifyOrderNodeExecutor(NodeExecutorBase):
                     "modified_order": None,
                 }
             
-            new_order_no = ""
-            if response.block2:
-                new_order_no = str(response.block2.OrdNo) if response.block2.OrdNo else ""
+            new_order_no = _ls_str(response.block2, "OrdNo")
 
             # 정정 빈-주문번호 가드 (거래시간 외/정정 불가 상태 silent no-op 차단)
             if not new_order_no:
@@ -15060,7 +15702,7 @@ class ModifyOrderNodeExecutor(NodeExecutorBase):
         from datetime import datetime
         
         # 매매구분코드: 1=매도, 2=매수
-        bns_tp_code = "1" if side == "sell" else "2"
+        bns_tp_code = NewOrderNodeExecutor.BNS_TP_CODES.get(side, "2")
         
         today = datetime.now().strftime("%Y%m%d")
         expiry_month = config.get("expiry_month", "")
@@ -15101,10 +15743,8 @@ class ModifyOrderNodeExecutor(NodeExecutorBase):
                     "modified_order": None,
                 }
 
-            new_order_no = ""
-            if response.block2:
-                # 해외선물 정정 주문번호 필드: OvrsFutsOrdNo
-                new_order_no = str(response.block2.OvrsFutsOrdNo) if hasattr(response.block2, "OvrsFutsOrdNo") and response.block2.OvrsFutsOrdNo else ""
+            # 해외선물 정정 주문번호 필드: OvrsFutsOrdNo
+            new_order_no = _ls_str(response.block2, "OvrsFutsOrdNo")
 
             # 정정 빈-주문번호 가드 (거래시간 외/정정 불가 상태 silent no-op 차단)
             if not new_order_no:
@@ -15202,9 +15842,7 @@ class ModifyOrderNodeExecutor(NodeExecutorBase):
                     "modified_order": None,
                 }
 
-            new_order_no = ""
-            if response.block2:
-                new_order_no = str(response.block2.OrdNo) if response.block2.OrdNo else ""
+            new_order_no = _ls_str(response.block2, "OrdNo")
 
             # 정정 빈-주문번호 가드 (거래시간 외/정정 불가 상태 silent no-op 차단)
             if not new_order_no:
@@ -15294,6 +15932,14 @@ class CancelOrderNodeExecutor(NodeExecutorBase):
         "AMEX": "83",
     }
 
+    # 상품 → 취소 실행 메서드 이름 (NewOrderNodeExecutor.PRODUCT_ORDER_HANDLERS 와 같은 방식)
+    PRODUCT_CANCEL_HANDLERS = {
+        "overseas_stock": "_cancel_overseas_stock",
+        "overseas_futures": "_cancel_overseas_futures",
+        "overseas_futureoption": "_cancel_overseas_futures",
+        "korea_stock": "_cancel_korea_stock",
+    }
+
     async def execute(
         self,
         node_id: str,
@@ -15334,15 +15980,7 @@ class CancelOrderNodeExecutor(NodeExecutorBase):
             return self._error_result("Invalid connection type")
 
         # 노드 타입에서 상품 결정
-        if "KoreaStock" in node_type:
-            product = "korea_stock"
-        elif node_type.startswith("Stock"):
-            product = "overseas_stock"
-        elif node_type.startswith("Futures"):
-            product = "overseas_futures"
-        else:
-            product = broker_connection.get("product", "overseas_stock")
-        paper_trading = broker_connection.get("paper_trading", False) if product != "korea_stock" else False
+        product, paper_trading = _order_node_product(node_type, broker_connection)
 
         # === 2. 바인딩 표현식 평가 ===
         config = evaluate_all_bindings(config, context, node_id)
@@ -15366,45 +16004,28 @@ class CancelOrderNodeExecutor(NodeExecutorBase):
             node_id
         )
         
+        # 지원하지 않는 상품은 로그인(토큰 발급) 전에 돌려보낸다
+        handler_name = self.PRODUCT_CANCEL_HANDLERS.get(product)
+        if handler_name is None:
+            context.log("error", f"{node_type}: Unsupported product: {product}", node_id)
+            return self._error_result(f"Unsupported product: {product}")
+
         # === 4. LS 로그인 ===
-        credential = context.get_credential()
-        if not credential:
-            context.log("error", f"{node_type}: Credential not found", node_id)
-            return self._error_result("Missing credentials")
-        
-        appkey = credential.get("appkey")
-        appsecret = credential.get("appsecret")
-        
-        if not appkey or not appsecret:
-            context.log("error", f"{node_type}: appkey/appsecret not found", node_id)
-            return self._error_result("Missing appkey/appsecret")
-        
         try:
-            ls, success, error = ensure_ls_login(
-                appkey, appsecret, paper_trading, context, node_id,
-                product=product,
-                caller_name=node_type
-            )
-            if not success:
+            ls, error = _order_node_login(node_type, paper_trading, product, context, node_id)
+            if error is not None:
                 return self._error_result(error)
-            
+
             # === 5. 상품별 취소 실행 ===
-            if product == "overseas_stock":
-                return await self._cancel_overseas_stock(
-                    ls, order_id, symbol, exchange, config, context, node_id
-                )
-            elif product in ("overseas_futures", "overseas_futureoption"):
-                return await self._cancel_overseas_futures(
-                    ls, order_id, symbol, exchange, config, context, node_id
-                )
-            elif product == "korea_stock":
-                return await self._cancel_korea_stock(
-                    ls, order_id, symbol, config, context, node_id
-                )
-            else:
-                context.log("error", f"{node_type}: Unsupported product: {product}", node_id)
-                return self._error_result(f"Unsupported product: {product}")
-                
+            handler = getattr(self, handler_name)
+            try:
+                if product == "korea_stock":  # KRX 단일 시장 — exchange 인자 없음
+                    return await handler(ls, order_id, symbol, config, context, node_id)
+                return await handler(ls, order_id, symbol, exchange, config, context, node_id)
+            finally:
+                # 주문이 바뀌었으면 직전 예수금 캐시는 더 이상 믿을 수 없다
+                AccountNodeExecutor.invalidate_deposit_cache(ls)
+
         except Exception as e:
             context.log("error", f"{node_type}: Unexpected error: {e}", node_id)
             return self._error_result(str(e))
@@ -15758,6 +16379,7 @@ class AIAgentToolExecutor:
             List of tool definitions in OpenAI function calling format:
             [{"type": "function", "function": {"name": ..., "description": ..., "parameters": ...}}]
         """
+        from programgarden_core.nodes.order import BaseModifyOrderNode, BaseOrderNode
         from programgarden_core.registry import NodeTypeRegistry
 
         registry = NodeTypeRegistry()
@@ -15786,10 +16408,12 @@ class AIAgentToolExecutor:
             tool_name = tool_schema["tool_name"]
 
             # 기본 config 캐시 (LLM args와 병합 시 사용)
+            # mutates: 주문 계열 노드 — 같은 응답의 다른 Tool 과 동시에 돌리지 않는다
             self._tool_configs[tool_name] = {
                 "node_id": tool_node_id,
                 "node_type": node.node_type,
                 "config": node.config.copy(),
+                "mutates": issubclass(node_class, (BaseOrderNode, BaseModifyOrderNode)),
             }
             self._tool_schemas[tool_name] = tool_schema
 
@@ -15983,6 +16607,12 @@ class AIAgentNodeExecutor(NodeExecutorBase):
     # 순위형(포지션/종목) 감지용 키 세트
     _RANKING_KEYS = {"symbol", "pnl", "pnl_rate", "quantity", "qty"}
 
+    # structured 출력 output_schema 타입명 → Python 타입
+    _SCHEMA_TYPE_MAP = {
+        "string": str, "number": float, "integer": int,
+        "boolean": bool, "array": list, "object": dict,
+    }
+
     @staticmethod
     def _detect_array_type(arr: list) -> str:
         """배열의 데이터 타입을 감지하여 최적 전략을 선택.
@@ -16347,21 +16977,41 @@ class AIAgentNodeExecutor(NodeExecutorBase):
 
         context.log("info", f"AIAgent starting (model={llm_connection.get('model')}, tools={len(selected_tools)})", node_id)
 
+        from programgarden_core.bases.listener import (
+            AIToolCallEvent,
+            LLMStreamEvent,
+            TokenUsageEvent,
+        )
+
+        # 스트리밍 토큰 콜백 — 루프 반복마다 새로 만들지 않고, 토큰마다 import 하지 않도록 한 번만 정의
+        async def on_token(token: str):
+            await context.notify_llm_stream(LLMStreamEvent(
+                job_id=context.job_id or "",
+                node_id=node_id,
+                token=token,
+                is_final=False,
+                timestamp=datetime.utcnow(),
+            ))
+
+        import time as _time
+
+        async def _invoke_tool(tool_name: str, tool_args: Dict[str, Any]):
+            """Tool 한 건 실행 → (결과, 예외, 소요 ms). 예외는 값으로 돌려준다."""
+            tool_start = _time.monotonic()
+            try:
+                tool_result = await tool_executor.call_tool(
+                    tool_name=tool_name,
+                    args=tool_args,
+                    agent_node_id=node_id,
+                )
+            except Exception as e:
+                return None, e, (_time.monotonic() - tool_start) * 1000
+            return tool_result, None, (_time.monotonic() - tool_start) * 1000
+
         while True:
             # LLM 호출
             try:
                 if streaming:
-                    async def on_token(token: str):
-                        from programgarden_core.bases.listener import LLMStreamEvent
-                        from datetime import datetime
-                        await context.notify_llm_stream(LLMStreamEvent(
-                            job_id=context.job_id or "",
-                            node_id=node_id,
-                            token=token,
-                            is_final=False,
-                            timestamp=datetime.utcnow(),
-                        ))
-
                     llm_response = await provider.chat_stream(
                         messages=messages,
                         on_token=on_token,
@@ -16369,8 +17019,6 @@ class AIAgentNodeExecutor(NodeExecutorBase):
                     )
 
                     # 스트리밍 완료 이벤트
-                    from programgarden_core.bases.listener import LLMStreamEvent
-                    from datetime import datetime
                     await context.notify_llm_stream(LLMStreamEvent(
                         job_id=context.job_id or "",
                         node_id=node_id,
@@ -16388,8 +17036,6 @@ class AIAgentNodeExecutor(NodeExecutorBase):
                 raise ExecutionError(f"AIAgentNode LLM call failed: {e}", node_id=node_id) from e
 
             # 토큰 사용량 이벤트
-            from programgarden_core.bases.listener import TokenUsageEvent
-            from datetime import datetime
             accumulated_tokens += llm_response.total_tokens
             await context.notify_token_usage(TokenUsageEvent(
                 job_id=context.job_id or "",
@@ -16424,7 +17070,51 @@ class AIAgentNodeExecutor(NodeExecutorBase):
             assistant_msg["tool_calls"] = llm_response.tool_calls
             messages.append(assistant_msg)
 
+            calls = []
             for tc in llm_response.tool_calls:
+                func = tc.get("function", {})
+                tool_name = func.get("name", "")
+                tool_args_str = func.get("arguments", "{}")
+
+                try:
+                    tool_args = json_module.loads(tool_args_str) if isinstance(tool_args_str, str) else tool_args_str
+                except json_module.JSONDecodeError:
+                    tool_args = {}
+
+                calls.append((tc, tool_name, tool_args))
+
+            # 한 응답에 담긴 Tool 호출들은 서로 독립인 조회라 동시에 실행한다 — 대기 시간이
+            # 호출 수의 합이 아니라 가장 느린 한 건이 된다. Tool 은 LS TR 조회 노드라 다른
+            # 종목 단위 조회와 같은 상한(_gather_bounded)을 따르고, 같은 Tool 노드(executor
+            # 인스턴스·node id 공유)에 대한 호출끼리는 하나씩 돈다. 결과는 아래에서 요청
+            # 순서대로 처리하므로 메시지·이벤트 순서는 같다. 주문 노드가 섞였거나 max_tool_calls
+            # 에 걸릴 수 있으면(성공 건만 세므로 몇 건이 돌지 미리 알 수 없다) 예전처럼 하나씩 돈다.
+            prefetched = None
+            if (
+                len(calls) > 1
+                and tool_call_count + len(calls) <= max_tool_calls
+                and not any(
+                    tool_executor._tool_configs.get(tool_name, {}).get("mutates")
+                    for _, tool_name, _ in calls
+                )
+            ):
+                for _, tool_name, tool_args in calls:
+                    context.log("info", f"Tool call: {tool_name}({tool_args})", node_id)
+                calls_by_tool_node: Dict[str, List[int]] = {}
+                for index, (_, tool_name, _) in enumerate(calls):
+                    tool_key = tool_executor._tool_configs.get(tool_name, {}).get("node_id") or tool_name
+                    calls_by_tool_node.setdefault(tool_key, []).append(index)
+
+                prefetched = [None] * len(calls)
+
+                async def _invoke_tool_node_calls(indices: List[int]) -> None:
+                    for index in indices:
+                        _, tool_name, tool_args = calls[index]
+                        prefetched[index] = await _invoke_tool(tool_name, tool_args)
+
+                await _gather_bounded(_invoke_tool_node_calls, list(calls_by_tool_node.values()))
+
+            for index, (tc, tool_name, tool_args) in enumerate(calls):
                 if tool_call_count >= max_tool_calls:
                     context.log(
                         "warning",
@@ -16439,36 +17129,23 @@ class AIAgentNodeExecutor(NodeExecutorBase):
                     })
                     continue
 
-                func = tc.get("function", {})
-                tool_name = func.get("name", "")
-                tool_args_str = func.get("arguments", "{}")
-
-                try:
-                    tool_args = json_module.loads(tool_args_str) if isinstance(tool_args_str, str) else tool_args_str
-                except json_module.JSONDecodeError:
-                    tool_args = {}
-
-                context.log("info", f"Tool call: {tool_name}({tool_args})", node_id)
+                if prefetched is None:
+                    context.log("info", f"Tool call: {tool_name}({tool_args})", node_id)
 
                 # Tool 노드 ID 조회
                 tool_info = tool_executor._tool_configs.get(tool_name, {})
                 tool_node_id = tool_info.get("node_id", "")
 
-                # Tool 실행
-                import time as _time
-                tool_start = _time.monotonic()
-
                 try:
-                    tool_result = await tool_executor.call_tool(
-                        tool_name=tool_name,
-                        args=tool_args,
-                        agent_node_id=node_id,
-                    )
+                    if prefetched is not None:
+                        tool_result, tool_error, tool_duration = prefetched[index]
+                    else:
+                        tool_result, tool_error, tool_duration = await _invoke_tool(tool_name, tool_args)
+                    if tool_error is not None:
+                        raise tool_error
                     tool_call_count += 1
-                    tool_duration = (_time.monotonic() - tool_start) * 1000
 
                     # AIToolCallEvent 발행 (완료)
-                    from programgarden_core.bases.listener import AIToolCallEvent
                     await context.notify_ai_tool_call(AIToolCallEvent(
                         job_id=context.job_id or "",
                         node_id=node_id,
@@ -16490,10 +17167,8 @@ class AIAgentNodeExecutor(NodeExecutorBase):
 
                 except Exception as e:
                     context.log("warning", f"Tool '{tool_name}' failed: {e}", node_id)
-                    tool_duration = (_time.monotonic() - tool_start) * 1000
 
                     # AIToolCallEvent 발행 (실패)
-                    from programgarden_core.bases.listener import AIToolCallEvent
                     await context.notify_ai_tool_call(AIToolCallEvent(
                         job_id=context.job_id or "",
                         node_id=node_id,
@@ -16646,22 +17321,14 @@ class AIAgentNodeExecutor(NodeExecutorBase):
             fields = {}
             for key, schema in output_schema.items():
                 if isinstance(schema, str):
-                    type_map = {
-                        "string": str, "number": float, "integer": int,
-                        "boolean": bool, "array": list, "object": dict,
-                    }
-                    fields[key] = (type_map.get(schema, str), ...)
+                    fields[key] = (self._SCHEMA_TYPE_MAP.get(schema, str), ...)
                 elif isinstance(schema, dict):
                     base_type = schema.get("type", "string")
                     if "enum" in schema:
                         from typing import Literal as PyLiteral
                         fields[key] = (PyLiteral[tuple(schema["enum"])], ...)
                     else:
-                        type_map = {
-                            "string": str, "number": float, "integer": int,
-                            "boolean": bool, "array": list, "object": dict,
-                        }
-                        fields[key] = (type_map.get(base_type, str), ...)
+                        fields[key] = (self._SCHEMA_TYPE_MAP.get(base_type, str), ...)
 
             DynamicModel = create_model("AIAgentOutput", **fields)
             validated = DynamicModel(**parsed)
@@ -17944,6 +18611,12 @@ class WorkflowJob:
         self._has_schedule_node = self._check_has_schedule_node()
         self._stay_connected_nodes = self._find_stay_connected_nodes()
 
+        # Split→Aggregate 분기 구조 캐시 — 워크플로우 그래프는 job 수명 동안 바뀌지 않는데
+        # main flow 마다, 실시간 틱마다 엣지 전체를 다시 훑던 것을 처음 한 번만 계산한다.
+        self._successors: Optional[Dict[str, List[str]]] = None
+        self._split_aggregate_pairs: Optional[Dict[str, str]] = None
+        self._branch_nodes_cache: Dict[Tuple[str, str], Set[str]] = {}
+
         # Per-node state cache listener — mirrors every NodeStateEvent into
         # _node_states/_node_errors/_node_durations so get_state() surfaces
         # accurate per-node diagnostics without scraping logs.
@@ -18986,12 +19659,24 @@ class WorkflowJob:
 
         return skip_nodes
 
+    def _node_successors(self) -> Dict[str, List[str]]:
+        """from_node_id → [to_node_id, ...] 인접 목록 (처음 호출 시 한 번 만든다)"""
+        if self._successors is None:
+            successors: Dict[str, List[str]] = {}
+            for edge in self.workflow.edges:
+                successors.setdefault(edge.from_node_id, []).append(edge.to_node_id)
+            self._successors = successors
+        return self._successors
+
     def _find_split_aggregate_pairs(self) -> Dict[str, str]:
         """Find pairs of SplitNode → AggregateNode in the workflow
 
         Returns:
             Dict mapping SplitNode ID to its paired AggregateNode ID
         """
+        if self._split_aggregate_pairs is not None:
+            return self._split_aggregate_pairs
+
         pairs: Dict[str, str] = {}
         split_nodes = []
         aggregate_nodes = []
@@ -19011,24 +19696,23 @@ class WorkflowJob:
                     pairs[split_id] = agg_id
                     break
 
+        self._split_aggregate_pairs = pairs
         return pairs
 
     def _is_reachable(self, from_id: str, to_id: str) -> bool:
         """Check if to_id is reachable from from_id via edges"""
+        successors = self._node_successors()
         visited = set()
-        queue = [from_id]
+        queue = deque([from_id])
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             if current == to_id:
                 return True
             if current in visited:
                 continue
             visited.add(current)
-
-            for edge in self.workflow.edges:
-                if edge.from_node_id == current:
-                    queue.append(edge.to_node_id)
+            queue.extend(successors.get(current, ()))
 
         return False
 
@@ -19042,26 +19726,26 @@ class WorkflowJob:
         Returns:
             Set of node IDs in the branch (excluding Split and Aggregate themselves)
         """
+        cached = self._branch_nodes_cache.get((split_id, aggregate_id))
+        if cached is not None:
+            return cached
+
+        successors = self._node_successors()
         branch = set()
         visited = set()
-        queue = []
 
         # Start from nodes directly connected to SplitNode
-        for edge in self.workflow.edges:
-            if edge.from_node_id == split_id:
-                queue.append(edge.to_node_id)
+        queue = deque(successors.get(split_id, ()))
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             if current == aggregate_id or current in visited:
                 continue
             visited.add(current)
             branch.add(current)
+            queue.extend(successors.get(current, ()))
 
-            for edge in self.workflow.edges:
-                if edge.from_node_id == current:
-                    queue.append(edge.to_node_id)
-
+        self._branch_nodes_cache[(split_id, aggregate_id)] = branch
         return branch
 
     async def _execute_split_branch(
@@ -19172,28 +19856,35 @@ class WorkflowJob:
 
         print(f"    📦 SplitNode: {total} items, parallel={parallel}, delay_ms={delay_ms}")
 
+        self.context.set_node_state(
+            split_id, _REALTIME_BRANCH_KEY, _branch_has_realtime(self.workflow, branch_order)
+        )
+
         # === Execute branch for each item ===
         if parallel:
-            # Parallel execution
-            async def execute_item(idx: int, item: Any) -> Any:
-                return idx, await self._execute_branch_for_item(
-                    split_id=split_id,
-                    branch_order=branch_order,
-                    item=item,
-                    index=idx,
-                    total=total,
-                )
-
-            tasks = [execute_item(i, item) for i, item in enumerate(input_array)]
-            for coro in asyncio.as_completed(tasks):
-                try:
-                    idx, result = await coro
-                    results_by_index[idx] = result
-                except Exception as e:
-                    if continue_on_error:
-                        errors.append(str(e))
-                    else:
-                        raise
+            # Parallel execution — gather 는 입력 순서를 보존하므로 as_completed 큐나
+            # (idx, result) 태그 없이 위치로 받는다. continue_on_error=False 면 첫 예외가
+            # 그대로 전파된다.
+            outcomes = await asyncio.gather(
+                *(
+                    self._execute_branch_for_item(
+                        split_id=split_id,
+                        branch_order=branch_order,
+                        item=item,
+                        index=idx,
+                        total=total,
+                    )
+                    for idx, item in enumerate(input_array)
+                ),
+                return_exceptions=continue_on_error,
+            )
+            for idx, outcome in enumerate(outcomes):
+                if isinstance(outcome, BaseException):
+                    if not isinstance(outcome, Exception):
+                        raise outcome
+                    errors.append(str(outcome))
+                    continue
+                results_by_index[idx] = outcome
         else:
             # Sequential execution
             for idx, item in enumerate(input_array):
@@ -19222,11 +19913,7 @@ class WorkflowJob:
         # 통째로 비어 **표가 깜빡인다**(찼다 → 빈 표 → 찼다). 이번 사이클에 새 값이 없으면
         # 그 종목의 **직전 행을 유지**한다. 실시간이 아닌 분기는 기존대로 버린다
         # (아직 실데이터가 없는 아이템을 표에 끼우지 않기 위함 — 2026-07-14 결함2).
-        realtime_branch = any(
-            (self.workflow.nodes.get(n).node_type in REALTIME_NODE_TYPES)
-            for n in branch_order
-            if self.workflow.nodes.get(n)
-        )
+        realtime_branch = self.context.get_node_state(split_id, _REALTIME_BRANCH_KEY)
         held_key = "_last_branch_rows"
         held: Dict[str, Any] = dict(self.context.get_node_state(aggregate_id, held_key) or {})
 
@@ -19301,11 +19988,9 @@ class WorkflowJob:
         # 이 분기가 실시간 시세를 다루는가 + 이 아이템의 종목은 무엇인가.
         # (실시간 분기에서만 종목별 슬라이싱/행 생성을 적용해 파장을 그 경우로 가둔다.)
         symbol = _item_symbol(item)
-        realtime_branch = any(
-            (self.workflow.nodes.get(n).node_type in REALTIME_NODE_TYPES)
-            for n in branch_order
-            if self.workflow.nodes.get(n)
-        )
+        realtime_branch = self.context.get_node_state(split_id, _REALTIME_BRANCH_KEY)
+        if realtime_branch is None:
+            realtime_branch = _branch_has_realtime(self.workflow, branch_order)
         # 분기 아이템마다 독립된 상태 스코프. ThrottleNode 의 쿨다운은 노드별 상태라
         # 종목들이 한 노드를 공유하면 대기시간까지 공유돼 한 번에 한 종목만 통과한다.
         branch_scope = f"{split_id}#{index}"
@@ -19650,8 +20335,8 @@ class WorkflowJob:
         logger.info("Starting event loop")
         
         while self.context.is_running and not self.context.is_failed:
-            # Wait for event with timeout (allows checking is_running periodically)
-            event = await self.context.wait_for_event(timeout=1.0)
+            # 다음 이벤트까지 대기 — stop()/fail() 이 오면 None 으로 바로 깨어난다
+            event = await self.context.wait_for_event()
             
             if event is None:
                 continue
@@ -19896,7 +20581,7 @@ class WorkflowJob:
             print(f"  ⚠️ 트리거할 노드 없음, 스킵")
             return
         
-        logger.debug(f"Realtime update from {event.source_node_id}, triggering: {trigger_nodes}")
+        logger.debug("Realtime update from %s, triggering: %s", event.source_node_id, trigger_nodes)
         print(f"  → {event.source_node_id}에서 트리거: {trigger_nodes}")
         
         # 🆕 트리거된 노드들 + 하위 노드들을 모두 찾아서 실행 순서대로 정렬
@@ -8,8 +8,9 @@ ProgramGarden - Plugin Sandbox
 """
 
 import asyncio
+import functools
 import logging
-from typing import Any, Callable, Optional, List, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, Optional, List, TYPE_CHECKING
 from datetime import datetime
 
 if TYPE_CHECKING:
@@ -68,6 +69,7 @@ class PluginSandbox:
         default_timeout: float = 30.0,
         default_batch_size: int = 100,
         track_memory: bool = False,
+        max_concurrent_batches: int = 4,
     ):
         """
         Args:
@@ -75,11 +77,13 @@ class PluginSandbox:
             default_timeout: 기본 타임아웃 (초)
             default_batch_size: 기본 배치 크기
             track_memory: 메모리 추적 여부 (개발 모드)
+            max_concurrent_batches: execute_batched 에서 동시에 돌릴 배치 수
         """
         self._resource_context = resource_context
         self._default_timeout = default_timeout
         self._default_batch_size = default_batch_size
         self._track_memory = track_memory
+        self._max_concurrent_batches = max(1, max_concurrent_batches)
         
         # 실행 통계
         self._stats = {
@@ -151,7 +155,7 @@ class PluginSandbox:
             elapsed = (datetime.now() - start_time).total_seconds()
             self._stats["total_time_sec"] += elapsed
             
-            logger.debug(f"Plugin '{plugin_id}' completed in {elapsed:.2f}s")
+            logger.debug("Plugin '%s' completed in %.2fs", plugin_id, elapsed)
             return result
             
         except asyncio.TimeoutError:
@@ -172,22 +176,24 @@ class PluginSandbox:
                     weight=weight,
                 )
     
-    async def _call_plugin(
+    def _call_plugin(
         self,
         plugin_callable: Callable,
         args: tuple,
         kwargs: dict,
-    ) -> Any:
-        """플러그인 호출 (async/sync 모두 지원)"""
+    ) -> Awaitable[Any]:
+        """플러그인 호출 awaitable (async/sync 모두 지원)
+
+        코루틴이나 executor future 를 그대로 돌려준다. 감싸는 코루틴이 없어
+        wait_for 가 동기 플러그인마다 Task 를 하나 더 만들지 않는다.
+        """
         if asyncio.iscoroutinefunction(plugin_callable):
-            return await plugin_callable(*args, **kwargs)
-        else:
-            # 동기 함수는 executor에서 실행
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(
-                None,
-                lambda: plugin_callable(*args, **kwargs),
-            )
+            return plugin_callable(*args, **kwargs)
+        # 동기 함수는 executor에서 실행 (루프 차단 없이 타임아웃 적용)
+        return asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(plugin_callable, *args, **kwargs),
+        )
     
     async def _execute_with_memory_tracking(
         self,
@@ -243,6 +249,11 @@ class PluginSandbox:
     ) -> dict:
         """
         대량 종목을 배치로 분할하여 실행
+
+        배치는 최대 ``max_concurrent_batches`` 개씩 동시에 돌고, 결과는 배치 순서대로
+        합친다. 메모리 추적 모드에서는 tracemalloc 이 프로세스 전역이라 하나씩 돈다.
+        타임아웃된 배치는 그 종목만 failed 로 남기고, 그 밖의 오류가 나면 아직 시작하지 않은
+        배치는 돌리지 않고 오류를 올린다.
         
         Args:
             plugin_id: 플러그인 ID
@@ -275,43 +286,64 @@ class PluginSandbox:
             )
         
         # 배치 분할 실행
+        batches = [symbols[i:i + batch_size] for i in range(0, len(symbols), batch_size)]
+        total_batches = len(batches)
+        semaphore = asyncio.Semaphore(1 if self._track_memory else self._max_concurrent_batches)
+        # 타임아웃이 아닌 오류가 나면 대기 중인 배치는 플러그인을 돌리지 않는다 (순차 실행 때처럼 fail-fast)
+        failed = False
+        skipped = object()
+
+        async def _run_batch(batch_num: int, batch: List[str]) -> Any:
+            nonlocal failed
+            async with semaphore:
+                if failed:
+                    return skipped
+                logger.debug(
+                    "Plugin '%s' batch %d/%d (%d symbols)",
+                    plugin_id, batch_num, total_batches, len(batch),
+                )
+                try:
+                    return await self.execute(
+                        plugin_id=f"{plugin_id}:batch{batch_num}",
+                        plugin_callable=plugin_callable,
+                        kwargs={"symbols": batch, **kwargs},
+                        timeout=timeout,
+                    )
+                except PluginTimeoutError as e:
+                    # 타임아웃은 그 배치만 failed 로 처리하고 나머지 배치는 계속 돈다
+                    return e
+                except Exception:
+                    failed = True
+                    raise
+
+        results = await asyncio.gather(
+            *(_run_batch(n, batch) for n, batch in enumerate(batches, 1)),
+            return_exceptions=True,
+        )
+
         all_passed = []
         all_failed = []
         all_symbol_results = {}
-        
-        for i in range(0, len(symbols), batch_size):
-            batch = symbols[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (len(symbols) + batch_size - 1) // batch_size
-            
-            logger.debug(
-                f"Plugin '{plugin_id}' batch {batch_num}/{total_batches} "
-                f"({len(batch)} symbols)"
-            )
-            
-            try:
-                result = await self.execute(
-                    plugin_id=f"{plugin_id}:batch{batch_num}",
-                    plugin_callable=plugin_callable,
-                    kwargs={"symbols": batch, **kwargs},
-                    timeout=timeout,
-                )
-                
-                all_passed.extend(result.get("passed_symbols", []))
-                all_failed.extend(result.get("failed_symbols", []))
-                all_symbol_results.update(result.get("symbol_results", {}))
-                
-            except PluginTimeoutError:
+
+        for batch_num, (batch, result) in enumerate(zip(batches, results), 1):
+            if isinstance(result, PluginTimeoutError):
                 # 타임아웃된 배치는 failed로 처리
                 all_failed.extend(batch)
                 logger.warning(
                     f"Plugin '{plugin_id}' batch {batch_num} timed out, "
                     f"{len(batch)} symbols marked as failed"
                 )
-            
-            # 배치 간 쿨다운 (시스템 안정성)
-            if i + batch_size < len(symbols):
-                await asyncio.sleep(0.01)
+                continue
+            if isinstance(result, BaseException):
+                # 그 밖의 오류는 순차 실행 때처럼 호출 측으로 올린다 (앞 배치 우선)
+                raise result
+            if result is skipped:
+                # 앞선 배치 오류로 건너뛴 배치 — 위에서 그 오류를 이미 올린다
+                continue
+
+            all_passed.extend(result.get("passed_symbols", []))
+            all_failed.extend(result.get("failed_symbols", []))
+            all_symbol_results.update(result.get("symbol_results", {}))
         
         return {
             "passed_symbols": all_passed,
@@ -319,7 +351,7 @@ class PluginSandbox:
             "symbol_results": all_symbol_results,
             "result": len(all_passed) > 0,
             "batched": True,
-            "batch_count": (len(symbols) + batch_size - 1) // batch_size,
+            "batch_count": total_batches,
         }
     
     def get_stats(self) -> dict:
@@ -153,6 +153,136 @@ async def test_stock_balance_cosoq02701_failure_graceful():
     ctx.log.assert_any_call("warning", "COSOQ02701 조회 실패: rate limit exceeded", "account1")
 
 
+def _make_cosoq02701_ls(error_msg=None):
+    """COSOQ02701 체인만 갖춘 LS mock 과 req_async mock 을 돌려준다."""
+    response = MagicMock()
+    response.error_msg = error_msg
+    req_async = AsyncMock(return_value=response)
+    ls = MagicMock()
+    ls.overseas_stock.return_value.accno.return_value.cosoq02701.return_value.req_async = req_async
+    return ls, req_async
+
+
+@pytest.mark.asyncio
+async def test_cosoq02701_cached_within_ttl_and_invalidated():
+    """같은 LS 세션의 예수금 조회는 TTL 안에서 재사용되고, 주문 후 무효화된다"""
+    from programgarden.executor import AccountNodeExecutor
+
+    executor = _make_executor()
+    ls, req_async = _make_cosoq02701_ls()
+
+    first = await executor._fetch_cosoq02701(ls, "USD")
+    second = await executor._fetch_cosoq02701(ls, "USD")
+    assert first is second
+    assert req_async.await_count == 1
+
+    AccountNodeExecutor.invalidate_deposit_cache(ls)
+    await executor._fetch_cosoq02701(ls, "USD")
+    assert req_async.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cosoq02701_concurrent_calls_share_one_request():
+    """동시에 들어온 조회는 진행 중인 한 요청을 함께 기다린다"""
+    import asyncio
+
+    executor = _make_executor()
+    ls, req_async = _make_cosoq02701_ls()
+
+    async def slow():
+        await asyncio.sleep(0.01)
+        return req_async.return_value
+
+    req_async.side_effect = slow
+    a, b = await asyncio.gather(
+        executor._fetch_cosoq02701(ls, "USD"),
+        executor._fetch_cosoq02701(ls, "USD"),
+    )
+    assert a is b
+    assert req_async.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_deposit_cache_cleared_by_fill_and_disabled_by_zero_ttl(monkeypatch):
+    """체결 통보(ls=None)는 모든 세션 캐시를 비우고, TTL 0 이면 캐시하지 않는다"""
+    from programgarden.executor import AccountNodeExecutor
+
+    executor = _make_executor()
+    ls, req_async = _make_cosoq02701_ls()
+
+    await executor._fetch_cosoq02701(ls, "USD")
+    AccountNodeExecutor.invalidate_deposit_cache()
+    await executor._fetch_cosoq02701(ls, "USD")
+    assert req_async.await_count == 2
+
+    monkeypatch.setattr(AccountNodeExecutor, "DEPOSIT_CACHE_TTL", 0)
+    await executor._fetch_cosoq02701(ls, "USD")
+    assert req_async.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_cosoq02701_in_block_reused_across_requests():
+    """캐시가 비워져 다시 조회해도 같은 통화의 InBlock 인스턴스를 재사용한다"""
+    from programgarden.executor import AccountNodeExecutor
+
+    executor = _make_executor()
+    ls, req_async = _make_cosoq02701_ls()
+    tr = ls.overseas_stock.return_value.accno.return_value.cosoq02701
+
+    await executor._fetch_cosoq02701(ls, "USD")
+    AccountNodeExecutor.invalidate_deposit_cache(ls)
+    await executor._fetch_cosoq02701(ls, "USD")
+
+    # COSOQ02701InBlock1.CrcyCode 는 Literal["USD"] 라 다른 통화 키는 만들 수 없다
+    first, second = (c.args[0] for c in tr.call_args_list)
+    assert first is second
+    assert first.CrcyCode == "USD"
+
+
+@pytest.mark.asyncio
+async def test_cosoq02701_error_response_not_cached():
+    """에러 응답은 캐시하지 않고 다음 호출에서 다시 조회한다"""
+    executor = _make_executor()
+    ls, req_async = _make_cosoq02701_ls(error_msg="rate limit exceeded")
+
+    await executor._fetch_cosoq02701(ls, "USD")
+    await executor._fetch_cosoq02701(ls, "USD")
+    assert req_async.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stock_balance_and_deposit_fetched_concurrently():
+    """COSOQ00201(잔고)와 COSOQ02701(예수금)은 동시에 in-flight 된다"""
+    import asyncio
+
+    executor = _make_executor()
+    ctx = _make_mock_context()
+    ls, cash_req = _make_cosoq02701_ls()
+    both_started = asyncio.Event()
+    started = []
+
+    async def _track(name, response):
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        # 둘 다 시작돼야 풀린다 — 순차 실행이면 여기서 timeout
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return response
+
+    balance_response = MagicMock(error_msg=None, block2=None, block4=[])
+    cash_response = cash_req.return_value
+    cash_response.block3 = []
+    cash_response.block4 = None
+    accno = ls.overseas_stock.return_value.accno.return_value
+    accno.cosoq00201.return_value.req_async = lambda: _track("COSOQ00201", balance_response)
+    accno.cosoq02701.return_value.req_async = lambda: _track("COSOQ02701", cash_response)
+
+    result = await executor._ls_overseas_stock(ls, "account1", ctx)
+
+    assert sorted(started) == ["COSOQ00201", "COSOQ02701"]
+    assert result["positions"] == []
+
+
 # ── 해외선물 테스트 ──
 
 
@@ -291,6 +421,47 @@ async def test_futures_balance_by_currency_compat():
     assert balance["orderable_amount"] == 25000.0
 
 
+def test_pack_ls_floats_empty_fields_default_zero():
+    """패커 테이블: 빈 문자열/None/누락 필드는 0.0, 키 순서는 테이블 순서 유지"""
+    from types import SimpleNamespace
+    from programgarden.executor import _pack_ls_floats, _CIDBQ05300_CURRENCY_FIELDS
+
+    item = SimpleNamespace(OvrsFutsDps="1500.5", AbrdFutsOrdAbleAmt="", AbrdFutsEvalPnlAmt=None)
+    packed = _pack_ls_floats(item, _CIDBQ05300_CURRENCY_FIELDS)
+
+    assert list(packed) == ["deposit", "orderable_amount", "withdrawable_amount", "eval_pnl"]
+    assert packed == {
+        "deposit": 1500.5,
+        "orderable_amount": 0.0,
+        "withdrawable_amount": 0.0,
+        "eval_pnl": 0.0,
+    }
+
+
+def test_ls_str_strips_and_defaults():
+    """문자열 필드: 공백 제거, 비문자열은 str 변환, 빈 값/None/누락은 default"""
+    from types import SimpleNamespace
+    from programgarden.executor import _ls_str
+
+    item = SimpleNamespace(IsuCodeVal=" ESM26 ", OrdNo=12345, IsuNm="", CrcyCode=None)
+    assert _ls_str(item, "IsuCodeVal") == "ESM26"
+    assert _ls_str(item, "OrdNo") == "12345"
+    assert _ls_str(item, "IsuNm", "ESM26") == "ESM26"
+    assert _ls_str(item, "CrcyCode", "USD") == "USD"
+    assert _ls_str(item, "Missing") == ""
+
+
+def test_attr_or_reads_fallback_only_when_missing():
+    """주 필드가 있으면 (빈 값이어도) 그 값, 없을 때만 대체 필드 → default"""
+    from types import SimpleNamespace
+    from programgarden.executor import _attr_or
+
+    assert _attr_or(SimpleNamespace(ShtnIsuNo="AAPL", IsuNo="US0378331005"), "ShtnIsuNo", "IsuNo") == "AAPL"
+    assert _attr_or(SimpleNamespace(ShtnIsuNo="", IsuNo="X"), "ShtnIsuNo", "IsuNo") == ""
+    assert _attr_or(SimpleNamespace(IsuNo="X"), "ShtnIsuNo", "IsuNo") == "X"
+    assert _attr_or(SimpleNamespace(), "remaining_qty", "order_qty", 0) == 0
+
+
 @pytest.mark.asyncio
 async def test_futures_cidbq05300_replaces_cidbq03000():
     """CIDBQ05300 교체 후 기존 필드 유지 확인 + CIDBQ03000 미호출 검증"""
@@ -467,6 +638,25 @@ async def test_position_sizing_fixed_quantity_exempt_from_partial_failure_guard(
     assert "orders" in result or "symbols" in result
 
 
+@pytest.mark.asyncio
+async def test_position_sizing_fixed_quantity_skips_balance_extraction():
+    """fixed_quantity 는 balance 를 읽지 않는다 — 예수금 추출 자체를 건너뜀."""
+    from programgarden.executor import PositionSizingNodeExecutor
+
+    executor = PositionSizingNodeExecutor()
+    ctx = _make_sizing_context(dry_run=False)
+    config = {
+        "symbols": [{"symbol": "AAPL", "exchange": "NASDAQ"}],
+        "price_data": {"AAPL": {"price": 100.0}},
+        "method": "fixed_quantity",
+        "fixed_quantity": 2,
+    }
+
+    with patch.object(executor, "_extract_balance", side_effect=AssertionError("balance read")):
+        result = await executor.execute("sizing1", "PositionSizingNode", config, ctx)
+    assert result["orders"][0]["quantity"] == 2
+
+
 @pytest.mark.asyncio
 async def test_end_to_end_partial_failure_balance_blocks_position_sizing():
     """Phase 4 integration: AccountNode 의 mock COSOQ02701 실패가
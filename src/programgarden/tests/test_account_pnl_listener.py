@@ -227,6 +227,28 @@ class TestBrokerNodeExecutor:
         assert hasattr(active, 'on_workflow_pnl_update')
         assert callable(getattr(active, 'on_workflow_pnl_update'))
 
+    def test_fill_price_sync_skipped_without_position_tracker(self, tmp_path):
+        """포지션 추적기가 없으면(리스너 없음) 체결가 복구 태스크를 띄우지 않는다"""
+        from unittest.mock import AsyncMock, patch
+        from programgarden.executor import BrokerNodeExecutor, ExecutionContext
+
+        async def run_test():
+            ctx = ExecutionContext(job_id="j", workflow_id="w", storage_dir=str(tmp_path))
+            executor = BrokerNodeExecutor()
+            with patch.object(
+                BrokerNodeExecutor, "_sync_fill_prices_from_history", new_callable=AsyncMock,
+            ) as sync_mock:
+                out = await executor.execute(
+                    "broker", "OverseasFuturesBrokerNode",
+                    {"appkey": "AK", "appsecret": "AS", "paper_trading": True},
+                    ctx,
+                )
+                await asyncio.sleep(0)
+            assert out["connected"] is True
+            sync_mock.assert_not_called()
+
+        asyncio.run(run_test())
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
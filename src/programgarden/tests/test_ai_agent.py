@@ -303,6 +303,53 @@ class TestAIAgentNodeExecutor:
         # TokenUsage 이벤트가 발행됐는지 확인
         ctx.notify_token_usage.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_streaming_tokens_forwarded(self):
+        """streaming=True 면 토큰마다 LLMStreamEvent, 끝에 is_final 이벤트 발행."""
+        from programgarden.executor import AIAgentNodeExecutor
+
+        executor = AIAgentNodeExecutor()
+
+        ctx = _make_context(outputs={
+            "llm": {"connection": {
+                "provider": "openai",
+                "model": "gpt-4o",
+                "api_key": "sk-test",
+                "temperature": 0.7,
+                "max_tokens": 1000,
+                "streaming": True,
+            }},
+        })
+
+        nodes = {
+            "agent": ResolvedNode("agent", "AIAgentNode", "ai", {}),
+            "llm": ResolvedNode("llm", "LLMModelNode", "ai", {}),
+        }
+        ai_model_edges = [ResolvedEdge("llm", "agent", "ai_model")]
+        wf = _make_resolved_workflow(nodes=nodes, dag_edges=[], ai_model_edges=ai_model_edges)
+
+        config = {"user_prompt": "Hello!", "output_format": "text"}
+
+        async def _fake_chat_stream(self, messages, on_token, tools=None):
+            for token in ("Hi", " there!"):
+                await on_token(token)
+            return _make_litellm_response(content="Hi there!")
+
+        with patch("programgarden.providers.LLMProvider.chat_stream", _fake_chat_stream):
+            result = await executor.execute(
+                node_id="agent",
+                node_type="AIAgentNode",
+                config=config,
+                context=ctx,
+                workflow=wf,
+            )
+
+        assert result["response"] == "Hi there!"
+        events = [call.args[0] for call in ctx.notify_llm_stream.call_args_list]
+        assert [(e.token, e.is_final) for e in events] == [
+            ("Hi", False), (" there!", False), ("", True),
+        ]
+
     @pytest.mark.asyncio
     async def test_json_output_format(self):
         """JSON output_format 파싱."""
@@ -1244,6 +1291,121 @@ class TestMaxToolCalls:
         assert ctx.notify_ai_tool_call.call_count == 2
 
 
+class TestParallelToolCalls:
+    """한 응답의 여러 Tool 호출은 동시에 실행하고, 결과는 요청 순서대로 쌓는다.
+
+    같은 Tool 노드에 대한 호출끼리는 executor 인스턴스를 공유하므로 하나씩 돈다.
+    """
+
+    @staticmethod
+    def _workflow():
+        nodes = {
+            "agent": ResolvedNode("agent", "AIAgentNode", "ai", {}),
+            "llm": ResolvedNode("llm", "LLMModelNode", "ai", {}),
+            "market": ResolvedNode("market", "OverseasStockMarketDataNode", "market", {
+                "symbol": "AAPL",
+            }, product_scope="overseas_stock"),
+            "fundamental": ResolvedNode("fundamental", "OverseasStockFundamentalNode", "market", {
+                "symbol": "AAPL",
+            }, product_scope="overseas_stock"),
+        }
+        return _make_resolved_workflow(
+            nodes=nodes, dag_edges=[],
+            tool_edges=[
+                ResolvedEdge("market", "agent", "tool"),
+                ResolvedEdge("fundamental", "agent", "tool"),
+            ],
+            ai_model_edges=[ResolvedEdge("llm", "agent", "ai_model")],
+        )
+
+    @staticmethod
+    def _context():
+        return _make_context(outputs={
+            "llm": {"connection": {
+                "provider": "openai", "model": "gpt-4o",
+                "api_key": "sk-test", "temperature": 0.7,
+                "max_tokens": 1000, "streaming": False,
+            }},
+        })
+
+    async def _run(self, tool_calls, mock_call_tool):
+        from programgarden.executor import AIAgentNodeExecutor
+
+        ctx = self._context()
+        tool_call_resp = _make_litellm_response(content="", tool_calls=[
+            {"id": call_id, "type": "function",
+             "function": {"name": tool_name, "arguments": json.dumps({"symbol": "AAPL"})}}
+            for call_id, tool_name in tool_calls
+        ])
+        final_resp = _make_litellm_response(content="done")
+        captured = []
+
+        async def mock_chat(messages, tools=None):
+            captured.append(messages.copy())
+            return tool_call_resp if len(captured) == 1 else final_resp
+
+        with patch("programgarden.providers.LLMProvider.chat", side_effect=mock_chat):
+            with patch(
+                "programgarden.executor.AIAgentToolExecutor.call_tool",
+                new_callable=AsyncMock,
+                side_effect=mock_call_tool,
+            ):
+                result = await AIAgentNodeExecutor().execute(
+                    node_id="agent", node_type="AIAgentNode",
+                    config={"user_prompt": "AAPL 분석", "output_format": "text"},
+                    context=ctx, workflow=self._workflow(),
+                )
+
+        assert result["response"] == "done"
+        assert ctx.notify_ai_tool_call.call_count == len(tool_calls)
+        return [m for m in captured[1] if m.get("role") == "tool"]
+
+    @pytest.mark.asyncio
+    async def test_independent_tool_calls_run_concurrently(self):
+        import asyncio
+
+        # 시세 호출은 펀더멘털 호출이 시작돼야 끝난다 — 하나씩 돌면 타임아웃.
+        fundamental_started = asyncio.Event()
+
+        async def mock_call_tool(tool_name, args, agent_node_id):
+            if tool_name == "overseas_stock_market_data_node":
+                await asyncio.wait_for(fundamental_started.wait(), timeout=1)
+            else:
+                fundamental_started.set()
+            return {"tool": tool_name}
+
+        tool_msgs = await self._run(
+            [("call_market", "overseas_stock_market_data_node"),
+             ("call_fundamental", "overseas_stock_fundamental_node")],
+            mock_call_tool,
+        )
+
+        assert [m["tool_call_id"] for m in tool_msgs] == ["call_market", "call_fundamental"]
+        assert json.loads(tool_msgs[0]["content"]) == {"tool": "overseas_stock_market_data_node"}
+
+    @pytest.mark.asyncio
+    async def test_calls_to_same_tool_node_run_one_at_a_time(self):
+        import asyncio
+
+        stats = {"active": 0, "peak": 0}
+
+        async def mock_call_tool(tool_name, args, agent_node_id):
+            stats["active"] += 1
+            stats["peak"] = max(stats["peak"], stats["active"])
+            await asyncio.sleep(0.01)
+            stats["active"] -= 1
+            return {"tool": tool_name}
+
+        tool_msgs = await self._run(
+            [("call_1", "overseas_stock_market_data_node"),
+             ("call_2", "overseas_stock_market_data_node")],
+            mock_call_tool,
+        )
+
+        assert [m["tool_call_id"] for m in tool_msgs] == ["call_1", "call_2"]
+        assert stats["peak"] == 1
+
+
 class TestOutputParserEdgeCases:
     """Output Parser 추가 엣지케이스 테스트."""
 
@@ -0,0 +1,39 @@
+"""동기 래퍼 이벤트 루프 선택 (PG_EVENT_LOOP).
+
+- 기본값은 표준 asyncio 루프 (팩토리 None)
+- uvloop 요청인데 미설치면 경고 후 기본 루프로 폴백
+- 선택된 팩토리는 _run_coro_sync 의 전용 루프 생성에 쓰인다
+"""
+import asyncio
+import sys
+
+from programgarden import client
+
+
+def test_default_uses_stdlib_loop(monkeypatch):
+    monkeypatch.setattr(client, "_EVENT_LOOP", "")
+    assert client._loop_factory() is None
+
+
+def test_uvloop_missing_falls_back(monkeypatch, caplog):
+    monkeypatch.setattr(client, "_EVENT_LOOP", "uvloop")
+    monkeypatch.setitem(sys.modules, "uvloop", None)  # import 시 ImportError
+    with caplog.at_level("WARNING", logger="programgarden.client"):
+        assert client._loop_factory() is None
+    assert "uvloop is not installed" in caplog.text
+
+
+def test_run_coro_sync_uses_selected_factory(monkeypatch):
+    created = []
+
+    def factory():
+        loop = asyncio.new_event_loop()
+        created.append(loop)
+        return loop
+
+    monkeypatch.setattr(client, "_loop_factory", lambda: factory)
+
+    async def probe():
+        return asyncio.get_running_loop()
+
+    assert client._run_coro_sync(probe()) is created[0]
@@ -0,0 +1,75 @@
+"""ExecutionContext 정지 신호 (wait_for_event / wait_stopped).
+
+- 이벤트 대기는 주기적으로 깨어나지 않고, stop()/fail() 이 오면 즉시 None 으로 끝난다
+- 큐에 이미 들어온 이벤트는 정지 여부와 무관하게 먼저 돌려준다
+- wait_stopped 는 timeout 안에 멈췄는지 여부를 돌려주고, start() 로 다시 초기화된다
+"""
+import asyncio
+
+import pytest
+
+from programgarden.context import ExecutionContext
+
+
+def _make_context() -> ExecutionContext:
+    ctx = ExecutionContext(job_id="stop-event-job", workflow_id="wf-stop-event")
+    ctx.start()
+    return ctx
+
+
+@pytest.mark.asyncio
+async def test_wait_for_event_returns_event():
+    ctx = _make_context()
+    waiter = asyncio.create_task(ctx.wait_for_event())
+    await asyncio.sleep(0)
+    await ctx.emit_event("schedule_tick", "sched-1")
+
+    event = await asyncio.wait_for(waiter, timeout=1)
+    assert event.type == "schedule_tick"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("halt", ["stop", "fail"])
+async def test_wait_for_event_wakes_on_halt(halt):
+    ctx = _make_context()
+    waiter = asyncio.create_task(ctx.wait_for_event())
+    await asyncio.sleep(0)
+
+    if halt == "stop":
+        ctx.stop()
+    else:
+        ctx.fail("boom")
+
+    assert await asyncio.wait_for(waiter, timeout=1) is None
+
+
+@pytest.mark.asyncio
+async def test_queued_event_wins_over_stop():
+    ctx = _make_context()
+    await ctx.emit_event("realtime_update", "acct-1")
+    ctx.stop()
+
+    event = await ctx.wait_for_event()
+    assert event.type == "realtime_update"
+    assert await ctx.wait_for_event() is None
+
+
+@pytest.mark.asyncio
+async def test_wait_for_event_timeout_keeps_queue_intact():
+    ctx = _make_context()
+    assert await ctx.wait_for_event(timeout=0.01) is None
+
+    await ctx.emit_event("market_data", "md-1")
+    assert (await ctx.wait_for_event(timeout=0.01)).type == "market_data"
+
+
+@pytest.mark.asyncio
+async def test_wait_stopped():
+    ctx = _make_context()
+    assert await ctx.wait_stopped(0.01) is False
+
+    asyncio.get_running_loop().call_later(0.01, ctx.stop)
+    assert await ctx.wait_stopped(1) is True
+
+    ctx.start()
+    assert await ctx.wait_stopped(0.01) is False
@@ -35,6 +35,10 @@ class TestExchangeNormalization:
     def test_known_values_map_to_english_name_and_ls_code(self, raw, name, code):
         assert normalize_overseas_stock_exchange(raw) == (name, code)
 
+    @pytest.mark.parametrize("raw", ["nasdaq", " NASDAQ ", "Nasdaq", "nms", 82])
+    def test_case_whitespace_and_non_str_variants(self, raw):
+        assert normalize_overseas_stock_exchange(raw) == ("NASDAQ", "82")
+
     def test_83_is_a_phantom_code(self):
         """LS 는 AMEX 를 81 로 준다. 83 은 반환/수용하지 않는 유령 코드다."""
         assert normalize_overseas_stock_exchange("83") == (None, None)
@@ -308,6 +308,22 @@ class TestExclusionListExecutorFilter:
         assert "BA" in filtered_symbols
         assert len(result["filtered"]) == 2
 
+    @pytest.mark.asyncio
+    async def test_filter_matches_padded_codes(self, executor, ctx):
+        result = await executor.execute(
+            node_id="excl1",
+            node_type="ExclusionListNode",
+            config={
+                "symbols": ["005930"],
+                "input_symbols": [
+                    {"exchange": "KRX", "symbol": "005930  "},
+                    " 000660",
+                ],
+            },
+            context=ctx,
+        )
+        assert result["filtered"] == [{"exchange": "", "symbol": "000660"}]
+
     @pytest.mark.asyncio
     async def test_filter_no_input_symbols(self, executor, ctx):
         """input_symbols가 없으면 filtered는 빈 배열"""
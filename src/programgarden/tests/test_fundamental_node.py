@@ -218,6 +218,50 @@ class TestFundamentalNodeExecutorLogic:
 
         assert len(result["values"]) == 2
 
+    @pytest.mark.asyncio
+    async def test_entries_without_symbol_skipped_before_fetch(self, mock_context):
+        """symbol 없는 항목은 조회 없이 걸러지고, 결과는 입력 순서를 유지"""
+        from programgarden.executor import FundamentalNodeExecutor
+
+        def _g3104(body):
+            block = MagicMock()
+            block.engname = body.symbol
+            block.clos = 100.0
+            block.pcls = 100.0
+            tr = MagicMock()
+            tr.req.return_value = MagicMock(block=block)
+            return tr
+
+        mock_market = MagicMock()
+        mock_market.g3104.side_effect = _g3104
+
+        mock_api = MagicMock()
+        mock_api.market.return_value = mock_market
+
+        mock_ls = MagicMock()
+        mock_ls.overseas_stock.return_value = mock_api
+
+        with patch("programgarden.executor.ensure_ls_login") as mock_login:
+            mock_login.return_value = (mock_ls, True, None)
+
+            result = await FundamentalNodeExecutor().execute(
+                node_id="fund1",
+                node_type="OverseasStockFundamentalNode",
+                config={
+                    "symbols": [
+                        {"exchange": "NASDAQ", "symbol": "AAPL"},
+                        {"exchange": "NYSE", "symbol": ""},
+                        {"exchange": "NASDAQ", "symbol": "NVDA"},
+                        {"exchange": "NYSE", "symbol": "MSFT"},
+                    ],
+                    "connection": {"product": "overseas_stock"},
+                },
+                context=mock_context,
+            )
+
+        assert [v["symbol"] for v in result["values"]] == ["AAPL", "NVDA", "MSFT"]
+        assert mock_market.g3104.call_count == 3
+
     @pytest.mark.asyncio
     async def test_missing_credential_returns_error(self, mock_context):
         """credential이 없으면 에러 반환"""
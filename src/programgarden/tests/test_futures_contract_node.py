@@ -168,6 +168,31 @@ async def test_rollover_happens_automatically_next_month():
     assert out["symbols"] == [{"exchange": "HKEX", "symbol": "HMHQ26"}]
 
 
+@pytest.mark.asyncio
+async def test_master_is_cached_per_session_but_expiry_is_rechecked():
+    """같은 LS 세션은 o3101 을 TTL 안에서 재사용하되, 만기 판정은 매 실행 다시 한다."""
+    import datetime as _dt
+
+    ex = FuturesContractNodeExecutor()
+    month = [7]
+
+    class _FixedNow:
+        @staticmethod
+        def now():
+            return _dt.datetime(2026, month[0], 15)
+
+    config = {"base_products": ["HMH"], "contract_selection": "front"}
+    with _patched_master(LISTED_ROWS) as login, patch("programgarden.executor.datetime", _FixedNow):
+        first = await ex.execute("contract", "FuturesContractNode", config, _make_context())
+        month[0] = 8
+        second = await ex.execute("contract", "FuturesContractNode", config, _make_context())
+        market = login.return_value[0].overseas_futureoption.return_value.market.return_value
+
+    assert first["symbols"] == [{"exchange": "HKEX", "symbol": "HMHN26"}]
+    assert second["symbols"] == [{"exchange": "HKEX", "symbol": "HMHQ26"}]
+    assert market.해외선물마스터조회.call_count == 1
+
+
 # ---------------------------------------------------------------------------
 # 3. 실패는 조용하지 않다
 # ---------------------------------------------------------------------------
@@ -335,6 +360,37 @@ async def test_symbol_query_available_exchange_filters():
     assert all(s["exchange_name"] == "홍콩거래소" for s in out["symbols"])
 
 
+@pytest.mark.asyncio
+async def test_symbol_query_and_contract_node_share_master_fetch():
+    """두 노드는 같은 o3101 전체 마스터를 쓴다 — 같은 LS 세션이면 TTL 안에서 한 번만 조회한다."""
+    import datetime as _dt
+    from programgarden.executor import SymbolQueryNodeExecutor
+
+    class _FixedNow:
+        @staticmethod
+        def now():
+            return _dt.datetime(2026, 7, 15)
+
+    with _patched_master(LISTED_ROWS) as login, patch("programgarden.executor.datetime", _FixedNow):
+        out = await SymbolQueryNodeExecutor().execute(
+            "q", "OverseasFuturesSymbolQueryNode", {"futures_exchange": "6"},
+            _symbol_query_context(),
+        )
+        picked = await FuturesContractNodeExecutor().execute(
+            "contract", "FuturesContractNode",
+            {"base_products": ["HMH"], "contract_selection": "front"}, _make_context(),
+        )
+        again = await SymbolQueryNodeExecutor().execute(
+            "q", "OverseasFuturesSymbolQueryNode", {"futures_exchange": "6"},
+            _symbol_query_context(),
+        )
+        market = login.return_value[0].overseas_futureoption.return_value.market.return_value
+
+    assert out["count"] == again["count"] == 7
+    assert picked["count"] == 1
+    assert market.해외선물마스터조회.call_count == 1
+
+
 @pytest.mark.asyncio
 async def test_contract_node_accepts_sibling_enum_exchange_value():
     """형제 노드는 같은 이름의 필드를 enum('6'=HKEX)으로 쓴다. 챗봇이 그 값을 그대로
@@ -0,0 +1,82 @@
+"""해외선물 체결가격 복구 (BrokerNode._sync_overseas_futures_fill_prices).
+
+- 종목별로 나눠 묻지 않고 CIDBQ01800 을 전체 종목(IsuCodeVal="")으로 1회 조회한다
+- 가격이 비어 있는 주문번호만 골라 가중평균 체결가로 동기화한다
+- 전체 조회가 거부되면 대상 종목만 종목별로 다시 조회한다
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from programgarden.executor import BrokerNodeExecutor
+
+
+def _row(order_no, qty, price):
+    return SimpleNamespace(OvrsFutsOrdNo=order_no, ExecQty=qty, AbrdFutsExecPrc=price)
+
+
+def _make_ls(responses):
+    """CIDBQ01800 호출 인자(body)를 기록하며 responses 를 차례로 돌려주는 LS mock."""
+    bodies = []
+
+    def _tr(body):
+        bodies.append(body)
+        tr = MagicMock()
+        tr.req_async = AsyncMock(return_value=responses[len(bodies) - 1])
+        return tr
+
+    ls = MagicMock()
+    ls.overseas_futureoption.return_value.accno.return_value.CIDBQ01800.side_effect = _tr
+    return ls, bodies
+
+
+def _make_context():
+    ctx = MagicMock()
+    ctx.sync_workflow_fill_prices_from_history = MagicMock(return_value=1)
+    return ctx
+
+
+@pytest.mark.asyncio
+async def test_single_all_symbols_query_filters_pending_orders():
+    ls, bodies = _make_ls([
+        SimpleNamespace(error_msg=None, block2=[
+            _row("101", 1, 100.0),
+            _row("101", 3, 104.0),
+            _row("999", 2, 50.0),   # 이 워크플로우 주문이 아님
+        ]),
+    ])
+    ctx = _make_context()
+    orders = [
+        {"order_no": "101", "symbol": "ESM26"},
+        {"order_no": "102", "symbol": "NQU26"},
+    ]
+
+    await BrokerNodeExecutor()._sync_overseas_futures_fill_prices(
+        ls, orders, ctx, "broker", query_date="20260701"
+    )
+
+    assert len(bodies) == 1
+    assert bodies[0].IsuCodeVal == ""
+    assert bodies[0].OrdDt == "20260701"
+    ctx.sync_workflow_fill_prices_from_history.assert_called_once_with(
+        [{"order_no": "101", "order_date": "20260701", "fill_price": 103.0}]
+    )
+
+
+@pytest.mark.asyncio
+async def test_rejected_all_symbols_query_falls_back_per_symbol():
+    ls, bodies = _make_ls([
+        SimpleNamespace(error_msg="종목코드 필수", block2=[]),
+        SimpleNamespace(error_msg=None, block2=[_row("101", 1, 100.0)]),
+    ])
+    ctx = _make_context()
+
+    await BrokerNodeExecutor()._sync_overseas_futures_fill_prices(
+        ls, [{"order_no": "101", "symbol": "ESM26"}], ctx, "broker", query_date="20260701"
+    )
+
+    assert [b.IsuCodeVal for b in bodies] == ["", "ESM26"]
+    ctx.sync_workflow_fill_prices_from_history.assert_called_once_with(
+        [{"order_no": "101", "order_date": "20260701", "fill_price": 100.0}]
+    )
@@ -0,0 +1,60 @@
+"""MarketDataNode 해외선물 현재가(o3105) 조회.
+
+- 종목별 조회는 동시에 보내되 결과는 입력 순서를 유지한다
+- 같은 심볼은 한 번만 조회한다
+- 실패 종목만 경고 후 빠진다
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from programgarden.executor import MarketDataNodeExecutor
+
+
+def _make_mock_context():
+    ctx = MagicMock()
+    ctx.log = MagicMock()
+    ctx.get_credential = MagicMock(return_value={"appkey": "k", "appsecret": "s"})
+    return ctx
+
+
+def _o3105(body):
+    tr = MagicMock()
+    if body.symbol == "CLH26":
+        tr.req = MagicMock(side_effect=RuntimeError("timeout"))
+        return tr
+    blk = MagicMock()
+    blk.SymbolNm = body.symbol
+    blk.TrdP = 100.0
+    blk.YdiffP = -1.5
+    blk.YdiffSign = "5"
+    blk.Diff = -1.0
+    blk.TotQ = 10
+    blk.OpenP = blk.HighP = blk.LowP = 100.0
+    tr.req = MagicMock(return_value=MagicMock(block=blk))
+    return tr
+
+
+@pytest.mark.asyncio
+@patch("programgarden.executor.ensure_ls_login")
+async def test_o3105_dedupes_symbols_keeps_order_and_skips_failures(mock_login):
+    executor = MarketDataNodeExecutor()
+    ctx = _make_mock_context()
+
+    mock_ls = MagicMock()
+    mock_login.return_value = (mock_ls, True, None)
+    o3105 = MagicMock(side_effect=_o3105)
+    mock_ls.overseas_futureoption.return_value.market.return_value.o3105 = o3105
+
+    symbols = [
+        {"exchange": "HKEX", "symbol": "HMHU26"},
+        {"exchange": "CME", "symbol": "CLH26"},
+        {"exchange": "CME", "symbol": "GCGF26"},
+        {"exchange": "HKEX", "symbol": "HMHU26"},
+    ]
+    result = await executor._fetch_overseas_futures(symbols, ctx, "md1")
+
+    assert [v["symbol"] for v in result["values"]] == ["HMHU26", "GCGF26", "HMHU26"]
+    assert result["values"][0]["change"] == -1.5
+    assert o3105.call_count == 3
+    ctx.log.assert_any_call("warning", "Failed to fetch CME:CLH26: timeout", "md1")
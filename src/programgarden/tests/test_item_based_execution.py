@@ -127,6 +127,35 @@ class TestAggregateNodeFieldSchema:
         assert mode_schema.enum_values == expected_modes
 
 
+class TestAggregateNodeExecutor:
+    """AggregateNodeExecutor 수치 집계 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "mode, expected",
+        [("sum", 12), ("avg", 4), ("min", 1), ("max", 8)],
+    )
+    async def test_numeric_modes(self, mode, expected):
+        """숫자가 아닌 값은 건너뛰고 value_field 를 집계"""
+        from programgarden.executor import AggregateNodeExecutor
+
+        context = MagicMock()
+        context.get_node_state.return_value = [
+            {"value": 3},
+            {"value": 1},
+            {"value": "n/a"},
+            {"other": 5},
+            8,
+        ]
+
+        result = await AggregateNodeExecutor().execute(
+            "agg1", "AggregateNode", {"mode": mode}, context
+        )
+
+        assert result["value"] == expected
+        assert result["count"] == 3
+
+
 class TestItemBasedNodeSchemas:
     """Item-based 변경된 노드 스키마 테스트"""
 
@@ -873,3 +902,54 @@ class TestRealtimeSplitBranchFillsTablePerSymbol:
         assert len(second) == 2, "쿨다운 사이클에서 수집이 비어 표가 깜빡인다"
         assert [r["symbol"] for r in second] == ["005930", "000660"]
         assert second[0]["close"] == 263500
+
+
+class TestSplitTopologyIsComputedOnce:
+    """Split→Aggregate 짝/분기 노드는 처음 한 번만 계산하고 이후엔 재사용한다.
+
+    실시간 틱마다 _handle_realtime_update 가 이 둘을 다시 묻기 때문에, 엣지 전체를
+    매번 훑지 않는지 확인한다.
+    """
+
+    @staticmethod
+    def _mk_job():
+        from programgarden.executor import WorkflowJob
+
+        class _Edge:
+            def __init__(self, f, t):
+                self.from_node_id, self.to_node_id = f, t
+
+        class _Node:
+            def __init__(self, node_type):
+                self.node_type = node_type
+
+        job = WorkflowJob.__new__(WorkflowJob)
+        job._successors = None
+        job._split_aggregate_pairs = None
+        job._branch_nodes_cache = {}
+        wf = MagicMock()
+        wf.edges = [
+            _Edge("up", "split"), _Edge("split", "rm"),
+            _Edge("rm", "throttle"), _Edge("throttle", "agg"), _Edge("agg", "display"),
+        ]
+        wf.nodes = {
+            "up": _Node("WatchlistNode"),
+            "split": _Node("SplitNode"),
+            "rm": _Node("KoreaStockRealMarketDataNode"),
+            "throttle": _Node("ThrottleNode"),
+            "agg": _Node("AggregateNode"),
+            "display": _Node("TableDisplayNode"),
+        }
+        job.workflow = wf
+        return job
+
+    def test_pairs_and_branch_are_cached(self):
+        job = self._mk_job()
+
+        assert job._find_split_aggregate_pairs() == {"split": "agg"}
+        assert job._get_branch_nodes("split", "agg") == {"rm", "throttle"}
+
+        # 그래프가 한 번 읽힌 뒤에는 엣지를 다시 보지 않는다
+        job.workflow.edges = []
+        assert job._find_split_aggregate_pairs() == {"split": "agg"}
+        assert job._get_branch_nodes("split", "agg") == {"rm", "throttle"}
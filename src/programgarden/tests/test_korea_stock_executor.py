@@ -386,6 +386,43 @@ class TestKoreaStockMarketDataExecutor:
         result = await executor._fetch_korea_stock([{"symbol": "005930"}], ctx, "md1")
         assert "error" in result
 
+    @pytest.mark.asyncio
+    @patch("programgarden.executor.ensure_ls_login")
+    async def test_market_data_multi_symbol_keeps_order_and_skips_failures(self, mock_login):
+        """종목별 동시 조회: 입력 순서 유지, 실패·빈 symbol 항목만 빠진다"""
+        executor = self._make_executor()
+        ctx = _make_mock_context()
+
+        mock_ls = MagicMock()
+        mock_login.return_value = (mock_ls, True, None)
+
+        def _t1102(body):
+            tr = MagicMock()
+            if body.shcode == "000660":
+                tr.req = MagicMock(side_effect=RuntimeError("timeout"))
+                return tr
+            blk = MagicMock()
+            blk.hname = body.shcode
+            blk.price = 1000
+            blk.change = 0
+            blk.sign = "3"
+            blk.diff = 0.0
+            blk.volume = blk.open = blk.high = blk.low = 0
+            blk.per = blk.pbrx = 0.0
+            tr.req = MagicMock(return_value=MagicMock(block=blk))
+            return tr
+
+        mock_ls.korea_stock.return_value.market.return_value.t1102 = MagicMock(side_effect=_t1102)
+
+        symbols = [{"symbol": "005930"}, {"symbol": ""}, {"symbol": "000660"}, {"symbol": "035420"}]
+        result = await executor._fetch_korea_stock(symbols, ctx, "md1")
+
+        assert [v["symbol"] for v in result["values"]] == ["005930", "035420"]
+        ctx.log.assert_any_call("warning", "Failed to fetch KRX:000660: timeout", "md1")
+        # 빈 symbol 항목은 조회 전에 걸러져 t1102 를 부르지 않는다
+        assert mock_ls.korea_stock.return_value.market.return_value.t1102.call_count == 3
+        ctx.log.assert_any_call("debug", "Skipped 1 entries without symbol", "md1")
+
 
 # ── 5. FundamentalNodeExecutor._fetch_korea_stock ──
 
@@ -510,6 +547,48 @@ class TestKoreaStockHistoricalExecutor:
         assert entry["time_series"][1]["date"] == "20260302"
         assert entry["time_series"][0]["close"] == 65000
 
+    @pytest.mark.asyncio
+    @patch("programgarden.executor.ensure_ls_login")
+    async def test_historical_multi_symbol_keeps_order(self, mock_login):
+        """여러 종목을 동시에 조회해도 입력 순서를 지키고, 한 종목 실패는 그 종목만 비운다"""
+        executor = self._make_executor()
+        ctx = _make_mock_context()
+
+        mock_ls = MagicMock()
+        mock_login.return_value = (mock_ls, True, None)
+
+        def _t8451(body):
+            if body.shcode == "000660":
+                raise RuntimeError("boom")
+            bar = MagicMock()
+            bar.date = "20260301"
+            bar.open = bar.high = bar.low = bar.close = 100
+            bar.jdiff_vol = 1
+            tr = MagicMock()
+            tr.req = MagicMock(return_value=MagicMock(block1=[bar]))
+            return tr
+
+        mock_chart = MagicMock()
+        mock_chart.t8451 = MagicMock(side_effect=_t8451)
+        mock_ks = MagicMock()
+        mock_ks.chart = MagicMock(return_value=mock_chart)
+        mock_ls.korea_stock = MagicMock(return_value=mock_ks)
+
+        result = await executor._fetch_korea_stock(
+            symbols=["005930", "000660", "035720"],
+            start_date="20260301",
+            end_date="20260302",
+            interval="1d",
+            context=ctx,
+            node_id="hist1",
+        )
+
+        assert [entry["symbol"] for entry in result] == ["005930", "000660", "035720"]
+        assert len(result[0]["time_series"]) == 1
+        assert result[1]["time_series"] == []
+        assert "boom" in result[1]["_error"]
+        assert len(result[2]["time_series"]) == 1
+
     @pytest.mark.asyncio
     @patch("programgarden.executor.ensure_ls_login")
     async def test_historical_no_credential(self, mock_login):
@@ -641,6 +720,47 @@ class TestKoreaStockSymbolQueryExecutor:
         assert result["count"] == 1
         assert result["symbols"][0]["market"] == "KOSPI"
 
+    @pytest.mark.asyncio
+    @patch("programgarden.executor.ensure_ls_login")
+    async def test_symbol_query_one_market_failure_keeps_other(self, mock_login):
+        """한 시장 조회가 실패해도 나머지 시장 종목은 반환"""
+        executor = self._make_executor()
+        ctx = _make_mock_context()
+
+        mock_ls = MagicMock()
+        mock_login.return_value = (mock_ls, True, None)
+
+        kosdaq_item = MagicMock()
+        kosdaq_item.shcode = "035720"
+        kosdaq_item.hname = "카카오"
+        kosdaq_item.etfchk = "0"
+        kosdaq_resp = MagicMock()
+        kosdaq_resp.block = [kosdaq_item]
+
+        kospi_api = MagicMock()
+        kospi_api.req = MagicMock(side_effect=RuntimeError("timeout"))
+        kosdaq_api = MagicMock()
+        kosdaq_api.req = MagicMock(return_value=kosdaq_resp)
+
+        mock_market = MagicMock()
+        mock_market.t9945 = MagicMock(side_effect=[kospi_api, kosdaq_api])
+        mock_ks = MagicMock()
+        mock_ks.market = MagicMock(return_value=mock_market)
+        mock_ls.korea_stock = MagicMock(return_value=mock_ks)
+
+        result = await executor._execute_korea_stock_master(
+            node_id="sq1",
+            config={"stock_exchange": ""},
+            context=ctx,
+            appkey="k",
+            appsecret="s",
+            max_results=1000,
+        )
+
+        assert result["count"] == 1
+        assert result["symbols"][0]["market"] == "KOSDAQ"
+        assert "error" not in result
+
 
 # ── 8. NewOrderNodeExecutor._execute_korea_stock ──
 
@@ -33,8 +33,10 @@ class _StubContext:
 
 
 def _codes(passed):
+    # union_symbols() 는 문자열 종목을 normalize_symbol 로 SymbolEntry 로 복원한다
     return sorted(
-        s.get("symbol") if isinstance(s, dict) else s for s in passed
+        s.get("symbol") if isinstance(s, dict) else getattr(s, "symbol", s)
+        for s in passed
     )
 
 
@@ -143,6 +145,23 @@ def test_all_boolean_gate_false_blocks():
     assert passed == []
 
 
+def test_false_verdict_skips_symbol_normalisation(monkeypatch):
+    """A failed verdict returns [] without normalising legacy string symbols."""
+    import programgarden_core.models as models
+
+    def _fail(_sym):
+        raise AssertionError("symbols must not be normalised for a False verdict")
+
+    monkeypatch.setattr(models, "normalize_symbol", _fail)
+    results = [
+        _cond(0, False, ["AAPL"]),
+        _cond(1, True, ["JPM"]),
+    ]
+    final_result, passed = _apply_all(results)
+    assert final_result is False
+    assert passed == []
+
+
 # --- Bug A: is_condition_met list scalarisation (via execute) -----------
 
 
@@ -247,5 +266,75 @@ def test_execute_mixed_boolean_gate_with_symbol_bearing():
     assert _codes(out["passed_symbols"]) == ["AAPL", "JPM"]
 
 
+# --- count / weight based operators -------------------------------------
+
+
+@pytest.mark.parametrize("operator,threshold,expected,codes", [
+    ("xor", None, False, []),
+    # 개수/가중치 연산자는 통과 시 전체 조건의 합집합을 낸다 (기존 동작)
+    ("at_least", 2, True, ["AAPL", "JPM", "MSFT"]),
+    ("at_most", 1, False, []),
+    ("exactly", 2, True, ["AAPL", "JPM", "MSFT"]),
+    ("weighted", 3.0, True, ["AAPL", "JPM", "MSFT"]),
+    ("weighted", 3.5, False, []),
+])
+def test_count_and_weight_operators(operator, threshold, expected, codes):
+    results = [
+        _cond(0, True, ["AAPL"], weight=2.0),
+        _cond(1, False, ["MSFT"], weight=5.0),
+        _cond(2, True, ["JPM"]),
+    ]
+    exe = LogicNodeExecutor()
+    final_result, final_passed = exe._apply_operator(
+        operator=operator,
+        results=results,
+        all_passed_symbols=[r["passed_symbols"] for r in results],
+        threshold=threshold,
+        weights={r["index"]: r["weight"] for r in results},
+        context=_StubContext(),
+        node_id="logic",
+    )
+    assert final_result is expected
+    assert _codes(final_passed) == codes
+
+
+def test_xor_returns_the_single_passing_condition_symbols():
+    results = [
+        _cond(0, False, ["AAPL"]),
+        _cond(1, True, ["JPM"]),
+    ]
+    exe = LogicNodeExecutor()
+    final_result, final_passed = exe._apply_operator(
+        operator="xor",
+        results=results,
+        all_passed_symbols=[r["passed_symbols"] for r in results],
+        threshold=None,
+        weights={},
+        context=_StubContext(),
+        node_id="logic",
+    )
+    assert final_result is True
+    assert final_passed == ["JPM"]
+
+
+def test_weighted_uses_original_condition_index():
+    # conditions[1] 이 dict 가 아니어서 건너뛰어진 경우: results 위치 1 은 index 2 다
+    results = [
+        _cond(0, True, ["AAPL"]),
+        _cond(2, True, ["JPM"], weight=3.0),
+    ]
+    exe = LogicNodeExecutor()
+    final_result, _ = exe._apply_operator(
+        operator="weighted",
+        results=results,
+        all_passed_symbols=[r["passed_symbols"] for r in results],
+        threshold=3.5,
+        weights={0: 1.0, 2: 3.0},
+        context=_StubContext(),
+        node_id="logic",
+    )
+    assert final_result is True
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__, "-v"]))
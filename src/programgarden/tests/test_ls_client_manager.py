@@ -0,0 +1,90 @@
+"""LSClientManager 세션 재사용 테스트
+
+같은 product 에 모의/실전 credential 이 번갈아 들어와도, 이미 로그인한
+조합은 재로그인 없이 재사용되는지 확인한다.
+"""
+
+import time
+
+import pytest
+
+from programgarden.executor import LSClientManager
+
+
+class _FakeContext:
+    ls_token_provider = None
+
+    def log(self, level, message, node_id=None):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _reset_ls_clients():
+    LSClientManager.reset()
+    yield
+    LSClientManager.reset()
+
+
+@pytest.fixture
+def login_calls(monkeypatch):
+    from programgarden_finance import LS
+
+    calls = []
+
+    def _fake_login(self, appkey=None, appsecretkey=None, paper_trading=False):
+        calls.append((appkey, paper_trading))
+        self.token_manager.apply_token(f"TOKEN-{appkey}", time.time() + 3600)
+        return True
+
+    monkeypatch.setattr(LS, "login", _fake_login)
+    return calls
+
+
+def _get(appkey, paper_trading):
+    return LSClientManager.get_or_create(
+        product="overseas_stock",
+        appkey=appkey,
+        appsecret="AS",
+        paper_trading=paper_trading,
+        context=_FakeContext(),
+        node_id="broker-1",
+    )
+
+
+def test_alternating_credentials_reuse_logged_in_sessions(login_calls):
+    live, ok_live, _ = _get("LIVE", False)
+    paper, ok_paper, _ = _get("PAPER", True)
+    live_again, _, _ = _get("LIVE", False)
+    paper_again, _, _ = _get("PAPER", True)
+
+    assert ok_live and ok_paper
+    assert login_calls == [("LIVE", False), ("PAPER", True)]
+    assert live_again is live
+    assert paper_again is paper
+    assert LSClientManager.get("overseas_stock") is paper
+
+
+def test_expired_session_logs_in_again(login_calls):
+    live, _, _ = _get("LIVE", False)
+    _get("PAPER", True)
+    live.token_manager.apply_token("TOKEN-LIVE", time.time() - 1)
+
+    relogged, ok, _ = _get("LIVE", False)
+
+    assert ok
+    assert relogged is not live
+    assert login_calls == [("LIVE", False), ("PAPER", True), ("LIVE", False)]
+
+
+def test_sessions_bounded_per_product_and_keyed_without_secrets(login_calls):
+    limit = LSClientManager.MAX_SESSIONS_PER_PRODUCT
+    for i in range(limit + 2):
+        _get(f"KEY{i}", False)
+
+    assert len(LSClientManager._sessions) == limit
+    assert all("AS" not in key and not any(f"KEY{i}" in key for i in range(limit + 2))
+               for key in LSClientManager._sessions)
+
+    # 가장 오래된 조합은 밀려났으므로 다시 로그인한다
+    _get("KEY0", False)
+    assert login_calls[-1] == ("KEY0", False)
@@ -0,0 +1,104 @@
+"""종목 단위 LS REST 조회 동시 실행 헬퍼 (_gather_bounded).
+
+- 결과는 입력 순서를 유지한다 (완료 순서와 무관)
+- 동시 in-flight 수는 limit 을 넘지 않는다
+- 고정 워커 풀 — 느린 항목이 있어도 빈 자리에 다음 항목이 바로 들어가고, 태스크는 limit 개만 만든다
+- 한 항목의 예외는 결과 자리에 예외 객체로 남고 나머지는 계속 진행된다
+- 호출 측이 취소되면 진행 중인 항목도 함께 취소된다
+"""
+import asyncio
+
+import pytest
+
+from programgarden.executor import _gather_bounded
+
+
+@pytest.mark.asyncio
+async def test_results_keep_input_order():
+    async def work(n):
+        # 뒤 항목이 먼저 끝나도 결과 순서는 입력 순서
+        await asyncio.sleep(0.01 * (5 - n))
+        return n * 10
+
+    assert await _gather_bounded(work, [1, 2, 3, 4], limit=4) == [10, 20, 30, 40]
+
+
+@pytest.mark.asyncio
+async def test_inflight_never_exceeds_limit():
+    inflight = 0
+    peak = 0
+
+    async def work(_):
+        nonlocal inflight, peak
+        inflight += 1
+        peak = max(peak, inflight)
+        await asyncio.sleep(0.01)
+        inflight -= 1
+
+    await _gather_bounded(work, list(range(10)), limit=3)
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_pool_refills_without_waiting_for_straggler():
+    tasks = set()
+    finished = []
+
+    async def work(n):
+        tasks.add(asyncio.current_task())
+        # 첫 항목만 느리다 — 나머지는 그 사이 남은 한 자리로 차례차례 처리돼야 한다
+        await asyncio.sleep(0.05 if n == 0 else 0.001)
+        finished.append(n)
+        return n
+
+    assert await _gather_bounded(work, list(range(6)), limit=2) == list(range(6))
+    assert finished[-1] == 0
+    assert len(tasks) == 2
+
+
+@pytest.mark.asyncio
+async def test_failure_is_isolated_per_item():
+    async def work(n):
+        if n == 2:
+            raise ValueError("boom")
+        return n
+
+    results = await _gather_bounded(work, [1, 2, 3], limit=2)
+    assert results[0] == 1 and results[2] == 3
+    assert isinstance(results[1], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_limit_one_runs_sequentially():
+    order = []
+
+    async def work(n):
+        order.append(("start", n))
+        await asyncio.sleep(0)
+        order.append(("end", n))
+        return n
+
+    assert await _gather_bounded(work, [1, 2], limit=1) == [1, 2]
+    assert order == [("start", 1), ("end", 1), ("start", 2), ("end", 2)]
+
+
+@pytest.mark.asyncio
+async def test_caller_cancel_cancels_inflight_items():
+    started = asyncio.Event()
+    cancelled = []
+
+    async def work(n):
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(n)
+            raise
+
+    task = asyncio.create_task(_gather_bounded(work, [1, 2, 3], limit=2))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    # 진행 중이던 항목은 함께 취소되고, 대기 중이던 항목은 시작되지 않는다
+    assert sorted(cancelled) == [1, 2]
@@ -356,6 +356,56 @@ class TestSendNotification:
         assert isinstance(listener.notifications[0], NotificationEvent)
 
 
+class SlowListener(MockListener):
+    """on_notification 이 느린(웹훅 등) 리스너"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def on_notification(self, event: NotificationEvent) -> None:
+        await self.release.wait()
+        await super().on_notification(event)
+
+
+class TestNotifyInBackground:
+    """notify_in_background: 호출 측은 기다리지 않고, cleanup 이 남은 알림을 마저 보낸다"""
+
+    @pytest.mark.asyncio
+    async def test_caller_does_not_wait_for_listener(self):
+        ctx = make_context()
+        listener = SlowListener()
+        ctx._listeners = [listener]
+
+        ctx.notify_in_background(ctx.notify_notification(make_event()))
+
+        assert listener.notifications == []
+        assert len(ctx._notify_tasks) == 1
+
+        listener.release.set()
+        await asyncio.wait(list(ctx._notify_tasks))
+        assert len(listener.notifications) == 1
+        assert not ctx._notify_tasks
+
+    @pytest.mark.asyncio
+    async def test_cleanup_drains_pending_notifications(self):
+        ctx = make_context()
+        listener = SlowListener()
+        ctx._listeners = [listener]
+
+        ctx.notify_in_background(ctx.notify_notification(make_event()))
+        asyncio.get_running_loop().call_later(0.01, listener.release.set)
+        await ctx.cleanup_listeners()
+
+        assert len(listener.notifications) == 1
+        assert ctx._listeners == []
+
+    def test_without_running_loop_is_noop(self):
+        ctx = make_context()
+        ctx.notify_in_background(ctx.notify_notification(make_event()))
+        assert not ctx._notify_tasks
+
+
 # ============================================================
 # 5. RISK_ALERT 자동 래핑
 # ============================================================
@@ -31,6 +31,8 @@ def _make_context() -> MagicMock:
     ctx.log = MagicMock()
     ctx.record_workflow_order = MagicMock()
     ctx.send_notification = AsyncMock()
+    # 거부 알림은 백그라운드로 넘겨진다 — 넘겨진 코루틴은 닫기만 하고 호출 여부로 검증
+    ctx.notify_in_background = MagicMock(side_effect=lambda coro: coro.close())
     return ctx
 
 
@@ -103,7 +105,7 @@ class TestOrderRejectDiagnostics:
         assert diag["known"] is False
         assert diag["raw_msg"] == "잔고 부족"
         # 거부 알림 1건 발행
-        ctx.send_notification.assert_awaited_once()
+        ctx.send_notification.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_empty_order_no_uses_dedicated_diagnostic(self):
@@ -127,7 +129,7 @@ class TestOrderRejectDiagnostics:
         assert diag["known"] is True
         assert "no order number" in diag["cause"].lower()
         assert diag["tip"] is not None
-        ctx.send_notification.assert_awaited_once()
+        ctx.send_notification.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_exception_path_attaches_fallback_diagnostic(self):
@@ -172,7 +174,31 @@ class TestOrderRejectDiagnostics:
         assert order_result["status"] == "submitted"
         assert order_result["diagnostics"] is None
         assert result["order_id"] == "A123456"
-        ctx.send_notification.assert_not_awaited()
+        ctx.send_notification.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_success_log_carries_structured_fields(self):
+        """주문 접수 info 로그는 data 로 원시 필드를 함께 싣는다."""
+        ex = NewOrderNodeExecutor()
+        ctx = _make_context()
+        resp = _cosat_response(rsp_cd="00000", error_msg=None, ord_no="A123456")
+        ls = _make_ls_with_cosat_response(resp)
+
+        await ex._execute_overseas_stock(
+            ls, dict(ORDER), "buy", "limit", {}, ctx, "order-5"
+        )
+
+        data = next(
+            c.kwargs["data"] for c in ctx.log.call_args_list if "data" in c.kwargs
+        )
+        assert data == {
+            "product": "overseas_stock",
+            "symbol": "AAPL",
+            "side": "buy",
+            "quantity": 1,
+            "price": 150.0,
+            "order_id": "A123456",
+        }
 
 
 # ---------------------------------------------------------------------------
@@ -603,9 +629,9 @@ class TestOverseasFuturesRejectDiagnostics:
         # empty futures table → known=False raw fallback
         assert diag["known"] is False
         assert diag["raw_msg"] == "증거금 부족"
-        ctx.send_notification.assert_awaited_once()
+        ctx.send_notification.assert_called_once()
         # ORDER_REJECTED category + futures node label
-        _, kwargs = ctx.send_notification.await_args
+        _, kwargs = ctx.send_notification.call_args
         assert kwargs["category"] == NotificationCategory.ORDER_REJECTED
         assert kwargs["node_type"] == "OverseasFuturesNewOrderNode"
 
@@ -626,7 +652,7 @@ class TestOverseasFuturesRejectDiagnostics:
         assert diag is not None
         assert diag["known"] is True
         assert "no order number" in diag["cause"].lower()
-        ctx.send_notification.assert_awaited_once()
+        ctx.send_notification.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_futures_exception_attaches_fallback_diagnostic(self):
@@ -666,7 +692,7 @@ class TestOverseasFuturesRejectDiagnostics:
         assert order_result["success"] is True
         assert order_result["diagnostics"] is None
         assert result["order_id"] == "F987654"
-        ctx.send_notification.assert_not_awaited()
+        ctx.send_notification.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -720,8 +746,8 @@ class TestKoreaStockRejectDiagnostics:
         assert diag is not None
         assert diag["rsp_cd"] == "40300"
         assert diag["known"] is False
-        ctx.send_notification.assert_awaited_once()
-        _, kwargs = ctx.send_notification.await_args
+        ctx.send_notification.assert_called_once()
+        _, kwargs = ctx.send_notification.call_args
         assert kwargs["category"] == NotificationCategory.ORDER_REJECTED
         assert kwargs["node_type"] == "KoreaStockNewOrderNode"
 
@@ -741,7 +767,7 @@ class TestKoreaStockRejectDiagnostics:
         assert order_result["success"] is False
         assert order_result["error"].startswith("Empty OrderNo:")
         assert order_result["diagnostics"]["known"] is True
-        ctx.send_notification.assert_awaited_once()
+        ctx.send_notification.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_korea_success_records_order_no(self):
@@ -757,7 +783,7 @@ class TestKoreaStockRejectDiagnostics:
         assert order_result["success"] is True
         assert order_result["order_id"] == "123456"
         assert order_result["product"] == "korea_stock"
-        ctx.send_notification.assert_not_awaited()
+        ctx.send_notification.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_korea_exception_attaches_fallback_diagnostic(self):
@@ -780,3 +806,91 @@ class TestKoreaStockRejectDiagnostics:
         assert "kr net down" in order_result["error"]
         assert order_result["diagnostics"]["known"] is False
         assert order_result["diagnostics"]["rsp_cd"] == ""
+
+
+# ---------------------------------------------------------------------------
+# Zero orderable amount short-circuit (cached COSOQ02701)
+# ---------------------------------------------------------------------------
+
+def _seed_cosoq02701_cache(ls: MagicMock, orderable) -> None:
+    """AccountNode 가 방금 조회한 것처럼 COSOQ02701:USD 응답을 예수금 캐시에 넣는다."""
+    import time
+
+    from programgarden.executor import AccountNodeExecutor
+
+    usd = MagicMock()
+    usd.CrcyCode = "USD"
+    usd.FcurrOrdAbleAmt = orderable
+    response = MagicMock()
+    response.block3 = [usd]
+    AccountNodeExecutor._deposit_cache[ls] = {
+        "COSOQ02701:USD": (time.monotonic() + 60, response),
+    }
+
+
+class TestZeroOrderableShortCircuit:
+    _CONNECTION = {"product": "overseas_stock", "paper_trading": False}
+
+    def test_cached_orderable_amount_unknown_without_cache(self):
+        ex = NewOrderNodeExecutor()
+        assert ex._cached_orderable_amount(MagicMock(), "overseas_stock") is None
+
+    def test_cached_orderable_amount_reads_usd_row(self):
+        ex = NewOrderNodeExecutor()
+        ls = MagicMock()
+        _seed_cosoq02701_cache(ls, "1250.5")
+        assert ex._cached_orderable_amount(ls, "overseas_stock") == 1250.5
+        assert ex._cached_orderable_amount(ls, "korea_stock") is None
+
+    @pytest.mark.asyncio
+    async def test_zero_orderable_buy_is_not_sent(self, monkeypatch):
+        from programgarden import executor as executor_module
+        from programgarden.context import ExecutionContext
+
+        resp = _cosat_response(ord_no="12345")
+        ls = _make_ls_with_cosat_response(resp)
+        _seed_cosoq02701_cache(ls, 0)
+        monkeypatch.setattr(
+            executor_module, "_order_node_login", lambda *args: (ls, None)
+        )
+
+        ex = NewOrderNodeExecutor()
+        ctx = ExecutionContext(job_id="job-zero", workflow_id="wf-zero")
+        config = {
+            "connection": dict(self._CONNECTION),
+            "order": {"symbol": "AAPL", "exchange": "NASDAQ", "quantity": 1, "price": 190.0},
+            "side": "buy",
+            "order_type": "limit",
+        }
+        result = await ex.execute("order-zero", "StockNewOrderNode", config, ctx)
+
+        order_result = result["order_result"]
+        assert order_result["success"] is False
+        assert order_result["error"] == "Insufficient orderable amount"
+        assert order_result["diagnostics"]["known"] is True
+        ls.overseas_stock.return_value.주문.return_value.cosat00301.assert_not_called()
+
+
+class TestUnsupportedProductShortCircuit:
+    @pytest.mark.asyncio
+    async def test_unsupported_product_skips_login(self, monkeypatch):
+        from programgarden import executor as executor_module
+        from programgarden.context import ExecutionContext
+
+        logins = []
+        monkeypatch.setattr(
+            executor_module, "_order_node_login", lambda *args: logins.append(args) or (MagicMock(), None)
+        )
+
+        ex = NewOrderNodeExecutor()
+        ctx = ExecutionContext(job_id="job-unsupported", workflow_id="wf-unsupported")
+        config = {
+            "connection": {"product": "crypto", "paper_trading": False},
+            "order": {"symbol": "BTC", "exchange": "NASDAQ", "quantity": 1, "price": 100.0},
+            "side": "buy",
+            "order_type": "limit",
+        }
+        result = await ex.execute("order-unsupported", "NewOrderNode", config, ctx)
+
+        assert result["order_result"]["error"] == "Unsupported product: crypto"
+        assert logins == []
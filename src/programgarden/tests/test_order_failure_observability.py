@@ -288,6 +288,22 @@ class TestConfirmOrderFill:
         assert inner["filled_quantity"] == 3
         assert inner["filled_count"] == 0
 
+    @pytest.mark.asyncio
+    async def test_zero_attempts_skips_requery(self, monkeypatch):
+        """fill_confirm_attempts=0 이면 재조회 TR 자체를 보내지 않는다."""
+        ex = self._executor()
+        query = AsyncMock(return_value=(1, 5270.0))
+        monkeypatch.setattr(ex, "_query_korea_fill", query)
+        order_result = self._submitted()
+        await ex._confirm_order_fill(
+            MagicMock(), "korea_stock", "market", order_result,
+            {"fill_confirm_attempts": 0}, _mock_ctx(), "ord1",
+        )
+        query.assert_not_called()
+        inner = order_result["order_result"]
+        assert inner["status"] == "submitted"
+        assert "filled_quantity" not in inner
+
     @pytest.mark.asyncio
     async def test_requery_exception_never_disturbs_submission(self, monkeypatch):
         """재조회가 터져도 예외 전파 없이 접수 성공을 보존한다 (best-effort 계약)."""
@@ -138,3 +138,15 @@ class TestSanitizerDefenseInDepth:
         ctx.set_output("n", "data", {"symbol": "NVDA", "price": 209.0})
 
         assert ctx.get_all_outputs_sanitized("n")["data"] == {"symbol": "NVDA", "price": 209.0}
+
+    def test_key_verdict_is_reused_across_ticks(self, ctx):
+        """같은 키는 한 번만 판정하고, 재사용해도 마스킹 결과는 같다."""
+        ExecutionContext._sensitive_key_memo.clear()
+
+        for price in (1.0, 2.0):
+            ctx.set_output("n", "data", {"NVDA": {"price": price, "Access_Token": "LEAK"}})
+            safe = ctx.get_all_outputs_sanitized("n")
+            assert safe["data"]["NVDA"] == {"price": price, "Access_Token": "[REDACTED]"}
+
+        assert ExecutionContext._sensitive_key_memo["Access_Token"] is True
+        assert ExecutionContext._sensitive_key_memo["price"] is False
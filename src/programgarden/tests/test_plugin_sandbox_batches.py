@@ -0,0 +1,78 @@
+"""PluginSandbox.execute_batched 동시 배치 실행.
+
+- 배치는 max_concurrent_batches 개까지 동시에 돌고, 결과는 배치 순서대로 합쳐진다
+- 타임아웃된 배치의 종목만 failed 로 빠지고 나머지 배치 결과는 그대로 남는다
+- 그 밖의 오류가 나면 대기 중인 배치는 실행하지 않고 오류를 올린다
+"""
+import asyncio
+
+import pytest
+
+from programgarden.plugin.sandbox import PluginSandbox
+
+
+def _tracking_plugin(stats, delay=0.02, slow_symbol=None):
+    async def plugin(symbols, **kwargs):
+        stats["active"] += 1
+        stats["peak"] = max(stats["peak"], stats["active"])
+        try:
+            await asyncio.sleep(1 if slow_symbol in symbols else delay)
+        finally:
+            stats["active"] -= 1
+        return {"passed_symbols": list(symbols), "failed_symbols": [], "symbol_results": {}}
+
+    return plugin
+
+
+@pytest.mark.asyncio
+async def test_batches_run_concurrently_in_order():
+    stats = {"active": 0, "peak": 0}
+    sandbox = PluginSandbox(default_batch_size=2, max_concurrent_batches=3)
+
+    result = await sandbox.execute_batched("p", _tracking_plugin(stats), list("ABCDEFGHIJ"))
+
+    assert result["passed_symbols"] == list("ABCDEFGHIJ")
+    assert result["batch_count"] == 5
+    assert stats["peak"] == 3
+
+
+@pytest.mark.asyncio
+async def test_timed_out_batch_only_fails_its_symbols():
+    stats = {"active": 0, "peak": 0}
+    sandbox = PluginSandbox(default_batch_size=2, default_timeout=0.2)
+
+    result = await sandbox.execute_batched(
+        "p", _tracking_plugin(stats, slow_symbol="C"), list("ABCDE")
+    )
+
+    assert result["passed_symbols"] == ["A", "B", "E"]
+    assert result["failed_symbols"] == ["C", "D"]
+
+
+@pytest.mark.asyncio
+async def test_memory_tracking_runs_batches_one_at_a_time():
+    stats = {"active": 0, "peak": 0}
+    sandbox = PluginSandbox(default_batch_size=2, track_memory=True)
+
+    await sandbox.execute_batched("p", _tracking_plugin(stats), list("ABCDEF"))
+
+    assert stats["peak"] == 1
+
+
+@pytest.mark.asyncio
+async def test_error_stops_queued_batches():
+    started = []
+
+    async def plugin(symbols, **kwargs):
+        started.append(symbols[0])
+        await asyncio.sleep(0.01)
+        if symbols[0] == "A":
+            raise ValueError("boom")
+        return {"passed_symbols": list(symbols), "failed_symbols": [], "symbol_results": {}}
+
+    sandbox = PluginSandbox(default_batch_size=2, max_concurrent_batches=2)
+
+    with pytest.raises(ValueError, match="boom"):
+        await sandbox.execute_batched("p", plugin, list("ABCDEFGH"))
+    # 실패 전에 이미 돌던 배치(C)까지만 실행되고 대기 중이던 배치는 시작하지 않는다
+    assert started == ["A", "C"]
@@ -0,0 +1,61 @@
+"""SymbolFilterNode 집합 연산.
+
+- 보유 종목 코드의 공백 패딩과 무관하게 매칭되고, 결과는 input_a 순서를 유지한다
+- 겹치지 않는 입력은 B 쪽 문자열 항목을 정규화하지 않고 바로 결과를 낸다
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from programgarden.executor import SymbolFilterNodeExecutor
+
+
+def _make_context():
+    ctx = MagicMock()
+    ctx.is_deep_validate = False
+    return ctx
+
+
+class TestSymbolFilterHeldDifference:
+    """보유 종목 코드 공백 패딩과 무관하게 매칭되고 입력 순서가 유지되는지"""
+
+    @pytest.mark.asyncio
+    async def test_difference_strips_padded_codes_and_keeps_order(self):
+        executor = SymbolFilterNodeExecutor()
+        config = {
+            "operation": "difference",
+            "input_a": [
+                {"exchange": "NYSE", "symbol": "BA"},
+                {"exchange": "NASDAQ", "symbol": "NVDA"},
+                {"exchange": "NASDAQ", "symbol": "AAPL"},
+                {"exchange": "NYSE", "symbol": "BA"},
+            ],
+            "input_b": [{"exchange": "NASDAQ", "symbol": "NVDA  "}, "MSFT"],
+        }
+        result = await executor.execute("filter", "SymbolFilterNode", config, _make_context())
+
+        assert [s["symbol"] for s in result["symbols"]] == ["BA", "AAPL"]
+        assert result["count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_disjoint_inputs(self, monkeypatch):
+        import programgarden_core.models as core_models
+
+        executor = SymbolFilterNodeExecutor()
+        ctx = _make_context()
+        input_a = [{"exchange": "NYSE", "symbol": "BA"}, {"exchange": "NASDAQ", "symbol": "AAPL"}]
+
+        # difference / intersection 에서 B 쪽 문자열 항목은 정규화하지 않는다
+        normalized = []
+        original = core_models.normalize_symbol
+        monkeypatch.setattr(
+            core_models, "normalize_symbol", lambda code: normalized.append(code) or original(code)
+        )
+
+        config = {"operation": "difference", "input_a": input_a, "input_b": ["MSFT", "TSLA"]}
+        result = await executor.execute("filter", "SymbolFilterNode", config, ctx)
+        assert [s["symbol"] for s in result["symbols"]] == ["BA", "AAPL"]
+
+        config["operation"] = "intersection"
+        result = await executor.execute("filter", "SymbolFilterNode", config, ctx)
+        assert result["symbols"] == []
+        assert normalized == []
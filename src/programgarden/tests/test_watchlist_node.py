@@ -0,0 +1,38 @@
+"""WatchlistNode 종목 정규화.
+
+- config 에 dict 리터럴로 적힌 {exchange, symbol} 항목은 복사 없이 그대로 나간다
+- 바인딩으로 받은 항목은 상류 출력과 객체를 공유하지 않는다 (하류 변경이 상류로 새지 않게)
+"""
+import asyncio
+
+from programgarden.context import ExecutionContext
+from programgarden.executor import WatchlistNodeExecutor
+
+
+def _run(config, ctx):
+    return asyncio.run(
+        WatchlistNodeExecutor().execute(
+            node_id="watch", node_type="WatchlistNode", config=config, context=ctx,
+        )
+    )
+
+
+def test_literal_entries_are_normalized():
+    ctx = ExecutionContext(job_id="j", workflow_id="w")
+    out = _run({"symbols": [{"exchange": "NASDAQ", "symbol": "AAPL"}, "TSLA"]}, ctx)
+    assert out["symbols"] == [
+        {"exchange": "NASDAQ", "symbol": "AAPL"},
+        {"exchange": "", "symbol": "TSLA"},
+    ]
+
+
+def test_bound_entries_do_not_share_upstream_dicts():
+    ctx = ExecutionContext(job_id="j", workflow_id="w")
+    upstream = [{"exchange": "NASDAQ", "symbol": "AAPL"}]
+    ctx.set_output("up", "symbols", upstream)
+
+    out = _run({"symbols": "{{ nodes.up.symbols }}"}, ctx)
+    out["symbols"][0]["volume"] = 1
+
+    assert out["symbols"][0] is not ctx.get_output("up", "symbols")[0]
+    assert "volume" not in ctx.get_output("up", "symbols")[0]